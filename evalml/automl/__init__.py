@@ -1,3 +1,4 @@
 from .automl_search import AutoMLSearch
 from .utils import get_default_primary_search_objective, make_data_splitter, tune_binary_threshold
 from .engine import SequentialEngine, EngineBase
+from .events import EventSink, JSONLinesEventSink, QueueEventSink
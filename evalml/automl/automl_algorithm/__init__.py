@@ -1,2 +1,3 @@
 from .automl_algorithm import AutoMLAlgorithm, AutoMLAlgorithmException
+from .hyperband_algorithm import HyperbandAlgorithm
 from .iterative_algorithm import IterativeAlgorithm
@@ -1,5 +1,8 @@
+import inspect
 from abc import ABC, abstractmethod
 
+from .runtime_model import RuntimeModel, training_rows
+
 from evalml.exceptions import PipelineNotFoundError
 from evalml.tuners import SKOptTuner
 
@@ -16,7 +19,8 @@ class AutoMLAlgorithm(ABC):
                  allowed_pipelines=None,
                  max_iterations=None,
                  tuner_class=None,
-                 random_seed=0):
+                 random_seed=0,
+                 cost_aware=False):
         """This class represents an automated machine learning (AutoML) algorithm. It encapsulates the decision-making logic behind an automl search, by both deciding which pipelines to evaluate next and by deciding what set of parameters to configure the pipeline with.
 
         To use this interface, you must define a next_batch method which returns the next group of pipelines to evaluate on the training data. That method may access state and results recorded from the previous batches, although that information is not tracked in a general way in this base class. Overriding add_result is a convenient way to record pipeline evaluation info if necessary.
@@ -26,14 +30,27 @@ class AutoMLAlgorithm(ABC):
             max_iterations (int): The maximum number of iterations to be evaluated.
             tuner_class (class): A subclass of Tuner, to be used to find parameters for each pipeline. The default of None indicates the SKOptTuner will be used.
             random_state (int): Seed for the random number generator. Defaults to 0.
+            cost_aware (bool): If True, the training time of each evaluated pipeline is recorded in a runtime model. If the tuner class
+                accepts a `cost_aware` argument, as SKOptTuner does, the tuners are created with `cost_aware=True` and the training
+                times are passed to their `add` method, so they can weigh the expected improvement of parameters against their
+                expected training time. Other tuners are used as usual. Algorithms may also use the runtime model and `time_remaining`, the remaining time budget in seconds
+                which AutoMLSearch sets before requesting each batch when `max_time` is set, to avoid proposing pipelines which are
+                not expected to finish in time. Defaults to False.
         """
         self.random_seed = random_seed
+        self.cost_aware = cost_aware
+        self.time_remaining = None
+        self._runtime_model = RuntimeModel()
         self.allowed_pipelines = allowed_pipelines or []
         self.max_iterations = max_iterations
         self._tuner_class = tuner_class or SKOptTuner
         self._tuners = {}
+        self._cost_aware_tuners = cost_aware and 'cost_aware' in inspect.signature(self._tuner_class.__init__).parameters
         for p in self.allowed_pipelines:
-            self._tuners[p.name] = self._tuner_class(p.hyperparameters, random_seed=self.random_seed)
+            if self._cost_aware_tuners:
+                self._tuners[p.name] = self._tuner_class(p.hyperparameters, random_seed=self.random_seed, cost_aware=True)
+            else:
+                self._tuners[p.name] = self._tuner_class(p.hyperparameters, random_seed=self.random_seed)
         self._pipeline_number = 0
         self._batch_number = 0
 
@@ -55,7 +72,34 @@ class AutoMLAlgorithm(ABC):
         """
         if pipeline.name not in self._tuners:
             raise PipelineNotFoundError(f"No such pipeline allowed in this AutoML search: {pipeline.name}")
-        self._tuners[pipeline.name].add(pipeline.parameters, score_to_minimize)
+        self._record_training_time(pipeline, trained_pipeline_results)
+        tuner = self._tuners[pipeline.name]
+        tuner.remove_pending(pipeline.parameters)
+        if self._cost_aware_tuners:
+            tuner.add(pipeline.parameters, score_to_minimize, training_time=self._full_training_time(pipeline, trained_pipeline_results))
+        else:
+            tuner.add(pipeline.parameters, score_to_minimize)
+
+    def _record_training_time(self, pipeline, trained_pipeline_results):
+        self._runtime_model.add(pipeline.name, trained_pipeline_results.get('training_time'), training_rows(trained_pipeline_results))
+
+    def _full_training_time(self, pipeline, trained_pipeline_results):
+        """The time a full evaluation of the pipeline took, or the predicted time if the pipeline was pruned or its result was reused."""
+        training_time = trained_pipeline_results.get('training_time')
+        if trained_pipeline_results.get('pruned') or not training_time:
+            return self._runtime_model.predict(pipeline.name)
+        return training_time
+
+    def predict_training_time(self, pipeline_class):
+        """Predict how long a full evaluation of a pipeline of the given class will take, from the training times recorded so far.
+
+        Arguments:
+            pipeline_class (class): A PipelineBase subclass.
+
+        Returns:
+            float or None: The predicted time in seconds, or None if no pipeline of this class has been evaluated yet.
+        """
+        return self._runtime_model.predict(pipeline_class.name)
 
     @property
     def pipeline_number(self):
@@ -0,0 +1,169 @@
+import copy
+import inspect
+import math
+from operator import itemgetter
+
+import numpy as np
+
+from .automl_algorithm import AutoMLAlgorithmException
+from .iterative_algorithm import IterativeAlgorithm
+
+from evalml.automl.results_store import parameters_key
+from evalml.pipelines.components import Estimator
+from evalml.pipelines.components.utils import handle_component_class
+
+
+class HyperbandAlgorithm(IterativeAlgorithm):
+    """An automl algorithm which tunes pipelines with Hyperband-style successive halving over the estimator's `n_estimators` budget.
+
+    The first batch fits one pipeline of each allowed type with default parameters, as `IterativeAlgorithm` does. After that, each
+    pipeline type takes turns running a successive halving bracket. A bracket evaluates a group of tuner proposals with a fraction of
+    their `n_estimators`, keeps the best 1/eta of them, evaluates those with eta times more estimators and repeats until the remaining
+    proposals are evaluated with their full `n_estimators`. Only full-budget results are passed to the tuner. Like Hyperband, brackets
+    cycle from the most aggressive (most proposals, smallest starting budget) to a bracket which evaluates every proposal with the full
+    budget. Pipelines whose estimator has no `n_estimators` parameter always use full-budget brackets.
+    """
+
+    def __init__(self,
+                 allowed_pipelines=None,
+                 max_iterations=None,
+                 tuner_class=None,
+                 random_seed=0,
+                 n_jobs=-1,
+                 number_features=None,
+                 pipeline_params=None,
+                 eta=3,
+                 min_budget_fraction=1 / 9):
+        """An automl algorithm which tunes pipelines with Hyperband-style successive halving over the estimator's `n_estimators` budget.
+
+        Arguments:
+            allowed_pipelines (list(class)): A list of PipelineBase subclasses indicating the pipelines allowed in the search. The default of None indicates all pipelines for this problem type are allowed.
+            max_iterations (int): The maximum number of iterations to be evaluated.
+            tuner_class (class): A subclass of Tuner, to be used to find parameters for each pipeline. The default of None indicates the SKOptTuner will be used.
+            random_seed (int): Seed for the random number generator. Defaults to 0.
+            n_jobs (int or None): Non-negative integer describing level of parallelism used for pipelines.
+            number_features (int): The number of columns in the input features.
+            pipeline_params (dict or None): Pipeline-level parameters that should be passed to the proposed pipelines.
+            eta (int): The factor by which the budget grows, and the number of proposals shrinks, from one round of a bracket to the next. Must be at least 2. Defaults to 3.
+            min_budget_fraction (float): The smallest fraction of `n_estimators` a proposal is evaluated with. Must be in (0, 1]. Defaults to 1/9.
+        """
+        if eta < 2:
+            raise ValueError(f"Parameter eta must be at least 2. Received {eta}.")
+        if not 0 < min_budget_fraction <= 1:
+            raise ValueError(f"Parameter min_budget_fraction must be in (0, 1]. Received {min_budget_fraction}.")
+        super().__init__(allowed_pipelines=allowed_pipelines,
+                         max_iterations=max_iterations,
+                         tuner_class=tuner_class,
+                         random_seed=random_seed,
+                         n_jobs=n_jobs,
+                         number_features=number_features,
+                         ensembling=False,
+                         pipeline_params=pipeline_params)
+        self.eta = eta
+        self.min_budget_fraction = min_budget_fraction
+        # small epsilon so that exact powers of eta are not rounded down
+        self._max_bracket = int(math.floor(math.log(1 / min_budget_fraction, eta) + 1e-9))
+        self._bracket_number = 0
+        self._bracket = None
+        self._rung_scores = {}
+
+    @staticmethod
+    def _get_estimator_class(pipeline_class):
+        component_classes = [handle_component_class(c) for c in pipeline_class.linearized_component_graph]
+        estimator_classes = [c for c in component_classes if issubclass(c, Estimator)]
+        return estimator_classes[-1] if estimator_classes else None
+
+    def _start_bracket(self):
+        num_pipeline_classes = len(self._first_batch_results)
+        pipeline_class = self._first_batch_results[self._bracket_number % num_pipeline_classes][1]
+        estimator_class = self._get_estimator_class(pipeline_class)
+        n_estimators_default = None
+        if estimator_class is not None:
+            n_estimators_default = inspect.signature(estimator_class.__init__).parameters.get('n_estimators')
+        if n_estimators_default is None or n_estimators_default.default is inspect.Parameter.empty:
+            s = 0
+        else:
+            s = self._max_bracket - (self._bracket_number // num_pipeline_classes) % (self._max_bracket + 1)
+        num_proposals = int(math.ceil((self._max_bracket + 1) / (s + 1) * self.eta ** s))
+
+        proposals = []
+        for proposed_parameters in self._tuners[pipeline_class.name].propose_batch(num_proposals):
+            parameters = self._transform_parameters(pipeline_class, proposed_parameters)
+            full_budget = None
+            if s > 0:
+                full_budget = parameters.get(estimator_class.name, {}).get('n_estimators', n_estimators_default.default)
+            proposals.append((parameters, full_budget))
+
+        self._bracket = {'pipeline_class': pipeline_class,
+                         'estimator_name': estimator_class.name if estimator_class is not None else None,
+                         's': s,
+                         'rung': 0,
+                         'proposals': proposals}
+        self._bracket_number += 1
+
+    def _promote(self):
+        bracket = self._bracket
+        pipeline_class = bracket['pipeline_class']
+        scored = []
+        for index, (parameters, full_budget) in enumerate(bracket['proposals']):
+            rung_parameters = self._rung_parameters(parameters, full_budget)
+            score = self._rung_scores.get(parameters_key(pipeline_class.name, rung_parameters), np.inf)
+            scored.append((np.inf if score is None or np.isnan(score) else score, index))
+        num_promoted = max(1, len(bracket['proposals']) // self.eta)
+        promoted = sorted(scored, key=itemgetter(0, 1))[:num_promoted]
+        bracket['proposals'] = [bracket['proposals'][index] for _, index in promoted]
+        bracket['rung'] += 1
+
+    def _rung_parameters(self, parameters, full_budget):
+        bracket = self._bracket
+        if full_budget is None or bracket['rung'] == bracket['s']:
+            return parameters
+        rung_parameters = copy.deepcopy(parameters)
+        budget = max(1, int(math.ceil(full_budget * self.eta ** (bracket['rung'] - bracket['s']))))
+        rung_parameters.setdefault(bracket['estimator_name'], {})['n_estimators'] = budget
+        return rung_parameters
+
+    def next_batch(self):
+        """Get the next batch of pipelines to evaluate
+
+        Returns:
+            list(PipelineBase): a list of instances of PipelineBase subclasses, ready to be trained and evaluated.
+        """
+        if self._batch_number == 0:
+            return super().next_batch()
+        if self._batch_number == 1:
+            if len(self._first_batch_results) == 0:
+                raise AutoMLAlgorithmException('No results were reported from the first batch')
+            self._first_batch_results = sorted(self._first_batch_results, key=itemgetter(0))
+
+        if self._bracket is None or self._bracket['rung'] == self._bracket['s']:
+            self._start_bracket()
+        else:
+            self._promote()
+        self._rung_scores = {}
+
+        pipeline_class = self._bracket['pipeline_class']
+        next_batch = [pipeline_class(parameters=self._rung_parameters(parameters, full_budget), random_seed=self.random_seed)
+                      for parameters, full_budget in self._bracket['proposals']]
+        self._pipeline_number += len(next_batch)
+        self._batch_number += 1
+        return next_batch
+
+    def next_pipeline(self):
+        """Not supported. Each round of a successive halving bracket depends on every result of the previous round, so pipelines must be proposed with `next_batch`."""
+        raise AutoMLAlgorithmException('HyperbandAlgorithm does not support proposing pipelines asynchronously. Use next_batch instead.')
+
+    def add_result(self, score_to_minimize, pipeline, trained_pipeline_results):
+        """Register results from evaluating a pipeline
+
+        Arguments:
+            score_to_minimize (float): The score obtained by this pipeline on the primary objective, converted so that lower values indicate better pipelines.
+            pipeline (PipelineBase): The trained pipeline object which was used to compute the score.
+            trained_pipeline_results (dict): Results from training a pipeline.
+        """
+        if self._batch_number <= 1 or self._bracket is None:
+            super().add_result(score_to_minimize, pipeline, trained_pipeline_results)
+            return
+        self._rung_scores[parameters_key(pipeline.name, pipeline.parameters)] = score_to_minimize
+        if self._bracket['rung'] == self._bracket['s']:
+            super().add_result(score_to_minimize, pipeline, trained_pipeline_results)
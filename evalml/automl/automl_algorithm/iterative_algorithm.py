@@ -23,7 +23,8 @@ class IterativeAlgorithm(AutoMLAlgorithm):
                  n_jobs=-1,  # TODO remove
                  number_features=None,  # TODO remove
                  ensembling=False,
-                 pipeline_params=None):
+                 pipeline_params=None,
+                 cost_aware=False):
         """An automl algorithm which first fits a base round of pipelines with default parameters, then does a round of parameter tuning on each pipeline in order of performance.
 
         Arguments:
@@ -36,11 +37,16 @@ class IterativeAlgorithm(AutoMLAlgorithm):
             number_features (int): The number of columns in the input features.
             ensembling (boolean): If True, runs ensembling in a separate batch after every allowed pipeline class has been iterated over. Defaults to False.
             pipeline_params (dict or None): Pipeline-level parameters that should be passed to the proposed pipelines.
+            cost_aware (boolean): If True, pipeline types are tuned cheapest first according to the training times of the first batch,
+                instead of best first. Tuning batches are shortened to the number of pipelines expected to finish within `time_remaining`,
+                and pipeline types not expected to finish even one pipeline are deferred to their next turn. The tuners weigh expected
+                improvement against expected training time. Defaults to False.
         """
         super().__init__(allowed_pipelines=allowed_pipelines,
                          max_iterations=max_iterations,
                          tuner_class=tuner_class,
-                         random_seed=random_seed)
+                         random_seed=random_seed,
+                         cost_aware=cost_aware)
         self.pipelines_per_batch = pipelines_per_batch
         self.n_jobs = n_jobs
         self.number_features = number_features
@@ -48,6 +54,43 @@ class IterativeAlgorithm(AutoMLAlgorithm):
         self._best_pipeline_info = {}
         self.ensembling = ensembling and len(self.allowed_pipelines) > 1
         self._pipeline_params = pipeline_params or {}
+        self._first_batch_size = 0
+        self._async_queue = []
+
+    def _check_first_batch_results(self):
+        if self._batch_number == 1:
+            if len(self._first_batch_results) == 0:
+                raise AutoMLAlgorithmException('No results were reported from the first batch')
+            if self.cost_aware:
+                self._first_batch_results = sorted(self._first_batch_results, key=self._cost_sort_key)
+            else:
+                self._first_batch_results = sorted(self._first_batch_results, key=itemgetter(0))
+
+    def _cost_sort_key(self, first_batch_result):
+        score, pipeline_class = first_batch_result
+        predicted_time = self.predict_training_time(pipeline_class)
+        return (np.inf if predicted_time is None else predicted_time, score)
+
+    def _is_ensemble_batch(self):
+        # One after training all pipelines one round
+        return (self.ensembling and
+                self._batch_number > 1 and
+                (self._batch_number) % (len(self._first_batch_results) + 1) == 0)
+
+    def _tuning_batch_plan(self):
+        """Returns the pipeline class to tune in the next batch and the number of pipelines to propose."""
+        num_pipeline_classes = (len(self._first_batch_results) + 1) if self.ensembling else len(self._first_batch_results)
+        idx = (self._batch_number - 1) % num_pipeline_classes
+        if not self.cost_aware or self.time_remaining is None:
+            return self._first_batch_results[idx][1], self.pipelines_per_batch
+        for offset in range(len(self._first_batch_results)):
+            pipeline_class = self._first_batch_results[(idx + offset) % len(self._first_batch_results)][1]
+            predicted_time = self.predict_training_time(pipeline_class)
+            if predicted_time is None or predicted_time <= 0:
+                return pipeline_class, self.pipelines_per_batch
+            if predicted_time <= self.time_remaining:
+                return pipeline_class, min(self.pipelines_per_batch, int(self.time_remaining // predicted_time))
+        raise StopIteration(f'No pipeline is expected to finish within the remaining {self.time_remaining:.1f} seconds')
 
     def next_batch(self):
         """Get the next batch of pipelines to evaluate
@@ -55,20 +98,15 @@ class IterativeAlgorithm(AutoMLAlgorithm):
         Returns:
             list(PipelineBase): a list of instances of PipelineBase subclasses, ready to be trained and evaluated.
         """
-        if self._batch_number == 1:
-            if len(self._first_batch_results) == 0:
-                raise AutoMLAlgorithmException('No results were reported from the first batch')
-            self._first_batch_results = sorted(self._first_batch_results, key=itemgetter(0))
+        self._check_first_batch_results()
 
         next_batch = []
         if self._batch_number == 0:
             next_batch = [pipeline_class(parameters=self._transform_parameters(pipeline_class, {}), random_seed=self.random_seed)
                           for pipeline_class in self.allowed_pipelines]
+            self._first_batch_size = len(next_batch)
 
-        # One after training all pipelines one round
-        elif (self.ensembling and
-              self._batch_number != 1 and
-              (self._batch_number) % (len(self._first_batch_results) + 1) == 0):
+        elif self._is_ensemble_batch():
             input_pipelines = []
             for pipeline_dict in self._best_pipeline_info.values():
                 pipeline_class = pipeline_dict['pipeline_class']
@@ -81,17 +119,51 @@ class IterativeAlgorithm(AutoMLAlgorithm):
 
             next_batch.append(ensemble)
         else:
-            num_pipeline_classes = (len(self._first_batch_results) + 1) if self.ensembling else len(self._first_batch_results)
-            idx = (self._batch_number - 1) % num_pipeline_classes
-            pipeline_class = self._first_batch_results[idx][1]
-            for i in range(self.pipelines_per_batch):
-                proposed_parameters = self._tuners[pipeline_class.name].propose()
+            pipeline_class, num_pipelines = self._tuning_batch_plan()
+            for proposed_parameters in self._tuners[pipeline_class.name].propose_batch(num_pipelines):
                 pl_parameters = self._transform_parameters(pipeline_class, proposed_parameters)
                 next_batch.append(pipeline_class(parameters=pl_parameters, random_seed=self.random_seed))
         self._pipeline_number += len(next_batch)
         self._batch_number += 1
         return next_batch
 
+    def next_pipeline(self):
+        """Get the next pipeline to evaluate, for use when pipelines are evaluated asynchronously.
+
+        Pipelines are proposed in the same order as by `next_batch`, but one at a time and without waiting for the rest of
+        the batch to be evaluated, so a new pipeline can be proposed whenever a worker becomes free. Results may be passed to
+        `add_result` in any order. Tuned parameters are proposed when the pipeline is requested, taking into account the
+        results received so far and the pipelines of the same type which are still being evaluated. The only point at which
+        the algorithm has to wait is after the first batch, because the order in which pipeline types are tuned depends on
+        their first scores. Do not mix calls to `next_pipeline` and `next_batch` within a search.
+
+        Returns:
+            PipelineBase or None: an instance of a PipelineBase subclass, ready to be trained and evaluated, or None if
+                no pipeline can be proposed until more results from the first batch have been added.
+        """
+        if not self._async_queue:
+            if self._batch_number == 1 and len(self._first_batch_results) < self._first_batch_size:
+                return None
+            if self._batch_number == 0 or self._is_ensemble_batch():
+                self._async_queue = self.next_batch()
+                if not self._async_queue:
+                    return None
+            else:
+                self._check_first_batch_results()
+                pipeline_class, num_pipelines = self._tuning_batch_plan()
+                self._async_queue = [pipeline_class] * num_pipelines
+                self._batch_number += 1
+
+        next_pipeline = self._async_queue.pop(0)
+        if isinstance(next_pipeline, type):
+            pipeline_class = next_pipeline
+            tuner = self._tuners[pipeline_class.name]
+            parameters = self._transform_parameters(pipeline_class, tuner.propose())
+            next_pipeline = pipeline_class(parameters=parameters, random_seed=self.random_seed)
+            tuner.add_pending(next_pipeline.parameters)
+            self._pipeline_number += 1
+        return next_pipeline
+
     def add_result(self, score_to_minimize, pipeline, trained_pipeline_results):
         """Register results from evaluating a pipeline
 
@@ -100,7 +172,9 @@ class IterativeAlgorithm(AutoMLAlgorithm):
             pipeline (PipelineBase): The trained pipeline object which was used to compute the score.
             trained_pipeline_results (dict): Results from training a pipeline.
         """
-        if pipeline.model_family != ModelFamily.ENSEMBLE:
+        if pipeline.model_family == ModelFamily.ENSEMBLE:
+            self._record_training_time(pipeline, trained_pipeline_results)
+        else:
             if self.batch_number == 1:
                 try:
                     super().add_result(score_to_minimize, pipeline, trained_pipeline_results)
@@ -0,0 +1,62 @@
+import numpy as np
+
+
+def training_rows(trained_pipeline_results):
+    """Returns the total number of rows a pipeline was trained on across its cross-validation folds, or None if unknown.
+
+    Arguments:
+        trained_pipeline_results (dict): Results from training a pipeline, as stored in AutoMLSearch.results['pipeline_results'].
+
+    Returns:
+        int or None: The number of training rows.
+    """
+    cv_data = trained_pipeline_results.get('cv_data') or []
+    rows = [fold.get('all_objective_scores', {}).get('# Training') for fold in cv_data]
+    if not rows or any(r is None for r in rows):
+        return None
+    return int(sum(rows))
+
+
+class RuntimeModel:
+    """Predicts how long evaluating a pipeline will take, from the training times observed so far in a search.
+
+    Training time is modeled per pipeline name as proportional to the number of rows the pipeline was trained on, summed over the
+    cross-validation folds. This lets results which trained on fewer rows, such as pruned pipelines or stacked ensembles which only
+    train on one fold, inform the prediction for a full evaluation. Each prediction is the median time per row observed for that
+    pipeline name, multiplied by the number of rows to train on.
+    """
+
+    def __init__(self):
+        """Predicts how long evaluating a pipeline will take, from the training times observed so far in a search."""
+        self._seconds_per_row = {}
+        self._max_rows = 0
+
+    def add(self, pipeline_name, training_time, rows):
+        """Record how long a pipeline took to evaluate. Records with a non-positive training time, for example evaluations which
+        reused an earlier result, or an unknown number of rows are ignored.
+
+        Arguments:
+            pipeline_name (str): Name of the pipeline.
+            training_time (float): The time in seconds the pipeline took to train and score.
+            rows (int): The total number of rows the pipeline was trained on.
+        """
+        if training_time is None or not training_time > 0 or not rows:
+            return
+        self._seconds_per_row.setdefault(pipeline_name, []).append(training_time / rows)
+        self._max_rows = max(self._max_rows, rows)
+
+    def predict(self, pipeline_name, rows=None):
+        """Predict how long a pipeline will take to evaluate.
+
+        Arguments:
+            pipeline_name (str): Name of the pipeline.
+            rows (int): The total number of rows to train on. Defaults to None, which uses the largest number of rows recorded
+                for any pipeline, which is the number of rows a full evaluation trains on.
+
+        Returns:
+            float or None: The predicted time in seconds, or None if no time has been recorded for this pipeline name.
+        """
+        if pipeline_name not in self._seconds_per_row:
+            return None
+        rows = rows or self._max_rows
+        return float(np.median(self._seconds_per_row[pipeline_name]) * rows)
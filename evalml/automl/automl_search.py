@@ -1,4 +1,6 @@
 import copy
+import importlib.util
+import os
 import time
 from collections import defaultdict
 
@@ -7,14 +9,27 @@ import numpy as np
 import pandas as pd
 from sklearn.model_selection import BaseCrossValidator
 
-from .pipeline_search_plots import PipelineSearchPlots
+from .pipeline_search_plots import PipelineSearchPlots, SearchIterationPlot
 
-from evalml.automl.automl_algorithm import IterativeAlgorithm
+from evalml.automl.automl_algorithm import (
+    HyperbandAlgorithm,
+    IterativeAlgorithm
+)
+from evalml.automl.background_training import BackgroundPipelineTrainer
 from evalml.automl.callbacks import log_error_callback
+from evalml.automl.checkpoint import SearchCheckpoint
 from evalml.automl.engine import SequentialEngine
+from evalml.automl.events import EventSink, make_event
+from evalml.automl.results_store import (
+    ResultsStore,
+    data_fingerprint,
+    evaluation_key
+)
 from evalml.automl.utils import (
+    add_early_stopping_parameters,
     get_default_primary_search_objective,
     make_data_splitter,
+    remove_early_stopping,
     tune_binary_threshold
 )
 from evalml.data_checks import (
@@ -40,9 +55,19 @@ from evalml.pipelines import (
     TimeSeriesBaselineRegressionPipeline
 )
 from evalml.pipelines.components.utils import get_estimators
-from evalml.pipelines.utils import get_generated_pipeline_class, make_pipeline
+from evalml.pipelines.utils import (
+    _CATEGORICAL_ENCODINGS,
+    _sparse_one_hot_parameters,
+    get_generated_pipeline_class,
+    make_pipeline
+)
 from evalml.preprocessing import split_data
-from evalml.problem_types import ProblemTypes, handle_problem_types, is_binary
+from evalml.problem_types import (
+    ProblemTypes,
+    handle_problem_types,
+    is_binary,
+    is_time_series
+)
 from evalml.tuners import SKOptTuner
 from evalml.utils import (
     _convert_woodwork_types_wrapper,
@@ -57,9 +82,15 @@ from evalml.utils.logger import (
     time_elapsed,
     update_pipeline
 )
+from evalml.utils.serialization_utils import (
+    load_from_directory,
+    save_to_directory
+)
 
 logger = get_logger(__file__)
 
+_MIN_BACKGROUND_FIT_TIMEOUT = 10
+
 
 class AutoMLSearch:
     """Automated Pipeline search."""
@@ -94,6 +125,19 @@ class AutoMLSearch:
                  problem_configuration=None,
                  train_best_pipeline=True,
                  pipeline_parameters=None,
+                 checkpoint_path=None,
+                 fold_pruning_tolerance=None,
+                 automl_algorithm='iterative',
+                 cost_aware=False,
+                 max_time_per_pipeline=None,
+                 max_memory_per_pipeline=None,
+                 record_peak_memory=False,
+                 trace_recorder=None,
+                 event_sinks=None,
+                 train_best_pipeline_in_background=False,
+                 max_background_fits=3,
+                 categorical_encoding="one_hot",
+                 early_stopping_rounds=None,
                  _pipelines_per_batch=5):
         """Automated pipeline search
 
@@ -170,6 +214,79 @@ class AutoMLSearch:
 
             train_best_pipeline (boolean): Whether or not to train the best pipeline before returning it. Defaults to True
 
+            checkpoint_path (str, None): Directory in which to checkpoint the progress of the search after every pipeline evaluation.
+                The checkpoint holds the search results, tuner states and batch position but not the training data, so it stays small.
+                Call `search(resume=True)` on a new AutoMLSearch created with the same arguments to continue an interrupted search.
+                Defaults to None, which disables checkpointing.
+
+            fold_pruning_tolerance (float, None): If set, stop cross validating a pipeline before its remaining folds once the mean score
+                of the folds evaluated so far is worse than the best score found so far by more than this fraction of the best score.
+                Pruned pipelines are ranked by the mean of their evaluated folds, which is also passed to the tuner, and are marked with
+                `pruned` in the results and rankings. Must be non-negative. Defaults to None, which evaluates every fold.
+
+            automl_algorithm (str): The automl algorithm which proposes pipelines. 'iterative' uses IterativeAlgorithm. 'hyperband' uses
+                HyperbandAlgorithm, which evaluates most tuner proposals with a fraction of their estimator's `n_estimators` and only
+                the best with the full number, so more proposals fit in the same time. HyperbandAlgorithm does not support ensembling,
+                and its batches vary in size, so `max_batches` only approximately limits the search. Defaults to 'iterative'.
+
+            cost_aware (boolean): If True, the automl algorithm predicts the training time of each pipeline type from the training times
+                of the first batch. Pipeline types are tuned cheapest first, and when `max_time` is set, tuning batches are shortened or
+                deferred if they are not expected to finish in the remaining time. If `tuner_class` supports the `cost_aware` argument, as
+                SKOptTuner does, the tuner also chooses parameters by expected improvement per second of training time. Only supported by
+                the 'iterative' automl algorithm. Defaults to False.
+
+            max_time_per_pipeline (int, float, str, None): Maximum time to spend evaluating a single pipeline. If set, each pipeline is
+                trained and scored in a child process, which is killed if the pipeline runs out of time or if it would run past `max_time`.
+                Pipelines which time out are recorded with NaN scores and `timed_out` set in their results. Defaults to None, which
+                evaluates pipelines in the search process without a time limit.
+
+            max_memory_per_pipeline (int, float, None): Maximum memory in megabytes a single pipeline evaluation may allocate. If set,
+                each pipeline is trained and scored in a child process whose address space is limited with `resource.setrlimit`, so a
+                pipeline which needs more memory fails with NaN scores without affecting the search. Because the limit applies to virtual
+                memory, it should leave headroom above the expected peak memory. Only supported on platforms with the `resource` module.
+                Defaults to None, for no limit.
+
+            record_peak_memory (boolean): Whether to record the peak memory of each pipeline evaluation as `peak_memory_mb` in its results.
+                Memory is sampled from a background thread while the pipeline is evaluated. Peak memory is always recorded when
+                `max_memory_per_pipeline` is set, and is NaN otherwise. Defaults to False.
+
+            trace_recorder (ChromeTraceRecorder, None): If set, records a timeline of each pipeline evaluation, its cross-validation folds
+                and every component operation within them, which can be saved with `trace_recorder.save` and opened in Perfetto or
+                chrome://tracing. Component operations are not recorded for pipelines evaluated in a child process, which happens when
+                `max_time_per_pipeline` or `max_memory_per_pipeline` is set. Defaults to None.
+
+            event_sinks (EventSink, list(EventSink), None): Destinations for structured events describing the progress of the search,
+                such as a `JSONLinesEventSink` or a `QueueEventSink`. Events are emitted when the search, a batch, a pipeline or a fold
+                starts, when a fold ends, when a pipeline is scored, on errors and when the search ends. See `EventSink` for the fields
+                of each event. Defaults to None.
+
+            train_best_pipeline_in_background (boolean): If True and `train_best_pipeline` is True, whenever a new pipeline takes the
+                lead during the search, it is trained on the full training data in a background process while the search continues,
+                and the training of the previous leader is cancelled. When the search ends, `best_pipeline` reuses the background fit
+                instead of training the best pipeline again. Each background fit runs in a new child process, which is forked from the
+                search process where the platform supports it. Forking while native thread pools such as BLAS or OpenMP are busy can
+                deadlock the child, so the number of background fits is limited by `max_background_fits`, and a background fit which has
+                not finished after as long as it took to evaluate the pipeline, or at least 10 seconds, is cancelled and the best
+                pipeline is trained after the search as usual. Defaults to False.
+
+            max_background_fits (int, None): Maximum number of leading pipelines to train in the background when
+                `train_best_pipeline_in_background` is True. Once reached, a pipeline which takes the lead later is trained after the
+                search as usual. None for no limit. Defaults to 3.
+
+            categorical_encoding (str): How the generated pipelines encode categorical features, "one_hot", "native" or "sparse_one_hot".
+                With "native", LightGBM and CatBoost handle categorical features themselves and XGBoost and the tree ensembles receive one
+                integer-coded column per feature instead of one column per category, which keeps high-cardinality data compact. With
+                "sparse_one_hot", the one-hot encodings stay in a sparse matrix for the estimators which support sparse input, which
+                are then not preceded by a `StandardScaler`. Only used when `allowed_pipelines` is None. See `make_pipeline`.
+                Defaults to "one_hot".
+
+            early_stopping_rounds (int, None): Number of rounds without improvement on a held-out 10% of their training data after
+                which the LightGBM, XGBoost and CatBoost estimators of the generated pipelines stop adding trees while pipelines are
+                evaluated. Not used for estimators whose `pipeline_parameters` already set early_stopping_rounds. Only used when
+                `allowed_pipelines` is None. Not supported for time series problem types, since the held-out rows are chosen at random.
+                The best pipeline is trained on all of the training data with early stopping turned off. None to train every tree.
+                Defaults to None.
+
             _pipelines_per_batch (int): The number of pipelines to train for every batch after the first one.
                 The first batch will train a baseline pipline + one of each pipeline family allowed in the search.
         """
@@ -218,6 +335,27 @@ class AutoMLSearch:
         if max_iterations is not None and max_iterations < 0:
             raise ValueError(f"Parameter max_iterations must be None or non-negative. Received {max_iterations}.")
         self.max_time = convert_to_seconds(max_time) if isinstance(max_time, str) else max_time
+        if not isinstance(max_time_per_pipeline, (int, float, str, type(None))):
+            raise TypeError(f"Parameter max_time_per_pipeline must be a float, int, string or None. Received {type(max_time_per_pipeline)} with value {str(max_time_per_pipeline)}.")
+        if isinstance(max_time_per_pipeline, (int, float)) and max_time_per_pipeline <= 0:
+            raise ValueError(f"Parameter max_time_per_pipeline must be None or positive. Received {max_time_per_pipeline}.")
+        self.max_time_per_pipeline = convert_to_seconds(max_time_per_pipeline) if isinstance(max_time_per_pipeline, str) else max_time_per_pipeline
+        if max_memory_per_pipeline is not None and (isinstance(max_memory_per_pipeline, bool) or
+                                                    not isinstance(max_memory_per_pipeline, (int, float)) or
+                                                    max_memory_per_pipeline <= 0):
+            raise ValueError(f"Parameter max_memory_per_pipeline must be None or a positive number of megabytes. Received {max_memory_per_pipeline}.")
+        if max_memory_per_pipeline is not None and importlib.util.find_spec("resource") is None:
+            raise ValueError("Parameter max_memory_per_pipeline requires the resource module, which is not available on this platform.")
+        self.max_memory_per_pipeline = max_memory_per_pipeline
+        self.record_peak_memory = record_peak_memory
+        self.trace_recorder = trace_recorder
+        if event_sinks is None:
+            event_sinks = []
+        elif isinstance(event_sinks, EventSink):
+            event_sinks = [event_sinks]
+        if not all(isinstance(sink, EventSink) for sink in event_sinks):
+            raise ValueError("Parameter event_sinks must be an EventSink or a list of EventSink instances.")
+        self._event_sinks = list(event_sinks)
         self.max_iterations = max_iterations
         self.max_batches = max_batches
         self._pipelines_per_batch = _pipelines_per_batch
@@ -234,9 +372,14 @@ class AutoMLSearch:
         self.patience = patience
         self.tolerance = tolerance or 0.0
 
+        if fold_pruning_tolerance is not None and fold_pruning_tolerance < 0:
+            raise ValueError(f"Parameter fold_pruning_tolerance must be None or non-negative. Received {fold_pruning_tolerance}.")
+        self.fold_pruning_tolerance = fold_pruning_tolerance
+
+        self._results_store = ResultsStore(greater_is_better=self.objective.greater_is_better)
         self._results = {
-            'pipeline_results': {},
-            'search_order': [],
+            'pipeline_results': self._results_store.pipeline_results,
+            'search_order': self._results_store.search_order,
             'errors': []
         }
         self.random_seed = deprecate_arg("random_state", "random_seed", random_state, random_seed)
@@ -260,6 +403,19 @@ class AutoMLSearch:
         self._validate_problem_type()
         self.problem_configuration = self._validate_problem_configuration(problem_configuration)
         self._train_best_pipeline = train_best_pipeline
+        self._background_trainer = None
+        if max_background_fits is not None and (isinstance(max_background_fits, bool) or not isinstance(max_background_fits, int) or
+                                                max_background_fits <= 0):
+            raise ValueError(f"Parameter max_background_fits must be None or a positive integer. Received {max_background_fits}.")
+        if categorical_encoding not in _CATEGORICAL_ENCODINGS:
+            raise ValueError(f"Invalid categorical_encoding {categorical_encoding}, must be one of {_CATEGORICAL_ENCODINGS}")
+        if early_stopping_rounds is not None and (isinstance(early_stopping_rounds, bool) or not isinstance(early_stopping_rounds, int) or
+                                                  early_stopping_rounds <= 0):
+            raise ValueError(f"Parameter early_stopping_rounds must be None or a positive integer. Received {early_stopping_rounds}.")
+        if early_stopping_rounds is not None and is_time_series(self.problem_type):
+            raise ValueError("Parameter early_stopping_rounds is not supported for time series problem types.")
+        if train_best_pipeline and train_best_pipeline_in_background:
+            self._background_trainer = BackgroundPipelineTrainer(self._fit_best_pipeline, max_starts=max_background_fits)
         self._best_pipeline = None
         self._searched = False
 
@@ -272,6 +428,11 @@ class AutoMLSearch:
         self.pipeline_parameters = pipeline_parameters if pipeline_parameters is not None else {}
         self.search_iteration_plot = None
         self._interrupted = False
+        self._checkpoint = SearchCheckpoint(checkpoint_path) if checkpoint_path is not None else None
+        self._current_batch = []
+        self._current_batch_start = 0
+        self._data_hash = None
+        self._evaluation_cache = {}
 
         self._engine = SequentialEngine(self.X_train,
                                         self.y_train,
@@ -284,12 +445,28 @@ class AutoMLSearch:
             logger.info("Generating pipelines to search over...")
             allowed_estimators = get_estimators(self.problem_type, self.allowed_model_families)
             logger.debug(f"allowed_estimators set to {[estimator.name for estimator in allowed_estimators]}")
-            self.allowed_pipelines = [make_pipeline(self.X_train, self.y_train, estimator, self.problem_type, custom_hyperparameters=self.pipeline_parameters) for estimator in allowed_estimators]
+            if early_stopping_rounds is not None:
+                self.pipeline_parameters = add_early_stopping_parameters(self.pipeline_parameters, allowed_estimators, early_stopping_rounds)
+            if categorical_encoding == "sparse_one_hot":
+                self.pipeline_parameters = _sparse_one_hot_parameters(self.pipeline_parameters)
+            self.allowed_pipelines = [make_pipeline(self.X_train, self.y_train, estimator, self.problem_type, custom_hyperparameters=self.pipeline_parameters,
+                                                    categorical_encoding=categorical_encoding) for estimator in allowed_estimators]
 
         if self.allowed_pipelines == []:
             raise ValueError("No allowed pipelines to search")
 
+        if automl_algorithm not in ('iterative', 'hyperband'):
+            raise ValueError(f"Parameter automl_algorithm must be 'iterative' or 'hyperband'. Received {automl_algorithm}.")
+        self.automl_algorithm = automl_algorithm
+
         run_ensembling = self.ensembling
+        if run_ensembling and automl_algorithm == 'hyperband':
+            logger.warning("Ensembling is set to True, but it is not supported by the hyperband automl algorithm, so ensembling will not run.")
+            run_ensembling = False
+        self.cost_aware = cost_aware
+        if self.cost_aware and automl_algorithm == 'hyperband':
+            logger.warning("Cost-aware search is set to True, but it is not supported by the hyperband automl algorithm, so it will not be used.")
+            self.cost_aware = False
         if run_ensembling and len(self.allowed_pipelines) == 1:
             logger.warning("Ensembling is set to True, but the number of unique pipelines is one, so ensembling will not run.")
             run_ensembling = False
@@ -327,21 +504,48 @@ class AutoMLSearch:
         else:
             pipeline_params = self.pipeline_parameters
 
-        self._automl_algorithm = IterativeAlgorithm(
-            max_iterations=self.max_iterations,
-            allowed_pipelines=self.allowed_pipelines,
-            tuner_class=self.tuner_class,
-            random_seed=self.random_seed,
-            n_jobs=self.n_jobs,
-            number_features=self.X_train.shape[1],
-            pipelines_per_batch=self._pipelines_per_batch,
-            ensembling=run_ensembling,
-            pipeline_params=pipeline_params
-        )
+        if automl_algorithm == 'hyperband':
+            self._automl_algorithm = HyperbandAlgorithm(
+                max_iterations=self.max_iterations,
+                allowed_pipelines=self.allowed_pipelines,
+                tuner_class=self.tuner_class,
+                random_seed=self.random_seed,
+                n_jobs=self.n_jobs,
+                number_features=self.X_train.shape[1],
+                pipeline_params=pipeline_params
+            )
+        else:
+            self._automl_algorithm = IterativeAlgorithm(
+                max_iterations=self.max_iterations,
+                allowed_pipelines=self.allowed_pipelines,
+                tuner_class=self.tuner_class,
+                random_seed=self.random_seed,
+                n_jobs=self.n_jobs,
+                number_features=self.X_train.shape[1],
+                pipelines_per_batch=self._pipelines_per_batch,
+                ensembling=run_ensembling,
+                pipeline_params=pipeline_params,
+                cost_aware=self.cost_aware
+            )
+
+    def _emit_event(self, event_type, **fields):
+        """Sends an event to each event sink. Does nothing if the search has no event sinks.
+
+        Arguments:
+            event_type (str): Type of the event.
+            **fields: Fields of the event.
+        """
+        if not self._event_sinks:
+            return
+        event = make_event(event_type, **fields)
+        for sink in self._event_sinks:
+            sink.emit(event)
 
     def _pre_evaluation_callback(self, pipeline):
         if self.start_iteration_callback:
             self.start_iteration_callback(pipeline.__class__, pipeline.parameters, self)
+        self._emit_event('pipeline_start', pipeline_name=pipeline.name, parameters=pipeline.parameters,
+                         pipeline_number=self._num_pipelines())
         desc = f"{pipeline.name}"
         if len(desc) > AutoMLSearch._MAX_NAME_LEN:
             desc = desc[:AutoMLSearch._MAX_NAME_LEN - 3] + "..."
@@ -466,7 +670,7 @@ class AutoMLSearch:
             else:
                 leading_char = ""
 
-    def search(self, data_checks="auto", show_iteration_plot=True):
+    def search(self, data_checks="auto", show_iteration_plot=True, resume=False, iteration_plot_refresh_interval=1.0):
         """Find the best pipeline for the data set.
 
         Arguments:
@@ -480,10 +684,23 @@ class AutoMLSearch:
 
             show_iteration_plot (boolean, True): Shows an iteration vs. score plot in Jupyter notebook.
                 Disabled by default in non-Jupyter enviroments.
+
+            resume (boolean): If True, continue the search from the checkpoint in `checkpoint_path`. Pipelines which were
+                already evaluated are not evaluated again, and time spent before the interruption counts towards `max_time`.
+                If no checkpoint has been written yet, the search starts from the beginning. If False and a checkpoint already
+                exists in `checkpoint_path`, a ValueError is raised rather than overwriting it. Defaults to False.
+
+            iteration_plot_refresh_interval (float): Minimum number of seconds between redraws of the iteration plot shown in
+                Jupyter notebooks. Pipelines evaluated in between are added to the plot at the next redraw. Defaults to 1.0.
         """
+        if resume and self._checkpoint is None:
+            raise ValueError("Cannot resume a search without a checkpoint_path.")
         if self._searched:
             logger.info("AutoMLSearch.search() has already been run and will not run again on the same instance. Re-initialize AutoMLSearch to search again.")
             return
+        if not resume and self._checkpoint is not None and self._checkpoint.exists():
+            raise ValueError(f"A checkpoint already exists at {self._checkpoint.path}. Call search(resume=True) to continue that search, "
+                             "or remove the checkpoint or pass another checkpoint_path to start a new search.")
 
         # don't show iteration plot outside of a jupyter notebook
         if show_iteration_plot:
@@ -516,24 +733,55 @@ class AutoMLSearch:
         logger.info("Allowed model families: %s\n" % ", ".join([model.value for model in self.allowed_model_families]))
         self.search_iteration_plot = None
         if self.plot:
-            self.search_iteration_plot = self.plot.search_iteration_plot(interactive_plot=show_iteration_plot)
-
-        self._start = time.time()
+            self.search_iteration_plot = self.plot.search_iteration_plot(interactive_plot=show_iteration_plot,
+                                                                         refresh_interval=iteration_plot_refresh_interval)
 
         try:
-            self._add_baseline_pipelines()
-        except KeyboardInterrupt:
-            if self._handle_keyboard_interrupt():
-                self._interrupted = True
+            self._search_loop(resume)
+        finally:
+            for sink in self._event_sinks:
+                sink.close()
+
+    def _search_loop(self, resume):
+        """Evaluates batches of pipelines until the search should stop, emitting the search_start and search_end events.
+
+        Arguments:
+            resume (boolean): Whether to resume from the checkpoint.
+        """
+        self._start = time.time()
+        self._emit_event('search_start', objective=self.objective.name, max_iterations=self.max_iterations,
+                         max_batches=self.max_batches, max_time=self.max_time)
 
         current_batch_pipelines = []
+        if resume and self._checkpoint.exists():
+            current_batch_pipelines = self._resume_from_checkpoint()
+        elif self._checkpoint is not None:
+            if resume:
+                logger.info(f"No checkpoint found at {self._checkpoint.path}, starting a new search.")
+            self._checkpoint.clear()
+
+        if not self._results['pipeline_results']:
+            try:
+                self._add_baseline_pipelines()
+            except KeyboardInterrupt:
+                if self._handle_keyboard_interrupt():
+                    self._interrupted = True
+
         current_batch_pipeline_scores = []
         new_pipeline_ids = []
-        loop_interrupted = False
+        # when resuming, finish the batch which was being evaluated before asking the algorithm for a new one
+        loop_interrupted = len(current_batch_pipelines) > 0
         while self._should_continue():
             try:
                 if not loop_interrupted:
+                    if self.max_time:
+                        self._automl_algorithm.time_remaining = max(0.0, self.max_time - (time.time() - self._start))
                     current_batch_pipelines = self._automl_algorithm.next_batch()
+                    self._current_batch = current_batch_pipelines
+                    self._current_batch_start = self._num_pipelines()
+                    self._emit_event('batch_start', batch_number=self._automl_algorithm.batch_number,
+                                     num_pipelines=len(current_batch_pipelines))
+                    self._write_checkpoint()
             except StopIteration:
                 logger.info('AutoML Algorithm out of recommendations, ending')
                 break
@@ -544,13 +792,17 @@ class AutoMLSearch:
                 loop_interrupted = True
                 if self._handle_keyboard_interrupt():
                     break
-            full_rankings = self.full_rankings
-            current_batch_idx = full_rankings['id'].isin(new_pipeline_ids)
-            current_batch_pipeline_scores = full_rankings[current_batch_idx]['score']
+            # pipelines which ran out of time say nothing about whether the search is set up correctly
+            current_batch_pipeline_scores = pd.Series([self._results['pipeline_results'][pipeline_id]['score']
+                                                       for pipeline_id in new_pipeline_ids
+                                                       if not self._results['pipeline_results'][pipeline_id]['timed_out']],
+                                                      dtype='float64')
             if len(current_batch_pipeline_scores) and current_batch_pipeline_scores.isna().all():
                 raise AutoMLSearchException(f"All pipelines in the current AutoML batch produced a score of np.nan on the primary objective {self.objective}.")
 
         self.search_duration = time.time() - self._start
+        if isinstance(self.search_iteration_plot, SearchIterationPlot):
+            self.search_iteration_plot.update(force=True)
         elapsed_time = time_elapsed(self._start)
         desc = f"\nSearch finished after {elapsed_time}"
         desc = desc.ljust(self._MAX_NAME_LEN)
@@ -563,26 +815,186 @@ class AutoMLSearch:
             logger.info(f"Best pipeline: {best_pipeline_name}")
             logger.info(f"Best pipeline {self.objective.name}: {best_pipeline['score']:3f}")
         self._searched = True
+        if self._event_sinks:
+            rankings = self.rankings
+            self._emit_event('search_end', search_duration=self.search_duration,
+                             best_pipeline_id=None if rankings.empty else int(rankings.iloc[0]['id']),
+                             best_score=None if rankings.empty else rankings.iloc[0]['score'],
+                             interrupted=self._interrupted)
+
+    def _write_checkpoint(self, pipeline_id=None):
+        """Checkpoints the search state if a checkpoint_path was provided.
+
+        Arguments:
+            pipeline_id (int, None): ID of a newly evaluated pipeline, whose results are appended to the checkpoint.
+        """
+        if self._checkpoint is None:
+            return
+        if pipeline_id is not None:
+            self._checkpoint.append_result(self._results['pipeline_results'][pipeline_id])
+        self._checkpoint.write_state({
+            "num_results": self._num_pipelines(),
+            "problem_type": self.problem_type.value,
+            "objective": self.objective.name,
+            "random_seed": self.random_seed,
+            "data_hash": self._get_data_hash(),
+            "automl_algorithm": self._automl_algorithm,
+            "baseline_cv_scores": self._baseline_cv_scores,
+            "elapsed_time": time.time() - self._start if self._start else 0.0,
+            "current_batch": self._current_batch,
+            "current_batch_start": self._current_batch_start,
+            "errors": self._results['errors']
+        })
+
+    def _resume_from_checkpoint(self):
+        """Restores the search state from the checkpoint.
+
+        Returns:
+            list(PipelineBase): The pipelines from the batch which was being evaluated when the checkpoint was written that have not been evaluated yet.
+        """
+        state, pipeline_results = self._checkpoint.load()
+        expected = {"problem_type": self.problem_type.value,
+                    "objective": self.objective.name,
+                    "random_seed": self.random_seed,
+                    "data_hash": self._get_data_hash()}
+        for key, value in expected.items():
+            if state[key] != value:
+                raise ValueError(f"Checkpoint at {self._checkpoint.path} was written by a search with {key} {state[key]}, "
+                                 f"which does not match this search's {key} {value}.")
+        for result in pipeline_results:
+            self._results_store.add(result)
+            self._cache_evaluation(result['pipeline_class'], result['parameters'], self.random_seed, result)
+        self._automl_algorithm = state["automl_algorithm"]
+        self._baseline_cv_scores = state["baseline_cv_scores"]
+        self._results['errors'] = list(state["errors"])
+        self._start = time.time() - state["elapsed_time"]
+        num_evaluated = self._num_pipelines() - state["current_batch_start"]
+        self._current_batch = state["current_batch"][max(num_evaluated, 0):]
+        self._current_batch_start = self._num_pipelines()
+        logger.info(f"Resuming search from checkpoint at {self._checkpoint.path} with {self._num_pipelines()} pipelines already evaluated.")
+        return self._current_batch
+
+    def _get_data_hash(self):
+        if self._data_hash is None:
+            self._data_hash = data_fingerprint(_convert_woodwork_types_wrapper(self.X_train.to_dataframe()),
+                                               _convert_woodwork_types_wrapper(self.y_train.to_series()))
+        return self._data_hash
+
+    def _evaluation_key(self, pipeline_class, parameters, random_seed):
+        return evaluation_key(pipeline_class, parameters, random_seed, self._get_data_hash())
+
+    def _cache_evaluation(self, pipeline_class, parameters, random_seed, pipeline_results):
+        # timed out evaluations are not reused, because the time limit may have been shortened by max_time
+        if pipeline_results.get('timed_out', False):
+            return
+        self._evaluation_cache.setdefault(self._evaluation_key(pipeline_class, parameters, random_seed), pipeline_results['id'])
+
+    def _get_cached_evaluation(self, pipeline):
+        """Looks up a previous evaluation of the same pipeline class with the same parameters and random seed on the same data.
+
+        Arguments:
+            pipeline (PipelineBase): The pipeline about to be evaluated.
+
+        Returns:
+            dict, None: Evaluation results in the format returned by `EngineBase.train_and_score_pipeline`, reusing the scores of the
+                previous evaluation, or None if the pipeline has not been evaluated before.
+        """
+        pipeline_id = self._evaluation_cache.get(self._evaluation_key(type(pipeline), pipeline.parameters, pipeline.random_seed))
+        if pipeline_id is None:
+            return None
+        pipeline_results = self._results['pipeline_results'][pipeline_id]
+        logger.info(f"\tReusing the scores of pipeline {pipeline_id}, which was evaluated with the same parameters")
+        cv_data = copy.deepcopy(pipeline_results['cv_data'])
+        cv_scores = pd.Series([fold['score'] for fold in cv_data])
+        return {'cv_data': cv_data, 'training_time': 0.0, 'peak_memory_mb': np.nan, 'cv_scores': cv_scores,
+                'cv_score_mean': cv_scores.mean(), 'pruned': pipeline_results.get('pruned', False)}
+
+    def _get_pipeline_time_limit(self):
+        """The time in seconds the next pipeline may take to evaluate, or None if there is no limit.
+
+        Returns:
+            float or None: The smaller of `max_time_per_pipeline` and the time remaining before `max_time`, if `max_time_per_pipeline` is set.
+        """
+        if self.max_time_per_pipeline is None:
+            return None
+        time_limit = self.max_time_per_pipeline
+        if self.max_time and self._start and not self._searched:
+            time_limit = min(time_limit, max(0.0, self.max_time - (time.time() - self._start)))
+        return time_limit
+
+    def _should_prune_pipeline(self, pipeline, cv_data):
+        """Whether to skip the remaining cross validation folds of a pipeline, given the scores of the folds evaluated so far.
+
+        Arguments:
+            pipeline (PipelineBase): The pipeline being evaluated.
+            cv_data (list(dict)): The results of the folds evaluated so far.
+
+        Returns:
+            bool: True if the pipeline's mean score so far is worse than the best score by more than `fold_pruning_tolerance`.
+        """
+        if self.fold_pruning_tolerance is None or pipeline.model_family == ModelFamily.BASELINE or not cv_data:
+            return False
+        best_pipeline_id = self._results_store.best_id
+        if best_pipeline_id is None:
+            return False
+        best_score = self._results['pipeline_results'][best_pipeline_id]['score']
+        partial_score = pd.Series([fold['score'] for fold in cv_data], dtype='float64').mean()
+        if pd.isnull(best_score) or pd.isnull(partial_score):
+            return False
+        margin = self.fold_pruning_tolerance * abs(best_score)
+        if self.objective.greater_is_better:
+            return partial_score < best_score - margin
+        return partial_score > best_score + margin
 
     def _find_best_pipeline(self):
         """Finds the best pipeline in the rankings
         If self._best_pipeline already exists, check to make sure it is different from the current best pipeline before training and thresholding"""
-        if len(self.rankings) == 0:
+        best_pipeline_id = self._results_store.best_id
+        if best_pipeline_id is None:
             return
-        best_pipeline = self.rankings.iloc[0]
-        if not (self._best_pipeline and self._best_pipeline == self.get_pipeline(best_pipeline['id'])):
-            self._best_pipeline = self.get_pipeline(best_pipeline['id'])
+        best_pipeline = remove_early_stopping(self.get_pipeline(best_pipeline_id))
+        if not (self._best_pipeline and self._best_pipeline == best_pipeline):
+            self._best_pipeline = best_pipeline
             if self._train_best_pipeline:
-                X_threshold_tuning = None
-                y_threshold_tuning = None
-                X_train, y_train = self.X_train, self.y_train
-                if is_binary(self.problem_type) and self.objective.is_defined_for_problem_type(self.problem_type) \
-                   and self.optimize_thresholds and self.objective.can_optimize_threshold:
-                    X_train, X_threshold_tuning, y_train, y_threshold_tuning = split_data(X_train, y_train, self.problem_type,
-                                                                                          test_size=0.2,
-                                                                                          random_seed=self.random_seed)
-                self._best_pipeline.fit(X_train, y_train)
-                tune_binary_threshold(self._best_pipeline, self.objective, self.problem_type, X_threshold_tuning, y_threshold_tuning)
+                trained_pipeline = None
+                if self._background_trainer is not None:
+                    # cross-validation fit the pipeline once per fold, so a background fit which takes longer than the whole evaluation
+                    # is most likely stuck
+                    timeout = max(self._results['pipeline_results'][best_pipeline_id]['training_time'], _MIN_BACKGROUND_FIT_TIMEOUT)
+                    trained_pipeline = self._background_trainer.result(best_pipeline_id, timeout=timeout)
+                    self._background_trainer.cancel()
+                if trained_pipeline is not None:
+                    self._best_pipeline = trained_pipeline
+                else:
+                    self._fit_best_pipeline(self._best_pipeline)
+
+    def _fit_best_pipeline(self, pipeline):
+        """Fits a pipeline on the full training data, tuning its binary classification threshold if applicable.
+
+        Arguments:
+            pipeline (PipelineBase): The pipeline to fit.
+
+        Returns:
+            PipelineBase: The fitted pipeline.
+        """
+        X_threshold_tuning = None
+        y_threshold_tuning = None
+        X_train, y_train = self.X_train, self.y_train
+        if is_binary(self.problem_type) and self.objective.is_defined_for_problem_type(self.problem_type) \
+           and self.optimize_thresholds and self.objective.can_optimize_threshold:
+            X_train, X_threshold_tuning, y_train, y_threshold_tuning = split_data(X_train, y_train, self.problem_type,
+                                                                                  test_size=0.2,
+                                                                                  random_seed=self.random_seed)
+        pipeline.fit(X_train, y_train)
+        tune_binary_threshold(pipeline, self.objective, self.problem_type, X_threshold_tuning, y_threshold_tuning)
+        return pipeline
+
+    def _update_background_training(self):
+        """Starts training the best pipeline in the background if it has changed since the last result."""
+        best_pipeline_id = self._results_store.best_id
+        if best_pipeline_id is not None and best_pipeline_id != self._background_trainer.key:
+            if self._background_trainer.start(best_pipeline_id, remove_early_stopping(self.get_pipeline(best_pipeline_id))):
+                logger.debug(f"Training new best pipeline {best_pipeline_id} in the background")
 
     def _num_pipelines(self):
         """Return the number of pipeline evaluations which have been made
@@ -710,7 +1122,7 @@ class AutoMLSearch:
             high_variance_cv = True
 
         pipeline_id = len(self._results['pipeline_results'])
-        self._results['pipeline_results'][pipeline_id] = {
+        self._results_store.add({
             "id": pipeline_id,
             "pipeline_name": pipeline_name,
             "pipeline_class": type(pipeline),
@@ -718,13 +1130,20 @@ class AutoMLSearch:
             "parameters": pipeline.parameters,
             "score": cv_score,
             "high_variance_cv": high_variance_cv,
+            "pruned": evaluation_results.get('pruned', False),
+            "timed_out": evaluation_results.get('timed_out', False),
             "training_time": training_time,
+            "peak_memory_mb": evaluation_results.get('peak_memory_mb', np.nan),
             "cv_data": cv_data,
             "percent_better_than_baseline_all_objectives": percent_better_than_baseline,
             "percent_better_than_baseline": percent_better_than_baseline[self.objective.name],
             "validation_score": cv_scores[0]
-        }
-        self._results['search_order'].append(pipeline_id)
+        })
+        self._cache_evaluation(type(pipeline), pipeline.parameters, pipeline.random_seed, self._results['pipeline_results'][pipeline_id])
+        self._emit_event('score', id=pipeline_id, pipeline_name=pipeline_name, score=cv_score, training_time=training_time,
+                         peak_memory_mb=evaluation_results.get('peak_memory_mb', np.nan), pruned=evaluation_results.get('pruned', False),
+                         timed_out=evaluation_results.get('timed_out', False),
+                         percent_better_than_baseline=percent_better_than_baseline[self.objective.name])
 
         if not is_baseline:
             score_to_minimize = -cv_score if self.objective.greater_is_better else cv_score
@@ -732,8 +1151,11 @@ class AutoMLSearch:
                 self._automl_algorithm.add_result(score_to_minimize, pipeline, self._results['pipeline_results'][pipeline_id])
             except PipelineNotFoundError:
                 pass
+        self._write_checkpoint(pipeline_id)
+        if self._background_trainer is not None and self._start and not self._searched:
+            self._update_background_training()
 
-        if self.search_iteration_plot:
+        if isinstance(self.search_iteration_plot, SearchIterationPlot):
             self.search_iteration_plot.update()
 
         if self.add_result_callback:
@@ -750,7 +1172,7 @@ class AutoMLSearch:
         Returns:
             PipelineBase: untrained pipeline instance associated with the provided ID
         """
-        pipeline_results = self.results['pipeline_results'].get(pipeline_id)
+        pipeline_results = self._results['pipeline_results'].get(pipeline_id)
         if pipeline_results is None:
             raise PipelineNotFoundError("Pipeline not found in automl results")
         pipeline_class = pipeline_results.get('pipeline_class')
@@ -819,10 +1241,8 @@ class AutoMLSearch:
         Arguments:
             pipeline (PipelineBase): pipeline to train and evaluate.
         """
-        pipeline_rows = self.full_rankings[self.full_rankings['pipeline_name'] == pipeline.name]
-        for parameter in pipeline_rows['parameters']:
-            if pipeline.parameters == parameter:
-                return
+        if self._results_store.contains(pipeline.name, pipeline.parameters):
+            return
 
         self._engine.evaluate_batch([pipeline])
         self._find_best_pipeline()
@@ -831,10 +1251,19 @@ class AutoMLSearch:
     def results(self):
         """Class that allows access to a copy of the results from `automl_search`.
 
+           The copy is shallow: the dicts and lists of the results and the result dict of each pipeline are copied, but values nested
+           in a pipeline's results, such as its `cv_data` and `parameters`, are shared with the search and must not be modified. Use
+           `copy.deepcopy` on the results for a copy which is fully independent of the search.
+
            Returns: dict containing `pipeline_results`: a dict with results from each pipeline,
                     and `search_order`: a list describing the order the pipelines were searched.
            """
-        return copy.deepcopy(self._results)
+        return {
+            'pipeline_results': {pipeline_id: dict(pipeline_results)
+                                 for pipeline_id, pipeline_results in self._results['pipeline_results'].items()},
+            'search_order': list(self._results['search_order']),
+            'errors': list(self._results['errors'])
+        }
 
     @property
     def rankings(self):
@@ -844,20 +1273,7 @@ class AutoMLSearch:
     @property
     def full_rankings(self):
         """Returns a pandas.DataFrame with scoring results from all pipelines searched"""
-        ascending = True
-        if self.objective.greater_is_better:
-            ascending = False
-
-        full_rankings_cols = ["id", "pipeline_name", "score", "validation_score",
-                              "percent_better_than_baseline", "high_variance_cv", "parameters"]
-        if not self._results['pipeline_results']:
-            return pd.DataFrame(columns=full_rankings_cols)
-
-        rankings_df = pd.DataFrame(self._results['pipeline_results'].values())
-        rankings_df = rankings_df[full_rankings_cols]
-        rankings_df.sort_values("score", ascending=ascending, inplace=True)
-        rankings_df.reset_index(drop=True, inplace=True)
-        return rankings_df
+        return self._results_store.full_rankings()
 
     @property
     def best_pipeline(self):
@@ -871,28 +1287,44 @@ class AutoMLSearch:
 
         return self._best_pipeline
 
-    def save(self, file_path, pickle_protocol=cloudpickle.DEFAULT_PROTOCOL):
+    def save(self, file_path, pickle_protocol=cloudpickle.DEFAULT_PROTOCOL, format="pickle"):
         """Saves AutoML object at file path
 
         Arguments:
             file_path (str): location to save file
             pickle_protocol (int): the pickle data stream format.
+            format (str): "pickle" to save to a single cloudpickle file, or "directory" to save to a directory where
+                large arrays, such as the training data and fitted model arrays, are stored as separate .npy files which
+                can be memory-mapped by `load`. Defaults to "pickle".
 
         Returns:
             None
         """
+        if format == "directory":
+            metadata = {"object_type": "automl",
+                        "problem_type": str(self.problem_type),
+                        "objective": self.objective.name,
+                        "num_pipelines": self._num_pipelines()}
+            save_to_directory(self, file_path, metadata=metadata, pickle_protocol=pickle_protocol)
+            return
+        if format != "pickle":
+            raise ValueError(f"Unknown format '{format}'. Valid formats are 'pickle' and 'directory'.")
         with open(file_path, 'wb') as f:
             cloudpickle.dump(self, f, protocol=pickle_protocol)
 
     @staticmethod
-    def load(file_path):
+    def load(file_path, mmap_mode="r"):
         """Loads AutoML object at file path
 
         Arguments:
             file_path (str): location to find file to load
+            mmap_mode (str, None): Only used for searches saved with format="directory". Memory-map mode for the stored
+                arrays. If None, arrays are read into memory. Defaults to "r".
 
         Returns:
             AutoSearchBase object
         """
+        if os.path.isdir(str(file_path)):
+            return load_from_directory(file_path, mmap_mode=mmap_mode)
         with open(file_path, 'rb') as f:
             return cloudpickle.load(f)
@@ -0,0 +1,137 @@
+import time
+
+import cloudpickle
+
+from evalml.automl.engine.engine_base import (
+    _child_process_arguments,
+    _get_multiprocessing_context,
+    _load_child_process_arguments
+)
+from evalml.utils.logger import get_logger
+
+logger = get_logger(__file__)
+
+_POLL_INTERVAL = 0.1
+
+
+def _fit_in_child(connection, arguments):
+    """Entry point of the child process started by `BackgroundPipelineTrainer.start`."""
+    try:
+        fit_function, pipeline = _load_child_process_arguments(arguments)
+        message = ('result', fit_function(pipeline))
+    except Exception as e:
+        message = ('error', f"{type(e).__name__}: {e}")
+    try:
+        # cloudpickle, so that pipeline classes defined at runtime can be sent back
+        connection.send_bytes(cloudpickle.dumps(message))
+    finally:
+        connection.close()
+
+
+class BackgroundPipelineTrainer:
+    """Fits one pipeline at a time in a child process, so that a search can keep evaluating pipelines while it trains.
+
+    Starting a new fit kills the one in progress, which is how fits of a pipeline that is no longer needed are cancelled.
+
+    Where available, the child process is started by forking the current process. Forking a process while native thread pools, such
+    as those of BLAS or OpenMP, hold locks can deadlock the child, so every fit started is a risk; `max_starts` bounds how many
+    processes are forked, and `result` stops waiting for a fit which takes longer than a timeout. Where forking is not available,
+    the fit function and the pipeline are sent to the child process with cloudpickle.
+    """
+
+    def __init__(self, fit_function, max_starts=None):
+        """Fits one pipeline at a time in a child process.
+
+        Arguments:
+            fit_function (callable): Function which takes an untrained pipeline, fits it and returns it. Runs in the child process.
+            max_starts (int, None): Maximum number of fits to start. Once reached, `start` only cancels the fit in progress.
+                Defaults to None, for no limit.
+        """
+        self.fit_function = fit_function
+        self.max_starts = max_starts
+        self.num_starts = 0
+        self.key = None
+        self._process = None
+        self._connection = None
+        self._start_time = None
+
+    def start(self, key, pipeline):
+        """Starts fitting a pipeline, cancelling the fit in progress.
+
+        Arguments:
+            key: Identifies the pipeline being fit, for example its ID in the search results.
+            pipeline (PipelineBase): The untrained pipeline to fit.
+
+        Returns:
+            bool: Whether the fit was started, which is False once `max_starts` fits have been started.
+        """
+        self.cancel()
+        if self.max_starts is not None and self.num_starts >= self.max_starts:
+            return False
+        self.num_starts += 1
+        context = _get_multiprocessing_context()
+        parent_connection, child_connection = context.Pipe(duplex=False)
+        arguments = _child_process_arguments(context, self.fit_function, pipeline)
+        self._process = context.Process(target=_fit_in_child, args=(child_connection, arguments), daemon=True)
+        self._process.start()
+        child_connection.close()
+        self._connection = parent_connection
+        self._start_time = time.time()
+        self.key = key
+        return True
+
+    def cancel(self):
+        """Stops the fit in progress, if any."""
+        if self._process is not None:
+            if self._process.is_alive():
+                self._process.kill()
+            self._process.join()
+            self._connection.close()
+        self._process = None
+        self._connection = None
+        self._start_time = None
+        self.key = None
+
+    def result(self, key, timeout=None):
+        """Waits for the fit of a pipeline to finish and returns the fitted pipeline.
+
+        Arguments:
+            key: Identifies the pipeline, as passed to `start`.
+            timeout (float, None): Maximum number of seconds the fit may take, counted from when it was started. If the fit has not
+                finished by then, it is cancelled. Defaults to None, for no limit.
+
+        Returns:
+            PipelineBase or None: The fitted pipeline, or None if that pipeline is not being fit, if fitting it failed or if it did not
+                finish in time.
+        """
+        if self._process is None or key != self.key:
+            return None
+        try:
+            status, value = self._wait_for_result(timeout)
+        finally:
+            self.cancel()
+        if status == 'error':
+            logger.warning(f"Training the best pipeline in the background failed: {value}")
+            return None
+        return value
+
+    def _wait_for_result(self, timeout):
+        while not self._connection.poll(_POLL_INTERVAL):
+            if not self._process.is_alive() and not self._connection.poll():
+                return 'error', self._exit_message()
+            if timeout is not None and time.time() - self._start_time > timeout:
+                return 'error', f"the fit did not finish within {timeout:.1f} seconds"
+        try:
+            return cloudpickle.loads(self._connection.recv_bytes())
+        except EOFError:
+            self._process.join(_POLL_INTERVAL)
+            return 'error', self._exit_message()
+
+    def _exit_message(self):
+        return f"the process stopped unexpectedly with exit code {self._process.exitcode}"
+
+    def __getstate__(self):
+        # processes and connections cannot be pickled, so a saved search has no fit in progress
+        state = self.__dict__.copy()
+        state.update({'key': None, '_process': None, '_connection': None, '_start_time': None})
+        return state
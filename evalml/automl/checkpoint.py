@@ -0,0 +1,98 @@
+import os
+import pickle
+
+import cloudpickle
+
+_STATE_FILE = "state.pkl"
+_RESULTS_FILE = "results.pkl"
+_FORMAT_VERSION = 2
+
+
+class SearchCheckpoint:
+    """On-disk store used by AutoMLSearch to checkpoint the progress of a search so that it can be resumed.
+
+    The store is a directory holding two files. `results.pkl` is an append-only log with one pickled record per
+    evaluated pipeline, so recording a new result does not rewrite the results which came before it. `state.pkl`
+    holds the remaining search state (the automl algorithm including its tuners, the batch being evaluated, the errors
+    recorded by the error callback and the elapsed search time) and is replaced atomically each time it is written. The training data is never stored.
+    """
+
+    def __init__(self, path):
+        """On-disk store for AutoMLSearch checkpoints.
+
+        Arguments:
+            path (str): Location of the checkpoint directory. Will be created when the first checkpoint is written.
+        """
+        self.path = str(path)
+        self._state_path = os.path.join(self.path, _STATE_FILE)
+        self._results_path = os.path.join(self.path, _RESULTS_FILE)
+
+    def exists(self):
+        """Whether a checkpoint has been written to this location.
+
+        Returns:
+            bool: True if a checkpoint exists.
+        """
+        return os.path.exists(self._state_path)
+
+    def clear(self):
+        """Removes any checkpoint previously written to this location."""
+        for file_path in (self._state_path, self._results_path):
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+    def append_result(self, pipeline_result):
+        """Appends a single pipeline evaluation result to the results log.
+
+        Arguments:
+            pipeline_result (dict): A pipeline result, as stored in AutoMLSearch.results['pipeline_results'].
+        """
+        os.makedirs(self.path, exist_ok=True)
+        with open(self._results_path, "ab") as f:
+            cloudpickle.dump(pipeline_result, f)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def write_state(self, state):
+        """Writes the search state, replacing the previous state atomically.
+
+        Arguments:
+            state (dict): The search state. Must include `num_results`, the number of results in the results log
+                which the state corresponds to.
+        """
+        os.makedirs(self.path, exist_ok=True)
+        state = {"format_version": _FORMAT_VERSION, **state}
+        tmp_path = self._state_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            cloudpickle.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._state_path)
+
+    def load(self):
+        """Loads the checkpointed search state and results.
+
+        Results which were appended after the state was last written, for instance because the search was killed in
+        between the two writes, are discarded and removed from the log so that the results and the state are consistent.
+
+        Returns:
+            (dict, list(dict)): The search state and the list of pipeline results, in the order they were recorded.
+        """
+        if not self.exists():
+            raise ValueError(f"No AutoMLSearch checkpoint found at {self.path}")
+        with open(self._state_path, "rb") as f:
+            state = pickle.load(f)
+        if state.get("format_version") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported checkpoint format version {state.get('format_version')} in {self.path}")
+        num_results = state["num_results"]
+        results = []
+        if num_results:
+            with open(self._results_path, "rb") as f:
+                while len(results) < num_results:
+                    results.append(pickle.load(f))
+                end_of_results = f.tell()
+            with open(self._results_path, "r+b") as f:
+                f.truncate(end_of_results)
+        elif os.path.exists(self._results_path):
+            os.remove(self._results_path)
+        return state, results
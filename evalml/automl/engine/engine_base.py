@@ -1,12 +1,18 @@
+import multiprocessing
 import sys
+import threading
 import time
 import traceback
 from abc import ABC, abstractmethod
 from collections import OrderedDict
 
+import cloudpickle
 import numpy as np
 import pandas as pd
 
+import psutil
+
+from evalml.automl.events import _ListEventSink
 from evalml.automl.utils import tune_binary_threshold
 from evalml.exceptions import PipelineScoreError
 from evalml.model_family import ModelFamily
@@ -15,8 +21,137 @@ from evalml.problem_types import is_binary, is_multiclass
 from evalml.utils.logger import get_logger
 from evalml.utils.woodwork_utils import _convert_woodwork_types_wrapper
 
+try:
+    import resource
+except ImportError:
+    resource = None
+
 logger = get_logger(__file__)
 
+_BYTES_PER_MB = 1024 ** 2
+
+
+class _PeakMemoryMonitor:
+    """Measures the peak resident memory of the current process while it is running, relative to when it was started.
+
+    The resident set size is sampled from a background thread, so memory allocated by native code such as LightGBM or XGBoost is
+    counted too. Allocations shorter than the sampling interval may be missed.
+    """
+
+    def __init__(self, interval=0.02):
+        self._interval = interval
+        self._process = psutil.Process()
+        self._stop = threading.Event()
+        self._thread = None
+        self._start_rss = 0
+        self._peak_rss = 0
+
+    def _sample(self):
+        self._peak_rss = max(self._peak_rss, self._process.memory_info().rss)
+
+    def _run(self):
+        while not self._stop.wait(self._interval):
+            self._sample()
+
+    def __enter__(self):
+        self._start_rss = self._peak_rss = self._process.memory_info().rss
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+    @property
+    def peak_memory_mb(self):
+        """The peak resident memory in megabytes above the resident memory when the monitor was started."""
+        return (self._peak_rss - self._start_rss) / _BYTES_PER_MB
+
+
+def _limit_memory(memory_limit):
+    """Limits the address space of the current process to its current size plus memory_limit megabytes."""
+    _, hard_limit = resource.getrlimit(resource.RLIMIT_AS)
+    soft_limit = psutil.Process().memory_info().vms + int(memory_limit * _BYTES_PER_MB)
+    if hard_limit != resource.RLIM_INFINITY:
+        soft_limit = min(soft_limit, hard_limit)
+    resource.setrlimit(resource.RLIMIT_AS, (soft_limit, hard_limit))
+
+
+class _ErrorCollector:
+    """Error callback used in the child process started by `EngineBase.train_and_score_pipeline_with_limits`. It collects the errors,
+    which are sent back to the search process and passed to the search's error callback there, since changes the callback makes to
+    the search in the child process would be lost."""
+
+    def __init__(self):
+        self.errors = []
+
+    def __call__(self, exception, traceback, automl, fold_num, pipeline):
+        self.errors.append((exception, traceback, fold_num))
+
+
+def _train_and_score_pipeline_in_child(connection, arguments):
+    """Entry point of the child process started by `EngineBase.train_and_score_pipeline_with_limits`."""
+    pipeline, automl, full_X_train, full_y_train, memory_limit = _load_child_process_arguments(arguments)
+    # events emitted and errors caught in the child are collected and sent back to the search, which passes them on to its
+    # event sinks and error callback
+    event_sink = None
+    if automl._event_sinks:
+        event_sink = _ListEventSink()
+        automl._event_sinks = [event_sink]
+    error_collector = None
+    if automl.error_callback is not None:
+        error_collector = _ErrorCollector()
+        automl.error_callback = error_collector
+    try:
+        if memory_limit is not None:
+            _limit_memory(memory_limit)
+        message = ('result', EngineBase.train_and_score_pipeline(pipeline, automl, full_X_train, full_y_train))
+    except BaseException as e:
+        message = ('error', e)
+    events = event_sink.events if event_sink is not None else []
+    errors = error_collector.errors if error_collector is not None else []
+    try:
+        connection.send(message + (events, errors))
+    except Exception:
+        # an exception could not be pickled
+        if message[0] == 'error':
+            message = ('error', _picklable_exception(message[1]))
+        errors = [(_picklable_exception(exception), tb, fold_num) for exception, tb, fold_num in errors]
+        connection.send(message + (events, errors))
+    finally:
+        connection.close()
+
+
+def _picklable_exception(exception):
+    return RuntimeError(f"{type(exception).__name__}: {exception}")
+
+
+def _get_multiprocessing_context():
+    # forking shares the search and the training data with the child process without copying or pickling them
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+
+def _child_process_arguments(context, *args):
+    """Prepares arguments to pass to a child process started from a multiprocessing context.
+
+    Forked child processes receive the arguments without pickling them. Otherwise the arguments are sent to the child as cloudpickle
+    bytes, since multiprocessing pickles them with the standard pickle module, which cannot pickle pipeline classes defined at
+    runtime, such as those generated by `make_pipeline`. Load them in the child with `_load_child_process_arguments`.
+    """
+    if context.get_start_method() == 'fork':
+        return args
+    return cloudpickle.dumps(args)
+
+
+def _load_child_process_arguments(arguments):
+    if isinstance(arguments, bytes):
+        return cloudpickle.loads(arguments)
+    return arguments
+
 
 class EngineBase(ABC):
     """Base class for the engine API which handles the fitting and evaluation of pipelines during AutoML."""
@@ -61,10 +196,26 @@ class EngineBase(ABC):
             full_y_train (ww.DataColumn): training target
 
         Returns:
-            dict: a dict containing cv_score_mean, cv_scores, training_time and a cv_data structure with details.
+            dict: a dict containing cv_score_mean, cv_scores, training_time, peak_memory_mb, a cv_data structure with details and pruned,
+                which is True if the remaining folds were skipped because the automl search's fold pruning determined the pipeline could not
+                be competitive. peak_memory_mb is the peak resident memory of the process during the evaluation, in megabytes above the
+                memory in use before it started, or NaN unless the automl search records peak memory or limits memory per pipeline. If the
+                automl search has a trace_recorder, each fold in cv_data includes the component_profile of the pipeline trained on that fold.
         """
+        if not (automl.record_peak_memory or automl.max_memory_per_pipeline is not None):
+            evaluation_result = EngineBase._train_and_score_pipeline(pipeline, automl, full_X_train, full_y_train)
+            evaluation_result['peak_memory_mb'] = np.nan
+            return evaluation_result
+        with _PeakMemoryMonitor() as memory_monitor:
+            evaluation_result = EngineBase._train_and_score_pipeline(pipeline, automl, full_X_train, full_y_train)
+        evaluation_result['peak_memory_mb'] = memory_monitor.peak_memory_mb
+        return evaluation_result
+
+    @staticmethod
+    def _train_and_score_pipeline(pipeline, automl, full_X_train, full_y_train):
         start = time.time()
         cv_data = []
+        pruned = False
         logger.info("\tStarting cross validation")
         X_pd = _convert_woodwork_types_wrapper(full_X_train.to_dataframe())
         y_pd = _convert_woodwork_types_wrapper(full_y_train.to_series())
@@ -73,7 +224,13 @@ class EngineBase(ABC):
                 # Stacked ensembles do CV internally, so we do not run CV here for performance reasons.
                 logger.debug(f"Skipping fold {i} because CV for stacked ensembles is not supported.")
                 break
+            if automl._should_prune_pipeline(pipeline, cv_data):
+                logger.info(f"\tPruning remaining folds from fold {i} because the mean {automl.objective.name} so far is not competitive")
+                pruned = True
+                break
             logger.debug(f"\t\tTraining and scoring on fold {i}")
+            fold_start = time.time()
+            automl._emit_event('fold_start', pipeline_name=pipeline.name, fold=i, training_rows=len(train))
             X_train, X_valid = full_X_train.iloc[train], full_X_train.iloc[valid]
             y_train, y_valid = full_y_train.iloc[train], full_y_train.iloc[valid]
             if is_binary(automl.problem_type) or is_multiclass(automl.problem_type):
@@ -94,6 +251,8 @@ class EngineBase(ABC):
                                                                                           test_size=0.2,
                                                                                           random_seed=automl.random_seed)
                 cv_pipeline = pipeline.clone()
+                if automl.trace_recorder is not None:
+                    cv_pipeline._component_graph.add_profile_hook(automl.trace_recorder)
                 logger.debug(f"\t\t\tFold {i}: starting training")
                 cv_pipeline.fit(X_train, y_train)
                 logger.debug(f"\t\t\tFold {i}: finished training")
@@ -106,6 +265,7 @@ class EngineBase(ABC):
                 logger.debug(f"\t\t\tFold {i}: {automl.objective.name} score: {scores[automl.objective.name]:.3f}")
                 score = scores[automl.objective.name]
             except Exception as e:
+                automl._emit_event('error', pipeline_name=pipeline.name, fold=i, error_type=type(e).__name__, message=str(e))
                 if automl.error_callback is not None:
                     automl.error_callback(exception=e, traceback=traceback.format_tb(sys.exc_info()[2]), automl=automl,
                                           fold_num=i, pipeline=pipeline)
@@ -127,9 +287,97 @@ class EngineBase(ABC):
             evaluation_entry = {"all_objective_scores": ordered_scores, "score": score, 'binary_classification_threshold': None}
             if is_binary(automl.problem_type) and cv_pipeline is not None and cv_pipeline.threshold is not None:
                 evaluation_entry['binary_classification_threshold'] = cv_pipeline.threshold
+            if automl.trace_recorder is not None:
+                evaluation_entry['component_profile'] = cv_pipeline.component_profile if cv_pipeline is not None else {}
             cv_data.append(evaluation_entry)
+            automl._emit_event('fold_end', pipeline_name=pipeline.name, fold=i, score=score, fold_time=time.time() - fold_start)
+            if automl.trace_recorder is not None:
+                automl.trace_recorder.add_event(f"{pipeline.name} fold {i}", 'fold', fold_start, time.time() - fold_start,
+                                                {'# Training': y_train.shape[0], '# Validation': y_valid.shape[0]})
         training_time = time.time() - start
+        if automl.trace_recorder is not None:
+            automl.trace_recorder.add_event(pipeline.name, 'pipeline', start, training_time, {'pruned': pruned})
         cv_scores = pd.Series([fold['score'] for fold in cv_data])
         cv_score_mean = cv_scores.mean()
         logger.info(f"\tFinished cross validation - mean {automl.objective.name}: {cv_score_mean:.3f}")
-        return {'cv_data': cv_data, 'training_time': training_time, 'cv_scores': cv_scores, 'cv_score_mean': cv_score_mean}
+        return {'cv_data': cv_data, 'training_time': training_time, 'cv_scores': cv_scores, 'cv_score_mean': cv_score_mean,
+                'pruned': pruned}
+
+    @staticmethod
+    def train_and_score_pipeline_with_limits(pipeline, automl, full_X_train, full_y_train, time_limit=None, memory_limit=None):
+        """Train and score a pipeline like `train_and_score_pipeline`, but in a child process which is killed if it runs out of time,
+        and which cannot allocate more than a given amount of memory.
+
+        Killing the child process stops the evaluation even inside long-running native code, and releases all the memory it used. The
+        memory limit is enforced by limiting the child's address space with `resource.setrlimit`, so allocations beyond it fail inside
+        the child. Depending on where the allocation fails, this either gives the failing folds NaN scores and calls the error callback,
+        or ends the child process, which gives the pipeline NaN scores. Either way the search process is not affected.
+
+        Errors caught while evaluating the folds are sent back from the child process, and the error callback is called with them in
+        the search process once the child has finished, so that callbacks like `log_and_save_error_callback` can record them in the
+        search results.
+
+        The child process is forked from the search process where the platform supports it. Elsewhere, such as on Windows, it is
+        spawned, and the pipeline, the search and the training data are sent to it with cloudpickle.
+
+        Arguments:
+            pipeline (PipelineBase): the pipeline to score
+            automl (AutoMLSearch): the AutoML search, used to access config and for the error callback
+            full_X_train (ww.DataTable): training features
+            full_y_train (ww.DataColumn): training target
+            time_limit (float): the maximum time in seconds to spend training and scoring the pipeline. Defaults to None, for no limit.
+            memory_limit (float): the maximum memory in megabytes the pipeline may allocate. Only supported on platforms with the
+                `resource` module. Defaults to None, for no limit.
+
+        Returns:
+            dict: the same dict as `train_and_score_pipeline`, with timed_out set to True and NaN scores if the pipeline ran out of time.
+        """
+        if memory_limit is not None and resource is None:
+            raise ValueError("Limiting the memory of a pipeline evaluation requires the resource module, which is not available on this platform.")
+        start = time.time()
+        context = _get_multiprocessing_context()
+        parent_connection, child_connection = context.Pipe(duplex=False)
+        arguments = _child_process_arguments(context, pipeline, automl, full_X_train, full_y_train, memory_limit)
+        process = context.Process(target=_train_and_score_pipeline_in_child, args=(child_connection, arguments), daemon=True)
+        process.start()
+        child_connection.close()
+        try:
+            if parent_connection.poll(time_limit):
+                try:
+                    status, value, events, errors = parent_connection.recv()
+                except EOFError:
+                    status, value, events, errors = 'crashed', None, [], []
+            else:
+                status, value, events, errors = 'timed_out', None, [], []
+        finally:
+            if process.is_alive():
+                process.kill()
+            process.join()
+            parent_connection.close()
+
+        for event in events:
+            for sink in automl._event_sinks:
+                sink.emit(event)
+        for exception, tb, fold_num in errors:
+            automl.error_callback(exception=exception, traceback=tb, automl=automl, fold_num=fold_num, pipeline=pipeline)
+        if status == 'result':
+            value['timed_out'] = False
+            return value
+        if status == 'error':
+            raise value
+        if status == 'timed_out':
+            message = f"Stopped evaluating {pipeline.name} after exceeding the time limit of {time_limit:.1f} seconds"
+            logger.info(f"\t{message}")
+        else:
+            message = f"Evaluating {pipeline.name} stopped unexpectedly with exit code {process.exitcode}"
+            logger.error(f"\t{message}")
+        automl._emit_event('error', pipeline_name=pipeline.name, fold=None,
+                           error_type='TimeoutError' if status == 'timed_out' else 'ProcessExitError', message=message)
+        return EngineBase._nan_evaluation(automl, time.time() - start, timed_out=status == 'timed_out')
+
+    @staticmethod
+    def _nan_evaluation(automl, training_time, timed_out):
+        scores = OrderedDict((objective.name, np.nan) for objective in [automl.objective] + automl.additional_objectives)
+        cv_data = [{"all_objective_scores": scores, "score": np.nan, 'binary_classification_threshold': None}]
+        return {'cv_data': cv_data, 'training_time': training_time, 'cv_scores': pd.Series([np.nan]), 'cv_score_mean': np.nan,
+                'pruned': False, 'timed_out': timed_out, 'peak_memory_mb': np.nan}
@@ -7,6 +7,10 @@ class SequentialEngine(EngineBase):
     def evaluate_batch(self, pipelines):
         """Evaluate a batch of pipelines using the current dataset and AutoML state.
 
+        Pipelines which the AutoML search has already evaluated with the same parameters reuse the earlier scores instead of being trained again.
+        If the AutoML search limits the time or memory per pipeline, each pipeline is evaluated in a child process which is killed when the
+        time runs out and which cannot allocate more than the memory limit.
+
         Arguments:
             pipelines (list(PipelineBase)): A batch of pipelines to be fitted and evaluated.
 
@@ -20,7 +24,15 @@ class SequentialEngine(EngineBase):
         while self._should_continue_callback() and index < len(pipelines):
             pipeline = pipelines[index]
             self._pre_evaluation_callback(pipeline)
-            evaluation_result = EngineBase.train_and_score_pipeline(pipeline, self.automl, self.X_train, self.y_train)
+            evaluation_result = self.automl._get_cached_evaluation(pipeline)
+            if evaluation_result is None:
+                time_limit = self.automl._get_pipeline_time_limit()
+                memory_limit = self.automl.max_memory_per_pipeline
+                if time_limit is None and memory_limit is None:
+                    evaluation_result = EngineBase.train_and_score_pipeline(pipeline, self.automl, self.X_train, self.y_train)
+                else:
+                    evaluation_result = EngineBase.train_and_score_pipeline_with_limits(pipeline, self.automl, self.X_train, self.y_train,
+                                                                                        time_limit=time_limit, memory_limit=memory_limit)
             new_pipeline_ids.append(self._post_evaluation_callback(pipeline, evaluation_result))
             index += 1
         return new_pipeline_ids
@@ -0,0 +1,153 @@
+import json
+import os
+import queue
+import time
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+import psutil
+
+_BYTES_PER_MB = 1024 ** 2
+
+
+def make_event(event_type, **fields):
+    """Creates a search event with a timestamp and the current resource usage of the process.
+
+    Arguments:
+        event_type (str): Type of the event, for example 'pipeline_start' or 'score'.
+        **fields: Additional fields of the event.
+
+    Returns:
+        dict: The event, with keys 'event', 'timestamp' in seconds since the epoch, 'memory_mb' (the resident memory of the process),
+            'cpu_time' (the CPU time used by the process so far, in seconds) and the additional fields.
+    """
+    event = {'event': event_type,
+             'timestamp': time.time(),
+             'memory_mb': psutil.Process().memory_info().rss / _BYTES_PER_MB,
+             'cpu_time': time.process_time()}
+    event.update(fields)
+    return event
+
+
+def _to_json_compatible(value):
+    """Converts numpy values to Python values and NaN to None, so that an event can be written as strict JSON."""
+    if isinstance(value, dict):
+        return {str(key): _to_json_compatible(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json_compatible(item) for item in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
+
+
+class EventSink(ABC):
+    """Base class for destinations of the structured events AutoMLSearch emits while it searches.
+
+    Events are dicts with an 'event' type, a 'timestamp', the resource usage of the process and fields specific to the type:
+
+    * 'search_start': objective, max_iterations, max_batches, max_time
+    * 'batch_start': batch_number, num_pipelines
+    * 'pipeline_start': pipeline_name, parameters, pipeline_number
+    * 'fold_start': pipeline_name, fold, training_rows
+    * 'fold_end': pipeline_name, fold, score, fold_time
+    * 'error': pipeline_name, fold, error_type, message
+    * 'score': id, pipeline_name, score, training_time, peak_memory_mb, pruned, timed_out, percent_better_than_baseline
+    * 'search_end': search_duration, best_pipeline_id, best_score, interrupted
+
+    Sinks are called synchronously from the search, so `emit` should return quickly.
+    """
+
+    @abstractmethod
+    def emit(self, event):
+        """Receives an event.
+
+        Arguments:
+            event (dict): The event.
+        """
+
+    def close(self):
+        """Releases any resources held by the sink. Called when the search finishes, including when it raises an exception."""
+
+
+class JSONLinesEventSink(EventSink):
+    """Writes each event as one line of JSON to a file, which can be followed while the search runs."""
+
+    def __init__(self, file_path):
+        """Writes each event as one line of JSON to a file.
+
+        Arguments:
+            file_path (str): Location of the file. Events are appended if the file exists.
+        """
+        self.file_path = str(file_path)
+        self._file = None
+
+    def emit(self, event):
+        """Appends the event to the file as a line of JSON. NaN values are written as null.
+
+        Arguments:
+            event (dict): The event.
+        """
+        if self._file is None:
+            directory = os.path.dirname(self.file_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.file_path, 'a')
+        self._file.write(json.dumps(_to_json_compatible(event), default=str) + '\n')
+        self._file.flush()
+
+    def close(self):
+        """Closes the file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_file'] = None
+        return state
+
+
+class QueueEventSink(EventSink):
+    """Puts each event on a queue, for consumption by another thread in the same process, such as a dashboard."""
+
+    def __init__(self, event_queue=None):
+        """Puts each event on a queue.
+
+        Arguments:
+            event_queue (queue.Queue): The queue to put events on. Defaults to None, which creates an unbounded queue.Queue.
+        """
+        self.queue = event_queue if event_queue is not None else queue.Queue()
+
+    def emit(self, event):
+        """Puts the event on the queue without blocking. Events are dropped if the queue is full.
+
+        Arguments:
+            event (dict): The event.
+        """
+        try:
+            self.queue.put_nowait(event)
+        except queue.Full:
+            pass
+
+    def __getstate__(self):
+        # queues hold locks, which cannot be pickled, so a saved search gets a new, empty queue when loaded
+        state = self.__dict__.copy()
+        del state['queue']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.queue = queue.Queue()
+
+
+class _ListEventSink(EventSink):
+    """Collects events in a list. Used to pass events from a child process back to the search."""
+
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event):
+        self.events.append(event)
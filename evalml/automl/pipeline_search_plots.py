@@ -1,17 +1,33 @@
+import time
+
 from evalml.utils import import_or_raise, jupyter_check
 
 
 class SearchIterationPlot():
-    def __init__(self, data, show_plot=True):
+    def __init__(self, data, show_plot=True, refresh_interval=1.0):
+        """Plot of the score of each pipeline searched and of the best score so far, which is updated as the search runs.
+
+        The scores are kept in running arrays, so each update only processes the pipelines evaluated since the previous one.
+        The figure is redrawn at most once every `refresh_interval` seconds.
+
+        Arguments:
+            data (AutoMLSearch): Automated pipeline search object
+            show_plot (boolean): Unused. Defaults to True.
+            refresh_interval (float): Minimum number of seconds between redraws of the figure. Defaults to 1.0.
+        """
         self._go = import_or_raise("plotly.graph_objects", error_msg="Cannot find dependency plotly.graph_objects")
 
         if jupyter_check():
             import_or_raise("ipywidgets", warning=True)
 
         self.data = data
+        self.refresh_interval = refresh_interval
         self.best_score_by_iter_fig = None
+        self.iteration_ids = list()
         self.curr_iteration_scores = list()
         self.best_iteration_scores = list()
+        self._num_plotted = 0
+        self._last_draw = None
 
         title = 'Pipeline Search: Iteration vs. {}<br><sub>Gray marker indicates the score at current iteration</sub>'.format(self.data.objective.name)
         data = [
@@ -30,41 +46,47 @@ class SearchIterationPlot():
         }
         self.best_score_by_iter_fig = self._go.FigureWidget(data, layout)
         self.best_score_by_iter_fig.update_layout(showlegend=False)
-        self.update()
-
-    def update(self):
-        if len(self.data.results['search_order']) > 0 and len(self.data.results['pipeline_results']) > 0:
-            iter_idx = self.data.results['search_order']
-            pipeline_res = self.data.results['pipeline_results']
-            iter_scores = [pipeline_res[i]['score'] for i in iter_idx]
-
-            iter_score_pairs = zip(iter_idx, iter_scores)
-            iter_score_pairs = sorted(iter_score_pairs, key=lambda value: value[0])
-            sorted_iter_idx, sorted_iter_scores = zip(*iter_score_pairs)
-
-            # Create best score data
-            best_iteration_scores = list()
-            curr_best = None
-            for score in sorted_iter_scores:
-                if curr_best is None:
-                    best_iteration_scores.append(score)
-                    curr_best = score
-                else:
-                    if self.data.objective.greater_is_better and score > curr_best \
-                            or not self.data.objective.greater_is_better and score < curr_best:
-                        best_iteration_scores.append(score)
-                        curr_best = score
-                    else:
-                        best_iteration_scores.append(curr_best)
-
-            # Update entire line plot
+        self.update(force=True)
+
+    def _is_better(self, score, best_score):
+        if self.data.objective.greater_is_better:
+            return score > best_score
+        return score < best_score
+
+    def update(self, force=False):
+        """Adds the pipelines evaluated since the last update to the plot, and redraws the figure if at least `refresh_interval`
+        seconds have passed since it was last drawn.
+
+        Arguments:
+            force (boolean): If True, redraw the figure regardless of when it was last drawn. Defaults to False.
+        """
+        # read the search's results directly, since `results` returns a copy
+        search_order = self.data._results['search_order']
+        pipeline_results = self.data._results['pipeline_results']
+        for pipeline_id in sorted(search_order[len(self.iteration_ids):]):
+            score = pipeline_results[pipeline_id]['score']
+            self.iteration_ids.append(pipeline_id)
+            self.curr_iteration_scores.append(score)
+            if not self.best_iteration_scores or self._is_better(score, self.best_iteration_scores[-1]):
+                self.best_iteration_scores.append(score)
+            else:
+                self.best_iteration_scores.append(self.best_iteration_scores[-1])
+
+        if self._num_plotted == len(self.iteration_ids):
+            return
+        now = time.time()
+        if not force and self._last_draw is not None and now - self._last_draw < self.refresh_interval:
+            return
+        with self.best_score_by_iter_fig.batch_update():
             best_score_trace = self.best_score_by_iter_fig.data[0]
-            best_score_trace.x = sorted_iter_idx
-            best_score_trace.y = best_iteration_scores
+            best_score_trace.x = tuple(self.iteration_ids)
+            best_score_trace.y = tuple(self.best_iteration_scores)
 
             curr_score_trace = self.best_score_by_iter_fig.data[1]
-            curr_score_trace.x = sorted_iter_idx
-            curr_score_trace.y = sorted_iter_scores
+            curr_score_trace.x = tuple(self.iteration_ids)
+            curr_score_trace.y = tuple(self.curr_iteration_scores)
+        self._num_plotted = len(self.iteration_ids)
+        self._last_draw = now
 
 
 class PipelineSearchPlots:
@@ -80,9 +102,13 @@ class PipelineSearchPlots:
         self._go = import_or_raise("plotly.graph_objects", error_msg="Cannot find dependency plotly.graph_objects")
         self.data = data
 
-    def search_iteration_plot(self, interactive_plot=False):
+    def search_iteration_plot(self, interactive_plot=False, refresh_interval=1.0):
         """Shows a plot of the best score at each iteration using data gathered during training.
 
+        Arguments:
+            interactive_plot (boolean): If True, display a plot which is updated as the search runs. Defaults to False.
+            refresh_interval (float): Minimum number of seconds between redraws of an interactive plot. Defaults to 1.0.
+
         Returns:
             plot
         """
@@ -91,7 +117,7 @@ class PipelineSearchPlots:
             return self._go.Figure(plot_obj.best_score_by_iter_fig)
         try:
             ipython_display = import_or_raise("IPython.display", error_msg="Cannot find dependency IPython.display")
-            plot_obj = SearchIterationPlot(self.data)
+            plot_obj = SearchIterationPlot(self.data, refresh_interval=refresh_interval)
             ipython_display.display(plot_obj.best_score_by_iter_fig)
             return plot_obj
         except ImportError:
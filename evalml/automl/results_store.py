@@ -0,0 +1,172 @@
+import hashlib
+from collections.abc import Mapping
+
+import numpy as np
+import pandas as pd
+
+RANKINGS_COLUMNS = ["id", "pipeline_name", "score", "validation_score",
+                    "percent_better_than_baseline", "high_variance_cv", "pruned", "parameters"]
+
+
+def _make_hashable(value):
+    """Converts a (possibly nested) parameter value into a hashable value which compares equal whenever the inputs compare equal."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((key, _make_hashable(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_make_hashable(item) for item in value)
+    if isinstance(value, np.ndarray):
+        return ("ndarray", value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, np.generic):
+        return value.item()
+    if hasattr(value, "name") and isinstance(getattr(value, "parameters", None), dict):
+        # pipeline and component instances, for example the input pipelines of a stacked ensemble
+        return (type(value).__name__, value.name, _make_hashable(value.parameters))
+    try:
+        hash(value)
+    except TypeError:
+        return ("unhashable", repr(value))
+    return value
+
+
+def parameters_key(pipeline_name, parameters):
+    """Returns a hashable key identifying a pipeline and the parameters it was configured with.
+
+    Arguments:
+        pipeline_name (str): Name of the pipeline.
+        parameters (dict): Pipeline parameters.
+
+    Returns:
+        tuple: Key for the pipeline name and parameters.
+    """
+    return (pipeline_name, _make_hashable(parameters))
+
+
+def data_fingerprint(X, y):
+    """Returns a hash of the contents of a dataset.
+
+    Arguments:
+        X (pd.DataFrame): Features.
+        y (pd.Series): Target.
+
+    Returns:
+        str: Hex digest which changes whenever the values, index, column names or dtypes of X or y change.
+    """
+    digest = hashlib.sha256()
+    for data in (X, y):
+        digest.update(repr(data.shape).encode())
+        if isinstance(data, pd.DataFrame):
+            digest.update(repr([(str(column), str(dtype)) for column, dtype in data.dtypes.items()]).encode())
+        else:
+            digest.update(repr((str(data.name), str(data.dtype))).encode())
+        try:
+            digest.update(pd.util.hash_pandas_object(data, index=True).values.tobytes())
+        except TypeError:
+            # columns holding unhashable values, such as lists
+            digest.update(data.to_csv().encode())
+    return digest.hexdigest()
+
+
+def evaluation_key(pipeline_class, parameters, random_seed, data_hash):
+    """Returns a hashable key identifying the evaluation of a pipeline, which is the same whenever an evaluation would be repeated.
+
+    Arguments:
+        pipeline_class (class): Pipeline class.
+        parameters (dict): Pipeline parameters.
+        random_seed (int): Random seed the pipeline is evaluated with.
+        data_hash (str): Fingerprint of the data the pipeline is evaluated on, from `data_fingerprint`.
+
+    Returns:
+        tuple: Key for the evaluation.
+    """
+    return (pipeline_class.name, _make_hashable(pipeline_class.component_graph), _make_hashable(parameters),
+            random_seed, data_hash)
+
+
+class ResultsStore:
+    """Append-only store of AutoMLSearch pipeline results.
+
+    Alongside the results themselves, the store keeps the id of the best result, the rankings sorted by score and a set of the
+    (pipeline name, parameters) pairs which have been evaluated. Adding a result updates the best id and the set in constant time.
+    The sorted rankings are cached, and reading them sorts only the results added since the last read and inserts them into the
+    cache at positions found with a binary search, so reading the rankings or checking whether a pipeline has already been evaluated
+    does not have to revisit every result in Python.
+    """
+
+    def __init__(self, greater_is_better):
+        """Append-only store of AutoMLSearch pipeline results.
+
+        Arguments:
+            greater_is_better (bool): Whether greater scores on the primary objective are better.
+        """
+        self.greater_is_better = greater_is_better
+        self.pipeline_results = {}
+        self.search_order = []
+        self._parameters_keys = set()
+        self._best_key = None
+        self._best_id = None
+        self._pending_rows = []
+        self._rankings = pd.DataFrame(columns=RANKINGS_COLUMNS)
+        self._ranked_scores = np.empty(0)
+
+    def __len__(self):
+        return len(self.search_order)
+
+    def _sort_key(self, score, position):
+        # NaN scores rank last. Ties keep the order in which the results were added.
+        if pd.isnull(score):
+            return (1, 0.0, position)
+        return (0, -score if self.greater_is_better else score, position)
+
+    def add(self, pipeline_result):
+        """Adds the result of a pipeline evaluation.
+
+        Arguments:
+            pipeline_result (dict): The pipeline result. Must contain all of the rankings columns.
+        """
+        position = len(self.search_order)
+        pipeline_id = pipeline_result["id"]
+        self.pipeline_results[pipeline_id] = pipeline_result
+        self.search_order.append(pipeline_id)
+        sort_key = self._sort_key(pipeline_result["score"], position)
+        if self._best_key is None or sort_key < self._best_key:
+            self._best_key, self._best_id = sort_key, pipeline_id
+        self._pending_rows.append((sort_key, [pipeline_result[column] for column in RANKINGS_COLUMNS]))
+        self._parameters_keys.add(parameters_key(pipeline_result["pipeline_name"], pipeline_result["parameters"]))
+
+    def contains(self, pipeline_name, parameters):
+        """Whether a pipeline with the given name and parameters has already been evaluated.
+
+        Arguments:
+            pipeline_name (str): Name of the pipeline.
+            parameters (dict): Pipeline parameters.
+
+        Returns:
+            bool: True if a result for this pipeline and parameters has been added.
+        """
+        return parameters_key(pipeline_name, parameters) in self._parameters_keys
+
+    @property
+    def best_id(self):
+        """ID of the highest-ranked pipeline result, or None if no results have been added."""
+        return self._best_id
+
+    def full_rankings(self):
+        """Returns a pandas.DataFrame with the rankings columns for every result, sorted from best to worst score."""
+        if self._pending_rows:
+            self._merge_pending_rows()
+        return self._rankings.copy(deep=False)
+
+    def _merge_pending_rows(self):
+        # only the rows added since the last read are sorted. They are inserted into the sorted rankings at positions found with a
+        # binary search over the scores already ranked, after the rows they tie with since they were added later. NaN scores go last.
+        pending_rows = sorted(self._pending_rows, key=lambda pending_row: pending_row[0])
+        scores = np.array([sort_key[1] for sort_key, _ in pending_rows if sort_key[0] == 0], dtype=np.float64)
+        score_positions = np.searchsorted(self._ranked_scores, scores, side="right")
+        num_ranked = len(self._rankings)
+        positions = np.concatenate([score_positions, np.full(len(pending_rows) - len(scores), num_ranked)]).astype(int)
+        order = np.insert(np.arange(num_ranked), positions, np.arange(num_ranked, num_ranked + len(pending_rows)))
+        new_rows = pd.DataFrame([row for _, row in pending_rows], columns=RANKINGS_COLUMNS)
+        rankings = new_rows if self._rankings.empty else pd.concat([self._rankings, new_rows], ignore_index=True)
+        self._rankings = rankings.take(order).reset_index(drop=True)
+        self._ranked_scores = np.insert(self._ranked_scores, score_positions, scores)
+        self._pending_rows = []
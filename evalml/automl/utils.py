@@ -1,5 +1,6 @@
 from sklearn.model_selection import KFold, StratifiedKFold
 
+from evalml.model_family import ModelFamily
 from evalml.objectives import get_objective
 from evalml.preprocessing.data_splitters import (
     TimeSeriesSplit,
@@ -17,6 +18,9 @@ _LARGE_DATA_ROW_THRESHOLD = int(1e5)
 
 _LARGE_DATA_PERCENT_VALIDATION = 0.75
 
+# model families whose estimators take an early_stopping_rounds parameter
+_EARLY_STOPPING_MODEL_FAMILIES = {ModelFamily.LIGHTGBM, ModelFamily.XGBOOST, ModelFamily.CATBOOST}
+
 
 def get_default_primary_search_objective(problem_type):
     """Get the default primary search objective for a problem type.
@@ -85,3 +89,44 @@ def tune_binary_threshold(pipeline, objective, problem_type, X_threshold_tuning,
             y_predict_proba = pipeline.predict_proba(X_threshold_tuning)
             y_predict_proba = y_predict_proba.iloc[:, 1]
             pipeline.threshold = objective.optimize_threshold(y_predict_proba, y_threshold_tuning, X=X_threshold_tuning)
+
+
+def add_early_stopping_parameters(pipeline_parameters, estimators, early_stopping_rounds):
+    """Adds early stopping to the parameters of the LightGBM, XGBoost and CatBoost estimators among a list of estimators.
+
+    The number of rounds is added as a single-valued list, so that it is used both by the first pipeline of each estimator and by the
+    parameters the tuners propose. Estimators whose parameters already set early_stopping_rounds are left as they are.
+
+    Arguments:
+        pipeline_parameters (dict): Pipeline parameters, mapping component names to dictionaries of parameters.
+        estimators (list(class)): Estimator classes of the pipelines.
+        early_stopping_rounds (int): Number of rounds without improvement after which the estimators stop training.
+
+    Returns:
+        dict: A copy of pipeline_parameters with early stopping added.
+    """
+    pipeline_parameters = dict(pipeline_parameters)
+    for estimator in estimators:
+        if estimator.model_family not in _EARLY_STOPPING_MODEL_FAMILIES:
+            continue
+        estimator_parameters = pipeline_parameters.get(estimator.name, {})
+        if 'early_stopping_rounds' not in estimator_parameters:
+            pipeline_parameters[estimator.name] = {**estimator_parameters, 'early_stopping_rounds': [early_stopping_rounds]}
+    return pipeline_parameters
+
+
+def remove_early_stopping(pipeline):
+    """Turns off early stopping in the estimator of a pipeline, so that the estimator trains on all of the pipeline's training data.
+
+    Arguments:
+        pipeline (PipelineBase): The pipeline.
+
+    Returns:
+        PipelineBase: A new instance of the pipeline with early_stopping_rounds set to None, or the pipeline itself if its estimator
+            does not use early stopping.
+    """
+    if pipeline.estimator is None or pipeline.estimator.parameters.get('early_stopping_rounds') is None:
+        return pipeline
+    parameters = pipeline.parameters
+    parameters[pipeline._estimator_name] = {**parameters[pipeline._estimator_name], 'early_stopping_rounds': None}
+    return pipeline.__class__(parameters, random_seed=pipeline.random_seed)
@@ -34,6 +34,9 @@ class ModelFamily(Enum):
     DECISION_TREE = 'decision_tree'
     """Decision Tree model family."""
 
+    HIST_GRADIENT_BOOSTING = 'hist_gradient_boosting'
+    """Histogram-based Gradient Boosting model family."""
+
     BASELINE = 'baseline'
     """Baseline model family."""
 
@@ -50,6 +53,7 @@ class ModelFamily(Enum):
                              ModelFamily.CATBOOST.name: "CatBoost",
                              ModelFamily.EXTRA_TREES.name: "Extra Trees",
                              ModelFamily.DECISION_TREE.name: "Decision Tree",
+                             ModelFamily.HIST_GRADIENT_BOOSTING.name: "Histogram Gradient Boosting",
                              ModelFamily.BASELINE.name: "Baseline",
                              ModelFamily.ENSEMBLE.name: "Ensemble",
                              ModelFamily.NONE.name: "None"}
@@ -2,6 +2,7 @@ from .components import (
     Estimator,
     OneHotEncoder,
     TargetEncoder,
+    OrdinalEncoder,
     SimpleImputer,
     PerColumnImputer,
     StandardScaler,
@@ -31,7 +32,14 @@ from .components import (
     DFSTransformer,
     KNeighborsClassifier,
     SVMClassifier,
-    SVMRegressor
+    SVMRegressor,
+    HistGradientBoostingClassifier,
+    HistGradientBoostingRegressor,
+    NystroemSVMClassifier,
+    NystroemSVMRegressor,
+    TreeKNeighborsClassifier,
+    SGDClassifier,
+    SGDRegressor
 )
 
 from .component_graph import ComponentGraph
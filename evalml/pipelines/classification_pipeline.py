@@ -4,7 +4,11 @@ from sklearn.preprocessing import LabelEncoder
 
 from evalml.objectives import get_objective
 from evalml.pipelines import PipelineBase
-from evalml.utils import _convert_woodwork_types_wrapper, infer_feature_types
+from evalml.utils import (
+    _convert_woodwork_types_wrapper,
+    _iter_chunks,
+    infer_feature_types
+)
 
 
 class ClassificationPipeline(PipelineBase):
@@ -45,6 +49,33 @@ class ClassificationPipeline(PipelineBase):
         self._fit(X, y)
         return self
 
+    def fit_iter(self, chunks, classes=None):
+        """Build a classification model one chunk of data at a time, so that it can be trained on data which does not fit in memory.
+
+        Every component must support `partial_fit`, for example the SGD classifier, the imputers with any strategy but "median", the standard scaler,
+        the one-hot encoder with declared categories and the column selectors. The components are fit in order, with one pass over the chunks per component.
+
+        Arguments:
+            chunks (callable or iterable): The training data, as (X, y) tuples of a chunk of the input training data and its target labels.
+                Either a function which returns an iterator over the chunks, for example one which reads a file with `pd.read_csv(..., chunksize=...)`,
+                or a collection of chunks which can be iterated over more than once.
+            classes (list): All the classes of the target. Defaults to None, which makes an extra pass over the chunks to find them.
+
+        Returns:
+            self
+        """
+        if classes is None:
+            classes = pd.concat([self._convert_target(y).drop_duplicates() for _, y in _iter_chunks(chunks)]).unique()
+        self._encoder.fit(classes)
+        self._fit_iter(chunks, lambda y: self._encode_targets(self._convert_target(y)), classes=list(range(len(self._encoder.classes_))))
+        return self
+
+    @staticmethod
+    def _convert_target(y):
+        """Converts a target to a pd.Series."""
+        y = infer_feature_types(y)
+        return _convert_woodwork_types_wrapper(y.to_series())
+
     def _encode_targets(self, y):
         """Converts target values from their original values to integer values that can be processed."""
         try:
@@ -102,7 +133,10 @@ class ClassificationPipeline(PipelineBase):
             ww.DataTable: Probability estimates
         """
         X = self.compute_estimator_features(X, y=None)
-        proba = self.estimator.predict_proba(X).to_dataframe()
+        with self._profile_estimator('predict_proba', X) as event:
+            proba = self.estimator.predict_proba(X)
+            event['output'] = proba
+        proba = proba.to_dataframe()
         proba.columns = self._encoder.classes_
         return infer_feature_types(proba)
 
@@ -1,3 +1,5 @@
+from contextlib import nullcontext
+
 import networkx as nx
 import pandas as pd
 import woodwork as ww
@@ -8,9 +10,12 @@ from evalml.pipelines.components import ComponentBase, Estimator, Transformer
 from evalml.pipelines.components.utils import handle_component_class
 from evalml.utils import (
     _convert_woodwork_types_wrapper,
+    _iter_chunks,
     import_or_raise,
     infer_feature_types
 )
+from evalml.utils.profiling import profile_component
+from evalml.utils.sparse_utils import SparseFeatures, _densify
 
 
 class ComponentGraph:
@@ -33,6 +38,8 @@ class ComponentGraph:
         self.compute_order = self.generate_order(self.component_dict)
         self.input_feature_names = {}
         self._feature_provenance = {}
+        self.component_profile = {}
+        self._profile_hooks = []
         self._i = 0
 
     @classmethod
@@ -92,12 +99,51 @@ class ComponentGraph:
             X (ww.DataTable, pd.DataFrame): The input training data of shape [n_samples, n_features]
             y (ww.DataColumn, pd.Series): The target training data of length [n_samples]
         """
+        self.component_profile = {}
         X = infer_feature_types(X)
         X = _convert_woodwork_types_wrapper(X.to_dataframe())
         self._compute_features(self.compute_order, X, y, fit=True)
         self._feature_provenance = self._get_feature_provenance(X.columns)
         return self
 
+    def fit_iter(self, chunks, classes=None):
+        """Fit each component in the graph one chunk of data at a time, so that the graph can be fit on data which does not fit in memory.
+
+        Every component must support `partial_fit`. The components are fit in order, with one pass over the chunks per component, in which
+        each chunk is transformed by the components already fit and then passed to the component's `partial_fit`. Anything the components
+        were fit on before is discarded first, so fitting the graph again with `fit_iter` gives the same result as fitting a new graph.
+
+        Arguments:
+            chunks (callable or iterable): The training data, as (X, y) tuples of a chunk of the input training data and its target.
+                Either a function which returns an iterator over the chunks, or a collection of chunks which can be iterated over more than once.
+            classes (list): All the classes of the target, for classifiers. Defaults to None.
+        """
+        not_supported = [name for name in self.compute_order if not self.get_component(name).supports_partial_fit]
+        if not_supported:
+            raise ValueError(f"Cannot fit the component graph one chunk at a time, since these components do not support partial_fit: {', '.join(not_supported)}")
+        for component_name in self.compute_order:
+            self.get_component(component_name)._reset_partial_fit()
+        self.component_profile = {}
+        input_feature_names = None
+        for index, component_name in enumerate(self.compute_order):
+            component_instance = self.get_component(component_name)
+            partial_fit_kwargs = {'classes': classes} if classes is not None and isinstance(component_instance, Estimator) else {}
+            for X, y in _iter_chunks(chunks):
+                X = infer_feature_types(X)
+                X = _convert_woodwork_types_wrapper(X.to_dataframe())
+                if input_feature_names is None:
+                    input_feature_names = X.columns
+                output_cache = self._compute_features(self.compute_order[:index], X, y) if index > 0 else {}
+                x_inputs, y_input = self._get_parent_outputs(component_name, output_cache)
+                input_x, input_y = self._consolidate_inputs(x_inputs, y_input, X, y, keep_sparse=component_instance.supports_sparse_input)
+                self.input_feature_names.update({component_name: list(input_x.columns)})
+                with self.profile(component_name, 'partial_fit', input_x):
+                    component_instance.partial_fit(input_x, input_y, **partial_fit_kwargs)
+        if input_feature_names is None:
+            raise ValueError("Cannot fit the component graph on an empty collection of chunks")
+        self._feature_provenance = self._get_feature_provenance(input_feature_names)
+        return self
+
     def fit_features(self, X, y):
         """Fit all components save the final one, usually an estimator
 
@@ -106,7 +152,8 @@ class ComponentGraph:
             y (ww.DataColumn, pd.Series): The target training data of length [n_samples]
 
         Returns:
-            ww.DataTable: Transformed values.
+            ww.DataTable or SparseFeatures: Transformed values. SparseFeatures are returned when the final component supports sparse
+                input and they are among its inputs.
         """
         return self._fit_transform_features_helper(True, X, y)
 
@@ -119,7 +166,8 @@ class ComponentGraph:
             y (ww.DataColumn, pd.Series): The target training data of length [n_samples]. Defaults to None.
 
         Returns:
-            ww.DataTable: Transformed values.
+            ww.DataTable or SparseFeatures: Transformed values. SparseFeatures are returned when the final component supports sparse
+                input and they are among its inputs.
         """
         return self._fit_transform_features_helper(False, X, y)
 
@@ -132,8 +180,11 @@ class ComponentGraph:
             y (ww.DataColumn, pd.Series): The target training data of length [n_samples]. Defaults to None.
 
         Returns:
-            ww.DataTable: Transformed values.
+            ww.DataTable or SparseFeatures: Transformed values. SparseFeatures are returned when the final component supports sparse
+                input and they are among its inputs.
         """
+        if needs_fitting:
+            self.component_profile = {}
         if len(self.compute_order) <= 1:
             return infer_feature_types(X)
         component_outputs = self._compute_features(self.compute_order[:-1], X, y=y, fit=needs_fitting)
@@ -145,6 +196,14 @@ class ComponentGraph:
                 parent_output = pd.DataFrame(parent_output, columns=[parent])
                 parent_output = infer_feature_types(parent_output)
             final_component_inputs.append(parent_output)
+        if any(isinstance(component_input, SparseFeatures) for component_input in final_component_inputs):
+            concatted = None
+            if self.get_component(self.compute_order[-1]).supports_sparse_input:
+                concatted = SparseFeatures.concat(final_component_inputs)
+            if concatted is not None:
+                if needs_fitting:
+                    self.input_feature_names.update({self.compute_order[-1]: list(concatted.columns)})
+                return concatted
         concatted = pd.concat([component_input.to_dataframe() for component_input in final_component_inputs], axis=1)
         if needs_fitting:
             self.input_feature_names.update({self.compute_order[-1]: list(concatted.columns)})
@@ -186,28 +245,19 @@ class ComponentGraph:
             component_instance = self.get_component(component_name)
             if not isinstance(component_instance, ComponentBase):
                 raise ValueError('All components must be instantiated before fitting or predicting')
-            x_inputs = []
-            y_input = None
-            for parent_input in self.get_parents(component_name):
-                if parent_input[-2:] == '.y':
-                    if y_input is not None:
-                        raise ValueError(f'Cannot have multiple `y` parents for a single component {component_name}')
-                    y_input = output_cache[parent_input]
-                else:
-                    parent_x = output_cache.get(parent_input, output_cache.get(f'{parent_input}.x'))
-                    if isinstance(parent_x, ww.DataTable):
-                        parent_x = _convert_woodwork_types_wrapper(parent_x.to_dataframe())
-                    elif isinstance(parent_x, ww.DataColumn):
-                        parent_x = pd.Series(_convert_woodwork_types_wrapper(parent_x.to_series()), name=parent_input)
-                    x_inputs.append(parent_x)
-            input_x, input_y = self._consolidate_inputs(x_inputs, y_input, X, y)
+            x_inputs, y_input = self._get_parent_outputs(component_name, output_cache)
+            with self.profile(component_name, 'convert_inputs', X) as event:
+                input_x, input_y = self._consolidate_inputs(x_inputs, y_input, X, y, keep_sparse=component_instance.supports_sparse_input)
+                event['output'] = input_x
             self.input_feature_names.update({component_name: list(input_x.columns)})
 
             if isinstance(component_instance, Transformer):
-                if fit:
-                    output = component_instance.fit_transform(input_x, input_y)
-                else:
-                    output = component_instance.transform(input_x, input_y)
+                with self.profile(component_name, 'fit_transform' if fit else 'transform', input_x) as event:
+                    if fit:
+                        output = component_instance.fit_transform(input_x, input_y)
+                    else:
+                        output = component_instance.transform(input_x, input_y)
+                    event['output'] = output[0] if isinstance(output, tuple) else output
                 if isinstance(output, tuple):
                     output_x, output_y = output[0], output[1]
                 else:
@@ -217,14 +267,83 @@ class ComponentGraph:
                 output_cache[f"{component_name}.y"] = output_y
             else:
                 if fit:
-                    component_instance.fit(input_x, input_y)
+                    with self.profile(component_name, 'fit', input_x):
+                        component_instance.fit(input_x, input_y)
                 if not (fit and component_name == self.compute_order[-1]):  # Don't call predict on the final component during fit
-                    output = component_instance.predict(input_x)
+                    with self.profile(component_name, 'predict', input_x) as event:
+                        output = component_instance.predict(input_x)
+                        event['output'] = output
                 else:
                     output = None
                 output_cache[component_name] = output
         return output_cache
 
+    def _get_parent_outputs(self, component_name, output_cache):
+        """Gathers the outputs of the parents of a component, to be combined into its input with `_consolidate_inputs`.
+
+        Arguments:
+            component_name (str): Name of the component.
+            output_cache (dict): Outputs computed so far, as returned by `_compute_features`.
+
+        Returns:
+            list(pd.DataFrame, pd.Series, SparseFeatures), ww.DataColumn: The X outputs of the parents, and the y output of the parent
+                which gives the component its target, or None.
+        """
+        x_inputs = []
+        y_input = None
+        for parent_input in self.get_parents(component_name):
+            if parent_input[-2:] == '.y':
+                if y_input is not None:
+                    raise ValueError(f'Cannot have multiple `y` parents for a single component {component_name}')
+                y_input = output_cache[parent_input]
+            else:
+                parent_x = output_cache.get(parent_input, output_cache.get(f'{parent_input}.x'))
+                if isinstance(parent_x, ww.DataTable):
+                    parent_x = _convert_woodwork_types_wrapper(parent_x.to_dataframe())
+                elif isinstance(parent_x, ww.DataColumn):
+                    parent_x = pd.Series(_convert_woodwork_types_wrapper(parent_x.to_series()), name=parent_input)
+                x_inputs.append(parent_x)
+        return x_inputs, y_input
+
+    def profile(self, component_name, operation, X):
+        """Context manager which measures an operation of a component in the graph and records it in `component_profile`.
+
+        The wall time, CPU time, number of rows and columns in and out and the change in resident memory of each operation are summed
+        into `component_profile`, which maps component names to operation names to the totals. `component_profile` is reset each time
+        the graph is fit. Each measurement is also passed to the profile hooks as an event dict. Operations are only measured while at
+        least one profile hook has been added with `add_profile_hook`, so `component_profile` stays empty otherwise.
+
+        Arguments:
+            component_name (str): Name of the component.
+            operation (str): Name of the operation, for example 'fit', 'transform' or 'predict_proba'.
+            X (ww.DataTable, pd.DataFrame): Input data of the operation.
+
+        Returns:
+            Context manager which yields the event dict. Set its `output` key to the output of the operation to record the number of rows and columns out.
+        """
+        if not self._profile_hooks:
+            return nullcontext({})
+        return profile_component(component_name, operation, X, self.component_profile, self._profile_hooks)
+
+    def add_profile_hook(self, hook):
+        """Adds a function which is called with an event dict after each component operation, for example a `ChromeTraceRecorder`.
+
+        Component operations are only profiled, and `component_profile` only recorded, while at least one hook is added.
+
+        Arguments:
+            hook (callable): Function which takes the event dict. The event has the keys 'component', 'operation', 'start',
+                'wall_time', 'cpu_time', 'rows_in', 'columns_in', 'rows_out', 'columns_out' and 'memory_delta_mb'.
+        """
+        self._profile_hooks.append(hook)
+
+    def remove_profile_hook(self, hook):
+        """Removes a function added with `add_profile_hook`.
+
+        Arguments:
+            hook (callable): The function to remove.
+        """
+        self._profile_hooks.remove(hook)
+
     def _get_feature_provenance(self, input_feature_names):
         """Get the feature provenance for each feature in the input_feature_names.
 
@@ -275,28 +394,36 @@ class ComponentGraph:
         return {feature: children for feature, children in provenance.items() if len(children)}
 
     @staticmethod
-    def _consolidate_inputs(x_inputs, y_input, X, y):
+    def _consolidate_inputs(x_inputs, y_input, X, y, keep_sparse=False):
         """Combines any/all X and y inputs for a component, including handling defaults
 
         Arguments:
-            x_inputs (list(pd.DataFrame)): Data to be used as X input for a component
+            x_inputs (list(pd.DataFrame, SparseFeatures)): Data to be used as X input for a component
             y_input (pd.Series, None): If present, the Series to use as y input for a component, different from the original y
             X (ww.DataTable, pd.DataFrame): The original X input, to be used if there is no parent X input
             y (ww.DataColumn, pd.Series): The original y input, to be used if there is no parent y input
+            keep_sparse (bool): Whether the component supports sparse input. If True and any X input is SparseFeatures, the X inputs
+                are combined into SparseFeatures when they are all numeric. Otherwise, SparseFeatures are converted to dense data.
+                Defaults to False.
 
         Returns:
-            ww.DataTable, ww.DataColumn: The X and y transformed values to evaluate a component with
+            ww.DataTable or SparseFeatures, ww.DataColumn: The X and y transformed values to evaluate a component with
         """
-        if len(x_inputs) == 0:
-            return_x = X
-        else:
-            return_x = pd.concat(x_inputs, axis=1)
         return_y = y
         if y_input is not None:
             return_y = y_input
-        return_x = infer_feature_types(return_x)
         if return_y is not None:
             return_y = infer_feature_types(return_y)
+        if any(isinstance(x_input, SparseFeatures) for x_input in x_inputs):
+            return_x = SparseFeatures.concat(x_inputs) if keep_sparse else None
+            if return_x is not None:
+                return return_x, return_y
+            x_inputs = [_densify(x_input) for x_input in x_inputs]
+        if len(x_inputs) == 0:
+            return_x = X
+        else:
+            return_x = pd.concat(x_inputs, axis=1)
+        return_x = infer_feature_types(return_x)
         return return_x, return_y
 
     def get_component(self, component_name):
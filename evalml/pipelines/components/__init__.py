@@ -22,12 +22,20 @@ from .estimators import (
     TimeSeriesBaselineEstimator,
     KNeighborsClassifier,
     SVMClassifier,
-    SVMRegressor
+    SVMRegressor,
+    HistGradientBoostingClassifier,
+    HistGradientBoostingRegressor,
+    NystroemSVMClassifier,
+    NystroemSVMRegressor,
+    TreeKNeighborsClassifier,
+    SGDClassifier,
+    SGDRegressor
 )
 from .transformers import (
     Transformer,
     OneHotEncoder,
     TargetEncoder,
+    OrdinalEncoder,
     RFClassifierSelectFromModel,
     RFRegressorSelectFromModel,
     PerColumnImputer,
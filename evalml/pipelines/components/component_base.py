@@ -2,6 +2,7 @@ import copy
 from abc import ABC, abstractmethod
 
 import cloudpickle
+from sklearn.base import clone as clone_sklearn_object
 
 from evalml.exceptions import MethodPropertyNotFoundError
 from evalml.pipelines.components.component_base_meta import ComponentBaseMeta
@@ -21,6 +22,10 @@ logger = get_logger(__file__)
 class ComponentBase(ABC, metaclass=ComponentBaseMeta):
     """Base class for all components."""
     _default_parameters = None
+    # whether the component can take SparseFeatures as input, or needs them converted to a dense ww.DataTable
+    supports_sparse_input = False
+    # whether the component implements `partial_fit`, so that it can be fit one chunk of data at a time with `fit_iter`
+    supports_partial_fit = False
 
     def __init__(self, parameters=None, component_obj=None, random_state=None, random_seed=0, **kwargs):
         self.random_seed = deprecate_arg("random_state", "random_seed", random_state, random_seed)
@@ -76,6 +81,12 @@ class ComponentBase(ABC, metaclass=ComponentBaseMeta):
         """
         return self.__class__(**self.parameters, random_seed=self.random_seed)
 
+    def _reset_partial_fit(self):
+        """Discards everything the component has been fit on, so that `partial_fit` starts over. Called by `ComponentGraph.fit_iter`."""
+        if hasattr(self._component_obj, 'get_params'):
+            self._component_obj = clone_sklearn_object(self._component_obj)
+        self._is_fitted = False
+
     def fit(self, X, y=None):
         """Fits component to data
 
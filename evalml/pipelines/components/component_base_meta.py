@@ -9,6 +9,8 @@ from evalml.utils.base_meta import BaseMeta
 class ComponentBaseMeta(BaseMeta):
     """Metaclass that overrides creating a new component by wrapping methods with validators and setters"""
 
+    FIT_METHODS = BaseMeta.FIT_METHODS + ['partial_fit']
+
     @classmethod
     def check_for_fit(cls, method):
         """`check_for_fit` wraps a method that validates if `self._is_fitted` is `True`.
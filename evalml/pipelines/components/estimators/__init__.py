@@ -9,7 +9,11 @@ from .classifiers import (LogisticRegressionClassifier,
                           BaselineClassifier,
                           DecisionTreeClassifier,
                           KNeighborsClassifier,
-                          SVMClassifier)
+                          SVMClassifier,
+                          HistGradientBoostingClassifier,
+                          NystroemSVMClassifier,
+                          TreeKNeighborsClassifier,
+                          SGDClassifier)
 from .regressors import (LinearRegressor,
                          LightGBMRegressor,
                          RandomForestRegressor,
@@ -20,4 +24,7 @@ from .regressors import (LinearRegressor,
                          BaselineRegressor,
                          TimeSeriesBaselineEstimator,
                          DecisionTreeRegressor,
-                         SVMRegressor)
+                         SVMRegressor,
+                         HistGradientBoostingRegressor,
+                         NystroemSVMRegressor,
+                         SGDRegressor)
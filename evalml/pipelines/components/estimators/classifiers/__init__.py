@@ -9,3 +9,7 @@ from .lightgbm_classifier import LightGBMClassifier
 from .decision_tree_classifier import DecisionTreeClassifier
 from .kneighbors_classifier import KNeighborsClassifier
 from .svm_classifier import SVMClassifier
+from .hist_gradient_boosting_classifier import HistGradientBoostingClassifier
+from .nystroem_svm_classifier import NystroemSVMClassifier
+from .tree_kneighbors_classifier import TreeKNeighborsClassifier
+from .sgd_classifier import SGDClassifier
@@ -7,6 +7,9 @@ from skopt.space import Integer, Real
 
 from evalml.model_family import ModelFamily
 from evalml.pipelines.components.estimators import Estimator
+from evalml.pipelines.components.estimators.early_stopping import (
+    split_for_early_stopping
+)
 from evalml.problem_types import ProblemTypes
 from evalml.utils import (
     _convert_woodwork_types_wrapper,
@@ -34,21 +37,24 @@ class CatBoostClassifier(Estimator):
                                ProblemTypes.TIME_SERIES_BINARY, ProblemTypes.TIME_SERIES_MULTICLASS]
 
     def __init__(self, n_estimators=10, eta=0.03, max_depth=6, bootstrap_type=None, silent=True,
-                 allow_writing_files=False, random_state=None, random_seed=0, **kwargs):
+                 allow_writing_files=False, early_stopping_rounds=None, random_state=None, random_seed=0, **kwargs):
         random_seed = deprecate_arg("random_state", "random_seed", random_state, random_seed)
         parameters = {"n_estimators": n_estimators,
                       "eta": eta,
                       "max_depth": max_depth,
                       'bootstrap_type': bootstrap_type,
                       'silent': silent,
-                      'allow_writing_files': allow_writing_files}
+                      'allow_writing_files': allow_writing_files,
+                      'early_stopping_rounds': early_stopping_rounds}
         parameters.update(kwargs)
 
         cb_error_msg = "catboost is not installed. Please install using `pip install catboost.`"
         catboost = import_or_raise("catboost", error_msg=cb_error_msg)
         self._label_encoder = None
+        self.best_iteration = None
         # catboost will choose an intelligent default for bootstrap_type, so only set if provided
         cb_parameters = copy.copy(parameters)
+        cb_parameters.pop('early_stopping_rounds')
         if bootstrap_type is None:
             cb_parameters.pop('bootstrap_type')
         cb_classifier = catboost.CatBoostClassifier(**cb_parameters,
@@ -66,7 +72,14 @@ class CatBoostClassifier(Estimator):
         if y.nunique() <= 2:
             self._label_encoder = LabelEncoder()
             y = pd.Series(self._label_encoder.fit_transform(y))
-        self._component_obj.fit(X, y, silent=True, cat_features=cat_cols)
+        early_stopping_rounds = self.parameters['early_stopping_rounds']
+        if early_stopping_rounds is None:
+            self._component_obj.fit(X, y, silent=True, cat_features=cat_cols)
+            return self
+        X, X_valid, y, y_valid = split_for_early_stopping(X, y, self.random_seed, stratify=True)
+        self._component_obj.fit(X, y, silent=True, cat_features=cat_cols, eval_set=(X_valid, y_valid),
+                                early_stopping_rounds=early_stopping_rounds)
+        self.best_iteration = self._component_obj.get_best_iteration()
         return self
 
     def predict(self, X):
@@ -3,20 +3,26 @@ import copy
 import numpy as np
 import pandas as pd
 from pandas.api.types import is_integer_dtype
-from sklearn.preprocessing import LabelEncoder, OrdinalEncoder
+from sklearn.preprocessing import LabelEncoder
 from skopt.space import Integer, Real
 
 from evalml.model_family import ModelFamily
 from evalml.pipelines.components.estimators import Estimator
+from evalml.pipelines.components.estimators.early_stopping import (
+    split_for_early_stopping
+)
 from evalml.problem_types import ProblemTypes
 from evalml.utils import (
     SEED_BOUNDS,
     _convert_woodwork_types_wrapper,
-    _rename_column_names_to_numeric,
+    _encode_categories_as_codes,
+    _get_category_lookups,
+    _with_positional_column_names,
     deprecate_arg,
     import_or_raise,
     infer_feature_types
 )
+from evalml.utils.sparse_utils import SparseFeatures
 
 
 class LightGBMClassifier(Estimator):
@@ -35,13 +41,14 @@ class LightGBMClassifier(Estimator):
     model_family = ModelFamily.LIGHTGBM
     supported_problem_types = [ProblemTypes.BINARY, ProblemTypes.MULTICLASS,
                                ProblemTypes.TIME_SERIES_BINARY, ProblemTypes.TIME_SERIES_MULTICLASS]
+    supports_sparse_input = True
 
     SEED_MIN = 0
     SEED_MAX = SEED_BOUNDS.max_bound
 
     def __init__(self, boosting_type="gbdt", learning_rate=0.1, n_estimators=100, max_depth=0, num_leaves=31,
                  min_child_samples=20, n_jobs=-1, random_state=None, random_seed=0,
-                 bagging_fraction=0.9, bagging_freq=0, **kwargs):
+                 bagging_fraction=0.9, bagging_freq=0, early_stopping_rounds=None, **kwargs):
         random_seed = deprecate_arg("random_state", "random_seed", random_state, random_seed)
         parameters = {"boosting_type": boosting_type,
                       "learning_rate": learning_rate,
@@ -51,9 +58,11 @@ class LightGBMClassifier(Estimator):
                       "min_child_samples": min_child_samples,
                       "n_jobs": n_jobs,
                       "bagging_freq": bagging_freq,
-                      "bagging_fraction": bagging_fraction}
+                      "bagging_fraction": bagging_fraction,
+                      "early_stopping_rounds": early_stopping_rounds}
         parameters.update(kwargs)
         lg_parameters = copy.copy(parameters)
+        lg_parameters.pop('early_stopping_rounds')
         # when boosting type is random forest (rf), LightGBM requires bagging_freq == 1 and  0 < bagging_fraction < 1.0
         if boosting_type == "rf":
             lg_parameters['bagging_freq'] = 1
@@ -66,8 +75,9 @@ class LightGBMClassifier(Estimator):
 
         lgbm_error_msg = "LightGBM is not installed. Please install using `pip install lightgbm`."
         lgbm = import_or_raise("lightgbm", error_msg=lgbm_error_msg)
-        self._ordinal_encoder = None
+        self._category_lookups = {}
         self._label_encoder = None
+        self.best_iteration = None
 
         lgbm_classifier = lgbm.sklearn.LGBMClassifier(random_state=random_seed, **lg_parameters)
 
@@ -76,26 +86,20 @@ class LightGBMClassifier(Estimator):
                          random_seed=random_seed)
 
     def _encode_categories(self, X, fit=False):
-        """Encodes each categorical feature using ordinal encoding."""
-        X = infer_feature_types(X)
-        cat_cols = list(X.select('category').columns)
-        X = _convert_woodwork_types_wrapper(X.to_dataframe())
+        """Encodes each categorical feature as the codes of its categories seen during fit, and renames the features to their positions.
+        Sparse features have no categorical features and are passed on as a scipy sparse matrix."""
+        if isinstance(X, SparseFeatures):
+            if fit:
+                self.input_feature_names = X.columns
+                self._category_lookups = {}
+            return X.matrix
+        X_ww = infer_feature_types(X)
+        X = _convert_woodwork_types_wrapper(X_ww.to_dataframe())
         if fit:
             self.input_feature_names = list(X.columns)
-        X_encoded = _rename_column_names_to_numeric(X)
-        rename_cols_dict = dict(zip(X.columns, X_encoded.columns))
-        cat_cols = [rename_cols_dict[col] for col in cat_cols]
-
-        if len(cat_cols) == 0:
-            return X_encoded
-        if fit:
-            self._ordinal_encoder = OrdinalEncoder()
-            encoder_output = self._ordinal_encoder.fit_transform(X_encoded[cat_cols])
-        else:
-            encoder_output = self._ordinal_encoder.transform(X_encoded[cat_cols])
-        X_encoded[cat_cols] = pd.DataFrame(encoder_output)
-        X_encoded[cat_cols] = X_encoded[cat_cols].astype('category')
-        return X_encoded
+            self._category_lookups = _get_category_lookups(X, list(X_ww.select('category').columns))
+        X_encoded = _with_positional_column_names(X)
+        return _encode_categories_as_codes(X_encoded, self._category_lookups)
 
     def _encode_labels(self, y):
         y_encoded = infer_feature_types(y)
@@ -107,10 +111,16 @@ class LightGBMClassifier(Estimator):
         return y_encoded
 
     def fit(self, X, y=None):
-        X_encoded = infer_feature_types(X)
         X_encoded = self._encode_categories(X, fit=True)
         y_encoded = self._encode_labels(y)
-        self._component_obj.fit(X_encoded, y_encoded)
+        early_stopping_rounds = self.parameters['early_stopping_rounds']
+        if early_stopping_rounds is None:
+            self._component_obj.fit(X_encoded, y_encoded)
+            return self
+        X_encoded, X_valid, y_encoded, y_valid = split_for_early_stopping(X_encoded, y_encoded, self.random_seed, stratify=True)
+        self._component_obj.fit(X_encoded, y_encoded, eval_set=[(X_valid, y_valid)],
+                                early_stopping_rounds=early_stopping_rounds, verbose=False)
+        self.best_iteration = self._component_obj.best_iteration_
         return self
 
     def predict(self, X):
@@ -0,0 +1,92 @@
+import numpy as np
+from sklearn.linear_model import SGDClassifier as SKSGDClassifier
+from skopt.space import Real
+
+from evalml.model_family import ModelFamily
+from evalml.pipelines.components.estimators import Estimator
+from evalml.problem_types import ProblemTypes
+from evalml.utils import deprecate_arg
+from evalml.utils.sparse_utils import _unwrap_sparse
+
+
+class SGDClassifier(Estimator):
+    """Linear classifier fit with stochastic gradient descent.
+
+    Besides `fit`, it supports `partial_fit`, which fits the classifier one chunk of data at a time, so it can be trained on data which does not fit in memory.
+    """
+    name = "SGD Classifier"
+    hyperparameter_ranges = {
+        "loss": ["log", "modified_huber"],
+        "alpha": Real(0.000001, 0.1),
+        "l1_ratio": Real(0, 1),
+    }
+    model_family = ModelFamily.LINEAR_MODEL
+    supported_problem_types = [ProblemTypes.BINARY, ProblemTypes.MULTICLASS,
+                               ProblemTypes.TIME_SERIES_BINARY, ProblemTypes.TIME_SERIES_MULTICLASS]
+    supports_sparse_input = True
+    supports_partial_fit = True
+    _valid_losses = ["log", "modified_huber"]
+
+    def __init__(self,
+                 loss="log",
+                 penalty="elasticnet",
+                 alpha=0.0001,
+                 l1_ratio=0.15,
+                 max_iter=1000,
+                 n_jobs=-1,
+                 random_state=None,
+                 random_seed=0,
+                 **kwargs):
+        """Linear classifier fit with stochastic gradient descent.
+
+        Arguments:
+            loss (str): Loss function, "log" for logistic regression or "modified_huber" for a smoothed hinge loss, which fits a linear SVM.
+                Both can predict probabilities. Defaults to "log".
+            penalty (str): Regularization penalty, "l2", "l1" or "elasticnet". Defaults to "elasticnet".
+            alpha (float): Regularization strength. Defaults to 0.0001.
+            l1_ratio (float): Mix of L1 and L2 regularization when penalty is "elasticnet", from 0 for L2 to 1 for L1. Defaults to 0.15.
+            max_iter (int): Maximum number of passes over the training data in `fit`. `partial_fit` makes one pass over each chunk. Defaults to 1000.
+            n_jobs (int): Number of jobs to run in parallel for multiclass problems. -1 uses all processes. Defaults to -1.
+            random_seed (int): Seed for the random number generator. Defaults to 0.
+        """
+        if loss not in self._valid_losses:
+            raise ValueError(f"Invalid loss '{loss}', must be one of {self._valid_losses}, which can predict probabilities")
+        parameters = {"loss": loss,
+                      "penalty": penalty,
+                      "alpha": alpha,
+                      "l1_ratio": l1_ratio,
+                      "max_iter": max_iter,
+                      "n_jobs": n_jobs}
+        parameters.update(kwargs)
+        random_seed = deprecate_arg("random_state", "random_seed", random_state, random_seed)
+        sgd_classifier = SKSGDClassifier(random_state=random_seed,
+                                         **parameters)
+        super().__init__(parameters=parameters,
+                         component_obj=sgd_classifier,
+                         random_seed=random_seed)
+
+    def partial_fit(self, X, y=None, classes=None):
+        """Fits the classifier on one chunk of the training data, updating the coefficients fit on previous chunks.
+
+        Arguments:
+            X (ww.DataTable, pd.DataFrame or np.ndarray): A chunk of the training data of shape [n_samples, n_features]
+            y (ww.DataColumn, pd.Series): The target of the chunk, of length [n_samples]
+            classes (list): All the classes of the target. Required on the first call, since a chunk may not contain every class.
+
+        Returns:
+            self
+        """
+        X, y = self._manage_woodwork(X, y)
+        self.input_feature_names = list(X.columns)
+        self._component_obj.partial_fit(_unwrap_sparse(X), y, classes=classes)
+        return self
+
+    @property
+    def feature_importance(self):
+        coef_ = self._component_obj.coef_
+        # binary classification case
+        if len(coef_) <= 2:
+            return coef_.flatten()
+        else:
+            # multiclass classification case
+            return np.linalg.norm(coef_, axis=0, ord=2)
@@ -0,0 +1,78 @@
+import numpy as np
+from sklearn.neighbors import KNeighborsClassifier as SKKNeighborsClassifier
+from skopt.space import Integer
+
+from evalml.model_family import ModelFamily
+from evalml.pipelines.components.estimators import Estimator
+from evalml.problem_types import ProblemTypes
+from evalml.utils import deprecate_arg
+
+# the KD tree only prunes effectively on data with few features
+_KD_TREE_MAX_FEATURES = 15
+
+
+class TreeKNeighborsClassifier(Estimator):
+    """K-Nearest Neighbors Classifier which always indexes the training data with a KD tree or ball tree.
+
+    Unlike `KNeighborsClassifier`, it never falls back to comparing each row against every training row, so it can be used on large datasets
+    with few features. With many features, such as one-hot encoded categorical features, its predict time approaches that of comparing every
+    row, so it is not included in AutoML searches by default.
+    """
+    name = "Tree KNN Classifier"
+    hyperparameter_ranges = {
+        "n_neighbors": Integer(2, 12),
+        "weights": ["uniform", "distance"],
+        "algorithm": ["kd_tree", "ball_tree"],
+        "leaf_size": Integer(10, 100)
+    }
+    model_family = ModelFamily.K_NEIGHBORS
+    supported_problem_types = [ProblemTypes.BINARY, ProblemTypes.MULTICLASS,
+                               ProblemTypes.TIME_SERIES_BINARY, ProblemTypes.TIME_SERIES_MULTICLASS]
+
+    def __init__(self,
+                 n_neighbors=5,
+                 weights="uniform",
+                 algorithm="auto",
+                 leaf_size=40,
+                 n_jobs=-1,
+                 random_state=None,
+                 random_seed=0,
+                 **kwargs):
+        """K-Nearest Neighbors Classifier on a KD tree or ball tree index.
+
+        Arguments:
+            n_neighbors (int): Number of neighbors which vote on the prediction. Defaults to 5.
+            weights (str): "uniform" or "distance", which weighs neighbors by the inverse of their distance. Defaults to "uniform".
+            algorithm (str): The index, "kd_tree" or "ball_tree". Ball trees are faster on data with many features. "auto" uses a KD tree for
+                data with at most 15 features and a ball tree otherwise. Defaults to "auto".
+            leaf_size (int): Number of training rows in each leaf of the tree, below which neighbors are compared directly. Defaults to 40.
+            n_jobs (int): Number of jobs to run in parallel when querying neighbors. -1 uses all processes. Defaults to -1.
+            random_seed (int): Seed for the random number generator. Defaults to 0.
+        """
+        if algorithm not in ["auto", "kd_tree", "ball_tree"]:
+            raise ValueError(f"Invalid algorithm '{algorithm}', must be 'auto', 'kd_tree' or 'ball_tree'")
+        parameters = {"n_neighbors": n_neighbors,
+                      "weights": weights,
+                      "algorithm": algorithm,
+                      "leaf_size": leaf_size,
+                      "n_jobs": n_jobs}
+        parameters.update(kwargs)
+        # sklearn's own "auto" can compare every row, so the tree is chosen in fit instead
+        knn_classifier = SKKNeighborsClassifier(**{**parameters, "algorithm": "kd_tree" if algorithm == "auto" else algorithm})
+        random_seed = deprecate_arg("random_state", "random_seed", random_state, random_seed)
+        super().__init__(parameters=parameters,
+                         component_obj=knn_classifier,
+                         random_seed=random_seed)
+
+    def fit(self, X, y=None):
+        X, y = self._manage_woodwork(X, y)
+        if self.parameters["algorithm"] == "auto":
+            self._component_obj.set_params(algorithm="kd_tree" if X.shape[1] <= _KD_TREE_MAX_FEATURES else "ball_tree")
+        self.input_feature_names = list(X.columns)
+        self._component_obj.fit(X, y)
+        return self
+
+    @property
+    def feature_importance(self):
+        """Returns an array of 0's matching the number of input features, as feature importance is not defined for KNN classifiers."""
+        return np.zeros(self._component_obj.n_features_in_)
@@ -0,0 +1,37 @@
+import pandas as pd
+from sklearn.model_selection import ShuffleSplit, StratifiedShuffleSplit
+
+# fraction of the training data held out to decide when gradient boosting estimators stop adding trees
+EARLY_STOPPING_VALIDATION_FRACTION = 0.1
+
+
+def split_for_early_stopping(X, y, random_seed=0, stratify=False):
+    """Splits a validation set off the training data of an estimator, for it to evaluate its iterations on and stop once they stop improving.
+
+    Arguments:
+        X (pd.DataFrame, scipy.sparse.spmatrix): Training features.
+        y (pd.Series): Training target.
+        random_seed (int): Seed for the random number generator. Defaults to 0.
+        stratify (bool): Whether to keep the proportion of each class in both sets, for classification. Falls back to a
+            random split if there are too few rows of some class. Defaults to False.
+
+    Returns:
+        pd.DataFrame, pd.DataFrame, pd.Series, pd.Series: The features and targets to train on and to validate on.
+    """
+    splitter = ShuffleSplit(n_splits=1, test_size=EARLY_STOPPING_VALIDATION_FRACTION, random_state=random_seed)
+    if stratify:
+        try:
+            stratified_splitter = StratifiedShuffleSplit(n_splits=1, test_size=EARLY_STOPPING_VALIDATION_FRACTION, random_state=random_seed)
+            train, valid = next(stratified_splitter.split(X, y))
+            return _take_rows(X, train), _take_rows(X, valid), y.iloc[train], y.iloc[valid]
+        except ValueError:
+            pass
+    train, valid = next(splitter.split(X, y))
+    return _take_rows(X, train), _take_rows(X, valid), y.iloc[train], y.iloc[valid]
+
+
+def _take_rows(X, rows):
+    """Selects rows by position from a pd.DataFrame or a scipy sparse matrix."""
+    if isinstance(X, pd.DataFrame):
+        return X.iloc[rows]
+    return X[rows]
@@ -4,6 +4,7 @@ from evalml.exceptions import MethodPropertyNotFoundError
 from evalml.model_family import ModelFamily
 from evalml.pipelines.components import ComponentBase
 from evalml.utils import _convert_woodwork_types_wrapper, infer_feature_types
+from evalml.utils.sparse_utils import _is_sparse, _unwrap_sparse
 
 
 class Estimator(ComponentBase):
@@ -32,9 +33,10 @@ class Estimator(ComponentBase):
         super().__init__(parameters=parameters, component_obj=component_obj, random_seed=random_seed, **kwargs)
 
     def _manage_woodwork(self, X, y=None):
-        """Function to convert the input and target data to Pandas data structures."""
-        X = infer_feature_types(X)
-        X = _convert_woodwork_types_wrapper(X.to_dataframe())
+        """Function to convert the input and target data to Pandas data structures. Sparse input data is left sparse."""
+        if not _is_sparse(X):
+            X = infer_feature_types(X)
+            X = _convert_woodwork_types_wrapper(X.to_dataframe())
         if y is not None:
             y = infer_feature_types(y)
             y = _convert_woodwork_types_wrapper(y.to_series())
@@ -43,7 +45,7 @@ class Estimator(ComponentBase):
     def fit(self, X, y=None):
         X, y = self._manage_woodwork(X, y)
         self.input_feature_names = list(X.columns)
-        self._component_obj.fit(X, y)
+        self._component_obj.fit(_unwrap_sparse(X), y)
         return self
 
     def predict(self, X):
@@ -56,9 +58,8 @@ class Estimator(ComponentBase):
             ww.DataColumn: Predicted values
         """
         try:
-            X = infer_feature_types(X)
-            X = _convert_woodwork_types_wrapper(X.to_dataframe())
-            predictions = self._component_obj.predict(X)
+            X, _ = self._manage_woodwork(X)
+            predictions = self._component_obj.predict(_unwrap_sparse(X))
         except AttributeError:
             raise MethodPropertyNotFoundError("Estimator requires a predict method or a component_obj that implements predict")
         return infer_feature_types(predictions)
@@ -73,9 +74,8 @@ class Estimator(ComponentBase):
             ww.DataTable: Probability estimates
         """
         try:
-            X = infer_feature_types(X)
-            X = _convert_woodwork_types_wrapper(X.to_dataframe())
-            pred_proba = self._component_obj.predict_proba(X)
+            X, _ = self._manage_woodwork(X)
+            pred_proba = self._component_obj.predict_proba(_unwrap_sparse(X))
         except AttributeError:
             raise MethodPropertyNotFoundError("Estimator requires a predict_proba method or a component_obj that implements predict_proba")
         return infer_feature_types(pred_proba)
@@ -9,3 +9,6 @@ from .baseline_regressor import BaselineRegressor
 from .decision_tree_regressor import DecisionTreeRegressor
 from .time_series_baseline_estimator import TimeSeriesBaselineEstimator
 from .svm_regressor import SVMRegressor
+from .hist_gradient_boosting_regressor import HistGradientBoostingRegressor
+from .nystroem_svm_regressor import NystroemSVMRegressor
+from .sgd_regressor import SGDRegressor
@@ -4,6 +4,9 @@ from skopt.space import Integer, Real
 
 from evalml.model_family import ModelFamily
 from evalml.pipelines.components.estimators import Estimator
+from evalml.pipelines.components.estimators.early_stopping import (
+    split_for_early_stopping
+)
 from evalml.problem_types import ProblemTypes
 from evalml.utils import deprecate_arg, import_or_raise, infer_feature_types
 
@@ -25,20 +28,23 @@ class CatBoostRegressor(Estimator):
     supported_problem_types = [ProblemTypes.REGRESSION, ProblemTypes.TIME_SERIES_REGRESSION]
 
     def __init__(self, n_estimators=10, eta=0.03, max_depth=6, bootstrap_type=None, silent=False,
-                 allow_writing_files=False, random_state=None, random_seed=0, **kwargs):
+                 allow_writing_files=False, early_stopping_rounds=None, random_state=None, random_seed=0, **kwargs):
         random_seed = deprecate_arg("random_state", "random_seed", random_state, random_seed)
         parameters = {"n_estimators": n_estimators,
                       "eta": eta,
                       "max_depth": max_depth,
                       'bootstrap_type': bootstrap_type,
                       'silent': silent,
-                      'allow_writing_files': allow_writing_files}
+                      'allow_writing_files': allow_writing_files,
+                      'early_stopping_rounds': early_stopping_rounds}
         parameters.update(kwargs)
 
         cb_error_msg = "catboost is not installed. Please install using `pip install catboost.`"
         catboost = import_or_raise("catboost", error_msg=cb_error_msg)
+        self.best_iteration = None
         # catboost will choose an intelligent default for bootstrap_type, so only set if provided
         cb_parameters = copy.copy(parameters)
+        cb_parameters.pop('early_stopping_rounds')
         if bootstrap_type is None:
             cb_parameters.pop('bootstrap_type')
         cb_regressor = catboost.CatBoostRegressor(**cb_parameters,
@@ -52,7 +58,14 @@ class CatBoostRegressor(Estimator):
         cat_cols = list(X.select('category').columns)
         self.input_feature_names = list(X.columns)
         X, y = super()._manage_woodwork(X, y)
-        self._component_obj.fit(X, y, silent=True, cat_features=cat_cols)
+        early_stopping_rounds = self.parameters['early_stopping_rounds']
+        if early_stopping_rounds is None:
+            self._component_obj.fit(X, y, silent=True, cat_features=cat_cols)
+            return self
+        X, X_valid, y, y_valid = split_for_early_stopping(X, y, self.random_seed)
+        self._component_obj.fit(X, y, silent=True, cat_features=cat_cols, eval_set=(X_valid, y_valid),
+                                early_stopping_rounds=early_stopping_rounds)
+        self.best_iteration = self._component_obj.get_best_iteration()
         return self
 
     @property
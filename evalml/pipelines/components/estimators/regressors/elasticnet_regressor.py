@@ -16,6 +16,7 @@ class ElasticNetRegressor(Estimator):
     }
     model_family = ModelFamily.LINEAR_MODEL
     supported_problem_types = [ProblemTypes.REGRESSION, ProblemTypes.TIME_SERIES_REGRESSION]
+    supports_sparse_input = True
 
     def __init__(self, alpha=0.5, l1_ratio=0.5, max_iter=1000, normalize=False,
                  random_state=None, random_seed=0, **kwargs):
@@ -0,0 +1,58 @@
+import numpy as np
+from skopt.space import Integer, Real
+
+from evalml.model_family import ModelFamily
+from evalml.pipelines.components.estimators import Estimator
+from evalml.problem_types import ProblemTypes
+from evalml.utils import deprecate_arg
+
+try:
+    from sklearn.ensemble import \
+        HistGradientBoostingRegressor as SKHistGradientBoostingRegressor
+except ImportError:  # scikit-learn < 1.0 requires enabling the experimental estimator
+    from sklearn.experimental import enable_hist_gradient_boosting  # noqa: F401
+    from sklearn.ensemble import \
+        HistGradientBoostingRegressor as SKHistGradientBoostingRegressor
+
+
+class HistGradientBoostingRegressor(Estimator):
+    """Histogram-based Gradient Boosting Regressor. Bins each feature into at most 255 bins, which makes it fast on large datasets."""
+    name = "Histogram Gradient Boosting Regressor"
+    hyperparameter_ranges = {
+        "learning_rate": Real(0.000001, 1),
+        "max_iter": Integer(10, 100),
+        "max_leaf_nodes": Integer(2, 100),
+        "min_samples_leaf": Integer(1, 100),
+        "l2_regularization": Real(0, 1)
+    }
+    model_family = ModelFamily.HIST_GRADIENT_BOOSTING
+    supported_problem_types = [ProblemTypes.REGRESSION, ProblemTypes.TIME_SERIES_REGRESSION]
+
+    def __init__(self,
+                 learning_rate=0.1,
+                 max_iter=100,
+                 max_leaf_nodes=31,
+                 max_depth=None,
+                 min_samples_leaf=20,
+                 l2_regularization=0.0,
+                 random_state=None,
+                 random_seed=0,
+                 **kwargs):
+        parameters = {"learning_rate": learning_rate,
+                      "max_iter": max_iter,
+                      "max_leaf_nodes": max_leaf_nodes,
+                      "max_depth": max_depth,
+                      "min_samples_leaf": min_samples_leaf,
+                      "l2_regularization": l2_regularization}
+        parameters.update(kwargs)
+        random_seed = deprecate_arg("random_state", "random_seed", random_state, random_seed)
+        hgb_regressor = SKHistGradientBoostingRegressor(random_state=random_seed,
+                                                        **parameters)
+        super().__init__(parameters=parameters,
+                         component_obj=hgb_regressor,
+                         random_seed=random_seed)
+
+    @property
+    def feature_importance(self):
+        """Returns an array of 0's matching the number of input features, as the estimator does not compute feature importances."""
+        return np.zeros(self._component_obj.n_features_in_)
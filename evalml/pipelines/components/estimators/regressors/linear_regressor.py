@@ -15,6 +15,7 @@ class LinearRegressor(Estimator):
     }
     model_family = ModelFamily.LINEAR_MODEL
     supported_problem_types = [ProblemTypes.REGRESSION, ProblemTypes.TIME_SERIES_REGRESSION]
+    supports_sparse_input = True
 
     def __init__(self, fit_intercept=True, normalize=False, n_jobs=-1, random_state=None, random_seed=0, **kwargs):
         parameters = {
@@ -0,0 +1,75 @@
+import numpy as np
+from sklearn.kernel_approximation import Nystroem
+from sklearn.linear_model import SGDRegressor
+from skopt.space import Integer, Real
+
+from evalml.model_family import ModelFamily
+from evalml.pipelines.components.estimators import Estimator
+from evalml.problem_types import ProblemTypes
+from evalml.utils import deprecate_arg, infer_feature_types
+
+
+class NystroemSVMRegressor(Estimator):
+    """Support Vector Machine Regressor which approximates a kernel with the Nystroem method and fits a linear SVM on the approximation.
+
+    Unlike `SVMRegressor`, training time grows linearly with the number of rows, so it can be used on large datasets.
+    """
+    name = "Nystroem SVM Regressor"
+    hyperparameter_ranges = {
+        "alpha": Real(0.000001, 0.1),
+        "kernel": ["rbf", "poly", "sigmoid"],
+        "n_components": Integer(50, 500)
+    }
+    model_family = ModelFamily.SVM
+    supported_problem_types = [ProblemTypes.REGRESSION, ProblemTypes.TIME_SERIES_REGRESSION]
+
+    def __init__(self,
+                 alpha=0.0001,
+                 kernel="rbf",
+                 gamma=None,
+                 n_components=100,
+                 loss="epsilon_insensitive",
+                 max_iter=1000,
+                 random_state=None,
+                 random_seed=0,
+                 **kwargs):
+        """Support Vector Machine Regressor on a Nystroem kernel approximation.
+
+        Arguments:
+            alpha (float): Regularization strength of the linear SVM. Defaults to 0.0001.
+            kernel (str): Kernel to approximate, "rbf", "poly" or "sigmoid". Defaults to "rbf".
+            gamma (float): Kernel coefficient. Defaults to None, which uses 1 / n_features.
+            n_components (int): Number of training rows used to approximate the kernel, which is the number of features the linear SVM is fit on.
+                Defaults to 100.
+            loss (str): "epsilon_insensitive", the loss of a linear SVM, or "squared_epsilon_insensitive". Defaults to "epsilon_insensitive".
+            max_iter (int): Maximum number of passes over the training data. Defaults to 1000.
+            random_seed (int): Seed for the random number generator. Defaults to 0.
+        """
+        parameters = {"alpha": alpha,
+                      "kernel": kernel,
+                      "gamma": gamma,
+                      "n_components": n_components,
+                      "loss": loss,
+                      "max_iter": max_iter}
+        parameters.update(kwargs)
+        random_seed = deprecate_arg("random_state", "random_seed", random_state, random_seed)
+        self._nystroem = Nystroem(kernel=kernel, gamma=gamma, n_components=n_components, random_state=random_seed)
+        svm_regressor = SGDRegressor(alpha=alpha, loss=loss, max_iter=max_iter, random_state=random_seed, **kwargs)
+        super().__init__(parameters=parameters,
+                         component_obj=svm_regressor,
+                         random_seed=random_seed)
+
+    def fit(self, X, y=None):
+        X, y = self._manage_woodwork(X, y)
+        self.input_feature_names = list(X.columns)
+        self._component_obj.fit(self._nystroem.fit_transform(X), y)
+        return self
+
+    def predict(self, X):
+        X, _ = self._manage_woodwork(X)
+        return infer_feature_types(self._component_obj.predict(self._nystroem.transform(X)))
+
+    @property
+    def feature_importance(self):
+        """Returns an array of 0's matching the number of input features, as feature importance is not defined for kernel SVMs."""
+        return np.zeros(self._nystroem.components_.shape[1])
@@ -0,0 +1,77 @@
+from sklearn.linear_model import SGDRegressor as SKSGDRegressor
+from skopt.space import Real
+
+from evalml.model_family import ModelFamily
+from evalml.pipelines.components.estimators import Estimator
+from evalml.problem_types import ProblemTypes
+from evalml.utils import deprecate_arg
+from evalml.utils.sparse_utils import _unwrap_sparse
+
+
+class SGDRegressor(Estimator):
+    """Linear regressor fit with stochastic gradient descent.
+
+    Besides `fit`, it supports `partial_fit`, which fits the regressor one chunk of data at a time, so it can be trained on data which does not fit in memory.
+    """
+    name = "SGD Regressor"
+    hyperparameter_ranges = {
+        "loss": ["squared_loss", "huber", "epsilon_insensitive"],
+        "alpha": Real(0.000001, 0.1),
+        "l1_ratio": Real(0, 1),
+    }
+    model_family = ModelFamily.LINEAR_MODEL
+    supported_problem_types = [ProblemTypes.REGRESSION, ProblemTypes.TIME_SERIES_REGRESSION]
+    supports_sparse_input = True
+    supports_partial_fit = True
+
+    def __init__(self,
+                 loss="squared_loss",
+                 penalty="elasticnet",
+                 alpha=0.0001,
+                 l1_ratio=0.15,
+                 max_iter=1000,
+                 random_state=None,
+                 random_seed=0,
+                 **kwargs):
+        """Linear regressor fit with stochastic gradient descent.
+
+        Arguments:
+            loss (str): Loss function, "squared_loss" for least squares, "huber" for a loss which is less sensitive to outliers or
+                "epsilon_insensitive", which fits a linear SVM. Defaults to "squared_loss".
+            penalty (str): Regularization penalty, "l2", "l1" or "elasticnet". Defaults to "elasticnet".
+            alpha (float): Regularization strength. Defaults to 0.0001.
+            l1_ratio (float): Mix of L1 and L2 regularization when penalty is "elasticnet", from 0 for L2 to 1 for L1. Defaults to 0.15.
+            max_iter (int): Maximum number of passes over the training data in `fit`. `partial_fit` makes one pass over each chunk. Defaults to 1000.
+            random_seed (int): Seed for the random number generator. Defaults to 0.
+        """
+        parameters = {"loss": loss,
+                      "penalty": penalty,
+                      "alpha": alpha,
+                      "l1_ratio": l1_ratio,
+                      "max_iter": max_iter}
+        parameters.update(kwargs)
+        random_seed = deprecate_arg("random_state", "random_seed", random_state, random_seed)
+        sgd_regressor = SKSGDRegressor(random_state=random_seed,
+                                       **parameters)
+        super().__init__(parameters=parameters,
+                         component_obj=sgd_regressor,
+                         random_seed=random_seed)
+
+    def partial_fit(self, X, y=None):
+        """Fits the regressor on one chunk of the training data, updating the coefficients fit on previous chunks.
+
+        Arguments:
+            X (ww.DataTable, pd.DataFrame or np.ndarray): A chunk of the training data of shape [n_samples, n_features]
+            y (ww.DataColumn, pd.Series): The target of the chunk, of length [n_samples]
+
+        Returns:
+            self
+        """
+        X, y = self._manage_woodwork(X, y)
+        self.input_feature_names = list(X.columns)
+        self._component_obj.partial_fit(_unwrap_sparse(X), y)
+        return self
+
+    @property
+    def feature_importance(self):
+        return self._component_obj.coef_
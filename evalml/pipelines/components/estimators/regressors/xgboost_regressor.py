@@ -2,12 +2,17 @@ from skopt.space import Integer, Real
 
 from evalml.model_family import ModelFamily
 from evalml.pipelines.components.estimators import Estimator
+from evalml.pipelines.components.estimators.early_stopping import (
+    split_for_early_stopping
+)
 from evalml.problem_types import ProblemTypes
+from evalml.utils import infer_feature_types
 from evalml.utils.gen_utils import (
-    _rename_column_names_to_numeric,
+    _with_positional_column_names,
     deprecate_arg,
     import_or_raise
 )
+from evalml.utils.sparse_utils import SparseFeatures
 
 
 class XGBoostRegressor(Estimator):
@@ -21,25 +26,29 @@ class XGBoostRegressor(Estimator):
     }
     model_family = ModelFamily.XGBOOST
     supported_problem_types = [ProblemTypes.REGRESSION, ProblemTypes.TIME_SERIES_REGRESSION]
+    supports_sparse_input = True
 
     # xgboost supports seeds from -2**31 to 2**31 - 1 inclusive. these limits ensure the random seed generated below
     # is within that range.
     SEED_MIN = -2**31
     SEED_MAX = 2**31 - 1
 
-    def __init__(self, eta=0.1, max_depth=6, min_child_weight=1, n_estimators=100, random_state=None,
+    def __init__(self, eta=0.1, max_depth=6, min_child_weight=1, n_estimators=100, early_stopping_rounds=None, random_state=None,
                  random_seed=0, **kwargs):
         parameters = {"eta": eta,
                       "max_depth": max_depth,
                       "min_child_weight": min_child_weight,
-                      "n_estimators": n_estimators}
+                      "n_estimators": n_estimators,
+                      "early_stopping_rounds": early_stopping_rounds}
         parameters.update(kwargs)
+        xgb_parameters = {name: value for name, value in parameters.items() if name != 'early_stopping_rounds'}
 
         xgb_error_msg = "XGBoost is not installed. Please install using `pip install xgboost.`"
         xgb = import_or_raise("xgboost", error_msg=xgb_error_msg)
         random_seed = deprecate_arg("random_state", "random_seed", random_state, random_seed)
         xgb_Regressor = xgb.XGBRegressor(random_state=random_seed,
-                                         **parameters)
+                                         **xgb_parameters)
+        self.best_iteration = None
         super().__init__(parameters=parameters,
                          component_obj=xgb_Regressor,
                          random_seed=random_seed)
@@ -47,13 +56,20 @@ class XGBoostRegressor(Estimator):
     def fit(self, X, y=None):
         X, y = super()._manage_woodwork(X, y)
         self.input_feature_names = list(X.columns)
-        X = _rename_column_names_to_numeric(X, flatten_tuples=False)
-        self._component_obj.fit(X, y)
+        X = X.matrix if isinstance(X, SparseFeatures) else _with_positional_column_names(X)
+        early_stopping_rounds = self.parameters['early_stopping_rounds']
+        if early_stopping_rounds is None:
+            self._component_obj.fit(X, y)
+            return self
+        X, X_valid, y, y_valid = split_for_early_stopping(X, y, self.random_seed)
+        self._component_obj.fit(X, y, eval_set=[(X_valid, y_valid)], early_stopping_rounds=early_stopping_rounds, verbose=False)
+        self.best_iteration = self._component_obj.best_iteration
         return self
 
     def predict(self, X):
-        X = _rename_column_names_to_numeric(X, flatten_tuples=False)
-        return super().predict(X)
+        X, _ = super()._manage_woodwork(X)
+        X = X.matrix if isinstance(X, SparseFeatures) else _with_positional_column_names(X)
+        return infer_feature_types(self._component_obj.predict(X))
 
     @property
     def feature_importance(self):
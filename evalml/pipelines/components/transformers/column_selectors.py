@@ -5,6 +5,7 @@ from evalml.utils import infer_feature_types
 
 
 class ColumnSelector(Transformer):
+    supports_partial_fit = True
 
     def __init__(self, columns=None, random_state=None, random_seed=0, **kwargs):
         """Initalizes an transformer that drops specified columns in input data.
@@ -51,6 +52,18 @@ class ColumnSelector(Transformer):
         self._check_input_for_columns(X)
         return self
 
+    def partial_fit(self, X, y=None):
+        """Fits the transformer on one chunk of the data. The selected columns do not depend on the data, so this is the same as `fit`.
+
+        Arguments:
+            X (ww.DataTable, pd.DataFrame): Chunk of the data to check.
+            y (ww.DataColumn, pd.Series, optional): Targets.
+
+        Returns:
+            self
+        """
+        return self.fit(X, y)
+
     def transform(self, X, y=None):
         X = infer_feature_types(X)
         self._check_input_for_columns(X)
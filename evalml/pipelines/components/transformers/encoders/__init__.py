@@ -1,2 +1,3 @@
 from .onehot_encoder import OneHotEncoder
+from .ordinal_encoder import OrdinalEncoder
 from .target_encoder import TargetEncoder
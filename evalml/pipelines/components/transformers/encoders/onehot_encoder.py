@@ -9,6 +9,7 @@ from evalml.utils import (
     _retain_custom_types_and_initalize_woodwork,
     infer_feature_types
 )
+from evalml.utils.sparse_utils import SparseFeatures
 
 
 class OneHotEncoderMeta(ComponentBaseMeta):
@@ -20,6 +21,7 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
     """One-hot encoder to encode non-numeric data."""
     name = 'One Hot Encoder'
     hyperparameter_ranges = {}
+    supports_partial_fit = True
 
     def __init__(self,
                  top_n=10,
@@ -28,6 +30,7 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
                  drop=None,
                  handle_unknown="ignore",
                  handle_missing="error",
+                 sparse=False,
                  random_state=None,
                  random_seed=0,
                  **kwargs):
@@ -49,13 +52,17 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
                 `fit` or `transform`. If this is set to "as_category" and NaN values are within the `n` most frequent,
                 "nan" values will be encoded as their own column. If this is set to "error", any missing
                 values encountered will raise an error. Defaults to "error".
+            sparse (bool): If True and all the columns which are not encoded are numeric, `transform` returns SparseFeatures, which
+                store the one-hot encodings in a scipy sparse matrix instead of one dense column per category. They are passed on as is
+                to estimators which support sparse input and converted to a dense ww.DataTable for other components. Defaults to False.
         """
         parameters = {"top_n": top_n,
                       "features_to_encode": features_to_encode,
                       "categories": categories,
                       "drop": drop,
                       "handle_unknown": handle_unknown,
-                      "handle_missing": handle_missing}
+                      "handle_missing": handle_missing,
+                      "sparse": sparse}
         parameters.update(kwargs)
 
         # Check correct inputs
@@ -124,6 +131,23 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
         self._encoder.fit(X_t[self.features_to_encode])
         return self
 
+    def partial_fit(self, X, y=None):
+        """Fits the encoder to one chunk of the training data.
+
+        Only supported when the categories of each feature are declared with the `categories` parameter, since the most frequent categories
+        cannot be found from one chunk. The features to encode are found from the first chunk if `features_to_encode` is None.
+
+        Arguments:
+            X (ww.DataTable, pd.DataFrame): A chunk of the training data of shape [n_samples, n_features]
+            y (ww.DataColumn, pd.Series, optional): Ignored.
+
+        Returns:
+            self
+        """
+        if self.parameters['categories'] is None:
+            raise ValueError("OneHotEncoder only supports partial_fit when the categories of each feature are declared with the categories parameter")
+        return self.fit(X, y)
+
     def transform(self, X, y=None):
         """One-hot encode the input data.
 
@@ -132,27 +156,26 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
             y (ww.DataColumn, pd.Series): Ignored.
 
         Returns:
-            ww.DataTable: Transformed data, where each categorical feature has been encoded into numerical columns using one-hot encoding.
+            ww.DataTable or SparseFeatures: Transformed data, where each categorical feature has been encoded into numerical columns using
+                one-hot encoding. SparseFeatures if the `sparse` parameter is True and all the columns which are not encoded are numeric.
         """
         X_ww = infer_feature_types(X)
         X_copy = _convert_woodwork_types_wrapper(X_ww.to_dataframe())
         X_copy = self._handle_parameter_handle_missing(X_copy)
 
-        X_t = pd.DataFrame()
-        # Add the non-categorical columns, untouched
-        for col in X_copy.columns:
-            if col not in self.features_to_encode:
-                X_t = pd.concat([X_t, X_copy[col]], axis=1)
-        # The call to pd.concat above changes the type of the index so we will manually keep it the same.
-        if not X_t.empty:
-            X_t.index = X_copy.index
-
-        # Call sklearn's transform on the categorical columns
-        if len(self.features_to_encode) > 0:
-            X_cat = pd.DataFrame(self._encoder.transform(X_copy[self.features_to_encode]).toarray(), index=X_copy.index)
-            X_cat.columns = self.get_feature_names()
-            X_t = pd.concat([X_t, X_cat], axis=1)
-
+        # Keep the non-categorical columns, untouched
+        X_t = X_copy.drop(columns=self.features_to_encode)
+        if len(self.features_to_encode) == 0:
+            return _retain_custom_types_and_initalize_woodwork(X_ww, X_t)
+
+        # Call sklearn's transform on the categorical columns, which returns a sparse matrix
+        X_cat = self._encoder.transform(X_copy[self.features_to_encode])
+        if self.parameters['sparse']:
+            X_sparse = SparseFeatures.concat([X_t, SparseFeatures(X_cat, self.get_feature_names(), index=X_copy.index)])
+            if X_sparse is not None:
+                return X_sparse
+        X_cat = pd.DataFrame(X_cat.toarray(), index=X_copy.index, columns=self.get_feature_names())
+        X_t = pd.concat([X_t, X_cat], axis=1)
         return _retain_custom_types_and_initalize_woodwork(X_ww, X_t)
 
     def _handle_parameter_handle_missing(self, X):
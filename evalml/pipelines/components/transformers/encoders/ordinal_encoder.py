@@ -0,0 +1,77 @@
+import pandas as pd
+
+from woodwork.logical_types import Categorical
+
+from evalml.pipelines.components.transformers.transformer import Transformer
+from evalml.utils import (
+    _convert_woodwork_types_wrapper,
+    _retain_custom_types_and_initalize_woodwork,
+    infer_feature_types
+)
+
+
+class OrdinalEncoder(Transformer):
+    """Ordinal encoder to encode categorical data as compact integer codes, for tree-based estimators."""
+    name = 'Ordinal Encoder'
+    hyperparameter_ranges = {}
+
+    def __init__(self, features_to_encode=None, random_state=None, random_seed=0, **kwargs):
+        """Initializes a transformer that replaces each category of categorical features with an integer code.
+
+        Unlike one-hot encoding, this keeps one column per feature however many categories it has.
+
+        Arguments:
+            features_to_encode (list[str]): List of columns to encode. All other columns will remain untouched.
+                If None, all categorical columns will be encoded. Defaults to None.
+        """
+        parameters = {"features_to_encode": features_to_encode}
+        parameters.update(kwargs)
+        self.features_to_encode = features_to_encode
+        self._categories = {}
+        super().__init__(parameters=parameters,
+                         component_obj=None,
+                         random_state=random_state,
+                         random_seed=random_seed)
+
+    def fit(self, X, y=None):
+        X = infer_feature_types(X)
+        if self.features_to_encode is None:
+            self.features_to_encode = list(X.select(include=['category']).columns)
+        X = _convert_woodwork_types_wrapper(X.to_dataframe())
+        invalid_features = [col for col in self.features_to_encode if col not in list(X.columns)]
+        if len(invalid_features) > 0:
+            raise ValueError("Could not find and encode {} in input data.".format(', '.join(invalid_features)))
+        self._categories = {col: pd.Categorical(X[col]).categories for col in self.features_to_encode}
+        return self
+
+    def transform(self, X, y=None):
+        """Ordinal encode the input data.
+
+        Arguments:
+            X (ww.DataTable, pd.DataFrame): Features to encode.
+            y (ww.DataColumn, pd.Series): Ignored.
+
+        Returns:
+            ww.DataTable: Transformed data, where each categorical feature has been replaced by the position of its value in the categories
+                seen during fit. Values not seen during fit, including missing values, are encoded as -1.
+        """
+        X_ww = infer_feature_types(X)
+        X = _convert_woodwork_types_wrapper(X_ww.to_dataframe())
+        X_t = X.copy(deep=False)
+        for col, categories in self._categories.items():
+            X_t[col] = categories.get_indexer(X[col])
+        return _retain_custom_types_and_initalize_woodwork(X_ww, X_t, ltypes_to_ignore=[Categorical])
+
+    def categories(self, feature_name):
+        """Returns the categories of a feature seen during fit, in the order of their codes.
+
+        Arguments:
+            feature_name (str): The name of any feature encoded during fit.
+
+        Returns:
+            pd.Index: The categories.
+        """
+        try:
+            return self._categories[feature_name]
+        except KeyError:
+            raise ValueError(f'Feature "{feature_name}" was not provided to ordinal encoder as a training feature')
@@ -1,3 +1,9 @@
+import copy
+import numbers
+
+import pandas as pd
+from pandas.api.types import is_categorical_dtype
+
 from evalml.pipelines.components.transformers import Transformer
 from evalml.pipelines.components.transformers.imputers import SimpleImputer
 from evalml.utils import (
@@ -16,6 +22,7 @@ class Imputer(Transformer):
     }
     _valid_categorical_impute_strategies = set(["most_frequent", "constant"])
     _valid_numeric_impute_strategies = set(["mean", "median", "most_frequent", "constant"])
+    supports_partial_fit = True
 
     def __init__(self, categorical_impute_strategy="most_frequent",
                  categorical_fill_value=None,
@@ -50,6 +57,8 @@ class Imputer(Transformer):
         self._all_null_cols = None
         self._numeric_cols = None
         self._categorical_cols = None
+        self._partial_fit_cols = None
+        self._fill_values = None
         super().__init__(parameters=parameters,
                          component_obj=None,
                          random_state=random_state,
@@ -68,25 +77,111 @@ class Imputer(Transformer):
         """
         X = infer_feature_types(X)
         cat_cols = list(X.select(['category', 'boolean']).columns)
+        bool_cols = list(X.select('boolean').columns)
         numeric_cols = list(X.select('numeric').columns)
 
         X = _convert_woodwork_types_wrapper(X.to_dataframe())
 
-        self._all_null_cols = set(X.columns) - set(X.dropna(axis=1, how='all').columns)
-        X_copy = X.copy()
-        X_null_dropped = X_copy.drop(self._all_null_cols, axis=1, errors='ignore')
+        self._all_null_cols = set(X.columns[X.isna().all()])
+        self._numeric_cols = None
+        self._categorical_cols = None
+
+        numeric_cols = [col for col in numeric_cols if col not in self._all_null_cols]
+        if len(numeric_cols) > 0:
+            self._numeric_imputer.fit(X[numeric_cols], y)
+            self._numeric_cols = pd.Index(numeric_cols)
+
+        cat_cols = [col for col in cat_cols if col not in self._all_null_cols]
+        if len(cat_cols) > 0:
+            self._categorical_imputer.fit(X[cat_cols], y)
+            self._categorical_cols = pd.Index(cat_cols)
+        self._partial_fit_cols = None
+        self._set_fill_values()
+        # sklearn fits boolean columns as categories and returns their fill values as numbers
+        for col in bool_cols:
+            if isinstance(self._fill_values.get(col), numbers.Number):
+                self._fill_values[col] = bool(self._fill_values[col])
+        return self
+
+    def _reset_partial_fit(self):
+        super()._reset_partial_fit()
+        self._partial_fit_cols = None
+        self._numeric_imputer._reset_partial_fit()
+        self._categorical_imputer._reset_partial_fit()
 
-        X_numerics = X_null_dropped[[col for col in numeric_cols if col not in self._all_null_cols]]
-        if len(X_numerics.columns) > 0:
-            self._numeric_imputer.fit(X_numerics, y)
-            self._numeric_cols = X_numerics.columns
+    def partial_fit(self, X, y=None):
+        """Fits imputer to one chunk of the training data, so that it can be fit on data which does not fit in memory.
 
-        X_categorical = X_null_dropped[[col for col in cat_cols if col not in self._all_null_cols]]
-        if len(X_categorical.columns) > 0:
-            self._categorical_imputer.fit(X_categorical, y)
-            self._categorical_cols = X_categorical.columns
+        The numeric and categorical columns are those of the first chunk. See `SimpleImputer.partial_fit` for the running statistics kept.
+        Imputers partially fit on different shards of the data can be combined with `merge`.
+
+        Arguments:
+            X (ww.DataTable, pd.DataFrame or np.ndarray): A chunk of the input training data of shape [n_samples, n_features]
+            y (ww.DataColumn, pd.Series, optional): Ignored.
+
+        Returns:
+            self
+        """
+        X = infer_feature_types(X)
+        if self._partial_fit_cols is None:
+            self._partial_fit_cols = {'numeric': list(X.select('numeric').columns),
+                                      'categorical': list(X.select(['category', 'boolean']).columns)}
+        X = _convert_woodwork_types_wrapper(X.to_dataframe())
+        for cols, imputer in [(self._partial_fit_cols['numeric'], self._numeric_imputer),
+                              (self._partial_fit_cols['categorical'], self._categorical_imputer)]:
+            if len(cols) > 0:
+                imputer.partial_fit(X[cols])
+        self._set_columns_from_partial_fit()
+        return self
+
+    def merge(self, other):
+        """Combines the running statistics of another imputer partially fit on other chunks of the same columns, for example by a parallel worker.
+
+        Arguments:
+            other (Imputer): Imputer with the same parameters, partially fit with `partial_fit`.
+
+        Returns:
+            self
+        """
+        if other._partial_fit_cols is None:
+            raise ValueError("Only imputers fit with partial_fit can be merged")
+        if other.parameters != self.parameters:
+            raise ValueError(f"Cannot merge imputers with different parameters: {self.parameters} and {other.parameters}")
+        if self._partial_fit_cols is None:
+            self._partial_fit_cols = copy.deepcopy(other._partial_fit_cols)
+        elif self._partial_fit_cols != other._partial_fit_cols:
+            raise ValueError(f"Cannot merge imputers partially fit on columns {self._partial_fit_cols} and {other._partial_fit_cols}")
+        if len(self._partial_fit_cols['numeric']) > 0:
+            self._numeric_imputer.merge(other._numeric_imputer)
+        if len(self._partial_fit_cols['categorical']) > 0:
+            self._categorical_imputer.merge(other._categorical_imputer)
+        self._set_columns_from_partial_fit()
+        self._is_fitted = True
         return self
 
+    def _set_columns_from_partial_fit(self):
+        """Sets the columns to impute and the all-null columns to drop from the imputers fit with `partial_fit`."""
+        self._all_null_cols = set()
+        for cols_type, imputer in [('numeric', self._numeric_imputer), ('categorical', self._categorical_imputer)]:
+            cols = self._partial_fit_cols[cols_type]
+            if len(cols) == 0:
+                continue
+            self._all_null_cols.update(imputer._all_null_cols)
+            non_null_cols = pd.Index([col for col in cols if col not in imputer._all_null_cols])
+            if cols_type == 'numeric':
+                self._numeric_cols = non_null_cols
+            else:
+                self._categorical_cols = non_null_cols
+        self._set_fill_values()
+
+    def _set_fill_values(self):
+        """Collects the fill value of each column from the fitted numeric and categorical imputers, so that transform imputes every column in one pass."""
+        self._fill_values = dict()
+        for cols, imputer in [(self._numeric_cols, self._numeric_imputer), (self._categorical_cols, self._categorical_imputer)]:
+            if cols is not None and len(cols) > 0:
+                # sklearn's imputer is fit on exactly these columns, in this order
+                self._fill_values.update(zip(cols, imputer._component_obj.statistics_))
+
     def transform(self, X, y=None):
         """Transforms data X by imputing missing values. 'None' values are converted to np.nan before imputation and are
             treated as the same.
@@ -100,18 +195,15 @@ class Imputer(Transformer):
         """
         X_ww = infer_feature_types(X)
         X_null_dropped = _convert_woodwork_types_wrapper(X_ww.to_dataframe())
-        X_null_dropped.drop(self._all_null_cols, inplace=True, axis=1, errors='ignore')
+        # not inplace, since the dataframe can be the one the input DataTable holds
+        X_null_dropped = X_null_dropped.drop(self._all_null_cols, axis=1, errors='ignore')
         if X_null_dropped.empty:
             return _retain_custom_types_and_initalize_woodwork(X_ww, X_null_dropped)
 
-        if self._numeric_cols is not None and len(self._numeric_cols) > 0:
-            X_numeric = X_null_dropped[self._numeric_cols]
-            imputed = self._numeric_imputer.transform(X_numeric).to_dataframe()
-            X_null_dropped[X_numeric.columns] = imputed
-
-        if self._categorical_cols is not None and len(self._categorical_cols) > 0:
-            X_categorical = X_null_dropped[self._categorical_cols]
-            imputed = self._categorical_imputer.transform(X_categorical).to_dataframe()
-            X_null_dropped[X_categorical.columns] = imputed
-        X_null_dropped = _retain_custom_types_and_initalize_woodwork(X_ww, X_null_dropped)
-        return X_null_dropped
+        fill_values = {col: value for col, value in self._fill_values.items() if col in X_null_dropped.columns}
+        for col, value in fill_values.items():
+            column = X_null_dropped[col]
+            if is_categorical_dtype(column) and value not in column.cat.categories:
+                X_null_dropped[col] = column.cat.add_categories([value])
+        X_null_dropped = X_null_dropped.fillna(fill_values)
+        return _retain_custom_types_and_initalize_woodwork(X_ww, X_null_dropped)
@@ -1,3 +1,5 @@
+import pandas as pd
+
 from evalml.pipelines.components.transformers import Transformer
 from evalml.pipelines.components.transformers.imputers.simple_imputer import (
     SimpleImputer
@@ -13,6 +15,7 @@ class PerColumnImputer(Transformer):
     """Imputes missing data according to a specified imputation strategy per column"""
     name = 'Per Column Imputer'
     hyperparameter_ranges = {}
+    supports_partial_fit = True
 
     def __init__(self, impute_strategies=None, default_impute_strategy="most_frequent",
                  random_state=None, random_seed=0, **kwargs):
@@ -33,6 +36,9 @@ class PerColumnImputer(Transformer):
         parameters = {"impute_strategies": impute_strategies,
                       "default_impute_strategy": default_impute_strategy}
         self.imputers = None
+        self._columns = None
+        self._column_groups = None
+        self._group_imputers = None
         self.default_impute_strategy = default_impute_strategy
         self.impute_strategies = impute_strategies or dict()
 
@@ -45,7 +51,10 @@ class PerColumnImputer(Transformer):
                          random_seed=random_seed)
 
     def fit(self, X, y=None):
-        """Fits imputers on input data
+        """Fits imputers on input data.
+
+        Columns with the same impute strategy, fill value and dtype are imputed together as one block by a single SimpleImputer,
+        which `imputers` maps each of these columns to.
 
         Arguments:
             X (ww.DataTable, pd.DataFrame or np.ndarray): The input training data of shape [n_samples, n_features] to fit.
@@ -56,17 +65,84 @@ class PerColumnImputer(Transformer):
         """
         X = infer_feature_types(X)
         X = _convert_woodwork_types_wrapper(X.to_dataframe())
-        self.imputers = dict()
+        self._create_imputers(X)
+
+        for group, imputer in self._group_imputers.items():
+            imputer.fit(X[self._column_groups[group]])
+
+        return self
+
+    def _reset_partial_fit(self):
+        super()._reset_partial_fit()
+        self.imputers = None
+        self._columns = None
+        self._column_groups = None
+        self._group_imputers = None
+
+    def partial_fit(self, X, y=None):
+        """Fits imputers to one chunk of the training data, so that they can be fit on data which does not fit in memory.
+
+        See `SimpleImputer.partial_fit` for the running statistics kept. Imputers partially fit on different shards of the data can be combined with `merge`.
+
+        Arguments:
+            X (ww.DataTable, pd.DataFrame or np.ndarray): A chunk of the input training data of shape [n_samples, n_features] to fit.
+            y (ww.DataColumn, pd.Series, optional): The target training data of length [n_samples]. Ignored.
+
+        Returns:
+            self
+        """
+        X = infer_feature_types(X)
+        X = _convert_woodwork_types_wrapper(X.to_dataframe())
+        if self._group_imputers is None:
+            self._create_imputers(X)
+        elif list(X.columns) != self._columns:
+            raise ValueError(f"Chunk has columns {list(X.columns)}, but the imputer was partially fit on columns {self._columns}")
+
+        for group, imputer in self._group_imputers.items():
+            imputer.partial_fit(X[self._column_groups[group]])
+        return self
+
+    def merge(self, other):
+        """Combines the running statistics of another imputer partially fit on other chunks of the same columns, for example by a parallel worker.
+
+        Arguments:
+            other (PerColumnImputer): Imputer with the same parameters, partially fit with `partial_fit`.
+
+        Returns:
+            self
+        """
+        if other._group_imputers is None:
+            raise ValueError("Only imputers fit with partial_fit can be merged")
+        if other.parameters != self.parameters:
+            raise ValueError(f"Cannot merge imputers with different parameters: {self.parameters} and {other.parameters}")
+        if self._group_imputers is None:
+            self._columns = list(other._columns)
+            self._column_groups = {group: list(columns) for group, columns in other._column_groups.items()}
+            self._group_imputers = {group: imputer.clone() for group, imputer in other._group_imputers.items()}
+            self._map_columns_to_imputers()
+        elif self._columns != other._columns or self._column_groups != other._column_groups:
+            raise ValueError(f"Cannot merge imputers partially fit on columns {self._columns} and {other._columns} with different dtypes")
+        for group, imputer in self._group_imputers.items():
+            imputer.merge(other._group_imputers[group])
+        self._is_fitted = True
+        return self
+
+    def _create_imputers(self, X):
+        """Groups the columns by impute strategy, fill value and dtype, and creates an unfitted SimpleImputer for each group."""
+        self._columns = list(X.columns)
+        self._column_groups = dict()
         for column in X.columns:
             strategy_dict = self.impute_strategies.get(column, dict())
             strategy = strategy_dict.get('impute_strategy', self.default_impute_strategy)
             fill_value = strategy_dict.get('fill_value', None)
-            self.imputers[column] = SimpleImputer(impute_strategy=strategy, fill_value=fill_value)
-
-        for column, imputer in self.imputers.items():
-            imputer.fit(X[[column]])
+            self._column_groups.setdefault((strategy, fill_value, X[column].dtype.name), []).append(column)
+        self._group_imputers = {group: SimpleImputer(impute_strategy=group[0], fill_value=group[1]) for group in self._column_groups}
+        self._map_columns_to_imputers()
 
-        return self
+    def _map_columns_to_imputers(self):
+        """Sets `imputers` to map each column to the imputer shared by its group."""
+        column_groups = {column: group for group, columns in self._column_groups.items() for column in columns}
+        self.imputers = {column: self._group_imputers[column_groups[column]] for column in self._columns}
 
     def transform(self, X, y=None):
         """Transforms input data by imputing missing values.
@@ -80,13 +156,10 @@ class PerColumnImputer(Transformer):
         """
         X_ww = infer_feature_types(X)
         X = _convert_woodwork_types_wrapper(X_ww.to_dataframe())
-        X_t = X.copy()
-        cols_to_drop = []
-        for column, imputer in self.imputers.items():
-            transformed = imputer.transform(X[[column]]).to_dataframe()
-            if transformed.empty:
-                cols_to_drop.append(column)
-            else:
-                X_t[column] = transformed[column]
-        X_t = X_t.drop(cols_to_drop, axis=1)
+        fitted_columns = set(self._columns)
+        blocks = [X[[column for column in X.columns if column not in fitted_columns]]]
+        for group, imputer in self._group_imputers.items():
+            blocks.append(imputer._transform_dataframe(X[self._column_groups[group]]))
+        X_t = pd.concat(blocks, axis=1)
+        X_t = X_t[[column for column in X.columns if column in X_t.columns]]
         return _retain_custom_types_and_initalize_woodwork(X_ww, X_t)
@@ -1,4 +1,8 @@
+import copy
+
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
 from sklearn.impute import SimpleImputer as SkImputer
 
 from evalml.pipelines.components.transformers import Transformer
@@ -7,12 +11,14 @@ from evalml.utils import (
     _retain_custom_types_and_initalize_woodwork,
     infer_feature_types
 )
+from evalml.utils.sketch_utils import QuantileSketch, TopKSketch
 
 
 class SimpleImputer(Transformer):
     """Imputes missing data according to a specified imputation strategy."""
     name = 'Simple Imputer'
     hyperparameter_ranges = {"impute_strategy": ["mean", "median", "most_frequent"]}
+    supports_partial_fit = True
 
     def __init__(self, impute_strategy="most_frequent", fill_value=None, random_state=None, random_seed=0, **kwargs):
         """Initalizes an transformer that imputes missing data according to the specified imputation strategy."
@@ -30,6 +36,7 @@ class SimpleImputer(Transformer):
                             fill_value=fill_value,
                             **kwargs)
         self._all_null_cols = None
+        self._running_statistics = None
         super().__init__(parameters=parameters,
                          component_obj=imputer,
                          random_state=random_state,
@@ -46,16 +53,125 @@ class SimpleImputer(Transformer):
         Returns:
             self
         """
+        X = self._prepare_fit_input(X)
+        X_null_dropped = X.dropna(axis=1, how='all')
+        self._all_null_cols = set(X.columns) - set(X_null_dropped.columns)
+        if len(X_null_dropped.columns) > 0:
+            self._component_obj.fit(X_null_dropped, y)
+        self._running_statistics = None
+        return self
+
+    def _reset_partial_fit(self):
+        super()._reset_partial_fit()
+        self._running_statistics = None
+
+    def partial_fit(self, X, y=None):
+        """Fits imputer to one chunk of the training data, so that it can be fit on data which does not fit in memory.
+
+        Running statistics are kept over the chunks. Means are computed exactly from running sums and counts. Medians are estimated with a
+        `QuantileSketch` and most frequent values with a `TopKSketch`, which are exact for columns with up to 400 and 1000 distinct values.
+        Imputers partially fit on different shards of the data can be combined with `merge`.
+
+        Arguments:
+            X (ww.DataTable, pd.DataFrame or np.ndarray): A chunk of the input training data of shape [n_samples, n_features]
+            y (ww.DataColumn, pd.Series, optional): Ignored.
+
+        Returns:
+            self
+        """
+        impute_strategy = self.parameters['impute_strategy']
+        X = self._prepare_fit_input(X)
+        if self._running_statistics is None:
+            self._running_statistics = {'columns': list(X.columns),
+                                        'numeric': {col: is_numeric_dtype(X[col]) and not is_bool_dtype(X[col]) for col in X.columns},
+                                        'count': pd.Series(0, index=X.columns),
+                                        'sum': pd.Series(0.0, index=X.columns),
+                                        'sketches': {col: QuantileSketch() if impute_strategy == 'median' else TopKSketch() for col in X.columns},
+                                        'example': {}}
+        statistics = self._running_statistics
+        if list(X.columns) != statistics['columns']:
+            raise ValueError(f"Chunk has columns {list(X.columns)}, but the imputer was partially fit on columns {statistics['columns']}")
+
+        if impute_strategy in ['mean', 'median']:
+            non_numeric_cols = [col for col in X.columns if not is_numeric_dtype(X[col])]
+            if non_numeric_cols:
+                raise ValueError(f"Cannot use {impute_strategy} strategy with non-numeric data: {non_numeric_cols}")
+        statistics['count'] += X.count()
+        if impute_strategy == 'mean':
+            statistics['sum'] += X.sum()
+        elif impute_strategy in ['median', 'most_frequent']:
+            for col in X.columns:
+                statistics['sketches'][col].update(X[col])
+        else:
+            for col in X.columns:
+                if col not in statistics['example'] and X[col].count() > 0:
+                    statistics['example'][col] = X[col].dropna().iloc[0]
+        self._fit_to_running_statistics()
+        return self
+
+    def merge(self, other):
+        """Combines the running statistics of another imputer partially fit on other chunks of the same columns, for example by a parallel worker.
+
+        Arguments:
+            other (SimpleImputer): Imputer with the same parameters, partially fit with `partial_fit`.
+
+        Returns:
+            self
+        """
+        if other._running_statistics is None:
+            raise ValueError("Only imputers fit with partial_fit can be merged")
+        if other.parameters != self.parameters:
+            raise ValueError(f"Cannot merge imputers with different parameters: {self.parameters} and {other.parameters}")
+        if self._running_statistics is None:
+            self._running_statistics = copy.deepcopy(other._running_statistics)
+        else:
+            statistics = self._running_statistics
+            if other._running_statistics['columns'] != statistics['columns']:
+                raise ValueError(f"Cannot merge imputers partially fit on columns {statistics['columns']} and {other._running_statistics['columns']}")
+            statistics['count'] += other._running_statistics['count']
+            statistics['sum'] += other._running_statistics['sum']
+            for col, sketch in other._running_statistics['sketches'].items():
+                statistics['sketches'][col].merge(sketch)
+            for col, example in other._running_statistics['example'].items():
+                statistics['example'].setdefault(col, example)
+        self._fit_to_running_statistics()
+        self._is_fitted = True
+        return self
+
+    def _fit_to_running_statistics(self):
+        """Fits the sklearn imputer to the fill values given by the running statistics kept by `partial_fit`."""
+        statistics = self._running_statistics
+        fill_values = {col: self._running_fill_value(col) for col in statistics['columns'] if statistics['count'][col] > 0}
+        self._all_null_cols = set(statistics['columns']) - set(fill_values)
+        if fill_values:
+            # fitting the sklearn imputer on a single row of the fill values sets exactly those fill values
+            X_fill_values = pd.DataFrame({col: pd.Series([value], dtype=None if statistics['numeric'][col] else object)
+                                          for col, value in fill_values.items()})
+            self._component_obj.fit(X_fill_values)
+
+    def _running_fill_value(self, col):
+        """Returns the fill value of a column from the running statistics kept by `partial_fit`."""
+        statistics = self._running_statistics
+        impute_strategy = self.parameters['impute_strategy']
+        if impute_strategy == 'mean':
+            return statistics['sum'][col] / statistics['count'][col]
+        if impute_strategy == 'median':
+            return statistics['sketches'][col].quantile(0.5)
+        if impute_strategy == 'most_frequent':
+            return statistics['sketches'][col].most_frequent()
+        # the constant fill value is set by sklearn, which only needs a value of the same type as the column
+        return statistics['example'][col]
+
+    @staticmethod
+    def _prepare_fit_input(X):
+        """Converts the input data to a pd.DataFrame which sklearn's imputer can be fit on."""
         X = infer_feature_types(X)
         X = _convert_woodwork_types_wrapper(X.to_dataframe())
 
         # Convert all bool dtypes to category for fitting
         if (X.dtypes == bool).all():
             X = X.astype('category')
-
-        self._component_obj.fit(X, y)
-        self._all_null_cols = set(X.columns) - set(X.dropna(axis=1, how='all').columns)
-        return self
+        return X
 
     def transform(self, X, y=None):
         """Transforms input by imputing missing values. 'None' and np.nan values are treated as the same.
@@ -74,17 +190,25 @@ class SimpleImputer(Transformer):
         if (X.dtypes == bool).all():
             return infer_feature_types(X)
 
-        X_null_dropped = X.copy()
-        X_null_dropped.drop(self._all_null_cols, axis=1, errors='ignore', inplace=True)
-        X_t = self._component_obj.transform(X)
-        if X_null_dropped.empty:
-            X_t = pd.DataFrame(X_t, columns=X_null_dropped.columns)
+        X_t = self._transform_dataframe(X)
+        if X_t.empty:
+            X_t = pd.DataFrame(np.empty((len(X_t), 0)), columns=X_t.columns)
             return infer_feature_types(X_t)
-
-        X_t = pd.DataFrame(X_t, columns=X_null_dropped.columns)
-        X_t.index = X_null_dropped.index
         return _retain_custom_types_and_initalize_woodwork(X_ww, X_t)
 
+    def _transform_dataframe(self, X):
+        """Imputes a pd.DataFrame with the fitted sklearn imputer and drops the all-null columns, without initializing woodwork.
+
+        Used by `PerColumnImputer` to impute blocks of columns and initialize woodwork once for all of them.
+        """
+        if (X.dtypes == bool).all():
+            return X
+        X_null_dropped = X.drop(self._all_null_cols, axis=1, errors='ignore')
+        if X_null_dropped.empty:
+            return X_null_dropped
+        X_t = self._component_obj.transform(X_null_dropped)
+        return pd.DataFrame(X_t, columns=X_null_dropped.columns, index=X_null_dropped.index)
+
     def fit_transform(self, X, y=None):
         """Fits on X and transforms X
 
@@ -1,3 +1,6 @@
+import copy
+
+import numpy as np
 import pandas as pd
 from sklearn.preprocessing import StandardScaler as SkScaler
 from woodwork.logical_types import Categorical, Integer
@@ -14,6 +17,7 @@ class StandardScaler(Transformer):
     """Standardize features: removes mean and scales to unit variance."""
     name = "Standard Scaler"
     hyperparameter_ranges = {}
+    supports_partial_fit = True
 
     def __init__(self, random_state=None, random_seed=0, **kwargs):
         parameters = {}
@@ -25,6 +29,57 @@ class StandardScaler(Transformer):
                          random_state=random_state,
                          random_seed=random_seed)
 
+    def partial_fit(self, X, y=None):
+        """Fits scaler to one chunk of the training data, updating the running mean and variance of each feature.
+
+        Arguments:
+            X (ww.DataTable, pd.DataFrame or np.ndarray): A chunk of the input training data of shape [n_samples, n_features]
+            y (ww.DataColumn, pd.Series, optional): Ignored.
+
+        Returns:
+            self
+        """
+        X = infer_feature_types(X)
+        X = _convert_woodwork_types_wrapper(X.to_dataframe())
+        self._component_obj.partial_fit(X)
+        return self
+
+    def merge(self, other):
+        """Combines the mean and variance of another scaler fit on other chunks of the same columns, for example by a parallel worker.
+
+        The scalers can be fit with either `fit` or `partial_fit`. The combined mean and variance are exact.
+
+        Arguments:
+            other (StandardScaler): Fitted scaler with the same parameters.
+
+        Returns:
+            self
+        """
+        if not other._is_fitted:
+            raise ValueError("Only fitted scalers can be merged")
+        if other.parameters != self.parameters:
+            raise ValueError(f"Cannot merge scalers with different parameters: {self.parameters} and {other.parameters}")
+        if not self._is_fitted:
+            self._component_obj = copy.deepcopy(other._component_obj)
+            self._is_fitted = True
+            return self
+        scaler, other_scaler = self._component_obj, other._component_obj
+        if scaler.n_features_in_ != other_scaler.n_features_in_:
+            raise ValueError(f"Cannot merge scalers fit on {scaler.n_features_in_} and {other_scaler.n_features_in_} features")
+        n_samples, other_n_samples = scaler.n_samples_seen_, other_scaler.n_samples_seen_
+        total_samples = n_samples + other_n_samples
+        if scaler.mean_ is not None:
+            # combine the means and the sums of squared differences from the means, as in Chan et al.'s parallel variance algorithm
+            delta = other_scaler.mean_ - scaler.mean_
+            if scaler.var_ is not None:
+                sum_of_squares = (scaler.var_ * n_samples + other_scaler.var_ * other_n_samples +
+                                  delta ** 2 * n_samples * other_n_samples / total_samples)
+                scaler.var_ = sum_of_squares / total_samples
+                scaler.scale_ = np.where(scaler.var_ == 0, 1.0, np.sqrt(scaler.var_))
+            scaler.mean_ = scaler.mean_ + delta * other_n_samples / total_samples
+        scaler.n_samples_seen_ = total_samples
+        return self
+
     def transform(self, X, y=None):
         X_ww = infer_feature_types(X)
         X = _convert_woodwork_types_wrapper(X_ww.to_dataframe())
@@ -5,6 +5,7 @@ from sklearn.utils.multiclass import unique_labels
 from sklearn.utils.validation import check_is_fitted
 
 from evalml.exceptions import MissingComponentError
+from evalml.model_family import ModelFamily
 from evalml.model_family.utils import handle_model_family
 from evalml.pipelines.components import ComponentBase, Estimator, Transformer
 from evalml.problem_types import ProblemTypes, handle_problem_types
@@ -16,6 +17,9 @@ from evalml.utils import (
 
 logger = get_logger(__file__)
 
+# histogram gradient boosting is only searched by default when one of these faster boosting libraries is not installed
+_FAST_BOOSTING_MODEL_FAMILIES = {ModelFamily.LIGHTGBM, ModelFamily.XGBOOST}
+
 
 def _all_estimators():
     return get_importable_subclasses(Estimator, used_in_automl=False)
@@ -55,11 +59,13 @@ def allowed_model_families(problem_type):
 def get_estimators(problem_type, model_families=None):
     """Returns the estimators allowed for a particular problem type.
 
-    Can also optionally filter by a list of model types.
+    Can also optionally filter by a list of model types. By default, the histogram gradient boosting estimators are only
+    returned if LightGBM or XGBoost is not installed.
 
     Arguments:
         problem_type (ProblemTypes or str): problem type to filter for
-        model_families (list[ModelFamily] or list[str]): model families to filter for
+        model_families (list[ModelFamily] or list[str]): model families to filter for. Defaults to None, which returns
+            the estimators of all allowed model families, apart from histogram gradient boosting when LightGBM and XGBoost are installed.
 
     Returns:
         list[class]: a list of estimator subclasses
@@ -69,6 +75,8 @@ def get_estimators(problem_type, model_families=None):
     problem_type = handle_problem_types(problem_type)
     if model_families is None:
         model_families = allowed_model_families(problem_type)
+        if _FAST_BOOSTING_MODEL_FAMILIES.issubset(model_families):
+            model_families.remove(ModelFamily.HIST_GRADIENT_BOOSTING)
 
     model_families = [handle_model_family(model_family) for model_family in model_families]
     all_model_families = allowed_model_families(problem_type)
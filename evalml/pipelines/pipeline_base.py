@@ -23,7 +23,9 @@ from .components.utils import all_components, handle_component_class
 from evalml.exceptions import IllFormattedClassNameError, PipelineScoreError
 from evalml.pipelines import ComponentGraph
 from evalml.pipelines.pipeline_meta import PipelineBaseMeta
+from evalml.problem_types import is_time_series
 from evalml.utils import (
+    _iter_chunks,
     classproperty,
     deprecate_arg,
     get_logger,
@@ -34,6 +36,10 @@ from evalml.utils import (
     log_title,
     safe_repr
 )
+from evalml.utils.serialization_utils import (
+    load_from_directory,
+    save_to_directory
+)
 
 logger = get_logger(__file__)
 
@@ -184,7 +190,8 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
             X (ww.DataTable, pd.DataFrame): Input data to the pipeline to transform.
 
         Returns:
-            ww.DataTable: New transformed features.
+            ww.DataTable or SparseFeatures: New transformed features. SparseFeatures are returned when the estimator supports sparse
+                input and a component such as `OneHotEncoder` with `sparse=True` outputs them.
         """
         X_t = self._component_graph.compute_final_component_features(X, y=y)
         return X_t
@@ -200,6 +207,20 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
         self._component_graph.fit(X, y)
         self.input_feature_names = self._component_graph.input_feature_names
 
+    def _fit_iter(self, chunks, convert_target, classes=None):
+        """Fits the component graph one chunk at a time, converting the target of each chunk with `convert_target`."""
+        if is_time_series(self.problem_type):
+            raise ValueError("Time series pipelines cannot be fit one chunk at a time, since the delayed features of a chunk depend on the chunk before it")
+
+        def converted_chunks():
+            for X, y in _iter_chunks(chunks):
+                y = convert_target(y)
+                self.input_target_name = y.name
+                yield X, y
+        self._component_graph.fit_iter(converted_chunks, classes=classes)
+        self.input_feature_names = self._component_graph.input_feature_names
+        self._is_fitted = True
+
     @abstractmethod
     def fit(self, X, y):
         """Build a model
@@ -323,6 +344,21 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
             component_parameters['pipeline'] = self._pipeline_params
         return component_parameters
 
+    @property
+    def component_profile(self):
+        """Returns the time and memory used by each component operation since the pipeline was last fit.
+
+        Returns:
+            dict: Maps component names to operation names, such as 'fit', 'transform' or 'predict', to the totals 'calls', 'wall_time' and
+                'cpu_time' in seconds, the largest change in resident memory 'memory_delta_mb' and the 'rows_in', 'columns_in',
+                'rows_out' and 'columns_out' of the most recent call.
+        """
+        return self._component_graph.component_profile
+
+    def _profile_estimator(self, operation, X):
+        """Context manager which measures an operation of the final estimator called outside of the component graph."""
+        return self._component_graph.profile(self._estimator_name, operation, X)
+
     @classproperty
     def default_parameters(cls):
         """Returns the default parameter dictionary for this pipeline.
@@ -443,29 +479,54 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
         fig = go.Figure(data=data, layout=layout)
         return fig
 
-    def save(self, file_path, pickle_protocol=cloudpickle.DEFAULT_PROTOCOL):
+    def save(self, file_path, pickle_protocol=cloudpickle.DEFAULT_PROTOCOL, format="pickle"):
         """Saves pipeline at file path
 
         Arguments:
             file_path (str): location to save file
             pickle_protocol (int): the pickle data stream format.
+            format (str): "pickle" to save the whole pipeline to a single cloudpickle file, or "directory" to save to a
+                directory where each component's parameters are recorded as JSON and large fitted arrays are stored as
+                separate .npy files which can be memory-mapped by `load`. Defaults to "pickle".
 
         Returns:
             None
         """
+        if format == "directory":
+            save_to_directory(self, file_path, metadata=self._serialization_metadata(), pickle_protocol=pickle_protocol)
+            return
+        if format != "pickle":
+            raise ValueError(f"Unknown format '{format}'. Valid formats are 'pickle' and 'directory'.")
         with open(file_path, 'wb') as f:
             cloudpickle.dump(self, f, protocol=pickle_protocol)
 
+    def _serialization_metadata(self):
+        components = {}
+        for component_name, component in self._component_graph.component_instances.items():
+            components[component_name] = {"class": f"{type(component).__module__}.{type(component).__name__}",
+                                          "parameters": component.parameters}
+        return {"object_type": "pipeline",
+                "pipeline_name": self.name,
+                "problem_type": str(self.problem_type),
+                "random_seed": self.random_seed,
+                "is_fitted": self._is_fitted,
+                "components": components}
+
     @staticmethod
-    def load(file_path):
+    def load(file_path, mmap_mode="r"):
         """Loads pipeline at file path
 
         Arguments:
             file_path (str): location to load file
+            mmap_mode (str, None): Only used for pipelines saved with format="directory". Memory-map mode for the stored
+                arrays; the default of "r" maps them read-only so that processes loading the same pipeline share its memory.
+                If None, arrays are read into memory.
 
         Returns:
             PipelineBase object
         """
+        if os.path.isdir(str(file_path)):
+            return load_from_directory(file_path, mmap_mode=mmap_mode)
         with open(file_path, 'rb') as f:
             return cloudpickle.load(f)
 
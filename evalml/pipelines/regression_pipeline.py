@@ -28,6 +28,28 @@ class RegressionPipeline(PipelineBase):
         self._fit(X, y)
         return self
 
+    def fit_iter(self, chunks):
+        """Build a regression model one chunk of data at a time, so that it can be trained on data which does not fit in memory.
+
+        Every component must support `partial_fit`, for example the SGD regressor, the imputers with any strategy but "median", the standard scaler,
+        the one-hot encoder with declared categories and the column selectors. The components are fit in order, with one pass over the chunks per component.
+
+        Arguments:
+            chunks (callable or iterable): The training data, as (X, y) tuples of a chunk of the input training data and its target.
+                Either a function which returns an iterator over the chunks, for example one which reads a file with `pd.read_csv(..., chunksize=...)`,
+                or a collection of chunks which can be iterated over more than once.
+
+        Returns:
+            self
+        """
+        def convert_target(y):
+            y = infer_feature_types(y)
+            if "numeric" not in y.semantic_tags:
+                raise ValueError("Regression pipeline can only handle numeric target data")
+            return _convert_woodwork_types_wrapper(y.to_series())
+        self._fit_iter(chunks, convert_target)
+        return self
+
     def score(self, X, y, objectives):
         """Evaluate model performance on current and additional objectives
 
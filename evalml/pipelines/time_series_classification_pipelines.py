@@ -63,7 +63,8 @@ class TimeSeriesClassificationPipeline(ClassificationPipeline, metaclass=TimeSer
         X_t = _convert_woodwork_types_wrapper(X_t.to_dataframe())
         y_shifted = y.shift(-self.gap)
         X_t, y_shifted = drop_rows_with_nans(X_t, y_shifted)
-        self.estimator.fit(X_t, y_shifted)
+        with self._profile_estimator('fit', X_t):
+            self.estimator.fit(X_t, y_shifted)
         self.input_feature_names = self._component_graph.input_feature_names
         return self
 
@@ -75,7 +76,10 @@ class TimeSeriesClassificationPipeline(ClassificationPipeline, metaclass=TimeSer
         y_arg = None
         if self.estimator.predict_uses_y:
             y_arg = y
-        return self.estimator.predict(features, y=y_arg)
+        with self._profile_estimator('predict', features) as event:
+            predictions = self.estimator.predict(features, y=y_arg)
+            event['output'] = predictions
+        return predictions
 
     def _estimator_predict_proba(self, features, y):
         """Get estimator predicted probabilities.
@@ -85,7 +89,10 @@ class TimeSeriesClassificationPipeline(ClassificationPipeline, metaclass=TimeSer
         y_arg = None
         if self.estimator.predict_uses_y:
             y_arg = y
-        return self.estimator.predict_proba(features, y=y_arg)
+        with self._profile_estimator('predict_proba', features) as event:
+            proba = self.estimator.predict_proba(features, y=y_arg)
+            event['output'] = proba
+        return proba
 
     def _predict(self, X, y, objective=None, pad=False):
         features = self.compute_estimator_features(X, y)
@@ -61,7 +61,8 @@ class TimeSeriesRegressionPipeline(RegressionPipeline, metaclass=TimeSeriesPipel
 
         y_shifted = y.shift(-self.gap)
         X_t, y_shifted = drop_rows_with_nans(X_t, y_shifted)
-        self.estimator.fit(X_t, y_shifted)
+        with self._profile_estimator('fit', X_t):
+            self.estimator.fit(X_t, y_shifted)
         self.input_feature_names = self._component_graph.input_feature_names
 
         return self
@@ -89,7 +90,10 @@ class TimeSeriesRegressionPipeline(RegressionPipeline, metaclass=TimeSeriesPipel
         y_arg = None
         if self.estimator.predict_uses_y:
             y_arg = y
-        predictions = self.estimator.predict(features_no_nan, y_arg).to_series()
+        with self._profile_estimator('predict', features_no_nan) as event:
+            predictions = self.estimator.predict(features_no_nan, y_arg)
+            event['output'] = predictions
+        predictions = predictions.to_series()
         predictions = predictions.rename(self.input_target_name)
         padded = pad_with_nans(predictions, max(0, features.shape[0] - predictions.shape[0]))
         return infer_feature_types(padded)
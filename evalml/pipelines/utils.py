@@ -31,6 +31,7 @@ from evalml.pipelines.components import (  # noqa: F401
     Estimator,
     Imputer,
     OneHotEncoder,
+    OrdinalEncoder,
     RandomForestClassifier,
     StackedEnsembleClassifier,
     StackedEnsembleRegressor,
@@ -47,8 +48,15 @@ from evalml.utils import deprecate_arg, get_logger, infer_feature_types
 
 logger = get_logger(__file__)
 
+# tree-based model families which split on ordinal codes of categorical features as well as on their one-hot encodings
+_ORDINAL_ENCODED_MODEL_FAMILIES = {ModelFamily.XGBOOST, ModelFamily.RANDOM_FOREST, ModelFamily.EXTRA_TREES, ModelFamily.DECISION_TREE,
+                                   ModelFamily.HIST_GRADIENT_BOOSTING}
+_CATEGORICAL_ENCODINGS = ["one_hot", "native", "sparse_one_hot"]
+# model families which are sensitive to the scale of the features
+_SCALED_MODEL_FAMILIES = {ModelFamily.LINEAR_MODEL, ModelFamily.SVM, ModelFamily.K_NEIGHBORS}
 
-def _get_preprocessing_components(X, y, problem_type, estimator_class):
+
+def _get_preprocessing_components(X, y, problem_type, estimator_class, categorical_encoding="one_hot"):
     """Given input data, target data and an estimator class, construct a recommended preprocessing chain to be combined with the estimator and trained on the provided data.
 
     Arguments:
@@ -56,6 +64,8 @@ def _get_preprocessing_components(X, y, problem_type, estimator_class):
         y (ww.DataColumn): The target data of length [n_samples]
         problem_type (ProblemTypes or str): Problem type
         estimator_class (class): A class which subclasses Estimator estimator for pipeline
+        categorical_encoding (str): How categorical features are encoded, "one_hot", "native" or "sparse_one_hot". See `make_pipeline`.
+            Defaults to "one_hot".
 
     Returns:
         list[Transformer]: A list of applicable preprocessing components to use with the estimator
@@ -83,13 +93,39 @@ def _get_preprocessing_components(X, y, problem_type, estimator_class):
 
     categorical_cols = X.select('category')
     if len(categorical_cols.columns) > 0 and estimator_class not in {CatBoostClassifier, CatBoostRegressor}:
-        pp_components.append(OneHotEncoder)
-
-    if estimator_class.model_family == ModelFamily.LINEAR_MODEL:
+        if categorical_encoding in ("one_hot", "sparse_one_hot"):
+            pp_components.append(OneHotEncoder)
+        elif estimator_class.model_family in _ORDINAL_ENCODED_MODEL_FAMILIES:
+            pp_components.append(OrdinalEncoder)
+        elif estimator_class.model_family != ModelFamily.LIGHTGBM:
+            pp_components.append(OneHotEncoder)
+
+    # scaling would densify the sparse one-hot encodings, so estimators which take sparse input use them unscaled
+    keeps_sparse_encodings = categorical_encoding == "sparse_one_hot" and OneHotEncoder in pp_components and estimator_class.supports_sparse_input
+    if estimator_class.model_family in _SCALED_MODEL_FAMILIES and not keeps_sparse_encodings:
         pp_components.append(StandardScaler)
     return pp_components
 
 
+def _sparse_one_hot_parameters(parameters):
+    """Returns a copy of pipeline parameters or custom hyperparameters in which the One Hot Encoder outputs sparse features.
+
+    The `sparse` parameter is added as a single-valued list, which tuners and the first batch of a search both use as a fixed value.
+    Parameters which already set `sparse` for the One Hot Encoder are left as they are.
+
+    Arguments:
+        parameters (dict, None): Parameters, mapping component names to dictionaries of parameters.
+
+    Returns:
+        dict: The parameters with sparse one-hot encoding.
+    """
+    parameters = dict(parameters or {})
+    encoder_parameters = parameters.get(OneHotEncoder.name, {})
+    if 'sparse' not in encoder_parameters:
+        parameters[OneHotEncoder.name] = {**encoder_parameters, 'sparse': [True]}
+    return parameters
+
+
 def _get_pipeline_base_class(problem_type):
     """Returns pipeline base class for problem_type"""
     if problem_type == ProblemTypes.BINARY:
@@ -106,7 +142,7 @@ def _get_pipeline_base_class(problem_type):
         return TimeSeriesMulticlassClassificationPipeline
 
 
-def make_pipeline(X, y, estimator, problem_type, custom_hyperparameters=None):
+def make_pipeline(X, y, estimator, problem_type, custom_hyperparameters=None, categorical_encoding="one_hot"):
     """Given input data, target data, an estimator class and the problem type,
         generates a pipeline class with a preprocessing chain which was recommended based on the inputs.
         The pipeline will be a subclass of the appropriate pipeline base class for the specified problem_type.
@@ -118,6 +154,12 @@ def make_pipeline(X, y, estimator, problem_type, custom_hyperparameters=None):
         problem_type (ProblemTypes or str): Problem type for pipeline to generate
         custom_hyperparameters (dictionary): Dictionary of custom hyperparameters,
             with component name as key and dictionary of parameters as the value
+        categorical_encoding (str): How categorical features are encoded. "one_hot" one-hot encodes them for every estimator except CatBoost.
+            "native" keeps one column per feature: CatBoost and LightGBM receive the categorical features as they are and handle them
+            natively, XGBoost and the random forest, extra trees, decision tree and histogram gradient boosting estimators receive
+            integer codes from an `OrdinalEncoder`, and other estimators still receive one-hot encodings. "sparse_one_hot" one-hot
+            encodes them like "one_hot" but keeps the encodings in a sparse matrix for estimators which support sparse input, which
+            are then not preceded by a `StandardScaler`. Other estimators receive the encodings as dense columns. Defaults to "one_hot".
 
     Returns:
         class: PipelineBase subclass with dynamically generated preprocessing components and specified estimator
@@ -129,13 +171,17 @@ def make_pipeline(X, y, estimator, problem_type, custom_hyperparameters=None):
     problem_type = handle_problem_types(problem_type)
     if estimator not in get_estimators(problem_type):
         raise ValueError(f"{estimator.name} is not a valid estimator for problem type")
-    preprocessing_components = _get_preprocessing_components(X, y, problem_type, estimator)
+    if categorical_encoding not in _CATEGORICAL_ENCODINGS:
+        raise ValueError(f"Invalid categorical_encoding {categorical_encoding}, must be one of {_CATEGORICAL_ENCODINGS}")
+    preprocessing_components = _get_preprocessing_components(X, y, problem_type, estimator, categorical_encoding)
     complete_component_graph = preprocessing_components + [estimator]
 
     if custom_hyperparameters and not isinstance(custom_hyperparameters, dict):
         raise ValueError(f"if custom_hyperparameters provided, must be dictionary. Received {type(custom_hyperparameters)}")
 
     hyperparameters = custom_hyperparameters
+    if categorical_encoding == "sparse_one_hot" and OneHotEncoder in preprocessing_components:
+        hyperparameters = _sparse_one_hot_parameters(hyperparameters)
     base_class = _get_pipeline_base_class(problem_type)
 
     class GeneratedPipeline(base_class):
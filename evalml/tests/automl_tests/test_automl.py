@@ -13,6 +13,7 @@ from sklearn.model_selection import KFold, StratifiedKFold
 from skopt.space import Categorical, Integer, Real
 
 from evalml import AutoMLSearch
+from evalml.automl.background_training import BackgroundPipelineTrainer
 from evalml.automl.callbacks import (
     log_and_save_error_callback,
     log_error_callback,
@@ -55,7 +56,10 @@ from evalml.pipelines import (
     BinaryClassificationPipeline,
     Estimator,
     MulticlassClassificationPipeline,
-    RegressionPipeline
+    OneHotEncoder,
+    OrdinalEncoder,
+    RegressionPipeline,
+    StandardScaler
 )
 from evalml.pipelines.components.utils import get_estimators
 from evalml.pipelines.utils import make_pipeline
@@ -85,7 +89,7 @@ def test_search_results(X_y_regression, X_y_binary, X_y_multi, automl_type, obje
     assert automl.results['search_order'] == [0, 1]
     assert len(automl.results['pipeline_results']) == 2
     for pipeline_id, results in automl.results['pipeline_results'].items():
-        assert results.keys() == {'id', 'pipeline_name', 'pipeline_class', 'pipeline_summary', 'parameters', 'score', 'high_variance_cv', 'training_time',
+        assert results.keys() == {'id', 'pipeline_name', 'pipeline_class', 'pipeline_summary', 'parameters', 'score', 'high_variance_cv', 'pruned', 'timed_out', 'training_time', 'peak_memory_mb',
                                   'cv_data', 'percent_better_than_baseline_all_objectives',
                                   'percent_better_than_baseline', 'validation_score'}
         assert results['id'] == pipeline_id
@@ -589,6 +593,125 @@ def test_automl_serialization(X_y_binary, tmpdir):
     pd.testing.assert_frame_equal(automl.rankings, loaded_automl.rankings)
 
 
+def test_automl_serialization_directory(X_y_binary, tmpdir):
+    X, y = X_y_binary
+    path = os.path.join(str(tmpdir), 'automl_dir')
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_iterations=3, n_jobs=1)
+    automl.search()
+    automl.save(path, format="directory")
+    assert os.path.isdir(path)
+
+    loaded_automl = AutoMLSearch.load(path)
+    for i in range(3):
+        assert automl.get_pipeline(i).parameters == loaded_automl.get_pipeline(i).parameters
+    pd.testing.assert_frame_equal(automl.rankings, loaded_automl.rankings)
+    pd.testing.assert_frame_equal(automl.X_train.to_dataframe(), loaded_automl.X_train.to_dataframe())
+
+
+@patch('evalml.pipelines.BinaryClassificationPipeline.score')
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_automl_checkpoint_resume(mock_fit, mock_score, X_y_binary, tmpdir):
+    X, y = X_y_binary
+    mock_score.return_value = {'Log Loss Binary': 1.0}
+    checkpoint_path = os.path.join(str(tmpdir), 'checkpoint')
+
+    class StopSearch(Exception):
+        pass
+
+    def interrupt_callback(results, pipeline, automl_obj):
+        if len(automl_obj._results['pipeline_results']) == 4:
+            raise StopSearch()
+
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_iterations=8, n_jobs=1,
+                          checkpoint_path=checkpoint_path, add_result_callback=interrupt_callback)
+    with pytest.raises(StopSearch):
+        automl.search()
+    interrupted_results = automl.results['pipeline_results']
+    assert len(interrupted_results) == 4
+
+    resumed_automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_iterations=8, n_jobs=1,
+                                  checkpoint_path=checkpoint_path)
+    mock_fit.reset_mock()
+    resumed_automl.search(resume=True)
+    assert len(resumed_automl.results['pipeline_results']) == 8
+    # the 4 pipelines evaluated before the interruption are not evaluated again
+    assert mock_fit.call_count == 4 * resumed_automl.data_splitter.get_n_splits() + 1
+    for pipeline_id, result in interrupted_results.items():
+        assert resumed_automl.results['pipeline_results'][pipeline_id]['parameters'] == result['parameters']
+
+    uninterrupted_automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_iterations=8, n_jobs=1)
+    uninterrupted_automl.search()
+    for pipeline_id in range(8):
+        assert resumed_automl.get_pipeline(pipeline_id).parameters == uninterrupted_automl.get_pipeline(pipeline_id).parameters
+
+
+def test_automl_checkpoint_resume_errors(X_y_binary, X_y_multi, tmpdir):
+    X, y = X_y_binary
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_iterations=2, n_jobs=1)
+    with pytest.raises(ValueError, match='Cannot resume a search without a checkpoint_path'):
+        automl.search(resume=True)
+
+    checkpoint_path = os.path.join(str(tmpdir), 'checkpoint')
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_iterations=2, n_jobs=1,
+                          checkpoint_path=checkpoint_path)
+    automl.search(resume=True)
+    assert len(automl.results['pipeline_results']) == 2
+
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_iterations=2, n_jobs=1,
+                          checkpoint_path=checkpoint_path)
+    with pytest.raises(ValueError, match='A checkpoint already exists'):
+        automl.search()
+    assert os.path.exists(os.path.join(checkpoint_path, 'state.pkl'))
+
+    X_multi, y_multi = X_y_multi
+    automl = AutoMLSearch(X_train=X_multi, y_train=y_multi, problem_type='multiclass', max_iterations=2, n_jobs=1,
+                          checkpoint_path=checkpoint_path)
+    with pytest.raises(ValueError, match='does not match'):
+        automl.search(resume=True)
+
+
+def test_automl_checkpoint_resume_restores_errors(X_y_binary, tmpdir):
+    X, y = X_y_binary
+    checkpoint_path = os.path.join(str(tmpdir), 'checkpoint')
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_iterations=2, n_jobs=1,
+                          checkpoint_path=checkpoint_path)
+    automl.search()
+    automl._results['errors'].append(ValueError('pipeline failed'))
+    automl._write_checkpoint()
+
+    resumed_automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_iterations=2, n_jobs=1,
+                                  checkpoint_path=checkpoint_path)
+    resumed_automl.search(resume=True)
+    assert len(resumed_automl.results['pipeline_results']) == 2
+    assert [str(error) for error in resumed_automl.results['errors']] == ['pipeline failed']
+
+
+@patch('evalml.tuners.skopt_tuner.SKOptTuner.propose_batch', side_effect=lambda n: [{'Mock Classifier': {'a': 3, 'b': 1.5}} for _ in range(n)])
+@patch('evalml.pipelines.BinaryClassificationPipeline.score', return_value={'Log Loss Binary': 0.5})
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_automl_reuses_duplicate_evaluations(mock_fit, mock_score, mock_propose, dummy_binary_pipeline_class, X_y_binary):
+    X, y = X_y_binary
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_batches=2, n_jobs=1,
+                          allowed_pipelines=[dummy_binary_pipeline_class])
+    automl.search()
+    assert len(automl.results['pipeline_results']) == 7
+    n_splits = automl.data_splitter.get_n_splits()
+    # baseline, the default parameters and the first proposal are trained, then the best pipeline is fit once
+    assert mock_fit.call_count == 3 * n_splits + 1
+
+    first_proposal = automl.results['pipeline_results'][2]
+    for pipeline_id in range(3, 7):
+        result = automl.results['pipeline_results'][pipeline_id]
+        assert result['parameters'] == first_proposal['parameters']
+        assert result['score'] == first_proposal['score']
+        assert result['cv_data'] == first_proposal['cv_data']
+        assert result['training_time'] == 0
+        # nothing was measured for the reused evaluations
+        assert np.isnan(result['peak_memory_mb'])
+    # the reused scores are still reported to the tuner
+    assert len(automl._automl_algorithm._tuners[dummy_binary_pipeline_class.name].opt.yi) == 6
+
+
 @patch('cloudpickle.dump')
 def test_automl_serialization_protocol(mock_cloudpickle_dump, tmpdir, X_y_binary):
     X, y = X_y_binary
@@ -976,7 +1099,7 @@ def test_no_search(X_y_binary):
     assert isinstance(automl.full_rankings, pd.DataFrame)
 
     df_columns = ["id", "pipeline_name", "score", "validation_score", "percent_better_than_baseline",
-                  "high_variance_cv", "parameters"]
+                  "high_variance_cv", "pruned", "parameters"]
     assert (automl.rankings.columns == df_columns).all()
     assert (automl.full_rankings.columns == df_columns).all()
 
@@ -1067,6 +1190,10 @@ def test_results_getter(mock_fit, mock_score, X_y_binary):
 
     automl.results['pipeline_results'][0]['score'] = 2.0
     assert automl.results['pipeline_results'][0]['score'] == 1.0
+    automl.results['search_order'].append(5)
+    assert automl.results['search_order'] == [0]
+    # nested values are not copied
+    assert automl.results['pipeline_results'][0]['cv_data'] is automl._results['pipeline_results'][0]['cv_data']
 
 
 @pytest.mark.parametrize("data_type", ['li', 'np', 'pd', 'ww'])
@@ -2258,3 +2385,154 @@ def test_automl_raises_deprecated_random_state_warning(X_y_multi):
         automl = AutoMLSearch(X_train=X, y_train=y, problem_type='multiclass', random_state=10)
         assert automl.random_seed == 10
         assert str(warn[0].message).startswith("Argument 'random_state' has been deprecated in favor of 'random_seed'")
+
+
+@patch('evalml.pipelines.BinaryClassificationPipeline.score', return_value={"Log Loss Binary": 0.3})
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_automl_cost_aware(mock_fit, mock_score, dummy_binary_pipeline_class, X_y_binary, caplog):
+    X, y = X_y_binary
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', allowed_pipelines=[dummy_binary_pipeline_class],
+                          cost_aware=True, max_time=1000, max_batches=2)
+    assert automl._automl_algorithm.cost_aware
+    automl.search()
+    assert 0 < automl._automl_algorithm.time_remaining <= 1000
+    assert automl._automl_algorithm.predict_training_time(dummy_binary_pipeline_class) is not None
+
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', allowed_pipelines=[dummy_binary_pipeline_class],
+                          cost_aware=True, automl_algorithm='hyperband')
+    assert not automl._automl_algorithm.cost_aware
+    assert "Cost-aware search is set to True, but it is not supported by the hyperband automl algorithm" in caplog.text
+
+
+@pytest.mark.parametrize("in_background", [True, False])
+@patch('evalml.pipelines.BinaryClassificationPipeline.score')
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_automl_train_best_pipeline_in_background(mock_fit, mock_score, in_background, dummy_binary_pipeline_class, X_y_binary):
+    X, y = X_y_binary
+    mock_score.side_effect = [{"Log Loss Binary": score} for score in [0.9] * 3 + [0.5] * 3 + [0.2] * 3]
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', allowed_pipelines=[dummy_binary_pipeline_class],
+                          max_iterations=3, train_best_pipeline_in_background=in_background)
+    with patch.object(BackgroundPipelineTrainer, 'start', autospec=True, side_effect=BackgroundPipelineTrainer.start) as mock_start:
+        automl.search()
+    assert automl.best_pipeline.parameters == automl.get_pipeline(2).parameters
+    if in_background:
+        assert [call[0][1] for call in mock_start.call_args_list] == [0, 1, 2]
+        # the best pipeline was trained in the background process
+        assert mock_fit.call_count == 9
+        assert automl._background_trainer.key is None
+    else:
+        assert automl._background_trainer is None
+        assert mock_start.call_count == 0
+        assert mock_fit.call_count == 10
+
+
+@patch('evalml.pipelines.BinaryClassificationPipeline.score')
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_automl_max_background_fits(mock_fit, mock_score, dummy_binary_pipeline_class, X_y_binary):
+    X, y = X_y_binary
+    mock_score.side_effect = [{"Log Loss Binary": score} for score in [0.9] * 3 + [0.5] * 3 + [0.2] * 3]
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', allowed_pipelines=[dummy_binary_pipeline_class],
+                          max_iterations=3, train_best_pipeline_in_background=True, max_background_fits=1)
+    with patch.object(BackgroundPipelineTrainer, 'start', autospec=True, side_effect=BackgroundPipelineTrainer.start) as mock_start:
+        automl.search()
+    assert automl._background_trainer.num_starts == 1
+    assert [call[0][1] for call in mock_start.call_args_list] == [0, 1, 2]
+    # the best pipeline took the lead after the limit was reached, so it was trained after the search
+    assert mock_fit.call_count == 10
+    assert automl.best_pipeline.parameters == automl.get_pipeline(2).parameters
+
+
+@pytest.mark.parametrize("max_background_fits", [0, -1, 1.5, True])
+def test_automl_max_background_fits_invalid(max_background_fits, X_y_binary):
+    X, y = X_y_binary
+    with pytest.raises(ValueError, match='max_background_fits must be None or a positive integer'):
+        AutoMLSearch(X_train=X, y_train=y, problem_type='binary', train_best_pipeline_in_background=True,
+                     max_background_fits=max_background_fits)
+
+
+@pytest.mark.parametrize("early_stopping_rounds", [10, None])
+def test_automl_early_stopping_rounds(early_stopping_rounds, X_y_binary):
+    pytest.importorskip('xgboost', reason='Skipping test because xgboost not installed')
+    X, y = X_y_binary
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary',
+                          allowed_model_families=[ModelFamily.XGBOOST, ModelFamily.RANDOM_FOREST],
+                          early_stopping_rounds=early_stopping_rounds, max_iterations=3, n_jobs=1)
+    xgboost_pipeline = next(pipeline for pipeline in automl.allowed_pipelines if pipeline.model_family == ModelFamily.XGBOOST)
+    assert 'Random Forest Classifier' not in automl.pipeline_parameters
+    if early_stopping_rounds is None:
+        assert automl.pipeline_parameters == {}
+    else:
+        assert xgboost_pipeline.hyperparameters['XGBoost Classifier']['early_stopping_rounds'] == [early_stopping_rounds]
+        pipelines = automl._automl_algorithm.next_batch()
+        xgboost_parameters = next(pipeline.parameters for pipeline in pipelines if pipeline.model_family == ModelFamily.XGBOOST)
+        assert xgboost_parameters['XGBoost Classifier']['early_stopping_rounds'] == early_stopping_rounds
+
+
+@pytest.mark.parametrize("early_stopping_rounds", [0, -1, 2.5, True])
+def test_automl_early_stopping_rounds_invalid(early_stopping_rounds, X_y_binary):
+    X, y = X_y_binary
+    with pytest.raises(ValueError, match='early_stopping_rounds must be None or a positive integer'):
+        AutoMLSearch(X_train=X, y_train=y, problem_type='binary', early_stopping_rounds=early_stopping_rounds)
+
+
+@pytest.mark.parametrize("problem_type", ['time series regression', 'time series binary'])
+def test_automl_early_stopping_rounds_time_series(problem_type, ts_data):
+    X, y = ts_data
+    with pytest.raises(ValueError, match='early_stopping_rounds is not supported for time series'):
+        AutoMLSearch(X_train=X, y_train=y, problem_type=problem_type, early_stopping_rounds=10,
+                     problem_configuration={'gap': 0, 'max_delay': 0})
+
+
+@pytest.mark.parametrize("in_background", [True, False])
+@patch('evalml.pipelines.BinaryClassificationPipeline.score')
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_automl_best_pipeline_trained_without_early_stopping(mock_fit, mock_score, in_background, X_y_binary):
+    mock_score.side_effect = [{"Log Loss Binary": score} for score in [0.9] * 3 + [0.2] * 3]
+
+    class MockEarlyStoppingEstimator(Estimator):
+        name = "Mock Early Stopping Classifier"
+        model_family = ModelFamily.LIGHTGBM
+        supported_problem_types = [ProblemTypes.BINARY]
+        hyperparameter_ranges = {}
+
+        def __init__(self, early_stopping_rounds=None, random_seed=0):
+            super().__init__(parameters={'early_stopping_rounds': early_stopping_rounds}, component_obj=None, random_seed=random_seed)
+
+    class MockEarlyStoppingPipeline(BinaryClassificationPipeline):
+        component_graph = [MockEarlyStoppingEstimator]
+
+    X, y = X_y_binary
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', allowed_pipelines=[MockEarlyStoppingPipeline], max_iterations=2,
+                          pipeline_parameters={'Mock Early Stopping Classifier': {'early_stopping_rounds': 5}},
+                          train_best_pipeline_in_background=in_background)
+    automl.search()
+    assert automl.get_pipeline(1).parameters['Mock Early Stopping Classifier']['early_stopping_rounds'] == 5
+    assert automl.best_pipeline.parameters['Mock Early Stopping Classifier']['early_stopping_rounds'] is None
+
+
+@pytest.mark.parametrize("categorical_encoding,encoder", [("one_hot", OneHotEncoder), ("native", OrdinalEncoder)])
+def test_automl_categorical_encoding(categorical_encoding, encoder):
+    X = pd.DataFrame({"categorical": ["a", "b", "c"] * 10, "numeric": range(30)})
+    y = pd.Series([0, 1] * 15)
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type="binary", allowed_model_families=[ModelFamily.RANDOM_FOREST],
+                          categorical_encoding=categorical_encoding)
+    assert encoder in automl.allowed_pipelines[0].component_graph
+
+
+def test_automl_sparse_one_hot_categorical_encoding():
+    X = pd.DataFrame({"categorical": ["a", "b", "c"] * 10, "numeric": range(30)})
+    y = pd.Series([0, 1] * 15)
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type="binary", categorical_encoding="sparse_one_hot",
+                          allowed_model_families=[ModelFamily.LINEAR_MODEL, ModelFamily.RANDOM_FOREST], n_jobs=1)
+    assert automl.pipeline_parameters['One Hot Encoder'] == {'sparse': [True]}
+    assert all(StandardScaler not in pipeline.component_graph for pipeline in automl.allowed_pipelines)
+    for pipeline in automl._automl_algorithm.next_batch():
+        assert pipeline.parameters['One Hot Encoder']['sparse']
+
+
+@pytest.mark.parametrize("allowed_pipelines", [None, "dummy"])
+def test_automl_categorical_encoding_invalid(allowed_pipelines, dummy_binary_pipeline_class, X_y_binary):
+    X, y = X_y_binary
+    allowed_pipelines = [dummy_binary_pipeline_class] if allowed_pipelines == "dummy" else None
+    with pytest.raises(ValueError, match="Invalid categorical_encoding"):
+        AutoMLSearch(X_train=X, y_train=y, problem_type="binary", allowed_pipelines=allowed_pipelines, categorical_encoding="label")
@@ -1,12 +1,17 @@
 import pytest
 
 from evalml.automl.automl_algorithm import AutoMLAlgorithm
+from evalml.automl.automl_algorithm.runtime_model import (
+    RuntimeModel,
+    training_rows
+)
 from evalml.exceptions import PipelineNotFoundError
+from evalml.tuners import GridSearchTuner, RandomSearchTuner
 
 
 class DummyAlgorithm(AutoMLAlgorithm):
-    def __init__(self, dummy_pipelines=None):
-        super().__init__()
+    def __init__(self, dummy_pipelines=None, **kwargs):
+        super().__init__(**kwargs)
         self._dummy_pipelines = dummy_pipelines or []
 
     def next_batch(self):
@@ -43,3 +48,60 @@ def test_automl_algorithm_invalid_pipeline_add(dummy_regression_pipeline_class):
     pipeline = dummy_regression_pipeline_class(parameters={})
     with pytest.raises(PipelineNotFoundError, match="No such pipeline allowed in this AutoML search: Mock Regression Pipeline"):
         algo.add_result(0.1234, pipeline, {})
+
+
+def test_runtime_model():
+    model = RuntimeModel()
+    assert model.predict('Mock Pipeline') is None
+
+    model.add('Mock Pipeline', 3.0, 300)
+    model.add('Mock Pipeline', 1.0, 100)
+    model.add('Mock Pipeline', 0.0, 300)
+    model.add('Mock Pipeline', 5.0, None)
+    model.add('Other Pipeline', 20.0, 100)
+    assert model.predict('Mock Pipeline') == 3.0
+    assert model.predict('Mock Pipeline', rows=50) == 0.5
+    assert model.predict('Other Pipeline') == 60.0
+
+
+def test_training_rows():
+    assert training_rows({}) is None
+    assert training_rows({'cv_data': []}) is None
+    assert training_rows({'cv_data': [{'all_objective_scores': {'# Training': 80}},
+                                      {'all_objective_scores': {'# Training': 70}}]}) == 150
+    assert training_rows({'cv_data': [{'all_objective_scores': {}}]}) is None
+
+
+def test_automl_algorithm_cost_aware_add_result(dummy_regression_pipeline_class):
+    class MockTuner:
+        def __init__(self, pipeline_hyperparameter_ranges, random_seed=0, cost_aware=False):
+            self.cost_aware = cost_aware
+            self.added = []
+
+        def remove_pending(self, pipeline_parameters):
+            pass
+
+        def add(self, pipeline_parameters, score, training_time=None):
+            self.added.append((score, training_time))
+
+    algo = DummyAlgorithm(allowed_pipelines=[dummy_regression_pipeline_class], tuner_class=MockTuner, cost_aware=True)
+    tuner = algo._tuners[dummy_regression_pipeline_class.name]
+    assert tuner.cost_aware
+
+    pipeline = dummy_regression_pipeline_class(parameters={})
+    cv_data = [{'all_objective_scores': {'# Training': 100}}] * 2
+    algo.add_result(0.5, pipeline, {'training_time': 4.0, 'cv_data': cv_data})
+    assert algo.predict_training_time(dummy_regression_pipeline_class) == 4.0
+    # reused and pruned results pass the predicted time of a full evaluation to the tuner
+    algo.add_result(0.5, pipeline, {'training_time': 0.0, 'cv_data': cv_data})
+    algo.add_result(0.7, pipeline, {'training_time': 1.0, 'cv_data': cv_data[:1], 'pruned': True})
+    assert tuner.added == [(0.5, 4.0), (0.5, 4.0), (0.7, 3.0)]
+
+
+@pytest.mark.parametrize("tuner_class", [RandomSearchTuner, GridSearchTuner])
+def test_automl_algorithm_cost_aware_tuners_without_cost_aware(tuner_class, dummy_regression_pipeline_class):
+    algo = DummyAlgorithm(allowed_pipelines=[dummy_regression_pipeline_class], tuner_class=tuner_class, cost_aware=True)
+    assert isinstance(algo._tuners[dummy_regression_pipeline_class.name], tuner_class)
+    pipeline = dummy_regression_pipeline_class(parameters={})
+    algo.add_result(0.5, pipeline, {'training_time': 4.0, 'cv_data': [{'all_objective_scores': {'# Training': 100}}]})
+    assert algo.predict_training_time(dummy_regression_pipeline_class) == 4.0
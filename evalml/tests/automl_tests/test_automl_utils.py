@@ -8,11 +8,22 @@ from sklearn.model_selection import KFold, StratifiedKFold
 from evalml.automl.utils import (
     _LARGE_DATA_PERCENT_VALIDATION,
     _LARGE_DATA_ROW_THRESHOLD,
+    add_early_stopping_parameters,
     get_default_primary_search_objective,
     make_data_splitter,
+    remove_early_stopping,
     tune_binary_threshold
 )
+from evalml.model_family import ModelFamily
 from evalml.objectives import F1, R2, LogLossBinary, LogLossMulticlass
+from evalml.pipelines import BinaryClassificationPipeline
+from evalml.pipelines.components import (
+    CatBoostClassifier,
+    Estimator,
+    LightGBMClassifier,
+    RandomForestClassifier,
+    XGBoostClassifier
+)
 from evalml.preprocessing.data_splitters import (
     TimeSeriesSplit,
     TrainingValidationSplit
@@ -173,3 +184,43 @@ def test_tune_binary_threshold(mock_fit, mock_score, mock_predict_proba, mock_op
     pipeline = dummy_binary_pipeline_class({})
     tune_binary_threshold(pipeline, F1(), 'multiclass', X, y)
     assert pipeline.threshold is None
+
+
+def test_add_early_stopping_parameters():
+    pipeline_parameters = {'Imputer': {'numeric_impute_strategy': 'median'},
+                           'LightGBM Classifier': {'early_stopping_rounds': 5},
+                           'XGBoost Classifier': {'max_depth': 3}}
+    estimators = [CatBoostClassifier, LightGBMClassifier, RandomForestClassifier, XGBoostClassifier]
+    parameters = add_early_stopping_parameters(pipeline_parameters, estimators, 10)
+    assert parameters == {'Imputer': {'numeric_impute_strategy': 'median'},
+                          'CatBoost Classifier': {'early_stopping_rounds': [10]},
+                          'LightGBM Classifier': {'early_stopping_rounds': 5},
+                          'XGBoost Classifier': {'max_depth': 3, 'early_stopping_rounds': [10]}}
+    assert pipeline_parameters['XGBoost Classifier'] == {'max_depth': 3}
+
+
+def test_remove_early_stopping(dummy_binary_pipeline_class):
+    class MockEarlyStoppingEstimator(Estimator):
+        name = "Mock Early Stopping Classifier"
+        model_family = ModelFamily.LIGHTGBM
+        supported_problem_types = [ProblemTypes.BINARY]
+        hyperparameter_ranges = {}
+
+        def __init__(self, max_depth=6, early_stopping_rounds=None, random_seed=0):
+            super().__init__(parameters={'max_depth': max_depth, 'early_stopping_rounds': early_stopping_rounds},
+                             component_obj=None, random_seed=random_seed)
+
+    class MockEarlyStoppingPipeline(BinaryClassificationPipeline):
+        component_graph = ['Imputer', MockEarlyStoppingEstimator]
+
+    pipeline = MockEarlyStoppingPipeline({'Mock Early Stopping Classifier': {'max_depth': 3, 'early_stopping_rounds': 10}}, random_seed=5)
+    new_pipeline = remove_early_stopping(pipeline)
+    assert new_pipeline is not pipeline
+    assert new_pipeline.random_seed == 5
+    assert new_pipeline.parameters['Mock Early Stopping Classifier'] == {'max_depth': 3, 'early_stopping_rounds': None}
+    assert new_pipeline.parameters['Imputer'] == pipeline.parameters['Imputer']
+    assert pipeline.parameters['Mock Early Stopping Classifier']['early_stopping_rounds'] == 10
+
+    assert remove_early_stopping(new_pipeline) is new_pipeline
+    pipeline = dummy_binary_pipeline_class({})
+    assert remove_early_stopping(pipeline) is pipeline
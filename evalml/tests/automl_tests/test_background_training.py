@@ -0,0 +1,118 @@
+import multiprocessing
+import os
+import pickle
+import time
+from unittest.mock import patch
+
+import pytest
+
+from evalml.automl.background_training import BackgroundPipelineTrainer
+from evalml.pipelines import BinaryClassificationPipeline
+
+
+class _SleepingPipeline:
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.fitted = False
+
+
+def _fit(pipeline):
+    time.sleep(pipeline.seconds)
+    pipeline.fitted = True
+    return pipeline
+
+
+def _fail(pipeline):
+    raise ValueError('fit failed')
+
+
+def _exit(pipeline):
+    os._exit(3)
+
+
+def test_background_pipeline_trainer():
+    trainer = BackgroundPipelineTrainer(_fit)
+    assert trainer.result(0) is None
+
+    trainer.start(0, _SleepingPipeline(0))
+    assert trainer.key == 0
+    assert trainer.result(1) is None
+    pipeline = trainer.result(0)
+    assert pipeline.fitted
+    assert trainer.key is None
+
+
+def test_background_pipeline_trainer_cancel():
+    trainer = BackgroundPipelineTrainer(_fit)
+    trainer.start(0, _SleepingPipeline(60))
+    process = trainer._process
+    start = time.time()
+    trainer.start(1, _SleepingPipeline(0))
+    assert not process.is_alive()
+    assert trainer.result(1).fitted
+    assert time.time() - start < 30
+
+    trainer.start(2, _SleepingPipeline(60))
+    trainer = pickle.loads(pickle.dumps(trainer))
+    assert trainer.key is None
+
+
+def test_background_pipeline_trainer_max_starts():
+    trainer = BackgroundPipelineTrainer(_fit, max_starts=1)
+    assert trainer.start(0, _SleepingPipeline(60))
+    process = trainer._process
+    assert not trainer.start(1, _SleepingPipeline(0))
+    assert not process.is_alive()
+    assert trainer.key is None
+    assert trainer.result(1) is None
+    assert trainer.num_starts == 1
+
+
+def test_background_pipeline_trainer_error(caplog):
+    trainer = BackgroundPipelineTrainer(_fail)
+    trainer.start(0, _SleepingPipeline(0))
+    assert trainer.result(0) is None
+    assert 'ValueError: fit failed' in caplog.text
+
+
+def test_background_pipeline_trainer_timeout(caplog):
+    trainer = BackgroundPipelineTrainer(_fit)
+    trainer.start(0, _SleepingPipeline(60))
+    process = trainer._process
+    start = time.time()
+    assert trainer.result(0, timeout=0.5) is None
+    assert time.time() - start < 30
+    assert not process.is_alive()
+    assert trainer.key is None
+    assert 'did not finish within 0.5 seconds' in caplog.text
+
+    trainer.start(1, _SleepingPipeline(0))
+    assert trainer.result(1, timeout=30).fitted
+
+
+def test_background_pipeline_trainer_process_exit(caplog):
+    trainer = BackgroundPipelineTrainer(_exit)
+    trainer.start(0, _SleepingPipeline(0))
+    assert trainer.result(0, timeout=30) is None
+    assert 'exit code 3' in caplog.text
+
+
+@pytest.mark.parametrize("start_method", ['fork', 'spawn'])
+def test_background_pipeline_trainer_pipeline(start_method, X_y_binary):
+    if start_method not in multiprocessing.get_all_start_methods():
+        pytest.skip(f"The {start_method} start method is not available on this platform")
+    X, y = X_y_binary
+
+    class LocalPipeline(BinaryClassificationPipeline):
+        component_graph = ['Imputer', 'Random Forest Classifier']
+
+    def fit(pipeline):
+        return pipeline.fit(X, y)
+
+    trainer = BackgroundPipelineTrainer(fit)
+    # the local pipeline class and fit function can only be sent to a spawned process with cloudpickle
+    with patch('evalml.automl.background_training._get_multiprocessing_context', return_value=multiprocessing.get_context(start_method)):
+        trainer.start(0, LocalPipeline({'Random Forest Classifier': {'n_estimators': 3}}))
+    pipeline = trainer.result(0)
+    assert pipeline._is_fitted
+    assert len(pipeline.predict(X)) == len(y)
@@ -1,10 +1,25 @@
+import multiprocessing
+import sys
+import time
 from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
+import pytest
 
 from evalml.automl.automl_search import AutoMLSearch
+from evalml.automl.callbacks import (
+    log_and_save_error_callback,
+    raise_error_callback
+)
 from evalml.automl.engine import EngineBase
+from evalml.automl.events import QueueEventSink
+from evalml.pipelines import (
+    BinaryClassificationPipeline,
+    RandomForestClassifier
+)
+from evalml.pipelines.utils import make_pipeline
+from evalml.utils import ChromeTraceRecorder
 
 
 @patch('evalml.pipelines.BinaryClassificationPipeline.score')
@@ -19,6 +34,7 @@ def test_train_and_score_pipelines(mock_fit, mock_score, dummy_binary_pipeline_c
     assert mock_fit.call_count == automl.data_splitter.get_n_splits()
     assert mock_score.call_count == automl.data_splitter.get_n_splits()
     assert evaluation_result.get('training_time') is not None
+    assert np.isnan(evaluation_result.get('peak_memory_mb'))
     assert evaluation_result.get('cv_score_mean') == 0.42
     pd.testing.assert_series_equal(evaluation_result.get('cv_scores'), pd.Series([0.42] * 3))
     for i in range(automl.data_splitter.get_n_splits()):
@@ -42,3 +58,244 @@ def test_train_and_score_pipelines_error(mock_fit, mock_score, dummy_binary_pipe
     for i in range(automl.data_splitter.get_n_splits()):
         assert np.isnan(evaluation_result['cv_data'][i]['all_objective_scores']['Log Loss Binary'])
     assert 'yeet' in caplog.text
+
+
+@patch('evalml.pipelines.BinaryClassificationPipeline.score')
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_train_and_score_pipelines_fold_pruning(mock_fit, mock_score, dummy_binary_pipeline_class, X_y_binary):
+    X, y = X_y_binary
+    mock_score.return_value = {'Log Loss Binary': 0.42}
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_time=1, max_batches=1,
+                          allowed_pipelines=[dummy_binary_pipeline_class], fold_pruning_tolerance=0.1)
+    automl._add_baseline_pipelines()
+    pipeline = dummy_binary_pipeline_class({})
+
+    mock_fit.reset_mock()
+    mock_score.return_value = {'Log Loss Binary': 0.5}
+    evaluation_result = EngineBase.train_and_score_pipeline(pipeline, automl, automl.X_train, automl.y_train)
+    assert evaluation_result['pruned']
+    assert mock_fit.call_count == 1
+    assert len(evaluation_result['cv_data']) == 1
+    assert evaluation_result['cv_score_mean'] == 0.5
+
+    pipeline_id = automl._post_evaluation_callback(pipeline, evaluation_result)
+    assert automl.results['pipeline_results'][pipeline_id]['pruned']
+    assert automl.full_rankings['pruned'].tolist() == [False, True]
+
+    # within 10% of the best score, so every fold is evaluated
+    mock_fit.reset_mock()
+    mock_score.return_value = {'Log Loss Binary': 0.45}
+    evaluation_result = EngineBase.train_and_score_pipeline(pipeline, automl, automl.X_train, automl.y_train)
+    assert not evaluation_result['pruned']
+    assert mock_fit.call_count == automl.data_splitter.get_n_splits()
+    assert len(evaluation_result['cv_data']) == automl.data_splitter.get_n_splits()
+
+
+def test_fold_pruning_tolerance_invalid(X_y_binary):
+    X, y = X_y_binary
+    with pytest.raises(ValueError, match='fold_pruning_tolerance must be None or non-negative'):
+        AutoMLSearch(X_train=X, y_train=y, problem_type='binary', fold_pruning_tolerance=-1)
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='Mocks are not available in child processes which are not forked')
+@patch('evalml.pipelines.BinaryClassificationPipeline.score')
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_train_and_score_pipelines_with_limits(mock_fit, mock_score, dummy_binary_pipeline_class, X_y_binary):
+    X, y = X_y_binary
+    mock_score.return_value = {'Log Loss Binary': 0.42}
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_batches=1,
+                          allowed_pipelines=[dummy_binary_pipeline_class], max_time_per_pipeline=60)
+    pipeline = dummy_binary_pipeline_class({})
+    evaluation_result = EngineBase.train_and_score_pipeline_with_limits(pipeline, automl, automl.X_train, automl.y_train, time_limit=60)
+    assert not evaluation_result['timed_out']
+    assert evaluation_result['cv_score_mean'] == 0.42
+    pd.testing.assert_series_equal(evaluation_result['cv_scores'], pd.Series([0.42] * 3))
+    # the pipeline was evaluated in a child process
+    assert mock_fit.call_count == 0
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='Mocks are not available in child processes which are not forked')
+@patch('evalml.pipelines.BinaryClassificationPipeline.score')
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_train_and_score_pipelines_with_limits_timeout(mock_fit, mock_score, dummy_binary_pipeline_class, X_y_binary, caplog):
+    X, y = X_y_binary
+    mock_fit.side_effect = lambda X, y: time.sleep(60)
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_batches=1,
+                          allowed_pipelines=[dummy_binary_pipeline_class], max_time_per_pipeline=0.5)
+    pipeline = dummy_binary_pipeline_class({})
+    start = time.time()
+    evaluation_result = EngineBase.train_and_score_pipeline_with_limits(pipeline, automl, automl.X_train, automl.y_train, time_limit=0.5)
+    assert time.time() - start < 30
+    assert evaluation_result['timed_out']
+    assert np.isnan(evaluation_result['cv_score_mean'])
+    assert np.isnan(evaluation_result['cv_data'][0]['all_objective_scores']['Log Loss Binary'])
+    assert "exceeding the time limit of 0.5 seconds" in caplog.text
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='Mocks are not available in child processes which are not forked')
+@patch('evalml.pipelines.BinaryClassificationPipeline.score')
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_train_and_score_pipelines_with_limits_error(mock_fit, mock_score, dummy_binary_pipeline_class, X_y_binary):
+    X, y = X_y_binary
+    mock_score.side_effect = Exception('yeet')
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_batches=1, error_callback=raise_error_callback,
+                          allowed_pipelines=[dummy_binary_pipeline_class], max_time_per_pipeline=60)
+    pipeline = dummy_binary_pipeline_class({})
+    with pytest.raises(Exception, match='yeet'):
+        EngineBase.train_and_score_pipeline_with_limits(pipeline, automl, automl.X_train, automl.y_train, time_limit=60)
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='The resource module is not available on Windows')
+@patch('evalml.pipelines.BinaryClassificationPipeline.score')
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_train_and_score_pipelines_with_limits_error_callback_in_search_process(mock_fit, mock_score, dummy_binary_pipeline_class, X_y_binary):
+    X, y = X_y_binary
+    mock_score.side_effect = [{'Log Loss Binary': 0.42}, Exception('yeet'), Exception('yeet again')]
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_batches=1, error_callback=log_and_save_error_callback,
+                          allowed_pipelines=[dummy_binary_pipeline_class], max_time_per_pipeline=60)
+    pipeline = dummy_binary_pipeline_class({})
+    evaluation_result = EngineBase.train_and_score_pipeline_with_limits(pipeline, automl, automl.X_train, automl.y_train, time_limit=60)
+    assert evaluation_result['cv_scores'][0] == 0.42
+    assert np.isnan(evaluation_result['cv_scores'][1:]).all()
+    assert [str(error) for error in automl._results['errors']] == ['yeet', 'yeet again']
+
+
+def test_train_and_score_pipelines_with_limits_spawn(X_y_binary):
+    X, y = X_y_binary
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_batches=1, max_time_per_pipeline=120)
+    # generated pipeline classes are defined at runtime and cannot be pickled with the standard pickle module
+    pipeline = make_pipeline(X, y, RandomForestClassifier, 'binary')({'Random Forest Classifier': {'n_estimators': 3}})
+    with patch('evalml.automl.engine.engine_base._get_multiprocessing_context', return_value=multiprocessing.get_context('spawn')):
+        evaluation_result = EngineBase.train_and_score_pipeline_with_limits(pipeline, automl, automl.X_train, automl.y_train,
+                                                                            time_limit=120)
+    assert not evaluation_result['timed_out']
+    assert not np.isnan(evaluation_result['cv_score_mean'])
+
+
+@pytest.mark.parametrize("max_time_per_pipeline", [0, -1, [1]])
+def test_max_time_per_pipeline_invalid(max_time_per_pipeline, X_y_binary):
+    X, y = X_y_binary
+    with pytest.raises((ValueError, TypeError), match='max_time_per_pipeline must be'):
+        AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_time_per_pipeline=max_time_per_pipeline)
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='Mocks are not available in child processes which are not forked')
+@patch('evalml.pipelines.BinaryClassificationPipeline.score', return_value={'Log Loss Binary': 0.42})
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_automl_max_time_per_pipeline(mock_fit, mock_score, dummy_binary_pipeline_class, X_y_binary):
+    X, y = X_y_binary
+    mock_fit.side_effect = lambda X, y: time.sleep(60)
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_iterations=2,
+                          allowed_pipelines=[dummy_binary_pipeline_class], max_time_per_pipeline='1 second',
+                          train_best_pipeline=False)
+    assert automl.max_time_per_pipeline == 1
+    automl.search()
+    results = automl.results['pipeline_results']
+    assert [result['timed_out'] for result in results.values()] == [True, True]
+    assert all(np.isnan(result['score']) for result in results.values())
+
+
+def _allocate_memory(X, y):
+    data = np.ones(25_000_000)  # 200 MB
+    time.sleep(0.2)
+    return data
+
+
+@patch('evalml.pipelines.BinaryClassificationPipeline.score')
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_train_and_score_pipelines_peak_memory(mock_fit, mock_score, dummy_binary_pipeline_class, X_y_binary):
+    X, y = X_y_binary
+    mock_fit.side_effect = _allocate_memory
+    mock_score.return_value = {'Log Loss Binary': 0.42}
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_batches=1,
+                          allowed_pipelines=[dummy_binary_pipeline_class], record_peak_memory=True)
+    pipeline = dummy_binary_pipeline_class({})
+    evaluation_result = EngineBase.train_and_score_pipeline(pipeline, automl, automl.X_train, automl.y_train)
+    assert evaluation_result['peak_memory_mb'] > 150
+    assert evaluation_result['cv_score_mean'] == 0.42
+
+
+@patch('evalml.automl.engine.engine_base._PeakMemoryMonitor')
+@patch('evalml.pipelines.BinaryClassificationPipeline.score')
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_train_and_score_pipelines_peak_memory_not_recorded(mock_fit, mock_score, mock_monitor, dummy_binary_pipeline_class, X_y_binary):
+    X, y = X_y_binary
+    mock_score.return_value = {'Log Loss Binary': 0.42}
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_batches=1,
+                          allowed_pipelines=[dummy_binary_pipeline_class])
+    pipeline = dummy_binary_pipeline_class({})
+    evaluation_result = EngineBase.train_and_score_pipeline(pipeline, automl, automl.X_train, automl.y_train)
+    mock_monitor.assert_not_called()
+    assert np.isnan(evaluation_result['peak_memory_mb'])
+    assert evaluation_result['cv_score_mean'] == 0.42
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='The resource module is not available on Windows')
+@patch('evalml.pipelines.BinaryClassificationPipeline.score')
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_train_and_score_pipelines_with_limits_memory(mock_fit, mock_score, dummy_binary_pipeline_class, X_y_binary):
+    X, y = X_y_binary
+    mock_fit.side_effect = _allocate_memory
+    mock_score.return_value = {'Log Loss Binary': 0.42}
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_batches=1,
+                          allowed_pipelines=[dummy_binary_pipeline_class], max_memory_per_pipeline=50)
+    pipeline = dummy_binary_pipeline_class({})
+    evaluation_result = EngineBase.train_and_score_pipeline_with_limits(pipeline, automl, automl.X_train, automl.y_train,
+                                                                        memory_limit=50)
+    assert not evaluation_result['timed_out']
+    assert np.isnan(evaluation_result['cv_score_mean'])
+
+    evaluation_result = EngineBase.train_and_score_pipeline_with_limits(pipeline, automl, automl.X_train, automl.y_train,
+                                                                        memory_limit=1000)
+    assert evaluation_result['cv_score_mean'] == 0.42
+
+
+@pytest.mark.parametrize("max_memory_per_pipeline", [0, -1, '1 GB', True])
+def test_max_memory_per_pipeline_invalid(max_memory_per_pipeline, X_y_binary):
+    X, y = X_y_binary
+    with pytest.raises(ValueError, match='max_memory_per_pipeline must be None or a positive number of megabytes'):
+        AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_memory_per_pipeline=max_memory_per_pipeline)
+
+
+def test_train_and_score_pipelines_component_profile(X_y_binary):
+    X, y = X_y_binary
+
+    class ProfiledPipeline(BinaryClassificationPipeline):
+        component_graph = ['Imputer', 'Random Forest Classifier']
+
+    recorder = ChromeTraceRecorder()
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_batches=1,
+                          allowed_pipelines=[ProfiledPipeline], trace_recorder=recorder)
+    pipeline = ProfiledPipeline({'Random Forest Classifier': {'n_estimators': 3}})
+    evaluation_result = EngineBase.train_and_score_pipeline(pipeline, automl, automl.X_train, automl.y_train)
+    for fold in evaluation_result['cv_data']:
+        assert set(fold['component_profile']) == {'Imputer', 'Random Forest Classifier'}
+        assert fold['component_profile']['Random Forest Classifier']['fit']['rows_in'] == fold['all_objective_scores']['# Training']
+        assert fold['component_profile']['Random Forest Classifier']['predict_proba']['calls'] == 1
+
+    categories = [event['cat'] for event in recorder.to_dict()['traceEvents']]
+    assert categories[0] == 'pipeline'
+    assert categories.count('pipeline') == 1
+    assert categories.count('fold') == len(evaluation_result['cv_data'])
+    assert categories.count('component') > 0
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='The resource module is not available on Windows')
+@patch('evalml.pipelines.BinaryClassificationPipeline.score')
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_train_and_score_pipelines_with_limits_events(mock_fit, mock_score, dummy_binary_pipeline_class, X_y_binary):
+    X, y = X_y_binary
+    mock_score.return_value = {'Log Loss Binary': 0.42}
+    sink = QueueEventSink()
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_batches=1,
+                          allowed_pipelines=[dummy_binary_pipeline_class], event_sinks=sink)
+    pipeline = dummy_binary_pipeline_class({})
+    EngineBase.train_and_score_pipeline_with_limits(pipeline, automl, automl.X_train, automl.y_train, time_limit=60)
+    assert [event['event'] for event in sink.queue.queue] == ['fold_start', 'fold_end'] * 3
+
+    mock_fit.side_effect = lambda *args, **kwargs: time.sleep(5)
+    sink.queue.queue.clear()
+    EngineBase.train_and_score_pipeline_with_limits(pipeline, automl, automl.X_train, automl.y_train, time_limit=0.5)
+    events = list(sink.queue.queue)
+    assert [event['event'] for event in events] == ['error']
+    assert events[0]['error_type'] == 'TimeoutError'
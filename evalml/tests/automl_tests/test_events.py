@@ -0,0 +1,134 @@
+import json
+import os
+import pickle
+import queue
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from evalml.automl import (
+    AutoMLSearch,
+    EventSink,
+    JSONLinesEventSink,
+    QueueEventSink
+)
+from evalml.automl.callbacks import raise_error_callback
+from evalml.automl.events import make_event
+
+
+def test_make_event():
+    event = make_event('fold_end', fold=1, score=0.5)
+    assert event['event'] == 'fold_end'
+    assert event['fold'] == 1
+    assert event['score'] == 0.5
+    assert event['timestamp'] > 0
+    assert event['memory_mb'] > 0
+    assert event['cpu_time'] > 0
+
+
+def test_json_lines_event_sink(tmpdir):
+    file_path = os.path.join(str(tmpdir), 'events', 'search.jsonl')
+    sink = JSONLinesEventSink(file_path)
+    sink.emit(make_event('score', id=0, score=np.float64(0.25), parameters={'Imputer': {'fill_value': np.int64(1)}}))
+    sink.emit(make_event('score', id=1, score=np.nan))
+    sink = pickle.loads(pickle.dumps(sink))
+    sink.emit(make_event('search_end', best_pipeline_id=0))
+    sink.close()
+    with open(file_path) as f:
+        events = [json.loads(line) for line in f]
+    assert [event['event'] for event in events] == ['score', 'score', 'search_end']
+    assert events[0]['score'] == 0.25
+    assert events[0]['parameters'] == {'Imputer': {'fill_value': 1}}
+    assert events[1]['score'] is None
+
+
+def test_queue_event_sink():
+    sink = QueueEventSink(queue.Queue(maxsize=1))
+    sink.emit(make_event('fold_start'))
+    sink.emit(make_event('fold_end'))
+    assert sink.queue.get_nowait()['event'] == 'fold_start'
+    assert sink.queue.empty()
+
+    sink = pickle.loads(pickle.dumps(QueueEventSink()))
+    sink.emit(make_event('fold_start'))
+    assert sink.queue.qsize() == 1
+
+
+def test_automl_event_sinks_invalid(X_y_binary):
+    X, y = X_y_binary
+    with pytest.raises(ValueError, match='event_sinks must be an EventSink or a list of EventSink instances'):
+        AutoMLSearch(X_train=X, y_train=y, problem_type='binary', event_sinks=[queue.Queue()])
+
+
+@patch('evalml.pipelines.BinaryClassificationPipeline.score')
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_automl_event_sinks(mock_fit, mock_score, dummy_binary_pipeline_class, X_y_binary):
+    X, y = X_y_binary
+    mock_score.return_value = {'Log Loss Binary': 0.42}
+
+    class RecordingSink(EventSink):
+        def __init__(self):
+            self.events = []
+
+        def emit(self, event):
+            self.events.append(event)
+
+    sink = RecordingSink()
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_iterations=2,
+                          allowed_pipelines=[dummy_binary_pipeline_class], event_sinks=sink)
+    automl.search()
+    event_types = [event['event'] for event in sink.events]
+    assert event_types[0] == 'search_start'
+    assert event_types[-1] == 'search_end'
+    assert event_types.count('batch_start') == 1
+    assert event_types.count('pipeline_start') == 2
+    assert event_types.count('score') == 2
+    assert event_types.count('fold_start') == event_types.count('fold_end') == 6
+    assert 'error' not in event_types
+    assert event_types[1:6] == ['pipeline_start', 'fold_start', 'fold_end', 'fold_start', 'fold_end']
+
+    score_events = [event for event in sink.events if event['event'] == 'score']
+    assert [event['id'] for event in score_events] == [0, 1]
+    assert score_events[1]['score'] == 0.42
+    assert sink.events[-1]['best_pipeline_id'] == automl.rankings.iloc[0]['id']
+    assert not sink.events[-1]['interrupted']
+    assert all(later['timestamp'] >= earlier['timestamp'] for earlier, later in zip(sink.events, sink.events[1:]))
+
+
+@patch('evalml.pipelines.BinaryClassificationPipeline.score')
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_automl_event_sinks_error(mock_fit, mock_score, dummy_binary_pipeline_class, X_y_binary):
+    X, y = X_y_binary
+    mock_score.return_value = {'Log Loss Binary': 0.42}
+    mock_fit.side_effect = [None, None, None, ValueError('fit failed'), None, None, None]
+    sink = QueueEventSink()
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_iterations=2,
+                          allowed_pipelines=[dummy_binary_pipeline_class], event_sinks=[sink])
+    automl.search()
+    events = list(sink.queue.queue)
+    error_events = [event for event in events if event['event'] == 'error']
+    assert len(error_events) == 1
+    assert error_events[0]['fold'] == 0
+    assert error_events[0]['error_type'] == 'ValueError'
+    assert error_events[0]['message'] == 'fit failed'
+
+
+@patch('evalml.pipelines.BinaryClassificationPipeline.score')
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_automl_event_sinks_closed_when_search_raises(mock_fit, mock_score, dummy_binary_pipeline_class, X_y_binary, tmpdir):
+    X, y = X_y_binary
+    mock_score.return_value = {'Log Loss Binary': 0.42}
+    mock_fit.side_effect = ValueError('fit failed')
+    file_path = os.path.join(str(tmpdir), 'search.jsonl')
+    sink = JSONLinesEventSink(file_path)
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', max_iterations=2,
+                          allowed_pipelines=[dummy_binary_pipeline_class], event_sinks=sink,
+                          error_callback=raise_error_callback)
+    with pytest.raises(ValueError, match='fit failed'):
+        automl.search()
+    assert sink._file is None
+    with open(file_path) as f:
+        event_types = [json.loads(line)['event'] for line in f]
+    assert event_types[0] == 'search_start'
+    assert event_types[-1] == 'error'
@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+from skopt.space import Integer
+
+from evalml.automl import AutoMLSearch
+from evalml.automl.automl_algorithm import (
+    AutoMLAlgorithmException,
+    HyperbandAlgorithm
+)
+from evalml.model_family import ModelFamily
+from evalml.pipelines import BinaryClassificationPipeline
+from evalml.pipelines.components import Estimator
+from evalml.problem_types import ProblemTypes
+
+
+@pytest.fixture
+def dummy_budget_pipeline_class():
+    class MockBudgetEstimator(Estimator):
+        name = "Mock Budget Classifier"
+        model_family = ModelFamily.RANDOM_FOREST
+        supported_problem_types = [ProblemTypes.BINARY, ProblemTypes.MULTICLASS]
+        hyperparameter_ranges = {'max_depth': Integer(1, 100)}
+
+        def __init__(self, n_estimators=90, max_depth=6, n_jobs=-1, random_seed=0):
+            super().__init__(parameters={'n_estimators': n_estimators, 'max_depth': max_depth, 'n_jobs': n_jobs},
+                             component_obj=None, random_seed=random_seed)
+
+    class MockBudgetPipeline(BinaryClassificationPipeline):
+        component_graph = [MockBudgetEstimator]
+
+    return MockBudgetPipeline
+
+
+def test_hyperband_algorithm_init():
+    algo = HyperbandAlgorithm()
+    assert algo.pipeline_number == 0
+    assert algo.batch_number == 0
+    assert algo.allowed_pipelines == []
+    assert algo.eta == 3
+    assert algo._max_bracket == 2
+    assert not algo.ensembling
+
+    with pytest.raises(ValueError, match='eta must be at least 2'):
+        HyperbandAlgorithm(eta=1)
+    with pytest.raises(ValueError, match=r'min_budget_fraction must be in \(0, 1\]'):
+        HyperbandAlgorithm(min_budget_fraction=0)
+
+
+def test_hyperband_algorithm_empty():
+    algo = HyperbandAlgorithm()
+    assert algo.next_batch() == []
+    with pytest.raises(AutoMLAlgorithmException, match='No results were reported from the first batch'):
+        algo.next_batch()
+
+
+def test_hyperband_algorithm_successive_halving(dummy_budget_pipeline_class):
+    algo = HyperbandAlgorithm(allowed_pipelines=[dummy_budget_pipeline_class])
+    tuner = algo._tuners[dummy_budget_pipeline_class.name]
+
+    first_batch = algo.next_batch()
+    assert len(first_batch) == 1
+    assert first_batch[0].parameters['Mock Budget Classifier']['n_estimators'] == 90
+    algo.add_result(1.0, first_batch[0], {'id': 0})
+    assert len(tuner.opt.yi) == 1
+
+    # the most aggressive bracket evaluates 9 proposals with 1/9 of the estimators
+    rung_0 = algo.next_batch()
+    assert len(rung_0) == 9
+    assert all(p.parameters['Mock Budget Classifier']['n_estimators'] == 10 for p in rung_0)
+    scores = np.arange(9, 0, -1)
+    for score, pipeline in zip(scores, rung_0):
+        algo.add_result(score, pipeline, {'id': algo.pipeline_number})
+    assert len(tuner.opt.yi) == 1
+
+    # the best third is evaluated with 3 times more estimators
+    rung_1 = algo.next_batch()
+    assert len(rung_1) == 3
+    assert all(p.parameters['Mock Budget Classifier']['n_estimators'] == 30 for p in rung_1)
+    assert [p.parameters['Mock Budget Classifier']['max_depth'] for p in rung_1] == \
+        [p.parameters['Mock Budget Classifier']['max_depth'] for p in rung_0[-1:-4:-1]]
+    for score, pipeline in zip([0.5, 0.2, np.nan], rung_1):
+        algo.add_result(score, pipeline, {'id': algo.pipeline_number})
+
+    # only the best proposal is evaluated with the full budget, and only that result is passed to the tuner
+    rung_2 = algo.next_batch()
+    assert len(rung_2) == 1
+    assert rung_2[0].parameters['Mock Budget Classifier']['n_estimators'] == 90
+    assert rung_2[0].parameters['Mock Budget Classifier']['max_depth'] == rung_1[1].parameters['Mock Budget Classifier']['max_depth']
+    algo.add_result(0.1, rung_2[0], {'id': algo.pipeline_number})
+    assert len(tuner.opt.yi) == 2
+
+    # the next bracket starts with fewer proposals and a larger budget
+    next_bracket = algo.next_batch()
+    assert len(next_bracket) == 5
+    assert all(p.parameters['Mock Budget Classifier']['n_estimators'] == 30 for p in next_bracket)
+    assert algo.batch_number == 5
+    assert algo.pipeline_number == 1 + 9 + 3 + 1 + 5
+
+
+def test_hyperband_algorithm_no_budget(dummy_binary_pipeline_class):
+    algo = HyperbandAlgorithm(allowed_pipelines=[dummy_binary_pipeline_class])
+    first_batch = algo.next_batch()
+    algo.add_result(1.0, first_batch[0], {'id': 0})
+
+    # estimators without n_estimators evaluate every proposal with full budget
+    for _ in range(3):
+        next_batch = algo.next_batch()
+        assert len(next_batch) == 3
+        for pipeline in next_batch:
+            algo.add_result(0.5, pipeline, {'id': algo.pipeline_number})
+    assert len(algo._tuners[dummy_binary_pipeline_class.name].opt.yi) == 10
+
+
+def test_automl_search_hyperband_algorithm(dummy_binary_pipeline_class, X_y_binary):
+    X, y = X_y_binary
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type='binary', allowed_pipelines=[dummy_binary_pipeline_class],
+                          automl_algorithm='hyperband', ensembling=True)
+    assert isinstance(automl._automl_algorithm, HyperbandAlgorithm)
+
+    with pytest.raises(ValueError, match="automl_algorithm must be 'iterative' or 'hyperband'"):
+        AutoMLSearch(X_train=X, y_train=y, problem_type='binary', automl_algorithm='bayesian')
@@ -370,3 +370,83 @@ def test_iterative_algorithm_results_best_pipeline_info_id(dummy_binary_pipeline
         for pipeline_num, (score, pipeline) in enumerate(zip(scores, next_batch)):
             algo.add_result(score, pipeline, {"id": algo.pipeline_number + pipeline_num})
             assert algo._best_pipeline_info[pipeline.model_family]['id'] == algo.pipeline_number + pipeline_num
+
+
+def test_iterative_algorithm_next_pipeline(dummy_binary_pipeline_classes):
+    dummy_binary_pipeline_classes = dummy_binary_pipeline_classes(['default'] + [f'value {i}' for i in range(50)])
+    algo = IterativeAlgorithm(allowed_pipelines=dummy_binary_pipeline_classes, pipelines_per_batch=3)
+
+    first_batch = [algo.next_pipeline() for _ in range(len(dummy_binary_pipeline_classes))]
+    assert [p.__class__ for p in first_batch] == dummy_binary_pipeline_classes
+    assert algo.pipeline_number == len(dummy_binary_pipeline_classes)
+    assert algo.batch_number == 1
+
+    # tuning waits for every result of the first batch, which may arrive in any order
+    assert algo.next_pipeline() is None
+    algo.add_result(2, first_batch[2], {"id": 2})
+    algo.add_result(1, first_batch[0], {"id": 0})
+    assert algo.next_pipeline() is None
+    algo.add_result(0, first_batch[1], {"id": 1})
+
+    # pipelines are proposed while earlier ones are still pending, starting with the best pipeline type
+    best_class = dummy_binary_pipeline_classes[1]
+    tuner = algo._tuners[best_class.name]
+    pending = [algo.next_pipeline() for _ in range(2)]
+    assert [p.__class__ for p in pending] == [best_class] * 2
+    assert len(tuner._pending_parameters) == 2
+    assert algo.batch_number == 2
+    assert algo.pipeline_number == len(dummy_binary_pipeline_classes) + 2
+    assert pending[0].parameters != pending[1].parameters
+
+    algo.add_result(-1, pending[1], {"id": 4})
+    assert len(tuner._pending_parameters) == 1
+    assert len(tuner.opt.yi) == 2
+    pending.append(algo.next_pipeline())
+    assert pending[2].__class__ == best_class
+    algo.add_result(-2, pending[2], {"id": 5})
+    algo.add_result(np.nan, pending[0], {"id": 3})
+    assert tuner._pending_parameters == []
+    assert len(tuner.opt.yi) == 3
+
+    # once a batch has been proposed, the next pipeline type is tuned
+    assert algo.next_pipeline().__class__ == dummy_binary_pipeline_classes[0]
+    assert algo.batch_number == 3
+
+
+def test_iterative_algorithm_next_pipeline_empty():
+    algo = IterativeAlgorithm()
+    assert algo.next_pipeline() is None
+    assert algo.batch_number == 1
+    with pytest.raises(AutoMLAlgorithmException, match='No results were reported from the first batch'):
+        algo.next_pipeline()
+
+
+def test_iterative_algorithm_cost_aware(dummy_binary_pipeline_classes):
+    dummy_binary_pipeline_classes = dummy_binary_pipeline_classes(['default'] + [f'value {i}' for i in range(50)])
+    algo = IterativeAlgorithm(allowed_pipelines=dummy_binary_pipeline_classes, cost_aware=True)
+    assert all(tuner.cost_aware for tuner in algo._tuners.values())
+
+    # the best pipeline is the slowest to train
+    cv_data = [{'all_objective_scores': {'# Training': 100}}] * 3
+    first_batch = algo.next_batch()
+    for score, training_time, pipeline in zip([0, 1, 2], [30.0, 2.0, 10.0], first_batch):
+        algo.add_result(score, pipeline, {'id': algo.pipeline_number, 'training_time': training_time, 'cv_data': cv_data})
+    assert algo.predict_training_time(dummy_binary_pipeline_classes[1]) == 2.0
+
+    # pipeline types are tuned cheapest first
+    next_batch = algo.next_batch()
+    assert [p.__class__ for p in next_batch] == [dummy_binary_pipeline_classes[1]] * algo.pipelines_per_batch
+
+    # batches are shortened to fit the remaining time
+    algo.time_remaining = 25.0
+    next_batch = algo.next_batch()
+    assert [p.__class__ for p in next_batch] == [dummy_binary_pipeline_classes[2]] * 2
+
+    # pipeline types which would not finish are deferred to the next pipeline type that would
+    algo.time_remaining = 5.0
+    next_batch = algo.next_batch()
+    assert [p.__class__ for p in next_batch] == [dummy_binary_pipeline_classes[1]] * 2
+
+    algo.time_remaining = 1.0
+    with pytest.raises(StopIteration, match='No pipeline is expected to finish within the remaining 1.0 seconds'):
+        algo.next_batch()
@@ -17,7 +17,7 @@ def test_search_iteration_plot_class():
     class MockResults:
         def __init__(self):
             self.objective = MockObjective()
-            self.results = {
+            self._results = {
                 'pipeline_results': {
                     2: {
                         'score': 0.50
@@ -73,3 +73,47 @@ def test_jupyter(import_check, jupyter_check):
     with pytest.warns(None) as graph_valid:
         SearchIterationPlot(mock_data)
         assert len(graph_valid) == 0
+
+
+def test_search_iteration_plot_incremental_update():
+    pytest.importorskip('plotly.graph_objects', reason='Skipping plotting test because plotly not installed')
+
+    class MockObjective:
+        def __init__(self):
+            self.name = 'Test Objective'
+            self.greater_is_better = False
+
+    class MockResults:
+        def __init__(self):
+            self.objective = MockObjective()
+            self._results = {'pipeline_results': {}, 'search_order': []}
+
+        @property
+        def results(self):
+            raise AssertionError('the plot should not copy the results on every update')
+
+        def add(self, score):
+            pipeline_id = len(self._results['search_order'])
+            self._results['pipeline_results'][pipeline_id] = {'score': score}
+            self._results['search_order'].append(pipeline_id)
+
+    mock_data = MockResults()
+    plot = SearchIterationPlot(mock_data, refresh_interval=60)
+    assert list(plot.best_score_by_iter_fig.data[0]['x']) == []
+
+    mock_data.add(0.5)
+    plot.update()
+    assert list(plot.best_score_by_iter_fig.data[0]['y']) == [0.5]
+
+    # updates within the refresh interval are recorded but not drawn
+    mock_data.add(0.7)
+    mock_data.add(0.3)
+    plot.update()
+    assert plot.best_iteration_scores == [0.5, 0.5, 0.3]
+    assert plot.curr_iteration_scores == [0.5, 0.7, 0.3]
+    assert list(plot.best_score_by_iter_fig.data[0]['y']) == [0.5]
+
+    plot.update(force=True)
+    assert list(plot.best_score_by_iter_fig.data[0]['x']) == [0, 1, 2]
+    assert list(plot.best_score_by_iter_fig.data[0]['y']) == [0.5, 0.5, 0.3]
+    assert list(plot.best_score_by_iter_fig.data[1]['y']) == [0.5, 0.7, 0.3]
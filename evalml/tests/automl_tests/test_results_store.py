@@ -0,0 +1,77 @@
+import copy
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evalml.automl.results_store import RANKINGS_COLUMNS, ResultsStore
+
+
+def _make_result(pipeline_id, score, pipeline_name="Mock Pipeline", parameters=None):
+    return {"id": pipeline_id,
+            "pipeline_name": pipeline_name,
+            "score": score,
+            "validation_score": score,
+            "percent_better_than_baseline": 0,
+            "high_variance_cv": False,
+            "pruned": False,
+            "parameters": parameters if parameters is not None else {"Mock Estimator": {"a": pipeline_id}},
+            "cv_data": [{"score": score}]}
+
+
+@pytest.mark.parametrize("greater_is_better", [True, False])
+def test_results_store_rankings(greater_is_better):
+    store = ResultsStore(greater_is_better=greater_is_better)
+    assert store.best_id is None
+    assert list(store.full_rankings().columns) == RANKINGS_COLUMNS
+    assert store.full_rankings().empty
+
+    scores = [0.5, np.nan, 0.9, 0.1, 0.9]
+    for pipeline_id, score in enumerate(scores):
+        store.add(_make_result(pipeline_id, score))
+    assert len(store) == 5
+    assert store.search_order == [0, 1, 2, 3, 4]
+
+    expected = pd.DataFrame([_make_result(i, score) for i, score in enumerate(scores)])[RANKINGS_COLUMNS]
+    expected = expected.sort_values("score", ascending=not greater_is_better, kind="mergesort").reset_index(drop=True)
+    pd.testing.assert_frame_equal(store.full_rankings(), expected)
+    assert store.best_id == (2 if greater_is_better else 3)
+
+    rankings = store.full_rankings()
+    rankings.drop(columns=["parameters"], inplace=True)
+    assert list(store.full_rankings().columns) == RANKINGS_COLUMNS
+
+
+def test_results_store_contains():
+    store = ResultsStore(greater_is_better=True)
+    parameters = {"Imputer": {"strategy": "mean", "fill_values": [1, 2]},
+                  "Mock Estimator": {"n_estimators": 10, "ratio": np.float64(0.5)}}
+    store.add(_make_result(0, 1.0, parameters=parameters))
+    assert store.contains("Mock Pipeline", copy.deepcopy(parameters))
+    assert store.contains("Mock Pipeline", {"Mock Estimator": {"ratio": 0.5, "n_estimators": 10.0},
+                                            "Imputer": {"fill_values": [1, 2], "strategy": "mean"}})
+    assert not store.contains("Other Pipeline", parameters)
+    assert not store.contains("Mock Pipeline", {"Imputer": {"strategy": "median", "fill_values": [1, 2]},
+                                                "Mock Estimator": {"n_estimators": 10, "ratio": 0.5}})
+
+
+@pytest.mark.parametrize("greater_is_better", [True, False])
+def test_results_store_rankings_read_between_adds(greater_is_better):
+    rng = np.random.RandomState(0)
+    scores = list(rng.rand(30))
+    scores[3] = scores[7] = np.nan
+    scores[10] = scores[4]
+    scores[12] = scores[20] = -np.inf
+    scores[13] = np.inf
+    store = ResultsStore(greater_is_better=greater_is_better)
+    for pipeline_id, score in enumerate(scores):
+        store.add(_make_result(pipeline_id, score))
+        if pipeline_id % 4 == 0:
+            rankings = store.full_rankings()
+            assert len(rankings) == pipeline_id + 1
+            assert not store._pending_rows
+
+    expected = pd.DataFrame([_make_result(i, score) for i, score in enumerate(scores)])[RANKINGS_COLUMNS]
+    expected = expected.sort_values("score", ascending=not greater_is_better, kind="mergesort").reset_index(drop=True)
+    pd.testing.assert_frame_equal(store.full_rankings(), expected)
+    assert store.best_id == expected["id"][0]
@@ -18,3 +18,14 @@ def test_catboost_regressor_random_seed_bounds_seed(X_y_regression):
     clf = CatBoostRegressor(n_estimators=1, max_depth=1, random_seed=SEED_BOUNDS.max_bound)
     fitted = clf.fit(X, y)
     assert isinstance(fitted, CatBoostRegressor)
+
+
+def test_catboost_regressor_early_stopping(X_y_regression):
+    X, y = X_y_regression
+    clf = CatBoostRegressor(n_estimators=500, early_stopping_rounds=5)
+    assert clf.best_iteration is None
+    clf.fit(X, y)
+    assert clf.parameters['early_stopping_rounds'] == 5
+    assert clf.best_iteration is not None
+    assert clf.best_iteration < 500
+    assert len(clf.predict(X)) == len(y)
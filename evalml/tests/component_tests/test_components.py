@@ -35,12 +35,16 @@ from evalml.pipelines.components import (
     Estimator,
     ExtraTreesClassifier,
     ExtraTreesRegressor,
+    HistGradientBoostingClassifier,
+    HistGradientBoostingRegressor,
     Imputer,
     LightGBMClassifier,
     LightGBMRegressor,
     LinearDiscriminantAnalysis,
     LinearRegressor,
     LogisticRegressionClassifier,
+    NystroemSVMClassifier,
+    NystroemSVMRegressor,
     OneHotEncoder,
     PerColumnImputer,
     RandomForestClassifier,
@@ -55,6 +59,7 @@ from evalml.pipelines.components import (
     TextFeaturizer,
     TimeSeriesBaselineEstimator,
     Transformer,
+    TreeKNeighborsClassifier,
     XGBoostClassifier,
     XGBoostRegressor
 )
@@ -159,7 +164,8 @@ def test_describe_component():
                                                                                         'categories': None,
                                                                                         'drop': None,
                                                                                         'handle_unknown': 'ignore',
-                                                                                        'handle_missing': 'error'}}
+                                                                                        'handle_missing': 'error',
+                                                                                        'sparse': False}}
     assert imputer.describe(return_dict=True) == {'name': 'Imputer', 'parameters': {'categorical_impute_strategy': "most_frequent",
                                                                                     'categorical_fill_value': None,
                                                                                     'numeric_impute_strategy': "mean",
@@ -193,6 +199,11 @@ def test_describe_component():
     linear_regressor = LinearRegressor()
     svm_classifier = SVMClassifier()
     svm_regressor = SVMRegressor()
+    hgb_classifier = HistGradientBoostingClassifier()
+    hgb_regressor = HistGradientBoostingRegressor()
+    nystroem_svm_classifier = NystroemSVMClassifier()
+    nystroem_svm_regressor = NystroemSVMRegressor()
+    tree_knn_classifier = TreeKNeighborsClassifier()
     assert base_classifier.describe(return_dict=True) == {'name': 'Baseline Classifier', 'parameters': {'strategy': 'mode'}}
     assert base_regressor.describe(return_dict=True) == {'name': 'Baseline Regressor', 'parameters': {'strategy': 'mean'}}
     assert lr_classifier.describe(return_dict=True) == {'name': 'Logistic Regression Classifier', 'parameters': {'penalty': 'l2', 'C': 1.0, 'n_jobs': -1, 'multi_class': 'auto', 'solver': 'lbfgs'}}
@@ -205,27 +216,33 @@ def test_describe_component():
     assert linear_regressor.describe(return_dict=True) == {'name': 'Linear Regressor', 'parameters': {'fit_intercept': True, 'normalize': False, 'n_jobs': -1}}
     assert svm_classifier.describe(return_dict=True) == {'name': 'SVM Classifier', 'parameters': {'C': 1.0, 'kernel': 'rbf', 'gamma': 'scale', 'probability': True}}
     assert svm_regressor.describe(return_dict=True) == {'name': 'SVM Regressor', 'parameters': {'C': 1.0, 'kernel': 'rbf', 'gamma': 'scale'}}
+    hgb_parameters = {'learning_rate': 0.1, 'max_iter': 100, 'max_leaf_nodes': 31, 'max_depth': None, 'min_samples_leaf': 20, 'l2_regularization': 0.0}
+    assert hgb_classifier.describe(return_dict=True) == {'name': 'Histogram Gradient Boosting Classifier', 'parameters': hgb_parameters}
+    assert hgb_regressor.describe(return_dict=True) == {'name': 'Histogram Gradient Boosting Regressor', 'parameters': hgb_parameters}
+    assert nystroem_svm_classifier.describe(return_dict=True) == {'name': 'Nystroem SVM Classifier', 'parameters': {'alpha': 0.0001, 'kernel': 'rbf', 'gamma': None, 'n_components': 100, 'n_jobs': -1, 'max_iter': 1000, 'loss': 'modified_huber'}}
+    assert nystroem_svm_regressor.describe(return_dict=True) == {'name': 'Nystroem SVM Regressor', 'parameters': {'alpha': 0.0001, 'kernel': 'rbf', 'gamma': None, 'n_components': 100, 'loss': 'epsilon_insensitive', 'max_iter': 1000}}
+    assert tree_knn_classifier.describe(return_dict=True) == {'name': 'Tree KNN Classifier', 'parameters': {'n_neighbors': 5, 'weights': 'uniform', 'algorithm': 'auto', 'leaf_size': 40, 'n_jobs': -1}}
     try:
         xgb_classifier = XGBoostClassifier(eta=0.1, min_child_weight=1, max_depth=3, n_estimators=75)
         xgb_regressor = XGBoostRegressor(eta=0.1, min_child_weight=1, max_depth=3, n_estimators=75)
-        assert xgb_classifier.describe(return_dict=True) == {'name': 'XGBoost Classifier', 'parameters': {'eta': 0.1, 'max_depth': 3, 'min_child_weight': 1, 'n_estimators': 75}}
-        assert xgb_regressor.describe(return_dict=True) == {'name': 'XGBoost Regressor', 'parameters': {'eta': 0.1, 'max_depth': 3, 'min_child_weight': 1, 'n_estimators': 75}}
+        assert xgb_classifier.describe(return_dict=True) == {'name': 'XGBoost Classifier', 'parameters': {'eta': 0.1, 'max_depth': 3, 'min_child_weight': 1, 'n_estimators': 75, 'early_stopping_rounds': None}}
+        assert xgb_regressor.describe(return_dict=True) == {'name': 'XGBoost Regressor', 'parameters': {'eta': 0.1, 'max_depth': 3, 'min_child_weight': 1, 'n_estimators': 75, 'early_stopping_rounds': None}}
     except ImportError:
         pass
     try:
         cb_classifier = CatBoostClassifier()
         cb_regressor = CatBoostRegressor()
-        assert cb_classifier.describe(return_dict=True) == {'name': 'CatBoost Classifier', 'parameters': {'allow_writing_files': False, 'n_estimators': 10, 'eta': 0.03, 'max_depth': 6, 'bootstrap_type': None, 'silent': True}}
-        assert cb_regressor.describe(return_dict=True) == {'name': 'CatBoost Regressor', 'parameters': {'allow_writing_files': False, 'n_estimators': 10, 'eta': 0.03, 'max_depth': 6, 'bootstrap_type': None, 'silent': False}}
+        assert cb_classifier.describe(return_dict=True) == {'name': 'CatBoost Classifier', 'parameters': {'allow_writing_files': False, 'n_estimators': 10, 'eta': 0.03, 'max_depth': 6, 'bootstrap_type': None, 'silent': True, 'early_stopping_rounds': None}}
+        assert cb_regressor.describe(return_dict=True) == {'name': 'CatBoost Regressor', 'parameters': {'allow_writing_files': False, 'n_estimators': 10, 'eta': 0.03, 'max_depth': 6, 'bootstrap_type': None, 'silent': False, 'early_stopping_rounds': None}}
     except ImportError:
         pass
     try:
         lg_classifier = LightGBMClassifier()
         lg_regressor = LightGBMRegressor()
         assert lg_classifier.describe(return_dict=True) == {'name': 'LightGBM Classifier', 'parameters': {'boosting_type': 'gbdt', 'learning_rate': 0.1, 'n_estimators': 100, 'max_depth': 0, 'num_leaves': 31,
-                                                                                                          'min_child_samples': 20, 'n_jobs': -1, 'bagging_fraction': 0.9, 'bagging_freq': 0}}
+                                                                                                          'min_child_samples': 20, 'n_jobs': -1, 'bagging_fraction': 0.9, 'bagging_freq': 0, 'early_stopping_rounds': None}}
         assert lg_regressor.describe(return_dict=True) == {'name': 'LightGBM Regressor', 'parameters': {'boosting_type': 'gbdt', 'learning_rate': 0.1, 'n_estimators': 20, 'max_depth': 0, 'num_leaves': 31,
-                                                                                                        'min_child_samples': 20, 'n_jobs': -1, 'bagging_fraction': 0.9, 'bagging_freq': 0}}
+                                                                                                        'min_child_samples': 20, 'n_jobs': -1, 'bagging_fraction': 0.9, 'bagging_freq': 0, 'early_stopping_rounds': None}}
     except ImportError:
         pass
 
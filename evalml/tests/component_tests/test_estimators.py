@@ -8,6 +8,9 @@ import woodwork as ww
 from evalml.exceptions import ComponentNotYetFittedError
 from evalml.model_family import ModelFamily
 from evalml.pipelines.components import Estimator
+from evalml.pipelines.components.estimators.early_stopping import (
+    split_for_early_stopping
+)
 from evalml.pipelines.components.utils import (
     _all_estimators_used_in_search,
     get_estimators
@@ -208,3 +211,25 @@ def test_estimator_manage_woodwork(X_y_binary):
     X, y = est._manage_woodwork(X_ww, y_ww)
     assert isinstance(X, pd.DataFrame)
     assert isinstance(y, pd.Series)
+
+
+@pytest.mark.parametrize("stratify", [True, False])
+def test_split_for_early_stopping(stratify):
+    X = pd.DataFrame({'a': range(100)}, index=range(100, 200))
+    y = pd.Series([0] * 90 + [1] * 10, index=range(100, 200))
+    X_train, X_valid, y_train, y_valid = split_for_early_stopping(X, y, random_seed=0, stratify=stratify)
+    assert len(X_train) == len(y_train) == 90
+    assert len(X_valid) == len(y_valid) == 10
+    assert set(X_train.index) | set(X_valid.index) == set(X.index)
+    assert set(X_train.index) & set(X_valid.index) == set()
+    pd.testing.assert_index_equal(X_train.index, y_train.index)
+    if stratify:
+        assert y_valid.sum() == 1
+
+
+def test_split_for_early_stopping_stratify_falls_back():
+    X = pd.DataFrame({'a': range(20)})
+    y = pd.Series([0] * 19 + [1])
+    X_train, X_valid, y_train, y_valid = split_for_early_stopping(X, y, random_seed=0, stratify=True)
+    assert len(X_train) == 18
+    assert len(X_valid) == 2
@@ -0,0 +1,73 @@
+import numpy as np
+from sklearn.ensemble import \
+    HistGradientBoostingClassifier as SKHistGradientBoostingClassifier
+
+from evalml.model_family import ModelFamily
+from evalml.pipelines import HistGradientBoostingClassifier
+from evalml.problem_types import ProblemTypes
+
+
+def test_model_family():
+    assert HistGradientBoostingClassifier.model_family == ModelFamily.HIST_GRADIENT_BOOSTING
+
+
+def test_problem_types():
+    assert set(HistGradientBoostingClassifier.supported_problem_types) == {ProblemTypes.BINARY, ProblemTypes.MULTICLASS,
+                                                                           ProblemTypes.TIME_SERIES_BINARY,
+                                                                           ProblemTypes.TIME_SERIES_MULTICLASS}
+
+
+def test_fit_predict_binary(X_y_binary):
+    X, y = X_y_binary
+
+    sk_clf = SKHistGradientBoostingClassifier(random_state=0)
+    sk_clf.fit(X, y)
+    y_pred_sk = sk_clf.predict(X)
+    y_pred_proba_sk = sk_clf.predict_proba(X)
+
+    clf = HistGradientBoostingClassifier()
+    clf.fit(X, y)
+    y_pred = clf.predict(X)
+    y_pred_proba = clf.predict_proba(X)
+
+    np.testing.assert_almost_equal(y_pred_sk, y_pred.to_series().values, decimal=5)
+    np.testing.assert_almost_equal(y_pred_proba_sk, y_pred_proba.to_dataframe().values, decimal=5)
+
+
+def test_fit_predict_multi(X_y_multi):
+    X, y = X_y_multi
+
+    sk_clf = SKHistGradientBoostingClassifier(random_state=0)
+    sk_clf.fit(X, y)
+    y_pred_sk = sk_clf.predict(X)
+    y_pred_proba_sk = sk_clf.predict_proba(X)
+
+    clf = HistGradientBoostingClassifier()
+    fitted = clf.fit(X, y)
+    assert isinstance(fitted, HistGradientBoostingClassifier)
+
+    y_pred = clf.predict(X)
+    y_pred_proba = clf.predict_proba(X)
+
+    np.testing.assert_almost_equal(y_pred_sk, y_pred.to_series().values, decimal=5)
+    np.testing.assert_almost_equal(y_pred_proba_sk, y_pred_proba.to_dataframe().values, decimal=5)
+
+
+def test_fit_predict_missing_values(X_y_binary):
+    X, y = X_y_binary
+    X = X.copy()
+    X[::5, 0] = np.nan
+
+    clf = HistGradientBoostingClassifier()
+    clf.fit(X, y)
+    y_pred = clf.predict(X)
+    assert len(y_pred) == len(y)
+    assert not y_pred.to_series().isnull().any()
+
+
+def test_feature_importance(X_y_binary):
+    X, y = X_y_binary
+
+    clf = HistGradientBoostingClassifier()
+    clf.fit(X, y)
+    np.testing.assert_array_equal(clf.feature_importance, np.zeros(X.shape[1]))
@@ -0,0 +1,39 @@
+import numpy as np
+from sklearn.ensemble import \
+    HistGradientBoostingRegressor as SKHistGradientBoostingRegressor
+
+from evalml.model_family import ModelFamily
+from evalml.pipelines import HistGradientBoostingRegressor
+from evalml.problem_types import ProblemTypes
+
+
+def test_model_family():
+    assert HistGradientBoostingRegressor.model_family == ModelFamily.HIST_GRADIENT_BOOSTING
+
+
+def test_problem_types():
+    assert set(HistGradientBoostingRegressor.supported_problem_types) == {ProblemTypes.REGRESSION,
+                                                                          ProblemTypes.TIME_SERIES_REGRESSION}
+
+
+def test_fit_predict(X_y_regression):
+    X, y = X_y_regression
+
+    sk_clf = SKHistGradientBoostingRegressor(random_state=0)
+    sk_clf.fit(X, y)
+    y_pred_sk = sk_clf.predict(X)
+
+    clf = HistGradientBoostingRegressor()
+    fitted = clf.fit(X, y)
+    assert isinstance(fitted, HistGradientBoostingRegressor)
+
+    y_pred = clf.predict(X)
+    np.testing.assert_almost_equal(y_pred_sk, y_pred.to_series().values, decimal=5)
+
+
+def test_feature_importance(X_y_regression):
+    X, y = X_y_regression
+
+    clf = HistGradientBoostingRegressor()
+    clf.fit(X, y)
+    np.testing.assert_array_equal(clf.feature_importance, np.zeros(X.shape[1]))
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -365,3 +367,64 @@ def test_imputer_woodwork_custom_overrides_returned_by_components(X_df, has_nan,
             assert transformed.logical_types == {0: logical_type}
         else:
             assert transformed.logical_types == {0: Double}
+
+
+@pytest.mark.parametrize("numeric_impute_strategy", ["mean", "median", "most_frequent", "constant"])
+def test_imputer_partial_fit_matches_fit(numeric_impute_strategy):
+    X = pd.DataFrame({"int": [np.nan, 1, 3, 5, np.nan, 1, 7, 4],
+                      "float": [1.5, np.nan, 2.5, 4., 4., np.nan, 0.5, 1.],
+                      "category": pd.Series(["a", "b", np.nan, "b", "c", np.nan, "a", "b"], dtype="category"),
+                      "all_nan": [np.nan] * 8,
+                      "nan_in_first_chunk": [np.nan, np.nan, np.nan, 2, 3, 4, 2, np.nan]})
+    imputer = Imputer(numeric_impute_strategy=numeric_impute_strategy)
+    imputer.fit(X)
+    partial_imputer = Imputer(numeric_impute_strategy=numeric_impute_strategy)
+    for start in range(0, len(X), 3):
+        partial_imputer.partial_fit(X.iloc[start:start + 3])
+    assert partial_imputer._is_fitted
+    assert partial_imputer._all_null_cols == {"all_nan"}
+    assert_frame_equal(imputer.transform(X).to_dataframe(), partial_imputer.transform(X).to_dataframe())
+
+
+def test_imputer_merge():
+    X = pd.DataFrame({"int": [np.nan, 1, 3, 5, np.nan, 1, 7, 4],
+                      "category": pd.Series(["a", "b", np.nan, "b", "c", np.nan, "a", "b"], dtype="category"),
+                      "all_nan": [np.nan] * 8})
+    imputer = Imputer(numeric_impute_strategy="median")
+    imputer.fit(X)
+    merged_imputer = Imputer(numeric_impute_strategy="median")
+    for start in range(0, len(X), 4):
+        merged_imputer.merge(Imputer(numeric_impute_strategy="median").partial_fit(X.iloc[start:start + 4]))
+    assert merged_imputer._is_fitted
+    assert_frame_equal(imputer.transform(X).to_dataframe(), merged_imputer.transform(X).to_dataframe())
+
+    with pytest.raises(ValueError, match="parameters"):
+        merged_imputer.merge(Imputer().partial_fit(X))
+
+
+@patch("evalml.pipelines.components.transformers.imputers.simple_imputer.SimpleImputer.transform")
+def test_imputer_transform_fills_precomputed_values(mock_simple_imputer_transform):
+    X = pd.DataFrame({"int": [np.nan, 1, 3, 2],
+                      "category": pd.Series(["a", np.nan, "b", "b"], dtype="category"),
+                      "all_nan": [np.nan] * 4})
+    imputer = Imputer(categorical_impute_strategy="constant", categorical_fill_value="fill", numeric_impute_strategy="median")
+    imputer.fit(X)
+    assert imputer._fill_values == {"int": 2, "category": "fill"}
+
+    X_t = imputer.transform(X)
+    mock_simple_imputer_transform.assert_not_called()
+    assert_frame_equal(X_t.to_dataframe(),
+                       pd.DataFrame({"int": [2., 1, 3, 2],
+                                     "category": pd.Categorical(["a", "fill", "b", "b"], categories=["a", "b", "fill"])}))
+
+
+def test_imputer_transform_does_not_modify_input():
+    X = ww.DataTable(pd.DataFrame({"int": [np.nan, 1, 3, 2],
+                                   "category": pd.Series(["a", np.nan, "b", "b"], dtype="category"),
+                                   "all_nan": [np.nan] * 4}))
+    X_expected = X.to_dataframe().copy()
+    imputer = Imputer()
+    imputer.fit(X)
+    X_t = imputer.transform(X)
+    assert list(X_t.columns) == ["int", "category"]
+    assert_frame_equal(X.to_dataframe(), X_expected)
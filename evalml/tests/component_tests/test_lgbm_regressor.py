@@ -95,10 +95,10 @@ def test_correct_args(mock_predict, X_y_regression):
     X['categorical_data'].iloc[len(X) // 2:] = 'circle'
     X['categorical_data'] = X['categorical_data'].astype('category')
 
-    # create the expected result, which is a dataframe with int values in the categorical column and dtype=category
+    # create the expected result, which is a dataframe with the codes of the categories in the categorical columns and dtype=category
     X_expected = X.copy()
-    X_expected = X_expected.replace(["abc", "cba"], [0.0, 1.0])
-    X_expected = X_expected.replace(["square", "circle"], [1.0, 0.0])
+    X_expected = X_expected.replace(["abc", "cba"], [0, 1])
+    X_expected = X_expected.replace(["square", "circle"], [1, 0])
     X_expected[['string_col', 'categorical_data']] = X_expected[['string_col', 'categorical_data']].astype('category')
 
     # rename the columns to be the indices
@@ -116,12 +116,9 @@ def test_correct_args(mock_predict, X_y_regression):
 def test_categorical_data_subset(mock_predict, X_y_regression):
     X = pd.DataFrame({"feature_1": [0, 0, 1, 1, 0, 1], "feature_2": ["a", "a", "b", "b", "c", "c"]})
     y = pd.Series([1, 1, 0, 0, 0, 1])
-    X_expected = pd.DataFrame({0: [0, 0, 1, 1, 0, 1], 1: [0.0, 0.0, 1.0, 1.0, 2.0, 2.0]})
-    X_expected.iloc[:, 1] = X_expected.iloc[:, 1].astype('category')
-
     X_subset = pd.DataFrame({"feature_1": [1, 0], "feature_2": ["c", "a"]})
-    X_expected_subset = pd.DataFrame({0: [1, 0], 1: [2.0, 0.0]})
-    X_expected_subset.iloc[:, 1] = X_expected_subset.iloc[:, 1].astype('category')
+    # the categorical column keeps all the categories seen during fit
+    X_expected_subset = pd.DataFrame({0: [1, 0], 1: pd.Categorical([2, 0], categories=[0, 1, 2])})
 
     clf = LightGBMRegressor()
     clf.fit(X, y)
@@ -137,7 +134,7 @@ def test_multiple_fit(mock_predict):
     y = pd.Series([1] * 4)
     X1_fit = pd.DataFrame({"feature": ["a", "b", "c", "c"]})
     X1_predict = pd.DataFrame({"feature": ["a", "a", "b", "c"]})
-    X1_predict_expected = pd.DataFrame({0: [0.0, 0.0, 1.0, 2.0]}, dtype='category')
+    X1_predict_expected = pd.DataFrame({0: [0, 0, 1, 2]}, dtype='category')
 
     clf = LightGBMRegressor()
     clf.fit(X1_fit, y)
@@ -147,7 +144,7 @@ def test_multiple_fit(mock_predict):
     # Check if it will fit a different dataset with new variable
     X2_fit = pd.DataFrame({"feature": ["c", "b", "a", "d"]})
     X2_predict = pd.DataFrame({"feature": ["d", "c", "b", "a"]})
-    X2_predict_expected = pd.DataFrame({0: [3.0, 2.0, 1.0, 0.0]}, dtype='category')
+    X2_predict_expected = pd.DataFrame({0: [3, 2, 1, 0]}, dtype='category')
 
     clf = LightGBMRegressor()
     clf.fit(X2_fit, y)
@@ -189,3 +186,14 @@ def test_lightgbm_multiindex(data_type, X_y_regression, make_data_type):
     clf.fit(X, y)
     y_pred = clf.predict(X)
     assert not y_pred.to_series().isnull().values.any()
+
+
+def test_lightgbm_regressor_early_stopping(X_y_regression):
+    X, y = X_y_regression
+    clf = LightGBMRegressor(n_estimators=500, early_stopping_rounds=5)
+    assert clf.best_iteration is None
+    clf.fit(X, y)
+    assert clf.parameters['early_stopping_rounds'] == 5
+    assert clf.best_iteration is not None
+    assert clf.best_iteration < 500
+    assert len(clf.predict(X)) == len(y)
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.kernel_approximation import Nystroem
+from sklearn.linear_model import SGDClassifier
+
+from evalml.model_family import ModelFamily
+from evalml.pipelines import NystroemSVMClassifier
+from evalml.problem_types import ProblemTypes
+
+
+def test_model_family():
+    assert NystroemSVMClassifier.model_family == ModelFamily.SVM
+
+
+def test_problem_types():
+    assert set(NystroemSVMClassifier.supported_problem_types) == {ProblemTypes.BINARY, ProblemTypes.MULTICLASS,
+                                                                  ProblemTypes.TIME_SERIES_BINARY,
+                                                                  ProblemTypes.TIME_SERIES_MULTICLASS}
+
+
+def test_fit_predict_binary(X_y_binary):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+
+    nystroem = Nystroem(n_components=50, random_state=0)
+    sk_svc = SGDClassifier(loss="modified_huber", n_jobs=-1, random_state=0)
+    sk_svc.fit(nystroem.fit_transform(X), y)
+    y_pred_sk = sk_svc.predict(nystroem.transform(X))
+    y_pred_proba_sk = sk_svc.predict_proba(nystroem.transform(X))
+
+    svc = NystroemSVMClassifier(n_components=50)
+    fitted = svc.fit(X, y)
+    assert isinstance(fitted, NystroemSVMClassifier)
+    y_pred = svc.predict(X)
+    y_pred_proba = svc.predict_proba(X)
+
+    np.testing.assert_almost_equal(y_pred.to_series().values, y_pred_sk, decimal=5)
+    np.testing.assert_almost_equal(y_pred_proba.to_dataframe().values, y_pred_proba_sk, decimal=5)
+
+
+def test_fit_predict_multi(X_y_multi):
+    X, y = X_y_multi
+
+    svc = NystroemSVMClassifier(kernel="poly")
+    svc.fit(X, y)
+    y_pred = svc.predict(X)
+    y_pred_proba = svc.predict_proba(X)
+
+    assert set(y_pred.to_series()) <= set(y)
+    assert y_pred_proba.shape == (len(y), 3)
+    np.testing.assert_almost_equal(y_pred_proba.to_dataframe().sum(axis=1).values, np.ones(len(y)))
+
+
+def test_loss_is_modified_huber():
+    with pytest.warns(UserWarning, match="Parameter loss is being set to 'modified_huber'"):
+        svc = NystroemSVMClassifier(loss="hinge")
+    assert svc.parameters["loss"] == "modified_huber"
+    assert svc._component_obj.loss == "modified_huber"
+
+
+def test_feature_importance(X_y_binary):
+    X, y = X_y_binary
+
+    svc = NystroemSVMClassifier()
+    svc.fit(X, y)
+    np.testing.assert_equal(svc.feature_importance, np.zeros(X.shape[1]))
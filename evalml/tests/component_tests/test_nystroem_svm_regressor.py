@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+from sklearn.kernel_approximation import Nystroem
+from sklearn.linear_model import SGDRegressor
+
+from evalml.model_family import ModelFamily
+from evalml.pipelines import NystroemSVMRegressor
+from evalml.problem_types import ProblemTypes
+
+
+def test_model_family():
+    assert NystroemSVMRegressor.model_family == ModelFamily.SVM
+
+
+def test_problem_types():
+    assert set(NystroemSVMRegressor.supported_problem_types) == {ProblemTypes.REGRESSION,
+                                                                 ProblemTypes.TIME_SERIES_REGRESSION}
+
+
+def test_fit_predict(X_y_regression):
+    X, y = X_y_regression
+    X = pd.DataFrame(X)
+
+    nystroem = Nystroem(n_components=50, random_state=0)
+    sk_svr = SGDRegressor(loss="epsilon_insensitive", random_state=0)
+    sk_svr.fit(nystroem.fit_transform(X), y)
+    y_pred_sk = sk_svr.predict(nystroem.transform(X))
+
+    svr = NystroemSVMRegressor(n_components=50)
+    fitted = svr.fit(X, y)
+    assert isinstance(fitted, NystroemSVMRegressor)
+    y_pred = svr.predict(X)
+
+    np.testing.assert_almost_equal(y_pred.to_series().values, y_pred_sk, decimal=5)
+
+
+def test_feature_importance(X_y_regression):
+    X, y = X_y_regression
+
+    svr = NystroemSVMRegressor()
+    svr.fit(X, y)
+    np.testing.assert_equal(svr.feature_importance, np.zeros(X.shape[1]))
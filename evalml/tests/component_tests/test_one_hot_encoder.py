@@ -15,6 +15,7 @@ from woodwork.logical_types import (
 from evalml.exceptions import ComponentNotYetFittedError
 from evalml.pipelines.components import OneHotEncoder
 from evalml.utils import (
+    SparseFeatures,
     _convert_woodwork_types_wrapper,
     get_random_seed,
     infer_feature_types
@@ -27,7 +28,8 @@ def test_init():
                   'categories': None,
                   'drop': None,
                   'handle_unknown': 'ignore',
-                  'handle_missing': 'error'}
+                  'handle_missing': 'error',
+                  'sparse': False}
     encoder = OneHotEncoder()
     assert encoder.parameters == parameters
 
@@ -40,7 +42,8 @@ def test_parameters():
         'categories': None,
         'drop': None,
         'handle_unknown': 'ignore',
-        'handle_missing': 'error'
+        'handle_missing': 'error',
+        'sparse': False
     }
     assert encoder.parameters == expected_parameters
 
@@ -523,3 +526,38 @@ def test_ohe_woodwork_custom_overrides_returned_by_components(X_df):
         assert isinstance(transformed, ww.DataTable)
         if logical_type != Categorical:
             assert transformed.logical_types == {0: logical_type}
+
+
+def test_ohe_sparse():
+    X = pd.DataFrame({"col_1": ["a", "b", "c", "a"],
+                      "col_2": [1.5, 2.5, 3.5, 4.5]})
+    dense = OneHotEncoder(top_n=None).fit(X)
+    encoder = OneHotEncoder(top_n=None, sparse=True).fit(X)
+    X_t = encoder.transform(X)
+    assert isinstance(X_t, SparseFeatures)
+    assert X_t.columns == list(dense.transform(X).columns)
+    assert_frame_equal(X_t.to_dataframe(), _convert_woodwork_types_wrapper(dense.transform(X).to_dataframe()), check_dtype=False)
+
+
+def test_ohe_sparse_non_numeric_columns_returns_datatable():
+    X = pd.DataFrame({"col_1": ["a", "b", "c", "a"],
+                      "text": ["this is some text", "this is more text", "and more", "the last"]})
+    X = ww.DataTable(X, logical_types={"text": NaturalLanguage})
+    X_t = OneHotEncoder(top_n=None, sparse=True).fit_transform(X)
+    assert isinstance(X_t, ww.DataTable)
+    assert list(X_t.columns) == ["text", "col_1_a", "col_1_b", "col_1_c"]
+
+
+def test_ohe_partial_fit():
+    X = pd.DataFrame({"col_1": ["a", "b", "c", "a"],
+                      "col_2": [1.5, 2.5, 3.5, 4.5]})
+    with pytest.raises(ValueError, match="only supports partial_fit when the categories of each feature are declared"):
+        OneHotEncoder().partial_fit(X)
+
+    encoder = OneHotEncoder(top_n=None, categories=[["a", "b", "c", "d"]])
+    encoder.partial_fit(X.iloc[:2])
+    encoder.partial_fit(X.iloc[2:])
+    assert encoder._is_fitted
+    assert encoder.features_to_encode == ["col_1"]
+    assert list(encoder.categories("col_1")) == ["a", "b", "c", "d"]
+    assert list(encoder.transform(X).columns) == ["col_2", "col_1_a", "col_1_b", "col_1_c", "col_1_d"]
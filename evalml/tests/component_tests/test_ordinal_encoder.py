@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import woodwork as ww
+from woodwork.logical_types import Categorical, Integer
+
+from evalml.pipelines.components import OrdinalEncoder
+
+
+def test_init():
+    encoder = OrdinalEncoder()
+    assert encoder.parameters == {"features_to_encode": None}
+
+
+def test_fit_transform():
+    X = pd.DataFrame({"col_1": ["b", "a", "c", "a"],
+                      "col_2": pd.Series(["x", "y", "x", "y"], dtype="category"),
+                      "col_3": [1.5, 2.5, 3.5, 4.5]})
+    X = ww.DataTable(X, logical_types={"col_1": "categorical"})
+    encoder = OrdinalEncoder()
+    X_t = encoder.fit_transform(X)
+    assert encoder.features_to_encode == ["col_1", "col_2"]
+    expected = pd.DataFrame({"col_1": [1, 0, 2, 0], "col_2": [0, 1, 0, 1], "col_3": [1.5, 2.5, 3.5, 4.5]})
+    pd.testing.assert_frame_equal(X_t.to_dataframe(), expected, check_dtype=False)
+    assert X_t.logical_types["col_1"] == Integer
+    assert X_t.logical_types["col_2"] == Integer
+    assert list(encoder.categories("col_1")) == ["a", "b", "c"]
+
+
+def test_transform_unknown_and_missing():
+    X = pd.DataFrame({"col_1": ["b", "a", "c", "a"]})
+    encoder = OrdinalEncoder(features_to_encode=["col_1"])
+    encoder.fit(X)
+    X_t = encoder.transform(pd.DataFrame({"col_1": ["c", "d", np.nan]}))
+    assert X_t.to_dataframe()["col_1"].tolist() == [2, -1, -1]
+
+
+def test_features_to_encode():
+    X = pd.DataFrame({"col_1": ["b", "a", "c", "a"], "col_2": ["x", "y", "x", "y"]})
+    X = ww.DataTable(X, logical_types={"col_1": "categorical", "col_2": "categorical"})
+    encoder = OrdinalEncoder(features_to_encode=["col_2"])
+    X_t = encoder.fit_transform(X)
+    assert X_t.to_dataframe()["col_2"].tolist() == [0, 1, 0, 1]
+    assert X_t.to_dataframe()["col_1"].tolist() == ["b", "a", "c", "a"]
+    with pytest.raises(ValueError, match='Feature "col_1" was not provided to ordinal encoder'):
+        encoder.categories("col_1")
+
+
+def test_features_to_encode_missing():
+    encoder = OrdinalEncoder(features_to_encode=["col_3"])
+    with pytest.raises(ValueError, match="Could not find and encode col_3 in input data."):
+        encoder.fit(pd.DataFrame({"col_1": ["a", "b"]}))
+
+
+def test_encoded_columns_not_categorical():
+    X = ww.DataTable(pd.DataFrame({"col_1": ["b", "a"] * 10}), logical_types={"col_1": Categorical})
+    X_t = OrdinalEncoder().fit_transform(X)
+    assert X_t.logical_types["col_1"] != Categorical
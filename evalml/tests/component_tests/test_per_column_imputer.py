@@ -207,3 +207,54 @@ def test_per_column_imputer_woodwork_custom_overrides_returned_by_components(X_d
         transformed = imputer.transform(X, y)
         assert isinstance(transformed, ww.DataTable)
         assert transformed.logical_types == {0: logical_type}
+
+
+def test_per_column_imputer_partial_fit_and_merge():
+    X = pd.DataFrame({"a": [np.nan, 1, 3, 5, np.nan, 1, 7, 4],
+                      "b": [1.5, np.nan, 2.5, 4., 4., np.nan, 0.5, 1.],
+                      "c": pd.Series(["a", "b", np.nan, "b", "c", np.nan, "a", "b"], dtype="category")})
+    strategies = {"a": {"impute_strategy": "median"},
+                  "b": {"impute_strategy": "mean"},
+                  "c": {"impute_strategy": "most_frequent"}}
+    imputer = PerColumnImputer(impute_strategies=strategies)
+    imputer.fit(X)
+    partial_imputer = PerColumnImputer(impute_strategies=strategies)
+    merged_imputer = PerColumnImputer(impute_strategies=strategies)
+    for start in range(0, len(X), 3):
+        partial_imputer.partial_fit(X.iloc[start:start + 3])
+        merged_imputer.merge(PerColumnImputer(impute_strategies=strategies).partial_fit(X.iloc[start:start + 3]))
+    expected = imputer.transform(X).to_dataframe()
+    assert_frame_equal(expected, partial_imputer.transform(X).to_dataframe())
+    assert_frame_equal(expected, merged_imputer.transform(X).to_dataframe())
+
+    with pytest.raises(ValueError, match="columns"):
+        partial_imputer.partial_fit(X[["a"]])
+    with pytest.raises(ValueError, match="parameters"):
+        merged_imputer.merge(PerColumnImputer().partial_fit(X))
+
+
+def test_per_column_imputer_groups_columns():
+    X = pd.DataFrame({"int_1": [np.nan, 1, 3, 1],
+                      "int_2": [4, 4, np.nan, 2],
+                      "float": [np.nan, 0.5, 1.5, 2.5],
+                      "int_constant": [np.nan, 1, 2, 3],
+                      "category": pd.Series(["a", np.nan, "b", "b"], dtype="category"),
+                      "all_nan": [np.nan] * 4})
+    strategies = {"int_1": {"impute_strategy": "mean"},
+                  "int_2": {"impute_strategy": "mean"},
+                  "float": {"impute_strategy": "mean"},
+                  "int_constant": {"impute_strategy": "constant", "fill_value": -1}}
+    transformer = PerColumnImputer(impute_strategies=strategies)
+    transformer.fit(X)
+    assert list(transformer._column_groups.values()) == [["int_1", "int_2", "float"], ["int_constant"], ["category"], ["all_nan"]]
+    assert len(transformer._group_imputers) == 4
+    assert list(transformer.imputers) == list(X.columns)
+    assert transformer.imputers["int_1"] is transformer.imputers["float"]
+    assert transformer.imputers["int_constant"].parameters["impute_strategy"] == "constant"
+
+    X_expected = pd.DataFrame({"int_1": [5 / 3, 1, 3, 1],
+                               "int_2": [4, 4, 10 / 3, 2],
+                               "float": [1.5, 0.5, 1.5, 2.5],
+                               "int_constant": [-1., 1, 2, 3],
+                               "category": pd.Categorical(["a", "b", "b", "b"], categories=["a", "b"])})
+    assert_frame_equal(X_expected, transformer.transform(X).to_dataframe())
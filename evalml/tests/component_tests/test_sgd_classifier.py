@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import SGDClassifier as SKSGDClassifier
+
+from evalml.model_family import ModelFamily
+from evalml.pipelines import SGDClassifier
+from evalml.problem_types import ProblemTypes
+
+
+def test_model_family():
+    assert SGDClassifier.model_family == ModelFamily.LINEAR_MODEL
+
+
+def test_problem_types():
+    assert set(SGDClassifier.supported_problem_types) == {ProblemTypes.BINARY, ProblemTypes.MULTICLASS,
+                                                          ProblemTypes.TIME_SERIES_BINARY,
+                                                          ProblemTypes.TIME_SERIES_MULTICLASS}
+
+
+def test_invalid_loss():
+    with pytest.raises(ValueError, match="Invalid loss 'hinge'"):
+        SGDClassifier(loss="hinge")
+
+
+@pytest.mark.parametrize("loss", ["log", "modified_huber"])
+def test_fit_predict_binary(loss, X_y_binary):
+    X, y = X_y_binary
+
+    sk_clf = SKSGDClassifier(loss=loss, penalty="elasticnet", n_jobs=-1, random_state=0)
+    sk_clf.fit(X, y)
+    y_pred_sk = sk_clf.predict(X)
+    y_pred_proba_sk = sk_clf.predict_proba(X)
+
+    clf = SGDClassifier(loss=loss)
+    fitted = clf.fit(X, y)
+    assert isinstance(fitted, SGDClassifier)
+    y_pred = clf.predict(X)
+    y_pred_proba = clf.predict_proba(X)
+
+    np.testing.assert_almost_equal(y_pred.to_series().values, y_pred_sk, decimal=5)
+    np.testing.assert_almost_equal(y_pred_proba.to_dataframe().values, y_pred_proba_sk, decimal=5)
+
+
+@pytest.mark.parametrize("loss", ["log", "modified_huber"])
+def test_partial_fit(loss, X_y_multi):
+    X, y = X_y_multi
+    X = pd.DataFrame(X)
+    y = pd.Series(y)
+
+    sk_clf = SKSGDClassifier(loss=loss, penalty="elasticnet", n_jobs=-1, random_state=0)
+    clf = SGDClassifier(loss=loss)
+    for start in range(0, len(X), 25):
+        sk_clf.partial_fit(X.iloc[start:start + 25], y.iloc[start:start + 25], classes=[0, 1, 2])
+        clf.partial_fit(X.iloc[start:start + 25], y.iloc[start:start + 25], classes=[0, 1, 2])
+    assert clf._is_fitted
+    assert clf.input_feature_names == list(X.columns)
+
+    np.testing.assert_almost_equal(clf.predict(X).to_series().values, sk_clf.predict(X))
+    np.testing.assert_almost_equal(clf.predict_proba(X).to_dataframe().values, sk_clf.predict_proba(X))
+    np.testing.assert_almost_equal(clf.feature_importance, np.linalg.norm(sk_clf.coef_, axis=0, ord=2))
@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import SGDRegressor as SKSGDRegressor
+
+from evalml.model_family import ModelFamily
+from evalml.pipelines import SGDRegressor
+from evalml.problem_types import ProblemTypes
+
+
+def test_model_family():
+    assert SGDRegressor.model_family == ModelFamily.LINEAR_MODEL
+
+
+def test_problem_types():
+    assert set(SGDRegressor.supported_problem_types) == {ProblemTypes.REGRESSION, ProblemTypes.TIME_SERIES_REGRESSION}
+
+
+@pytest.mark.parametrize("loss", ["huber", "epsilon_insensitive"])
+def test_fit_predict(loss, X_y_regression):
+    X, y = X_y_regression
+
+    sk_reg = SKSGDRegressor(loss=loss, penalty="elasticnet", random_state=0)
+    sk_reg.fit(X, y)
+    y_pred_sk = sk_reg.predict(X)
+
+    reg = SGDRegressor(loss=loss)
+    fitted = reg.fit(X, y)
+    assert isinstance(fitted, SGDRegressor)
+    y_pred = reg.predict(X)
+
+    np.testing.assert_almost_equal(y_pred.to_series().values, y_pred_sk, decimal=5)
+    np.testing.assert_almost_equal(reg.feature_importance, sk_reg.coef_)
+
+
+def test_partial_fit(X_y_regression):
+    X, y = X_y_regression
+    X = pd.DataFrame(X)
+    y = pd.Series(y)
+
+    sk_reg = SKSGDRegressor(loss="huber", penalty="elasticnet", random_state=0)
+    reg = SGDRegressor(loss="huber")
+    for start in range(0, len(X), 25):
+        sk_reg.partial_fit(X.iloc[start:start + 25], y.iloc[start:start + 25])
+        reg.partial_fit(X.iloc[start:start + 25], y.iloc[start:start + 25])
+    assert reg._is_fitted
+    assert reg.input_feature_names == list(X.columns)
+
+    np.testing.assert_almost_equal(reg.predict(X).to_series().values, sk_reg.predict(X))
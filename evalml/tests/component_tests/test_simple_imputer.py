@@ -315,3 +315,81 @@ def test_simple_imputer_woodwork_custom_overrides_returned_by_components(X_df, h
             assert transformed.logical_types == {0: logical_type}
         else:
             assert transformed.logical_types == {0: Double}
+
+
+@pytest.mark.parametrize("impute_strategy", ["mean", "median", "most_frequent", "constant"])
+def test_simple_imputer_partial_fit_matches_fit(impute_strategy):
+    X = pd.DataFrame({"a": [np.nan, 1, 3, np.nan, 3, 10, 1, np.nan],
+                      "b": [2, 2, np.nan, 7, 7, np.nan, 0, 1],
+                      "all_nan": [np.nan] * 8})
+    imputer = SimpleImputer(impute_strategy=impute_strategy)
+    imputer.fit(X)
+    partial_imputer = SimpleImputer(impute_strategy=impute_strategy)
+    for start in range(0, len(X), 3):
+        partial_imputer.partial_fit(X.iloc[start:start + 3])
+    assert partial_imputer._is_fitted
+    assert partial_imputer._all_null_cols == {"all_nan"}
+    assert_frame_equal(imputer.transform(X).to_dataframe(), partial_imputer.transform(X).to_dataframe())
+
+
+def test_simple_imputer_partial_fit_categorical():
+    X = pd.DataFrame({"cat": pd.Series(["b", np.nan, "a", "a", "c", "b", np.nan], dtype="category"),
+                      "bool": pd.Series([True, np.nan, False, True, np.nan, False, False], dtype="boolean")})
+    imputer = SimpleImputer(impute_strategy="most_frequent")
+    imputer.fit(X)
+    partial_imputer = SimpleImputer(impute_strategy="most_frequent")
+    for start in range(0, len(X), 2):
+        partial_imputer.partial_fit(X.iloc[start:start + 2])
+    assert_frame_equal(imputer.transform(X).to_dataframe(), partial_imputer.transform(X).to_dataframe())
+    assert_frame_equal(partial_imputer.transform(X).to_dataframe(),
+                       pd.DataFrame({"cat": pd.Series(["b", "a", "a", "a", "c", "b", "a"], dtype="category"),
+                                     "bool": pd.Series([True, False, False, True, False, False, False], dtype="boolean")}))
+
+
+def test_simple_imputer_partial_fit_most_frequent_many_distinct_values():
+    rng = np.random.RandomState(0)
+    imputer = SimpleImputer(impute_strategy="most_frequent")
+    for _ in range(2):
+        imputer.partial_fit(pd.DataFrame({"a": rng.rand(1001)}))
+    transformed = imputer.transform(pd.DataFrame({"a": [np.nan, 0.5]})).to_dataframe()
+    assert not transformed["a"].isna().any()
+    assert transformed["a"].iloc[1] == 0.5
+
+
+def test_simple_imputer_partial_fit_errors():
+    with pytest.raises(ValueError, match="Cannot use median strategy with non-numeric data"):
+        SimpleImputer(impute_strategy="median").partial_fit(pd.DataFrame({"a": ["a", np.nan, "b"]}))
+    with pytest.raises(ValueError, match="Cannot use mean strategy with non-numeric data"):
+        SimpleImputer(impute_strategy="mean").partial_fit(pd.DataFrame({"a": ["a", np.nan, "b"]}))
+    imputer = SimpleImputer(impute_strategy="mean")
+    imputer.partial_fit(pd.DataFrame({"a": [1, np.nan], "b": [1, 2]}))
+    with pytest.raises(ValueError, match="Chunk has columns"):
+        imputer.partial_fit(pd.DataFrame({"a": [1, np.nan]}))
+
+
+@pytest.mark.parametrize("impute_strategy", ["mean", "median", "most_frequent"])
+def test_simple_imputer_merge(impute_strategy):
+    X = pd.DataFrame({"a": [np.nan, 1, 3, np.nan, 3, 10, 1, np.nan, 2],
+                      "b": [2, 2, np.nan, 7, 7, np.nan, 0, 1, 7],
+                      "all_nan": [np.nan] * 9})
+    imputer = SimpleImputer(impute_strategy=impute_strategy)
+    imputer.fit(X)
+    shard_imputers = [SimpleImputer(impute_strategy=impute_strategy).partial_fit(X.iloc[start:start + 3]) for start in range(0, len(X), 3)]
+    merged_imputer = SimpleImputer(impute_strategy=impute_strategy)
+    for shard_imputer in shard_imputers:
+        merged_imputer.merge(shard_imputer)
+    assert merged_imputer._is_fitted
+    assert_frame_equal(imputer.transform(X).to_dataframe(), merged_imputer.transform(X).to_dataframe())
+    # merging does not modify the merged imputer
+    assert_frame_equal(shard_imputers[0].transform(X).to_dataframe(),
+                       SimpleImputer(impute_strategy=impute_strategy).partial_fit(X.iloc[:3]).transform(X).to_dataframe())
+
+
+def test_simple_imputer_merge_errors():
+    X = pd.DataFrame({"a": [1, np.nan, 3]})
+    with pytest.raises(ValueError, match="Only imputers fit with partial_fit can be merged"):
+        SimpleImputer().merge(SimpleImputer().fit(X))
+    with pytest.raises(ValueError, match="parameters"):
+        SimpleImputer().merge(SimpleImputer(impute_strategy="median").partial_fit(X))
+    with pytest.raises(ValueError, match="columns"):
+        SimpleImputer().partial_fit(X).merge(SimpleImputer().partial_fit(X.rename(columns={"a": "b"})))
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 import woodwork as ww
@@ -23,3 +24,30 @@ def test_standard_scaler_woodwork_custom_overrides_returned_by_components(X_df):
         transformed = std_scaler.transform(X, y)
         assert isinstance(transformed, ww.DataTable)
         assert transformed.logical_types == {0: Double}
+
+
+def test_standard_scaler_partial_fit(X_y_regression):
+    X, _ = X_y_regression
+    X = pd.DataFrame(X)
+    scaler = StandardScaler()
+    scaler.fit(X)
+    partial_scaler = StandardScaler()
+    for start in range(0, len(X), 30):
+        partial_scaler.partial_fit(X.iloc[start:start + 30])
+    assert partial_scaler._is_fitted
+    np.testing.assert_almost_equal(partial_scaler.transform(X).to_dataframe().values, scaler.transform(X).to_dataframe().values)
+
+
+def test_standard_scaler_merge(X_y_regression):
+    X, _ = X_y_regression
+    X = pd.DataFrame(X)
+    scaler = StandardScaler()
+    scaler.fit(X)
+    merged_scaler = StandardScaler()
+    for start in range(0, len(X), 30):
+        merged_scaler.merge(StandardScaler().fit(X.iloc[start:start + 30]))
+    assert merged_scaler._is_fitted
+    np.testing.assert_almost_equal(merged_scaler.transform(X).to_dataframe().values, scaler.transform(X).to_dataframe().values)
+
+    with pytest.raises(ValueError, match="parameters"):
+        merged_scaler.merge(StandardScaler(with_mean=False).fit(X))
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.neighbors import KNeighborsClassifier as SKKNeighborsClassifier
+
+from evalml.model_family import ModelFamily
+from evalml.pipelines import TreeKNeighborsClassifier
+from evalml.pipelines.components.utils import get_estimators
+from evalml.problem_types import ProblemTypes
+
+
+def test_model_family():
+    assert TreeKNeighborsClassifier.model_family == ModelFamily.K_NEIGHBORS
+
+
+def test_problem_types():
+    assert set(TreeKNeighborsClassifier.supported_problem_types) == {ProblemTypes.BINARY, ProblemTypes.MULTICLASS,
+                                                                     ProblemTypes.TIME_SERIES_BINARY,
+                                                                     ProblemTypes.TIME_SERIES_MULTICLASS}
+
+
+def test_invalid_algorithm():
+    with pytest.raises(ValueError, match="Invalid algorithm 'brute', must be 'auto', 'kd_tree' or 'ball_tree'"):
+        TreeKNeighborsClassifier(algorithm="brute")
+
+
+@pytest.mark.parametrize("algorithm", ["kd_tree", "ball_tree"])
+def test_fit_predict_binary(algorithm, X_y_binary):
+    X, y = X_y_binary
+
+    sk_clf = SKKNeighborsClassifier(algorithm=algorithm, leaf_size=10)
+    sk_clf.fit(X, y)
+    y_pred_sk = sk_clf.predict(X)
+    y_pred_proba_sk = sk_clf.predict_proba(X)
+
+    clf = TreeKNeighborsClassifier(algorithm=algorithm, leaf_size=10)
+    fitted = clf.fit(X, y)
+    assert isinstance(fitted, TreeKNeighborsClassifier)
+    assert clf._component_obj._fit_method == algorithm
+
+    y_pred = clf.predict(X)
+    y_pred_proba = clf.predict_proba(X)
+
+    np.testing.assert_almost_equal(y_pred_sk, y_pred.to_series(), decimal=5)
+    np.testing.assert_almost_equal(y_pred_proba_sk, y_pred_proba.to_dataframe(), decimal=5)
+
+
+@pytest.mark.parametrize("n_features,algorithm", [(15, "kd_tree"), (16, "ball_tree")])
+def test_auto_algorithm(n_features, algorithm):
+    X = pd.DataFrame(np.random.RandomState(0).rand(50, n_features))
+    y = pd.Series([0, 1] * 25)
+    clf = TreeKNeighborsClassifier()
+    clf.fit(X, y)
+    assert clf.parameters["algorithm"] == "auto"
+    assert clf._component_obj._fit_method == algorithm
+
+
+def test_not_used_in_automl():
+    assert TreeKNeighborsClassifier not in get_estimators(ProblemTypes.BINARY)
+    assert TreeKNeighborsClassifier not in get_estimators(ProblemTypes.MULTICLASS)
+
+
+def test_fit_predict_multi(X_y_multi):
+    X, y = X_y_multi
+
+    sk_clf = SKKNeighborsClassifier(algorithm="kd_tree", leaf_size=40)
+    sk_clf.fit(X, y)
+    y_pred_sk = sk_clf.predict(X)
+    y_pred_proba_sk = sk_clf.predict_proba(X)
+
+    clf = TreeKNeighborsClassifier()
+    clf.fit(X, y)
+    y_pred = clf.predict(X)
+    y_pred_proba = clf.predict_proba(X)
+
+    np.testing.assert_almost_equal(y_pred_sk, y_pred.to_series(), decimal=5)
+    np.testing.assert_almost_equal(y_pred_proba_sk, y_pred_proba.to_dataframe(), decimal=5)
+
+
+def test_feature_importance(X_y_binary):
+    X, y = X_y_binary
+
+    clf = TreeKNeighborsClassifier()
+    clf.fit(X, y)
+    np.testing.assert_equal(clf.feature_importance, np.zeros(X.shape[1]))
@@ -68,3 +68,14 @@ def test_xgboost_multiindex(data_type, X_y_binary, make_data_type):
     y_pred_proba = clf.predict_proba(X)
     assert not y_pred.to_series().isnull().values.any()
     assert not y_pred_proba.to_dataframe().isnull().values.any().any()
+
+
+def test_xgboost_classifier_early_stopping(X_y_binary):
+    X, y = X_y_binary
+    clf = XGBoostClassifier(n_estimators=500, early_stopping_rounds=5)
+    assert clf.best_iteration is None
+    clf.fit(X, y)
+    assert clf.parameters['early_stopping_rounds'] == 5
+    assert clf.best_iteration is not None
+    assert clf.best_iteration < 500
+    assert len(clf.predict(X)) == len(y)
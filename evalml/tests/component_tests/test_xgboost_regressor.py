@@ -52,3 +52,14 @@ def test_xgboost_multiindex(data_type, X_y_regression, make_data_type):
     clf.fit(X, y)
     y_pred = clf.predict(X)
     assert not y_pred.to_series().isnull().values.any()
+
+
+def test_xgboost_regressor_early_stopping(X_y_regression):
+    X, y = X_y_regression
+    clf = XGBoostRegressor(n_estimators=500, early_stopping_rounds=5)
+    assert clf.best_iteration is None
+    clf.fit(X, y)
+    assert clf.parameters['early_stopping_rounds'] == 5
+    assert clf.best_iteration is not None
+    assert clf.best_iteration < 500
+    assert len(clf.predict(X)) == len(y)
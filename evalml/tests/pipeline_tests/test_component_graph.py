@@ -20,10 +20,15 @@ from evalml.pipelines.components import (
     LogisticRegressionClassifier,
     OneHotEncoder,
     RandomForestClassifier,
+    SGDClassifier,
     StandardScaler,
     Transformer
 )
-from evalml.utils import infer_feature_types
+from evalml.utils import (
+    ChromeTraceRecorder,
+    SparseFeatures,
+    infer_feature_types
+)
 
 
 class DummyTransformer(Transformer):
@@ -736,3 +741,138 @@ def test_component_graph_dataset_with_different_types():
     assert input_feature_names['Elastic Net'] == ['column_3', 'column_1_a', 'column_1_b', 'column_1_c', 'column_1_d',
                                                   'column_2_1', 'column_2_2', 'column_2_3', 'column_2_4', 'column_2_5', 'column_2_6']
     assert input_feature_names['Logistic Regression'] == ['Random Forest', 'Elastic Net']
+
+
+def test_component_profile(X_y_binary):
+    X, y = X_y_binary
+    component_graph = ComponentGraph.from_list(['Imputer', 'One Hot Encoder', 'Random Forest Classifier'])
+    component_graph.instantiate({'Random Forest Classifier': {'n_estimators': 3}})
+    with patch('evalml.pipelines.component_graph.profile_component') as mock_profile_component:
+        component_graph.fit(X, y)
+    mock_profile_component.assert_not_called()
+    assert component_graph.component_profile == {}
+    recorder = ChromeTraceRecorder()
+    component_graph.add_profile_hook(recorder)
+
+    component_graph.fit(X, y)
+    profile = component_graph.component_profile
+    assert set(profile) == {'Imputer', 'One Hot Encoder', 'Random Forest Classifier'}
+    assert set(profile['Imputer']) == {'convert_inputs', 'fit_transform'}
+    assert set(profile['Random Forest Classifier']) == {'convert_inputs', 'fit'}
+    imputer_fit = profile['Imputer']['fit_transform']
+    assert imputer_fit['calls'] == 1
+    assert imputer_fit['wall_time'] > 0
+    assert imputer_fit['cpu_time'] >= 0
+    assert (imputer_fit['rows_in'], imputer_fit['columns_in']) == X.shape
+    assert (imputer_fit['rows_out'], imputer_fit['columns_out']) == X.shape
+    assert (profile['Random Forest Classifier']['fit']['rows_out'], profile['Random Forest Classifier']['fit']['columns_out']) == (None, None)
+    assert len(recorder.events) == 6
+
+    component_graph.predict(X)
+    component_graph.predict(X)
+    assert profile['Imputer']['transform']['calls'] == 2
+    assert profile['Random Forest Classifier']['predict']['columns_out'] == 1
+    assert len(recorder.events) == 18
+
+    component_graph.remove_profile_hook(recorder)
+    component_graph.fit(X, y)
+    assert component_graph.component_profile == {}
+    assert len(recorder.events) == 18
+
+
+@pytest.mark.parametrize("supports_sparse_input", [True, False])
+def test_sparse_features_passed_to_components_which_support_them(supports_sparse_input, X_y_categorical_classification):
+    X, y = X_y_categorical_classification
+
+    class SparseEstimator(DummyEstimator):
+        pass
+    SparseEstimator.supports_sparse_input = supports_sparse_input
+
+    component_graph = ComponentGraph.from_list([Imputer, OneHotEncoder, SparseEstimator])
+    component_graph.instantiate({'One Hot Encoder': {'top_n': None, 'sparse': True}})
+    X_t = component_graph.fit_features(X, y)
+    assert isinstance(X_t, SparseFeatures if supports_sparse_input else ww.DataTable)
+    assert component_graph.input_feature_names['Dummy Estimator'] == list(X_t.columns)
+    assert isinstance(component_graph.compute_final_component_features(X), SparseFeatures if supports_sparse_input else ww.DataTable)
+
+    # the standard scaler does not support sparse input, so it and the components after it get dense features
+    component_graph = ComponentGraph.from_list([Imputer, OneHotEncoder, StandardScaler, SparseEstimator])
+    component_graph.instantiate({'One Hot Encoder': {'top_n': None, 'sparse': True}})
+    X_scaled = component_graph.fit_features(X, y)
+    assert isinstance(X_scaled, ww.DataTable)
+    assert list(X_scaled.columns) == list(X_t.columns)
+
+
+def test_fit_iter(X_y_binary):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    X.iloc[::10, 0] = np.nan
+    y = pd.Series(y)
+    chunks = [(X.iloc[start:start + 20], y.iloc[start:start + 20]) for start in range(0, len(X), 20)]
+
+    component_graph = ComponentGraph.from_list([Imputer, StandardScaler, SGDClassifier])
+    component_graph.instantiate({'SGD Classifier': {'loss': 'modified_huber'}})
+    component_graph.add_profile_hook(ChromeTraceRecorder())
+    with patch.object(SGDClassifier, 'partial_fit', wraps=component_graph.get_component('SGD Classifier').partial_fit) as mock_partial_fit:
+        component_graph.fit_iter(chunks, classes=[0, 1])
+    assert mock_partial_fit.call_count == len(chunks)
+    assert mock_partial_fit.call_args[1] == {'classes': [0, 1]}
+    assert all(component._is_fitted for component in component_graph.component_instances.values())
+    assert component_graph.input_feature_names['SGD Classifier'] == list(X.columns)
+    assert set(component_graph.component_profile) == {'Imputer', 'Standard Scaler', 'SGD Classifier'}
+    assert component_graph.component_profile['SGD Classifier']['partial_fit']['calls'] == len(chunks)
+
+    # the features the estimator is fit on are the same as those of a graph fit on all the data at once
+    fitted_graph = ComponentGraph.from_list([Imputer, StandardScaler, SGDClassifier])
+    fitted_graph.instantiate({'SGD Classifier': {'loss': 'modified_huber'}})
+    fitted_graph.fit(X, y)
+    assert_frame_equal(component_graph.compute_final_component_features(X).to_dataframe(),
+                       fitted_graph.compute_final_component_features(X).to_dataframe())
+
+    # chunks can also be returned by a function
+    component_graph = ComponentGraph.from_list([Imputer, StandardScaler, SGDClassifier])
+    component_graph.instantiate({'SGD Classifier': {'loss': 'modified_huber'}})
+    component_graph.fit_iter(lambda: iter(chunks), classes=[0, 1])
+    assert len(component_graph.predict(X).to_series()) == len(X)
+
+
+def test_fit_iter_refit(X_y_binary):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    X.iloc[::10, 0] = np.nan
+    y = pd.Series(y)
+    chunks_a = [(X.iloc[:40], y.iloc[:40]), (X.iloc[40:80], y.iloc[40:80])]
+    chunks_b = [(X.iloc[80:] + 5, y.iloc[80:])]
+    parameters = {'Imputer': {'numeric_impute_strategy': 'mean'}, 'SGD Classifier': {'loss': 'modified_huber'}}
+
+    component_graph = ComponentGraph.from_list([Imputer, StandardScaler, SGDClassifier])
+    component_graph.instantiate(parameters)
+    component_graph.fit_iter(chunks_a, classes=[0, 1])
+    component_graph.fit_iter(chunks_b, classes=[0, 1])
+
+    fitted_graph = ComponentGraph.from_list([Imputer, StandardScaler, SGDClassifier])
+    fitted_graph.instantiate(parameters)
+    fitted_graph.fit_iter(chunks_b, classes=[0, 1])
+
+    assert component_graph.get_component('Imputer')._fill_values == fitted_graph.get_component('Imputer')._fill_values
+    np.testing.assert_allclose(component_graph.get_component('Standard Scaler')._component_obj.mean_,
+                               fitted_graph.get_component('Standard Scaler')._component_obj.mean_)
+    np.testing.assert_allclose(component_graph.get_component('SGD Classifier')._component_obj.coef_,
+                               fitted_graph.get_component('SGD Classifier')._component_obj.coef_)
+
+
+def test_fit_iter_errors(X_y_binary):
+    X, y = X_y_binary
+    chunks = [(X[:50], y[:50]), (X[50:], y[50:])]
+
+    component_graph = ComponentGraph.from_list([Imputer, OneHotEncoder, RandomForestClassifier])
+    component_graph.instantiate({})
+    with pytest.raises(ValueError, match="these components do not support partial_fit: Random Forest Classifier"):
+        component_graph.fit_iter(chunks)
+
+    component_graph = ComponentGraph.from_list([Imputer, SGDClassifier])
+    component_graph.instantiate({'SGD Classifier': {'loss': 'modified_huber'}})
+    with pytest.raises(ValueError, match="Got a single-use iterator"):
+        component_graph.fit_iter(iter(chunks), classes=[0, 1])
+    with pytest.raises(ValueError, match="empty collection of chunks"):
+        component_graph.fit_iter([], classes=[0, 1])
@@ -21,6 +21,7 @@ from evalml.model_family import ModelFamily
 from evalml.objectives import FraudCost, Precision
 from evalml.pipelines import (
     BinaryClassificationPipeline,
+    ClassificationPipeline,
     GeneratedPipelineBinary,
     GeneratedPipelineMulticlass,
     GeneratedPipelineRegression,
@@ -37,10 +38,13 @@ from evalml.pipelines.components import (
     DropNullColumns,
     ElasticNetClassifier,
     Estimator,
+    HistGradientBoostingClassifier,
+    HistGradientBoostingRegressor,
     Imputer,
     LinearRegressor,
     LogisticRegressionClassifier,
     OneHotEncoder,
+    OrdinalEncoder,
     RandomForestClassifier,
     RFClassifierSelectFromModel,
     StackedEnsembleClassifier,
@@ -63,10 +67,12 @@ from evalml.pipelines.utils import (
 )
 from evalml.preprocessing.utils import is_classification
 from evalml.problem_types import ProblemTypes, is_time_series
+from evalml.utils.serialization_utils import read_manifest
 
 
 def test_allowed_model_families(has_minimal_dependencies):
-    families = [ModelFamily.RANDOM_FOREST, ModelFamily.LINEAR_MODEL, ModelFamily.EXTRA_TREES, ModelFamily.DECISION_TREE]
+    families = [ModelFamily.RANDOM_FOREST, ModelFamily.LINEAR_MODEL, ModelFamily.EXTRA_TREES, ModelFamily.DECISION_TREE,
+                ModelFamily.HIST_GRADIENT_BOOSTING, ModelFamily.SVM]
     expected_model_families_binary = set(families)
     expected_model_families_regression = set(families)
     if not has_minimal_dependencies:
@@ -78,23 +84,25 @@ def test_allowed_model_families(has_minimal_dependencies):
 
 def test_all_estimators(has_minimal_dependencies):
     if has_minimal_dependencies:
-        assert len((_all_estimators_used_in_search())) == 10
+        assert len((_all_estimators_used_in_search())) == 14
     else:
-        assert len(_all_estimators_used_in_search()) == 16
+        assert len(_all_estimators_used_in_search()) == 20
 
 
 def test_get_estimators(has_minimal_dependencies):
     if has_minimal_dependencies:
-        assert len(get_estimators(problem_type=ProblemTypes.BINARY)) == 5
+        assert len(get_estimators(problem_type=ProblemTypes.BINARY)) == 7
         assert len(get_estimators(problem_type=ProblemTypes.BINARY, model_families=[ModelFamily.LINEAR_MODEL])) == 2
-        assert len(get_estimators(problem_type=ProblemTypes.MULTICLASS)) == 5
-        assert len(get_estimators(problem_type=ProblemTypes.REGRESSION)) == 5
+        assert len(get_estimators(problem_type=ProblemTypes.MULTICLASS)) == 7
+        assert len(get_estimators(problem_type=ProblemTypes.REGRESSION)) == 7
     else:
-        assert len(get_estimators(problem_type=ProblemTypes.BINARY)) == 8
+        assert len(get_estimators(problem_type=ProblemTypes.BINARY)) == 9
         assert len(get_estimators(problem_type=ProblemTypes.BINARY, model_families=[ModelFamily.LINEAR_MODEL])) == 2
-        assert len(get_estimators(problem_type=ProblemTypes.MULTICLASS)) == 8
-        assert len(get_estimators(problem_type=ProblemTypes.REGRESSION)) == 8
+        assert len(get_estimators(problem_type=ProblemTypes.MULTICLASS)) == 9
+        assert len(get_estimators(problem_type=ProblemTypes.REGRESSION)) == 9
 
+    assert get_estimators(problem_type=ProblemTypes.BINARY, model_families=[ModelFamily.HIST_GRADIENT_BOOSTING]) == [HistGradientBoostingClassifier]
+    assert get_estimators(problem_type=ProblemTypes.REGRESSION, model_families=['hist_gradient_boosting']) == [HistGradientBoostingRegressor]
     assert len(get_estimators(problem_type=ProblemTypes.BINARY, model_families=[])) == 0
     assert len(get_estimators(problem_type=ProblemTypes.MULTICLASS, model_families=[])) == 0
     assert len(get_estimators(problem_type=ProblemTypes.REGRESSION, model_families=[])) == 0
@@ -107,6 +115,19 @@ def test_get_estimators(has_minimal_dependencies):
         get_estimators(problem_type="Not A Valid Problem Type")
 
 
+@pytest.mark.parametrize("fast_boosting_families,hist_gradient_boosting_used",
+                         [([ModelFamily.LIGHTGBM, ModelFamily.XGBOOST], False),
+                          ([ModelFamily.LIGHTGBM], True),
+                          ([ModelFamily.XGBOOST], True),
+                          ([], True)])
+@patch('evalml.pipelines.components.utils.allowed_model_families')
+def test_get_estimators_hist_gradient_boosting_default(mock_allowed_model_families, fast_boosting_families, hist_gradient_boosting_used):
+    mock_allowed_model_families.return_value = fast_boosting_families + [ModelFamily.RANDOM_FOREST, ModelFamily.HIST_GRADIENT_BOOSTING]
+    estimators = get_estimators(problem_type=ProblemTypes.BINARY)
+    assert (HistGradientBoostingClassifier in estimators) == hist_gradient_boosting_used
+    assert RandomForestClassifier in estimators
+
+
 @pytest.mark.parametrize("input_type", ["pd", "ww"])
 @pytest.mark.parametrize("problem_type", ProblemTypes.all_problem_types)
 def test_make_pipeline_all_nan_no_categoricals(input_type, problem_type):
@@ -132,7 +153,7 @@ def test_make_pipeline_all_nan_no_categoricals(input_type, problem_type):
                 delayed_features = [DelayedFeatureTransformer]
             else:
                 delayed_features = []
-            if estimator_class.model_family == ModelFamily.LINEAR_MODEL:
+            if estimator_class.model_family in [ModelFamily.LINEAR_MODEL, ModelFamily.SVM, ModelFamily.K_NEIGHBORS]:
                 estimator_components = [StandardScaler, estimator_class]
             elif estimator_class.model_family == ModelFamily.CATBOOST:
                 estimator_components = [estimator_class]
@@ -166,7 +187,7 @@ def test_make_pipeline(input_type, problem_type):
                 delayed_features = [DelayedFeatureTransformer]
             else:
                 delayed_features = []
-            if estimator_class.model_family == ModelFamily.LINEAR_MODEL:
+            if estimator_class.model_family in [ModelFamily.LINEAR_MODEL, ModelFamily.SVM, ModelFamily.K_NEIGHBORS]:
                 estimator_components = [OneHotEncoder, StandardScaler, estimator_class]
             elif estimator_class.model_family == ModelFamily.CATBOOST:
                 estimator_components = [estimator_class]
@@ -200,7 +221,7 @@ def test_make_pipeline_no_nulls(input_type, problem_type):
                 delayed_features = [DelayedFeatureTransformer]
             else:
                 delayed_features = []
-            if estimator_class.model_family == ModelFamily.LINEAR_MODEL:
+            if estimator_class.model_family in [ModelFamily.LINEAR_MODEL, ModelFamily.SVM, ModelFamily.K_NEIGHBORS]:
                 estimator_components = [OneHotEncoder, StandardScaler, estimator_class]
             elif estimator_class.model_family == ModelFamily.CATBOOST:
                 estimator_components = [estimator_class]
@@ -234,7 +255,7 @@ def test_make_pipeline_no_datetimes(input_type, problem_type):
                 delayed_features = [DelayedFeatureTransformer]
             else:
                 delayed_features = []
-            if estimator_class.model_family == ModelFamily.LINEAR_MODEL:
+            if estimator_class.model_family in [ModelFamily.LINEAR_MODEL, ModelFamily.SVM, ModelFamily.K_NEIGHBORS]:
                 estimator_components = [OneHotEncoder, StandardScaler, estimator_class]
             elif estimator_class.model_family == ModelFamily.CATBOOST:
                 estimator_components = [estimator_class]
@@ -265,7 +286,7 @@ def test_make_pipeline_no_column_names(input_type, problem_type):
                 delayed_features = [DelayedFeatureTransformer]
             else:
                 delayed_features = []
-            if estimator_class.model_family == ModelFamily.LINEAR_MODEL:
+            if estimator_class.model_family in [ModelFamily.LINEAR_MODEL, ModelFamily.SVM, ModelFamily.K_NEIGHBORS]:
                 estimator_components = [OneHotEncoder, StandardScaler, estimator_class]
             elif estimator_class.model_family == ModelFamily.CATBOOST:
                 estimator_components = [estimator_class]
@@ -299,7 +320,7 @@ def test_make_pipeline_text_columns(input_type, problem_type):
                 delayed_features = [DelayedFeatureTransformer]
             else:
                 delayed_features = []
-            if estimator_class.model_family == ModelFamily.LINEAR_MODEL:
+            if estimator_class.model_family in [ModelFamily.LINEAR_MODEL, ModelFamily.SVM, ModelFamily.K_NEIGHBORS]:
                 estimator_components = [OneHotEncoder, StandardScaler, estimator_class]
             elif estimator_class.model_family == ModelFamily.CATBOOST:
                 estimator_components = [estimator_class]
@@ -326,7 +347,7 @@ def test_make_pipeline_numpy_input(problem_type):
                 delayed_features = [DelayedFeatureTransformer]
             else:
                 delayed_features = []
-            if estimator_class.model_family == ModelFamily.LINEAR_MODEL:
+            if estimator_class.model_family in [ModelFamily.LINEAR_MODEL, ModelFamily.SVM, ModelFamily.K_NEIGHBORS]:
                 estimator_components = [StandardScaler, estimator_class]
             else:
                 estimator_components = [estimator_class]
@@ -357,7 +378,7 @@ def test_make_pipeline_datetime_no_categorical(input_type, problem_type):
                 delayed_features = [DelayedFeatureTransformer]
             else:
                 delayed_features = []
-            if estimator_class.model_family == ModelFamily.LINEAR_MODEL:
+            if estimator_class.model_family in [ModelFamily.LINEAR_MODEL, ModelFamily.SVM, ModelFamily.K_NEIGHBORS]:
                 estimator_components = [StandardScaler, estimator_class]
             elif estimator_class.model_family == ModelFamily.CATBOOST:
                 estimator_components = [estimator_class]
@@ -366,6 +387,54 @@ def test_make_pipeline_datetime_no_categorical(input_type, problem_type):
             assert pipeline.component_graph == [Imputer, DateTimeFeaturizer] + delayed_features + estimator_components
 
 
+@pytest.mark.parametrize("problem_type", [ProblemTypes.BINARY, ProblemTypes.REGRESSION])
+def test_make_pipeline_native_categorical_encoding(problem_type):
+    X = pd.DataFrame({"categorical": ["a", "b", "a", "c", "c"] * 4,
+                      "numeric": range(20)})
+    y = pd.Series([0, 1] * 10)
+    for estimator_class in get_estimators(problem_type=problem_type):
+        pipeline = make_pipeline(X, y, estimator_class, problem_type, categorical_encoding="native")
+        if estimator_class.model_family in [ModelFamily.CATBOOST, ModelFamily.LIGHTGBM]:
+            encoder = []
+        elif estimator_class.model_family in [ModelFamily.XGBOOST, ModelFamily.RANDOM_FOREST, ModelFamily.EXTRA_TREES, ModelFamily.DECISION_TREE,
+                                              ModelFamily.HIST_GRADIENT_BOOSTING]:
+            encoder = [OrdinalEncoder]
+        else:
+            encoder = [OneHotEncoder]
+        scaler = [StandardScaler] if estimator_class.model_family in [ModelFamily.LINEAR_MODEL, ModelFamily.SVM, ModelFamily.K_NEIGHBORS] else []
+        assert pipeline.component_graph == [Imputer] + encoder + scaler + [estimator_class]
+
+
+@pytest.mark.parametrize("problem_type", [ProblemTypes.BINARY, ProblemTypes.REGRESSION])
+def test_make_pipeline_sparse_one_hot_categorical_encoding(problem_type):
+    X = pd.DataFrame({"categorical": ["a", "b", "a", "c", "c"] * 4,
+                      "numeric": range(20)})
+    y = pd.Series([0, 1] * 10)
+    for estimator_class in get_estimators(problem_type=problem_type):
+        pipeline = make_pipeline(X, y, estimator_class, problem_type, categorical_encoding="sparse_one_hot")
+        if estimator_class.model_family == ModelFamily.CATBOOST:
+            assert pipeline.component_graph == [Imputer, estimator_class]
+            continue
+        scaled = estimator_class.model_family in [ModelFamily.LINEAR_MODEL, ModelFamily.SVM, ModelFamily.K_NEIGHBORS]
+        scaler = [StandardScaler] if scaled and not estimator_class.supports_sparse_input else []
+        assert pipeline.component_graph == [Imputer, OneHotEncoder] + scaler + [estimator_class]
+        assert pipeline.hyperparameters['One Hot Encoder']['sparse'] == [True]
+
+    pipeline = make_pipeline(X, y, ElasticNetClassifier, ProblemTypes.BINARY, categorical_encoding="sparse_one_hot",
+                             custom_hyperparameters={'One Hot Encoder': {'sparse': [False]}})
+    assert pipeline.hyperparameters['One Hot Encoder']['sparse'] == [False]
+
+    X_no_categorical = pd.DataFrame({"numeric": range(20)})
+    pipeline = make_pipeline(X_no_categorical, y, ElasticNetClassifier, ProblemTypes.BINARY, categorical_encoding="sparse_one_hot")
+    assert pipeline.component_graph == [Imputer, StandardScaler, ElasticNetClassifier]
+    assert 'sparse' not in pipeline.hyperparameters.get('One Hot Encoder', {})
+
+
+def test_make_pipeline_invalid_categorical_encoding():
+    with pytest.raises(ValueError, match="Invalid categorical_encoding"):
+        make_pipeline(pd.DataFrame(), pd.Series(), RandomForestClassifier, ProblemTypes.BINARY, categorical_encoding="ordinal")
+
+
 def test_make_pipeline_problem_type_mismatch():
     with pytest.raises(ValueError, match=f"{LogisticRegressionClassifier.name} is not a valid estimator for problem type"):
         make_pipeline(pd.DataFrame(), pd.Series(), LogisticRegressionClassifier, ProblemTypes.REGRESSION)
@@ -464,6 +533,40 @@ def test_serialization(X_y_binary, tmpdir, logistic_regression_binary_pipeline_c
     assert pipeline.score(X, y, ['precision']) == PipelineBase.load(path).score(X, y, ['precision'])
 
 
+@pytest.mark.parametrize("mmap_mode", ["r", None])
+def test_serialization_directory(mmap_mode, X_y_binary, tmpdir):
+    X, y = X_y_binary
+
+    class RFPipeline(BinaryClassificationPipeline):
+        component_graph = ['Imputer', 'Random Forest Classifier']
+
+    path = os.path.join(str(tmpdir), 'pipe_dir')
+    pipeline = RFPipeline(parameters={"Random Forest Classifier": {"n_estimators": 20, "n_jobs": 1}})
+    pipeline.fit(X, y)
+    pipeline.save(path, format="directory")
+    assert os.path.isdir(path)
+
+    manifest = read_manifest(path)
+    assert manifest['metadata']['object_type'] == 'pipeline'
+    assert manifest['metadata']['pipeline_name'] == pipeline.name
+    assert manifest['metadata']['components']['Random Forest Classifier']['parameters'] == pipeline.parameters['Random Forest Classifier']
+    assert len(manifest['arrays']) > 0
+    for array_file in manifest['arrays']:
+        assert os.path.exists(os.path.join(path, 'arrays', array_file))
+
+    loaded = PipelineBase.load(path, mmap_mode=mmap_mode)
+    assert loaded.parameters == pipeline.parameters
+    pd.testing.assert_series_equal(loaded.predict(X).to_series(), pipeline.predict(X).to_series())
+    assert pipeline.score(X, y, ['precision']) == loaded.score(X, y, ['precision'])
+
+
+def test_serialization_invalid_format(tmpdir, logistic_regression_binary_pipeline_class):
+    path = os.path.join(str(tmpdir), 'pipe.pkl')
+    pipeline = logistic_regression_binary_pipeline_class(parameters={})
+    with pytest.raises(ValueError, match="Unknown format 'zip'"):
+        pipeline.save(path, format="zip")
+
+
 @patch('cloudpickle.dump')
 def test_serialization_protocol(mock_cloudpickle_dump, tmpdir, logistic_regression_binary_pipeline_class):
     path = os.path.join(str(tmpdir), 'pipe.pkl')
@@ -666,7 +769,8 @@ def test_parameters(logistic_regression_binary_pipeline_class):
             'categories': None,
             'drop': None,
             'handle_unknown': 'ignore',
-            'handle_missing': 'error'
+            'handle_missing': 'error',
+            'sparse': False
         },
         'Logistic Regression Classifier': {
             'penalty': 'l2',
@@ -705,7 +809,8 @@ def test_parameters_nonlinear(nonlinear_binary_pipeline_class):
             'categories': None,
             'drop': None,
             'handle_unknown': 'ignore',
-            'handle_missing': 'error'
+            'handle_missing': 'error',
+            'sparse': False
         },
         'OneHot_ElasticNet': {
             'top_n': 10,
@@ -713,7 +818,8 @@ def test_parameters_nonlinear(nonlinear_binary_pipeline_class):
             'categories': None,
             'drop': None,
             'handle_unknown': 'ignore',
-            'handle_missing': 'error'
+            'handle_missing': 'error',
+            'sparse': False
         },
         'Random Forest': {
             'max_depth': 6,
@@ -1553,7 +1659,8 @@ def test_get_default_parameters(logistic_regression_binary_pipeline_class):
             'categories': None,
             'drop': None,
             'handle_unknown': 'ignore',
-            'handle_missing': 'error'
+            'handle_missing': 'error',
+            'sparse': False
         },
         'Logistic Regression Classifier': {
             'penalty': 'l2',
@@ -2011,19 +2118,19 @@ def test_nonlinear_pipeline_repr(pipeline_class):
         }
 
     pipeline = MockPipeline(parameters={})
-    expected_repr = f"MockPipeline(parameters={{'Imputer':{{'categorical_impute_strategy': 'most_frequent', 'numeric_impute_strategy': 'mean', 'categorical_fill_value': None, 'numeric_fill_value': None}}, 'OHE_1':{{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': None, 'handle_unknown': 'ignore', 'handle_missing': 'error'}}, 'OHE_2':{{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': None, 'handle_unknown': 'ignore', 'handle_missing': 'error'}}, 'Estimator':{{'n_estimators': 100, 'max_depth': 6, 'n_jobs': -1}},}})"
+    expected_repr = f"MockPipeline(parameters={{'Imputer':{{'categorical_impute_strategy': 'most_frequent', 'numeric_impute_strategy': 'mean', 'categorical_fill_value': None, 'numeric_fill_value': None}}, 'OHE_1':{{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': None, 'handle_unknown': 'ignore', 'handle_missing': 'error', 'sparse': False}}, 'OHE_2':{{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': None, 'handle_unknown': 'ignore', 'handle_missing': 'error', 'sparse': False}}, 'Estimator':{{'n_estimators': 100, 'max_depth': 6, 'n_jobs': -1}},}})"
     assert repr(pipeline) == expected_repr
 
     pipeline_with_parameters = MockPipeline(parameters={'Imputer': {'numeric_fill_value': 42}})
-    expected_repr = f"MockPipeline(parameters={{'Imputer':{{'categorical_impute_strategy': 'most_frequent', 'numeric_impute_strategy': 'mean', 'categorical_fill_value': None, 'numeric_fill_value': 42}}, 'OHE_1':{{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': None, 'handle_unknown': 'ignore', 'handle_missing': 'error'}}, 'OHE_2':{{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': None, 'handle_unknown': 'ignore', 'handle_missing': 'error'}}, 'Estimator':{{'n_estimators': 100, 'max_depth': 6, 'n_jobs': -1}},}})"
+    expected_repr = f"MockPipeline(parameters={{'Imputer':{{'categorical_impute_strategy': 'most_frequent', 'numeric_impute_strategy': 'mean', 'categorical_fill_value': None, 'numeric_fill_value': 42}}, 'OHE_1':{{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': None, 'handle_unknown': 'ignore', 'handle_missing': 'error', 'sparse': False}}, 'OHE_2':{{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': None, 'handle_unknown': 'ignore', 'handle_missing': 'error', 'sparse': False}}, 'Estimator':{{'n_estimators': 100, 'max_depth': 6, 'n_jobs': -1}},}})"
     assert repr(pipeline_with_parameters) == expected_repr
 
     pipeline_with_inf_parameters = MockPipeline(parameters={'Imputer': {'numeric_fill_value': float('inf'), 'categorical_fill_value': np.inf}})
-    expected_repr = f"MockPipeline(parameters={{'Imputer':{{'categorical_impute_strategy': 'most_frequent', 'numeric_impute_strategy': 'mean', 'categorical_fill_value': float('inf'), 'numeric_fill_value': float('inf')}}, 'OHE_1':{{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': None, 'handle_unknown': 'ignore', 'handle_missing': 'error'}}, 'OHE_2':{{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': None, 'handle_unknown': 'ignore', 'handle_missing': 'error'}}, 'Estimator':{{'n_estimators': 100, 'max_depth': 6, 'n_jobs': -1}},}})"
+    expected_repr = f"MockPipeline(parameters={{'Imputer':{{'categorical_impute_strategy': 'most_frequent', 'numeric_impute_strategy': 'mean', 'categorical_fill_value': float('inf'), 'numeric_fill_value': float('inf')}}, 'OHE_1':{{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': None, 'handle_unknown': 'ignore', 'handle_missing': 'error', 'sparse': False}}, 'OHE_2':{{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': None, 'handle_unknown': 'ignore', 'handle_missing': 'error', 'sparse': False}}, 'Estimator':{{'n_estimators': 100, 'max_depth': 6, 'n_jobs': -1}},}})"
     assert repr(pipeline_with_inf_parameters) == expected_repr
 
     pipeline_with_nan_parameters = MockPipeline(parameters={'Imputer': {'numeric_fill_value': float('nan'), 'categorical_fill_value': np.nan}})
-    expected_repr = f"MockPipeline(parameters={{'Imputer':{{'categorical_impute_strategy': 'most_frequent', 'numeric_impute_strategy': 'mean', 'categorical_fill_value': np.nan, 'numeric_fill_value': np.nan}}, 'OHE_1':{{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': None, 'handle_unknown': 'ignore', 'handle_missing': 'error'}}, 'OHE_2':{{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': None, 'handle_unknown': 'ignore', 'handle_missing': 'error'}}, 'Estimator':{{'n_estimators': 100, 'max_depth': 6, 'n_jobs': -1}},}})"
+    expected_repr = f"MockPipeline(parameters={{'Imputer':{{'categorical_impute_strategy': 'most_frequent', 'numeric_impute_strategy': 'mean', 'categorical_fill_value': np.nan, 'numeric_fill_value': np.nan}}, 'OHE_1':{{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': None, 'handle_unknown': 'ignore', 'handle_missing': 'error', 'sparse': False}}, 'OHE_2':{{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': None, 'handle_unknown': 'ignore', 'handle_missing': 'error', 'sparse': False}}, 'Estimator':{{'n_estimators': 100, 'max_depth': 6, 'n_jobs': -1}},}})"
     assert repr(pipeline_with_nan_parameters) == expected_repr
 
 
@@ -2434,3 +2541,63 @@ def test_pipelines_raise_deprecated_random_state_warning(dummy_binary_pipeline_c
     test_pipeline_class(dummy_time_series_regression_pipeline_class)
     test_pipeline_class(dummy_ts_binary_pipeline_class)
     test_pipeline_class(time_series_multiclass_classification_pipeline_class)
+
+
+def test_fit_iter_classification(X_y_multi):
+    X, y = X_y_multi
+    X = pd.DataFrame(X)
+    X.iloc[::7, 1] = np.nan
+    y = pd.Series(y, name="target").map({0: "a", 1: "b", 2: "c"})
+    chunks = [(X.iloc[start:start + 20], y.iloc[start:start + 20]) for start in range(0, len(X), 20)]
+
+    class IncrementalPipeline(MulticlassClassificationPipeline):
+        component_graph = ['Imputer', 'Standard Scaler', 'SGD Classifier']
+
+    parameters = {'SGD Classifier': {'loss': 'modified_huber'}}
+    pipeline = IncrementalPipeline(parameters)
+    with pytest.raises(PipelineNotYetFittedError):
+        pipeline.predict(X)
+    assert pipeline.fit_iter(chunks) is pipeline
+    assert list(pipeline.classes_) == ["a", "b", "c"]
+    assert pipeline.input_target_name == "target"
+    assert pipeline.input_feature_names['SGD Classifier'] == list(X.columns)
+    assert set(pipeline.predict(X).to_series()) <= {"a", "b", "c"}
+    assert list(pipeline.predict_proba(X).columns) == ["a", "b", "c"]
+
+    # the classes can be declared to skip the pass over the chunks to find them
+    pipeline = IncrementalPipeline(parameters)
+    with patch.object(ClassificationPipeline, '_convert_target', wraps=ClassificationPipeline._convert_target) as mock_convert_target:
+        pipeline.fit_iter(chunks, classes=["c", "b", "a"])
+    assert mock_convert_target.call_count == 3 * len(chunks)
+    assert list(pipeline.classes_) == ["a", "b", "c"]
+
+
+def test_fit_iter_regression(X_y_regression):
+    X, y = X_y_regression
+    X = pd.DataFrame(X)
+    y = pd.Series(y)
+    chunks = [(X.iloc[start:start + 20], y.iloc[start:start + 20]) for start in range(0, len(X), 20)]
+
+    class IncrementalPipeline(RegressionPipeline):
+        component_graph = ['Imputer', 'Standard Scaler', 'SGD Regressor']
+
+    pipeline = IncrementalPipeline({'SGD Regressor': {'loss': 'huber'}})
+    pipeline.fit_iter(lambda: iter(chunks))
+    assert len(pipeline.predict(X).to_series()) == len(X)
+
+    pipeline = IncrementalPipeline({'SGD Regressor': {'loss': 'huber'}})
+    with pytest.raises(ValueError, match="Regression pipeline can only handle numeric target data"):
+        pipeline.fit_iter([(X, pd.Series(["a", "b"] * 50))])
+
+    class NonIncrementalPipeline(RegressionPipeline):
+        component_graph = ['Imputer', 'Random Forest Regressor']
+
+    with pytest.raises(ValueError, match="these components do not support partial_fit: Random Forest Regressor"):
+        NonIncrementalPipeline({}).fit_iter(chunks)
+
+
+def test_fit_iter_time_series_not_supported(time_series_regression_pipeline_class, X_y_regression):
+    X, y = X_y_regression
+    pipeline = time_series_regression_pipeline_class({"pipeline": {"gap": 0, "max_delay": 1}})
+    with pytest.raises(ValueError, match="Time series pipelines cannot be fit one chunk at a time"):
+        pipeline.fit_iter([(X, y)])
@@ -5,6 +5,7 @@ from unittest.mock import patch
 
 import numpy as np
 import pytest
+from skopt import Optimizer
 from skopt.space import Integer, Real
 
 from evalml.tuners import ParameterError, Tuner
@@ -159,6 +160,104 @@ def test_skopt_tuner_propose():
     }
 
 
+def test_skopt_tuner_propose_batch():
+    pipeline_hyperparameter_ranges = {'Mock Classifier': {
+        'param a': Integer(0, 10),
+        'param b': Real(0, 10),
+        'param c': ['option a', 'option b', 'option c']
+    }}
+    tuner = SKOptTuner(pipeline_hyperparameter_ranges, random_seed=random_seed)
+    for i in range(10):
+        parameters = tuner.propose()
+        tuner.add(parameters, parameters['Mock Classifier']['param b'])
+    with patch('skopt.Optimizer.ask', autospec=True, side_effect=Optimizer.ask) as mock_ask:
+        batch = tuner.propose_batch(4)
+    # the batch is proposed with skopt's constant liar strategy
+    assert mock_ask.call_args_list[0][1] == {'n_points': 4, 'strategy': 'cl_min'}
+    assert len(batch) == 4
+    for parameters in batch:
+        assert parameters['Mock Classifier'].keys() == pipeline_hyperparameter_ranges['Mock Classifier'].keys()
+        assert 0 <= parameters['Mock Classifier']['param a'] <= 10
+    # the surrogate model is told a score for each point in the batch, so the points differ from each other
+    assert len({tuple(parameters['Mock Classifier'].values()) for parameters in batch}) == 4
+    # proposing a batch does not add the points to the tuner
+    assert len(tuner.opt.yi) == 10
+
+    assert tuner.propose_batch(1) == [tuner.propose()]
+    assert SKOptTuner({'Mock Classifier': {}}).propose_batch(2) == [{'Mock Classifier': {}}, {'Mock Classifier': {}}]
+
+
+def test_tuner_propose_batch_default():
+    class MockTuner(Tuner):
+        def add(self, pipeline_parameters, score):
+            pass
+
+        def propose(self):
+            return {'Mock Classifier': {'param a': 0}}
+
+    assert MockTuner({'Mock Classifier': {}}).propose_batch(3) == [{'Mock Classifier': {'param a': 0}}] * 3
+    assert MockTuner({'Mock Classifier': {}}).propose_batch(0) == []
+
+
+def test_skopt_tuner_pending():
+    pipeline_hyperparameter_ranges = {'Mock Classifier': {'param a': Integer(0, 1000)}}
+    tuner = SKOptTuner(pipeline_hyperparameter_ranges, random_seed=random_seed)
+    for i in range(10):
+        parameters = tuner.propose()
+        tuner.add(parameters, parameters['Mock Classifier']['param a'])
+    parameters = tuner.propose()
+    assert tuner.propose() == parameters
+
+    # pending parameters are not proposed again
+    tuner.add_pending(parameters)
+    pending_parameters = tuner.propose()
+    assert pending_parameters != parameters
+    assert len(tuner.opt.yi) == 10
+    tuner.add_pending(pending_parameters)
+    assert len(tuner.propose_batch(2)) == 2
+
+    tuner.remove_pending(parameters)
+    tuner.remove_pending(parameters)
+    assert tuner._pending_parameters == [[pending_parameters['Mock Classifier']['param a']]]
+    tuner.remove_pending(pending_parameters)
+    assert tuner._pending_parameters == []
+
+
+def test_skopt_tuner_cost_aware():
+    pipeline_hyperparameter_ranges = {'Mock Classifier': {'param a': Integer(0, 1000)}}
+    tuner = SKOptTuner(pipeline_hyperparameter_ranges, random_seed=random_seed, cost_aware=True)
+    assert tuner.opt.acq_func == 'EIps'
+    for i in range(10):
+        parameters = tuner.propose()
+        tuner.add(parameters, parameters['Mock Classifier']['param a'], training_time=i + 1.0)
+    tuner.add(tuner.propose(), 1.0)
+    tuner.add(tuner.propose(), np.nan, training_time=2.0)
+    assert len(tuner.opt.yi) == 11
+    assert np.exp(tuner.opt.yi[-1][1]) == pytest.approx(5.5)
+
+    parameters = tuner.propose()
+    tuner.add_pending(parameters)
+    assert tuner.propose() != parameters
+    assert len(tuner.propose_batch(3)) == 3
+
+
+def test_skopt_tuner_cost_aware_propose_batch_lie():
+    pipeline_hyperparameter_ranges = {'Mock Classifier': {'param a': Integer(0, 1000)}}
+    tuner = SKOptTuner(pipeline_hyperparameter_ranges, random_seed=random_seed, cost_aware=True)
+    for i in range(10):
+        parameters = tuner.propose()
+        tuner.add(parameters, i + 5.0, training_time=0.5 + i)
+    # the lie pairs the lowest score with the shortest training time, which the optimizer stores as a logarithm
+    assert tuner._constant_lie() == pytest.approx([5.0, 0.5])
+    with patch('skopt.Optimizer.tell', autospec=True, side_effect=Optimizer.tell) as mock_tell:
+        batch = tuner.propose_batch(3)
+    assert len(batch) == 3
+    assert mock_tell.call_count == 3
+    for call in mock_tell.call_args_list:
+        assert call[0][2] == pytest.approx([5.0, 0.5])
+    assert len(tuner.opt.yi) == 10
+
+
 def test_skopt_tuner_raises_deprecated_random_state_warning():
     with warnings.catch_warnings(record=True) as warn:
         warnings.simplefilter("always")
@@ -12,7 +12,11 @@ from evalml.model_understanding.graphs import visualize_decision_tree
 from evalml.pipelines.components import ComponentBase
 from evalml.utils.gen_utils import (
     SEED_BOUNDS,
+    _encode_categories_as_codes,
+    _get_category_lookups,
+    _iter_chunks,
     _rename_column_names_to_numeric,
+    _with_positional_column_names,
     classproperty,
     convert_to_seconds,
     deprecate_arg,
@@ -270,6 +274,47 @@ def test_rename_column_names_to_numeric():
     assert X_renamed.logical_types == {0: ww.logical_types.Categorical, 1: ww.logical_types.Categorical}
 
 
+def test_with_positional_column_names():
+    X = pd.DataFrame({"<>": [1, 2], ">>": [2.0, 4.0]})
+    X_renamed = _with_positional_column_names(X)
+    pd.testing.assert_frame_equal(X_renamed, pd.DataFrame({0: [1, 2], 1: [2.0, 4.0]}))
+    assert list(X.columns) == ["<>", ">>"]
+    assert np.shares_memory(X_renamed[1].to_numpy(), X[">>"].to_numpy())
+
+
+def test_encode_categories_as_codes():
+    X = pd.DataFrame({"num": [1, 2, 3, 4], "cat": ["b", "a", "c", np.nan], "ordered": pd.Series(["x", "y", "x", "y"], dtype="category")})
+    category_lookups = _get_category_lookups(X, ["cat", "ordered"])
+    assert list(category_lookups) == [1, 2]
+    assert list(category_lookups[1]) == ["a", "b", "c"]
+
+    X_encoded = _encode_categories_as_codes(_with_positional_column_names(X), category_lookups)
+    assert X_encoded[0].tolist() == [1, 2, 3, 4]
+    assert X_encoded[1].cat.codes.tolist() == [1, 0, 2, -1]
+    assert X_encoded[2].tolist() == [0, 1, 0, 1]
+    assert X["cat"].tolist()[:3] == ["b", "a", "c"]
+
+    X_subset = pd.DataFrame({"num": [5], "cat": ["c"], "ordered": ["y"]})
+    X_encoded = _encode_categories_as_codes(_with_positional_column_names(X_subset), category_lookups)
+    assert X_encoded[1].tolist() == [2]
+    assert list(X_encoded[1].cat.categories) == [0, 1, 2]
+
+    X_unknown = pd.DataFrame({"num": [5], "cat": ["d"], "ordered": ["y"]})
+    with pytest.raises(ValueError, match="Found unknown categories"):
+        _encode_categories_as_codes(_with_positional_column_names(X_unknown), category_lookups)
+
+
+def test_iter_chunks():
+    chunks = [(1, 2), (3, 4)]
+    assert list(_iter_chunks(chunks)) == chunks
+    assert list(_iter_chunks(chunks)) == chunks
+    assert list(_iter_chunks(lambda: iter(chunks))) == chunks
+    with pytest.raises(ValueError, match="Got a single-use iterator"):
+        _iter_chunks(iter(chunks))
+    with pytest.raises(ValueError, match="Got a single-use iterator"):
+        _iter_chunks(chunk for chunk in chunks)
+
+
 @pytest.mark.parametrize("file_name,format,interactive",
                          [
                              ('test_plot', 'png', False),
@@ -0,0 +1,67 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import woodwork as ww
+
+from evalml.utils import ChromeTraceRecorder
+from evalml.utils.profiling import _get_shape, profile_component
+
+
+def test_get_shape():
+    X = pd.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]})
+    assert _get_shape(X) == (3, 2)
+    assert _get_shape(ww.DataTable(X)) == (3, 2)
+    assert _get_shape(X['a']) == (3, 1)
+    assert _get_shape(ww.DataColumn(X['a'])) == (3, 1)
+    assert _get_shape(np.ones((4, 5))) == (4, 5)
+    assert _get_shape(np.ones(4)) == (4, 1)
+    assert _get_shape(None) == (None, None)
+
+
+def test_profile_component():
+    X = pd.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]})
+    profile = {}
+    events = []
+    for _ in range(2):
+        with profile_component('Component', 'transform', X, profile, [events.append]) as event:
+            event['output'] = X[['a']]
+    assert len(events) == 2
+    assert set(events[0]) == {'component', 'operation', 'start', 'wall_time', 'cpu_time', 'memory_delta_mb',
+                              'rows_in', 'columns_in', 'rows_out', 'columns_out'}
+    totals = profile['Component']['transform']
+    assert totals['calls'] == 2
+    assert totals['wall_time'] == events[0]['wall_time'] + events[1]['wall_time']
+    assert (totals['rows_in'], totals['columns_in'], totals['rows_out'], totals['columns_out']) == (3, 2, 3, 1)
+
+
+def test_profile_component_records_failed_operation():
+    profile = {}
+    events = []
+    with pytest.raises(ValueError, match='fit failed'):
+        with profile_component('Component', 'fit', None, profile, [events.append]):
+            raise ValueError('fit failed')
+    assert len(events) == 1
+    assert profile['Component']['fit']['calls'] == 1
+    assert events[0]['wall_time'] >= 0
+
+
+def test_chrome_trace_recorder(tmpdir):
+    recorder = ChromeTraceRecorder()
+    recorder.add_event('Pipeline', 'pipeline', 10.0, 2.0, {'pruned': False})
+    with profile_component('Imputer', 'fit', None, {}, [recorder]):
+        pass
+    trace = recorder.to_dict()
+    assert [event['name'] for event in trace['traceEvents']] == ['Pipeline', 'Imputer fit']
+    assert trace['traceEvents'][0]['ts'] == 10.0 * 1e6
+    assert trace['traceEvents'][0]['dur'] == 2.0 * 1e6
+    assert all(event['ph'] == 'X' for event in trace['traceEvents'])
+    assert 'cpu_time' in trace['traceEvents'][1]['args']
+
+    path = os.path.join(str(tmpdir), 'trace.json')
+    recorder.save(path)
+    with open(path) as f:
+        assert json.load(f) == trace
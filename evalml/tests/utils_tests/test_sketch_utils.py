@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from evalml.utils import QuantileSketch, TopKSketch
+
+
+@pytest.mark.parametrize("values", [[3.0], [1, 1, 1, 5], [5, 1, 2, 2, 7, 10], np.arange(400), np.random.RandomState(0).randint(0, 50, 1001)])
+def test_quantile_sketch_exact_with_few_distinct_values(values):
+    sketch = QuantileSketch()
+    for chunk in np.array_split(np.asarray(values, dtype=float), 3):
+        sketch.update(chunk)
+    assert sketch.count == len(values)
+    assert not sketch._is_compressed
+    for q in [0, 0.1, 0.5, 0.75, 1]:
+        assert sketch.quantile(q) == pytest.approx(np.quantile(values, q))
+
+
+def test_quantile_sketch_ignores_nans():
+    sketch = QuantileSketch().update(pd.Series([np.nan, 1, 2, np.nan, 4]))
+    assert sketch.count == 3
+    assert sketch.quantile(0.5) == 2
+    assert np.isnan(QuantileSketch().quantile(0.5))
+    assert np.isnan(QuantileSketch().update([np.nan]).quantile(0.5))
+
+
+@pytest.mark.parametrize("distribution", ["uniform", "lognormal"])
+def test_quantile_sketch_compresses(distribution):
+    rng = np.random.RandomState(0)
+    values = rng.rand(100000) if distribution == "uniform" else rng.lognormal(size=100000)
+    sketch = QuantileSketch(compression=100)
+    for chunk in np.array_split(values, 20):
+        sketch.update(chunk)
+    assert sketch._is_compressed
+    assert len(sketch._means) <= 200
+    assert sketch.count == len(values)
+    for q in [0.001, 0.1, 0.5, 0.9, 0.999]:
+        # the fraction of values below the estimated quantile is close to the quantile
+        assert abs((values < sketch.quantile(q)).mean() - q) < 0.005
+    assert sketch.quantile(0) == values.min()
+    assert sketch.quantile(1) == values.max()
+
+
+def test_quantile_sketch_merge():
+    rng = np.random.RandomState(0)
+    values = rng.normal(size=50000)
+    shards = [QuantileSketch().update(shard) for shard in np.array_split(values, 4)]
+    merged = QuantileSketch()
+    for shard in shards:
+        merged.merge(shard)
+    assert merged.count == len(values)
+    assert abs((values < merged.quantile(0.5)).mean() - 0.5) < 0.005
+
+    small_values = [1, 2, 2, 3, 9]
+    merged = QuantileSketch().update(small_values[:2]).merge(QuantileSketch().update(small_values[2:]))
+    assert merged.quantile(0.5) == 2
+
+
+def test_topk_sketch_exact_with_few_distinct_values():
+    values = pd.Series(["b", "a", "c", "a", "b", np.nan, "b", "a"])
+    sketch = TopKSketch()
+    for chunk in np.array_split(values, 3):
+        sketch.update(chunk)
+    # ties are broken with the smallest value
+    assert sketch.most_frequent() == "a"
+    assert sketch.update(["b"]).most_frequent() == "b"
+    assert TopKSketch().update(pd.Series([True, False, True], dtype="category")).most_frequent()
+    assert np.isnan(TopKSketch().most_frequent())
+
+
+def test_topk_sketch_capacity():
+    rng = np.random.RandomState(0)
+    values = rng.zipf(1.5, 100000)
+    sketch = TopKSketch(capacity=50)
+    for chunk in np.array_split(values, 10):
+        sketch.update(chunk)
+    assert len(sketch._counts) <= 50
+    assert sketch.most_frequent() == pd.Series(values).mode()[0]
+
+
+def test_topk_sketch_more_distinct_values_than_capacity():
+    sketch = TopKSketch(capacity=10)
+    sketch.update(np.arange(11))
+    assert len(sketch._counts) == 10
+    sketch.update(np.arange(100, 111))
+    assert len(sketch._counts) == 10
+    assert not np.isnan(sketch.most_frequent())
+
+    # a value which makes up more than 1 / capacity of the values is kept although each update has more distinct values than the capacity
+    sketch = TopKSketch(capacity=10)
+    for start in range(0, 100, 20):
+        sketch.update(np.append(np.arange(start + 1, start + 21), [0, 0, 0]))
+    assert sketch.most_frequent() == 0
+
+
+def test_topk_sketch_merge():
+    values = pd.Series([1, 2, 2, 3, 3, 3, 4, 4, 4, 4])
+    merged = TopKSketch().update(values[:5]).merge(TopKSketch().update(values[5:]))
+    assert merged.most_frequent() == 4
+    assert merged._counts.to_dict() == {1: 1, 2: 2, 3: 3, 4: 4}
+
+    merged = TopKSketch(capacity=2).update(values[:5]).merge(TopKSketch(capacity=2).update(values[5:]))
+    assert len(merged._counts) <= 2
+    assert merged.most_frequent() == 4
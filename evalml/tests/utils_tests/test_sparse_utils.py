@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+from scipy import sparse
+
+import woodwork as ww
+
+from evalml.utils import SparseFeatures
+from evalml.utils.sparse_utils import _densify, _is_sparse, _unwrap_sparse
+
+
+def test_sparse_features_init():
+    features = SparseFeatures(np.array([[1, 0], [0, 2], [0, 0]]), ['a', 'b'])
+    assert sparse.isspmatrix_csr(features.matrix)
+    assert features.shape == (3, 2)
+    assert features.columns == ['a', 'b']
+    pd.testing.assert_index_equal(features.index, pd.RangeIndex(3))
+
+    with pytest.raises(ValueError, match="Got 1 column names for 2 columns"):
+        SparseFeatures(np.array([[1, 0]]), ['a'])
+
+
+def test_sparse_features_to_dataframe():
+    features = SparseFeatures(sparse.coo_matrix([[1, 0], [0, 2]]), ['a', 'b'], index=pd.Index([10, 20]))
+    expected = pd.DataFrame({'a': [1, 0], 'b': [0, 2]}, index=[10, 20])
+    assert_frame_equal(features.to_dataframe(), expected)
+    assert isinstance(features.to_datatable(), ww.DataTable)
+    assert_frame_equal(features.to_datatable().to_dataframe(), expected, check_dtype=False)
+
+
+@pytest.mark.parametrize("data_type", ['pd', 'ww'])
+def test_sparse_features_concat(data_type):
+    X = pd.DataFrame({'x': [1.5, 2.5], 'flag': [True, False]}, index=[3, 4])
+    if data_type == 'ww':
+        X = ww.DataTable(X)
+    features = SparseFeatures(sparse.csr_matrix([[0, 1], [1, 0]]), ['a', 'b'])
+    concatenated = SparseFeatures.concat([X, features])
+    assert isinstance(concatenated, SparseFeatures)
+    assert concatenated.columns == ['x', 'flag', 'a', 'b']
+    pd.testing.assert_index_equal(concatenated.index, pd.Index([3, 4]))
+    np.testing.assert_array_equal(concatenated.matrix.toarray(), [[1.5, 1, 0, 1], [2.5, 0, 1, 0]])
+
+
+def test_sparse_features_concat_non_numeric():
+    X = pd.DataFrame({'text': ['a', 'b']})
+    features = SparseFeatures(np.eye(2), ['a', 'b'])
+    assert SparseFeatures.concat([X, features]) is None
+
+
+def test_sparse_helpers():
+    X = pd.DataFrame({'a': [1, 0]})
+    features = SparseFeatures(X.to_numpy(), ['a'])
+    assert _is_sparse(features)
+    assert _is_sparse(features.matrix)
+    assert not _is_sparse(X)
+    assert _unwrap_sparse(features) is features.matrix
+    assert _unwrap_sparse(X) is X
+    assert_frame_equal(_densify(features), X)
+    assert _densify(X) is X
@@ -1,5 +1,6 @@
 import warnings
 
+import numpy as np
 import pandas as pd
 from skopt import Optimizer
 
@@ -15,23 +16,36 @@ logger = get_logger(__file__)
 class SKOptTuner(Tuner):
     """Bayesian Optimizer."""
 
-    def __init__(self, pipeline_hyperparameter_ranges, random_state=None, random_seed=0):
+    def __init__(self, pipeline_hyperparameter_ranges, random_state=None, random_seed=0, cost_aware=False):
         """Init SkOptTuner
 
         Arguments:
             pipeline_hyperparameter_ranges (dict): A set of hyperparameter ranges corresponding to a pipeline's parameters
             random_state (int): The random state. Defaults to 0.
+            cost_aware (bool): If True, the surrogate model also models the training time of each set of parameters, and parameters
+                are chosen by their expected improvement per second of training time. Defaults to False.
         """
         random_seed = deprecate_arg("random_state", "random_seed", random_state, random_seed)
         super().__init__(pipeline_hyperparameter_ranges, random_seed=random_seed)
-        self.opt = Optimizer(self._search_space_ranges, "ET", acq_optimizer="sampling", random_state=random_seed)
+        self.cost_aware = cost_aware
+        acq_func = "EIps" if cost_aware else "gp_hedge"
+        # only the latest surrogate model is needed to propose parameters. Keeping every model would make pickled
+        # searches and search checkpoints grow with each result.
+        self.opt = Optimizer(self._search_space_ranges, "ET", acq_func=acq_func, acq_optimizer="sampling",
+                             random_state=random_seed, model_queue_size=1)
 
-    def add(self, pipeline_parameters, score):
+    def _observed_training_times(self):
+        # the optimizer stores the logarithm of the training times
+        return [np.exp(log_time) for _, log_time in self.opt.yi]
+
+    def add(self, pipeline_parameters, score, training_time=None):
         """Add score to sample
 
         Arguments:
             pipeline_parameters (dict): A dict of the parameters used to evaluate a pipeline
             score (float): The score obtained by evaluating the pipeline with the provided parameters
+            training_time (float): The time in seconds it took to evaluate the pipeline. Only used if the tuner is cost-aware. If None
+                or not positive, the median training time observed so far is used. Defaults to None.
 
         Returns:
             None
@@ -40,6 +54,11 @@ class SKOptTuner(Tuner):
         if pd.isnull(score):
             return
         flat_parameter_values = self._convert_to_flat_parameters(pipeline_parameters)
+        if self.cost_aware:
+            if training_time is None or not training_time > 0:
+                observed_training_times = self._observed_training_times()
+                training_time = float(np.median(observed_training_times)) if observed_training_times else 1.0
+            score = [score, training_time]
         try:
             self.opt.tell(flat_parameter_values, score)
         except Exception as e:
@@ -52,9 +71,32 @@ class SKOptTuner(Tuner):
                 raise ParameterError(msg)
             raise(e)
 
+    def _constant_lie(self):
+        """The score which pending parameters are temporarily added to the surrogate model with: the lowest score observed so far.
+        When cost-aware, it is paired with the shortest training time observed so far."""
+        if self.cost_aware:
+            return [min([score for score, _ in self.opt.yi]), min(self._observed_training_times())] if self.opt.yi else [0.0, 1.0]
+        return min(self.opt.yi) if self.opt.yi else 0.0
+
+    def _get_optimizer(self, copy=False):
+        """Returns the optimizer to propose parameters with. If there are pending parameters, they are added to a copy of the
+        optimizer with the constant lie, so that they are not proposed again.
+
+        Arguments:
+            copy (bool): If True, always returns a copy of the optimizer, which the caller may add points to. Defaults to False.
+        """
+        if not self._pending_parameters and not copy:
+            return self.opt
+        opt = self.opt.copy(random_state=self.opt.rng.randint(0, np.iinfo(np.int32).max))
+        if self._pending_parameters:
+            opt.tell(list(self._pending_parameters), [self._constant_lie()] * len(self._pending_parameters))
+        return opt
+
     def propose(self):
         """Returns a suggested set of parameters to train and score a pipeline with, based off the search space dimensions and prior samples.
 
+        Parameters registered with `add_pending` are treated as if they had been scored with the lowest score observed so far.
+
         Returns:
             dict: Proposed pipeline parameters
         """
@@ -62,5 +104,37 @@ class SKOptTuner(Tuner):
             warnings.simplefilter('ignore')
             if not len(self._search_space_ranges):
                 return self._convert_to_pipeline_parameters({})
-            flat_parameters = self.opt.ask()
+            flat_parameters = self._get_optimizer().ask()
             return self._convert_to_pipeline_parameters(flat_parameters)
+
+    def propose_batch(self, n):
+        """Returns a batch of suggested sets of parameters, based off the search space dimensions and prior samples.
+
+        Uses the constant liar strategy: after each point is chosen, it is temporarily added to the surrogate model with the
+        lowest score observed so far, so that the following points in the batch are chosen elsewhere in the search space.
+
+        Arguments:
+            n (int): The number of sets of parameters to propose.
+
+        Returns:
+            list(dict): Proposed pipeline parameters
+        """
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            if not len(self._search_space_ranges):
+                return [self._convert_to_pipeline_parameters({}) for _ in range(n)]
+            if n == 1:
+                return [self.propose()]
+            if not self.cost_aware:
+                flat_parameters_batch = self._get_optimizer().ask(n_points=n, strategy="cl_min")
+                return [self._convert_to_pipeline_parameters(flat_parameters) for flat_parameters in flat_parameters_batch]
+            # skopt's own constant liar strategy takes the minimum over the [score, training time] pairs of a cost-aware
+            # optimizer as a whole, so the lie is added to a copy of the optimizer after each point instead
+            opt = self._get_optimizer(copy=True)
+            lie = self._constant_lie()
+            flat_parameters_batch = []
+            for _ in range(n):
+                flat_parameters = opt.ask()
+                flat_parameters_batch.append(flat_parameters)
+                opt.tell(flat_parameters, lie)
+            return [self._convert_to_pipeline_parameters(flat_parameters) for flat_parameters in flat_parameters_batch]
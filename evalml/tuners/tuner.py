@@ -20,6 +20,7 @@ class Tuner(ABC):
         self._parameter_names_map = dict()
         self._search_space_names = []
         self._search_space_ranges = []
+        self._pending_parameters = []
         if not isinstance(pipeline_hyperparameter_ranges, dict):
             raise ValueError('pipeline_hyperparameter_ranges must be a dict but is of type {}'.format(type(pipeline_hyperparameter_ranges)))
         self._component_names = list(pipeline_hyperparameter_ranges.keys())
@@ -75,6 +76,48 @@ class Tuner(ABC):
             dict: Proposed pipeline parameters
         """
 
+    def propose_batch(self, n):
+        """Returns a batch of suggested sets of parameters, for example to train and score several pipelines at once.
+
+        The default implementation calls `propose` n times. Tuners which can propose points jointly should override it.
+
+        Arguments:
+            n (int): The number of sets of parameters to propose.
+
+        Returns:
+            list(dict): Proposed pipeline parameters
+        """
+        return [self.propose() for _ in range(n)]
+
+    def add_pending(self, pipeline_parameters):
+        """Register a set of hyperparameters which is being evaluated but has not been scored yet.
+
+        Pending parameters let the tuner propose new parameters while earlier proposals are still being evaluated, for
+        example by other workers, without proposing the same parameters again. Call `remove_pending` once the score is known.
+
+        Arguments:
+            pipeline_parameters (dict): a dict of the parameters used to evaluate a pipeline
+
+        Returns:
+            None
+        """
+        self._pending_parameters.append(self._convert_to_flat_parameters(pipeline_parameters))
+
+    def remove_pending(self, pipeline_parameters):
+        """Unregister a set of hyperparameters previously registered with `add_pending`. Does nothing if the parameters are not pending.
+
+        Arguments:
+            pipeline_parameters (dict): a dict of the parameters used to evaluate a pipeline
+
+        Returns:
+            None
+        """
+        if not self._pending_parameters:
+            return
+        flat_parameter_values = self._convert_to_flat_parameters(pipeline_parameters)
+        if flat_parameter_values in self._pending_parameters:
+            self._pending_parameters.remove(flat_parameter_values)
+
     def is_search_space_exhausted(self):
         """Optional. If possible search space for tuner is finite, this method indicates whether or not all possible parameters have been scored.
 
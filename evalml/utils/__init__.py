@@ -15,6 +15,10 @@ from .gen_utils import (
     is_all_numeric,
     get_importable_subclasses,
     _rename_column_names_to_numeric,
+    _with_positional_column_names,
+    _get_category_lookups,
+    _encode_categories_as_codes,
+    _iter_chunks,
     deprecate_arg
 )
 from .cli_utils import (
@@ -30,3 +34,6 @@ from .woodwork_utils import (
     _retain_custom_types_and_initalize_woodwork,
     infer_feature_types
 )
+from .sparse_utils import SparseFeatures
+from .sketch_utils import QuantileSketch, TopKSketch
+from .profiling import ChromeTraceRecorder
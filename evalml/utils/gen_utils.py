@@ -159,7 +159,7 @@ _not_used_in_automl = {'BaselineClassifier', 'BaselineRegressor', 'TimeSeriesBas
                        'BaselineRegressionPipeline', 'ModeBaselineMulticlassPipeline', 'BaselineMulticlassPipeline',
                        'TimeSeriesBaselineRegressionPipeline', 'TimeSeriesBaselineBinaryPipeline',
                        'TimeSeriesBaselineMulticlassPipeline', 'KNeighborsClassifier',
-                       'SVMClassifier', 'SVMRegressor'}
+                       'SVMClassifier', 'SVMRegressor', 'SGDClassifier', 'SGDRegressor', 'TreeKNeighborsClassifier'}
 
 
 def get_importable_subclasses(base_class, used_in_automl=True):
@@ -228,6 +228,76 @@ def _rename_column_names_to_numeric(X, flatten_tuples=True):
     return X_renamed
 
 
+def _with_positional_column_names(X):
+    """Used in LightGBM and XGBoost estimator classes to rename the columns of a pd.DataFrame to their positions, like
+        `_rename_column_names_to_numeric`, but without copying the data.
+
+    Arguments:
+        X (pd.DataFrame): The input data of shape [n_samples, n_features]
+
+    Returns:
+        pd.DataFrame: A shallow copy of X with columns named 0 to n_features - 1, which shares its data with X.
+    """
+    X_renamed = X.copy(deep=False)
+    X_renamed.columns = pd.RangeIndex(len(X.columns))
+    return X_renamed
+
+
+def _get_category_lookups(X, columns):
+    """Finds the categories of each categorical column, for `_encode_categories_as_codes` to encode the column with.
+
+    Arguments:
+        X (pd.DataFrame): The training data.
+        columns (list): Names of the categorical columns.
+
+    Returns:
+        dict: Maps the position of each categorical column in X to a pd.Index of its categories, sorted when they are comparable.
+    """
+    columns = set(columns)
+    return {position: pd.Categorical(X.iloc[:, position]).categories
+            for position, col in enumerate(X.columns) if col in columns}
+
+
+def _encode_categories_as_codes(X, category_lookups):
+    """Replaces each categorical column of a pd.DataFrame by the integer codes of its values in the categories found during fit,
+        as a pandas categorical column. Missing values are encoded as missing.
+
+    Arguments:
+        X (pd.DataFrame): The data to encode, with columns named by their positions. Columns are replaced in place.
+        category_lookups (dict): Categories of each column, as returned by `_get_category_lookups`.
+
+    Returns:
+        pd.DataFrame: X, with the categorical columns encoded.
+    """
+    for position, categories in category_lookups.items():
+        column = X[position]
+        codes = categories.get_indexer(column)
+        unknown = (codes == -1) & column.notna().to_numpy()
+        if unknown.any():
+            raise ValueError(f"Found unknown categories {list(pd.unique(column[unknown]))} in column {position} during transform")
+        X[position] = pd.Categorical.from_codes(codes, categories=pd.RangeIndex(len(categories)))
+    return X
+
+
+def _iter_chunks(chunks):
+    """Returns an iterator over chunks of data, which can be called again to make another pass over the data.
+
+    Arguments:
+        chunks (callable or iterable): Function which returns an iterator over the chunks, for example one which reads a file
+            in chunks, or a collection of chunks such as a list.
+
+    Returns:
+        iterator: Iterator over the chunks.
+    """
+    if callable(chunks):
+        return iter(chunks())
+    iterator = iter(chunks)
+    if iterator is chunks:
+        raise ValueError("Chunks must be a function which returns an iterator or a collection which can be iterated over more than once, "
+                         "since fitting makes one pass over the data per component. Got a single-use iterator.")
+    return iterator
+
+
 def jupyter_check():
     """Get whether or not the code is being run in a Ipython environment (such as Jupyter Notebook or Jupyter Lab)
 
@@ -0,0 +1,132 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+import psutil
+import woodwork as ww
+
+from evalml.utils.sparse_utils import _is_sparse
+
+_BYTES_PER_MB = 1024 ** 2
+
+
+def _get_shape(data):
+    """Returns the number of rows and columns of a dataset, or (None, None) if it has no shape."""
+    if isinstance(data, ww.DataTable) or _is_sparse(data):
+        return data.shape
+    if isinstance(data, ww.DataColumn):
+        return (data.shape[0], 1)
+    if isinstance(data, (pd.DataFrame, np.ndarray)) and data.ndim == 2:
+        return data.shape
+    if isinstance(data, (pd.Series, np.ndarray)):
+        return (data.shape[0], 1)
+    return (None, None)
+
+
+def _aggregate_event(profile, event):
+    """Adds a component operation event to a profile.
+
+    Times and calls are summed over the events for the same component and operation. The input and output shapes are those of the most
+    recent event, and the memory delta is the largest seen.
+    """
+    totals = profile.setdefault(event['component'], {}).setdefault(event['operation'], {
+        'calls': 0, 'wall_time': 0.0, 'cpu_time': 0.0, 'memory_delta_mb': event['memory_delta_mb']})
+    totals['calls'] += 1
+    totals['wall_time'] += event['wall_time']
+    totals['cpu_time'] += event['cpu_time']
+    totals['memory_delta_mb'] = max(totals['memory_delta_mb'], event['memory_delta_mb'])
+    for key in ('rows_in', 'columns_in', 'rows_out', 'columns_out'):
+        totals[key] = event[key]
+
+
+@contextmanager
+def profile_component(component_name, operation, X, profile, hooks=()):
+    """Context manager which measures a component operation, such as a fit or a transform, and records it.
+
+    Measures the wall time, the CPU time of the process, the number of rows and columns in and out and the change in resident memory. The
+    measurements are added to the profile and passed to each hook as an event. The operation is recorded even if it raises an exception.
+
+    Arguments:
+        component_name (str): Name of the component in the component graph.
+        operation (str): Name of the operation, for example 'fit' or 'transform'.
+        X (ww.DataTable, pd.DataFrame): Input data of the operation.
+        profile (dict): Profile to add the measurements to. Maps component names to operation names to the totals of each measurement.
+        hooks (list(callable)): Functions called with the event dict of the operation.
+
+    Yields:
+        dict: The event. Set its `output` key to the output of the operation to record the number of rows and columns out.
+    """
+    process = psutil.Process()
+    rows_in, columns_in = _get_shape(X)
+    event = {'component': component_name, 'operation': operation, 'rows_in': rows_in, 'columns_in': columns_in}
+    memory_start = process.memory_info().rss
+    cpu_start = time.process_time()
+    event['start'] = time.time()
+    wall_start = time.perf_counter()
+    try:
+        yield event
+    finally:
+        event['wall_time'] = time.perf_counter() - wall_start
+        event['cpu_time'] = time.process_time() - cpu_start
+        event['memory_delta_mb'] = (process.memory_info().rss - memory_start) / _BYTES_PER_MB
+        event['rows_out'], event['columns_out'] = _get_shape(event.pop('output', None))
+        _aggregate_event(profile, event)
+        for hook in hooks:
+            hook(event)
+
+
+class ChromeTraceRecorder:
+    """Collects timed events and exports them in the Chrome trace event format, which can be opened in chrome://tracing or Perfetto.
+
+    An instance can be passed as `trace_recorder` to AutoMLSearch to record a timeline of the search, or added to a component graph with
+    `ComponentGraph.add_profile_hook` to record every component operation.
+    """
+
+    def __init__(self):
+        """Collects timed events and exports them in the Chrome trace event format."""
+        self.events = []
+
+    def __call__(self, component_event):
+        """Records a component operation event from `ComponentGraph`.
+
+        Arguments:
+            component_event (dict): Event, as passed to profile hooks.
+        """
+        args = {key: value for key, value in component_event.items()
+                if key not in ('component', 'operation', 'start', 'wall_time')}
+        self.add_event(f"{component_event['component']} {component_event['operation']}", 'component',
+                       component_event['start'], component_event['wall_time'], args)
+
+    def add_event(self, name, category, start, duration, args=None):
+        """Records an event.
+
+        Arguments:
+            name (str): Name of the event.
+            category (str): Category of the event, for example 'pipeline' or 'component'.
+            start (float): Start time of the event, in seconds since the epoch.
+            duration (float): Duration of the event, in seconds.
+            args (dict): Additional information to show with the event. Defaults to None.
+        """
+        self.events.append({'name': name, 'cat': category, 'ph': 'X', 'ts': start * 1e6, 'dur': duration * 1e6,
+                            'pid': os.getpid(), 'tid': 0, 'args': args or {}})
+
+    def to_dict(self):
+        """Returns the recorded events as a Chrome trace.
+
+        Returns:
+            dict: The trace, with the events sorted by start time.
+        """
+        return {'traceEvents': sorted(self.events, key=lambda event: event['ts']), 'displayTimeUnit': 'ms'}
+
+    def save(self, file_path):
+        """Saves the recorded events as a Chrome trace JSON file.
+
+        Arguments:
+            file_path (str): Location to save the file to.
+        """
+        with open(file_path, 'w') as f:
+            json.dump(self.to_dict(), f, default=str)
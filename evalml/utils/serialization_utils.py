@@ -0,0 +1,137 @@
+import json
+import os
+import pickle
+
+import cloudpickle
+import numpy as np
+
+_MANIFEST_FILE = "manifest.json"
+_OBJECT_FILE = "object.pkl"
+_ARRAYS_DIR = "arrays"
+_FORMAT_VERSION = 1
+
+# arrays smaller than this are cheaper to keep inline in the pickle stream than to store as separate files
+_MIN_ARRAY_BYTES = 1024
+
+
+class _ArrayExtractingPickler(cloudpickle.CloudPickler):
+    """A pickler which writes large numpy arrays to their own .npy files instead of the pickle stream."""
+
+    def __init__(self, file, array_dir, protocol=cloudpickle.DEFAULT_PROTOCOL, min_array_bytes=_MIN_ARRAY_BYTES):
+        super().__init__(file, protocol=protocol)
+        self._array_dir = array_dir
+        self._min_array_bytes = min_array_bytes
+        self._saved_arrays = {}
+        # keep a reference to every saved array so that ids are not reused while pickling
+        self._saved_array_refs = []
+        self.arrays = {}
+
+    def persistent_id(self, obj):
+        if type(obj) not in (np.ndarray, np.memmap):
+            return None
+        if obj.dtype.hasobject or obj.nbytes < self._min_array_bytes:
+            return None
+        file_name = self._saved_arrays.get(id(obj))
+        if file_name is None:
+            file_name = f"{len(self._saved_arrays)}.npy"
+            np.save(os.path.join(self._array_dir, file_name), obj, allow_pickle=False)
+            self._saved_arrays[id(obj)] = file_name
+            self._saved_array_refs.append(obj)
+            self.arrays[file_name] = {"shape": list(obj.shape), "dtype": obj.dtype.str}
+        return ("ndarray", file_name)
+
+
+class _ArrayLoadingUnpickler(pickle.Unpickler):
+    """An unpickler which restores arrays written by _ArrayExtractingPickler, optionally as memory maps."""
+
+    def __init__(self, file, array_dir, mmap_mode="r"):
+        super().__init__(file)
+        self._array_dir = array_dir
+        self._mmap_mode = mmap_mode
+        self._loaded_arrays = {}
+
+    def persistent_load(self, pid):
+        kind, file_name = pid
+        if kind != "ndarray":
+            raise pickle.UnpicklingError(f"Unsupported persistent id {pid}")
+        if file_name not in self._loaded_arrays:
+            self._loaded_arrays[file_name] = np.load(os.path.join(self._array_dir, file_name),
+                                                     mmap_mode=self._mmap_mode, allow_pickle=False)
+        return self._loaded_arrays[file_name]
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    return repr(value)
+
+
+def save_to_directory(obj, directory, metadata=None, pickle_protocol=cloudpickle.DEFAULT_PROTOCOL):
+    """Saves an object to a directory, storing large numpy arrays as separate .npy files so they can be memory-mapped on load.
+
+    The directory will contain a `manifest.json` file with the provided metadata and a description of each stored array,
+    an `object.pkl` file with the remainder of the object, and an `arrays` folder with one .npy file per large array.
+
+    Arguments:
+        obj (object): Object to save.
+        directory (str): Location of the directory to save to. Will be created if it does not exist.
+        metadata (dict): JSON-serializable information to record in the manifest. Defaults to None.
+        pickle_protocol (int): The pickle data stream format.
+
+    Returns:
+        None
+    """
+    directory = str(directory)
+    array_dir = os.path.join(directory, _ARRAYS_DIR)
+    os.makedirs(array_dir, exist_ok=True)
+    for file_name in os.listdir(array_dir):
+        if file_name.endswith(".npy"):
+            os.remove(os.path.join(array_dir, file_name))
+
+    with open(os.path.join(directory, _OBJECT_FILE), "wb") as f:
+        pickler = _ArrayExtractingPickler(f, array_dir, protocol=pickle_protocol)
+        pickler.dump(obj)
+
+    from evalml import __version__
+    manifest = {"format_version": _FORMAT_VERSION,
+                "evalml_version": __version__,
+                "metadata": metadata or {},
+                "arrays": pickler.arrays}
+    with open(os.path.join(directory, _MANIFEST_FILE), "w") as f:
+        json.dump(manifest, f, indent=2, default=_json_default)
+
+
+def load_from_directory(directory, mmap_mode="r"):
+    """Loads an object saved with `save_to_directory`.
+
+    Arguments:
+        directory (str): Location of the directory to load from.
+        mmap_mode (str, None): Memory-map mode used to open the stored arrays. See `numpy.load` for the available modes.
+            The default of "r" opens arrays read-only, so that processes which load the same directory share one copy
+            of the array data through the operating system's page cache. If None, arrays are read fully into memory.
+
+    Returns:
+        object: The loaded object.
+    """
+    directory = str(directory)
+    manifest = read_manifest(directory)
+    if manifest.get("format_version") != _FORMAT_VERSION:
+        raise ValueError(f"Unsupported serialization format version {manifest.get('format_version')} in {directory}")
+    with open(os.path.join(directory, _OBJECT_FILE), "rb") as f:
+        return _ArrayLoadingUnpickler(f, os.path.join(directory, _ARRAYS_DIR), mmap_mode=mmap_mode).load()
+
+
+def read_manifest(directory):
+    """Reads the manifest of a directory written by `save_to_directory` without loading the object itself.
+
+    Arguments:
+        directory (str): Location of the saved directory.
+
+    Returns:
+        dict: The manifest contents.
+    """
+    manifest_path = os.path.join(str(directory), _MANIFEST_FILE)
+    if not os.path.exists(manifest_path):
+        raise ValueError(f"{directory} does not contain a saved evalml object")
+    with open(manifest_path, "r") as f:
+        return json.load(f)
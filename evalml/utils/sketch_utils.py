@@ -0,0 +1,193 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_categorical_dtype
+
+
+class QuantileSketch:
+    """Mergeable summary of a distribution of numeric values, which estimates quantiles such as the median in bounded memory.
+
+    Like a t-digest, the values are summarized as weighted centroids, which are kept small near the tails of the distribution and larger
+    in the middle. Repeated values are stored once with their count, and centroids are only merged once there are more than twice
+    `compression` of them, so quantiles are exact for columns with fewer distinct values than that.
+    """
+
+    def __init__(self, compression=200):
+        """Mergeable summary of a distribution of numeric values.
+
+        Arguments:
+            compression (int): Number of centroids kept after merging. Larger values use more memory and give more accurate quantiles. Defaults to 200.
+        """
+        self.compression = compression
+        self._means = np.array([], dtype=np.float64)
+        self._weights = np.array([], dtype=np.float64)
+        self._min = np.inf
+        self._max = -np.inf
+        self._is_compressed = False
+
+    @property
+    def count(self):
+        """The number of values added to the sketch."""
+        return self._weights.sum()
+
+    def update(self, values):
+        """Adds values to the sketch. Missing values are ignored.
+
+        Arguments:
+            values (pd.Series, np.ndarray, list): The values to add.
+
+        Returns:
+            self
+        """
+        values = np.asarray(values, dtype=np.float64)
+        means, weights = np.unique(values[~np.isnan(values)], return_counts=True)
+        if len(means) > 0:
+            self._min, self._max = min(self._min, means[0]), max(self._max, means[-1])
+        self._add_centroids(means, weights)
+        return self
+
+    def merge(self, other):
+        """Adds the values summarized by another sketch, for example one updated on another shard of the data.
+
+        Arguments:
+            other (QuantileSketch): The sketch to merge.
+
+        Returns:
+            self
+        """
+        self._min, self._max = min(self._min, other._min), max(self._max, other._max)
+        self._is_compressed = self._is_compressed or other._is_compressed
+        self._add_centroids(other._means, other._weights)
+        return self
+
+    def quantile(self, q):
+        """Estimates a quantile of the values added to the sketch, interpolating linearly between values like `np.quantile`.
+
+        Arguments:
+            q (float): The quantile, between 0 and 1.
+
+        Returns:
+            float: The estimated quantile, or NaN if no values have been added.
+        """
+        if len(self._means) == 0:
+            return np.nan
+        ends = np.cumsum(self._weights) - 1
+        if not self._is_compressed:
+            # each centroid is one distinct value, at the positions from starts to ends in the sorted values
+            starts = ends - self._weights + 1
+            positions = np.column_stack([starts, ends]).ravel()
+            return float(np.interp(q * ends[-1], positions, np.repeat(self._means, 2)))
+        # interpolate between the centers of the centroids, and between the outer centroids and the smallest and largest values
+        centers = ends - (self._weights - 1) / 2
+        positions = np.concatenate([[0], centers, [ends[-1]]])
+        return float(np.interp(q * ends[-1], positions, np.concatenate([[self._min], self._means, [self._max]])))
+
+    def _add_centroids(self, means, weights):
+        """Adds weighted centroids, merging equal means exactly and compressing the centroids once there are too many."""
+        means = np.concatenate([self._means, means])
+        weights = np.concatenate([self._weights, np.asarray(weights, dtype=np.float64)])
+        order = np.argsort(means, kind='mergesort')
+        means, weights = means[order], weights[order]
+        if len(means) > 0:
+            is_new_value = np.concatenate([[True], means[1:] != means[:-1]])
+            starts = np.flatnonzero(is_new_value)
+            means, weights = means[starts], np.add.reduceat(weights, starts)
+        if len(means) > 2 * self.compression:
+            means, weights = self._compress(means, weights)
+            self._is_compressed = True
+        self._means, self._weights = means, weights
+
+    def _compress(self, means, weights):
+        """Merges neighboring centroids, limiting the weight of each centroid with the arcsine scale function of the t-digest.
+
+        The scale function k(q) = compression / (2 pi) * arcsin(2q - 1) maps quantiles to k, and the centroids whose middle falls between
+        the quantiles of two consecutive integers k are merged, so each merged centroid covers at most one unit of k.
+        """
+        cumulative_weights = np.cumsum(weights)
+        total = cumulative_weights[-1]
+        middle_quantiles = (cumulative_weights - weights / 2) / total
+        max_k = np.floor(self.compression / 4)
+        bucket_limits = (np.sin(np.arange(-max_k + 1, max_k + 1) * 2 * np.pi / self.compression) + 1) / 2
+        buckets = np.searchsorted(bucket_limits, middle_quantiles, side='right')
+        starts = np.flatnonzero(np.concatenate([[True], buckets[1:] != buckets[:-1]]))
+        merged_weights = np.add.reduceat(weights, starts)
+        merged_means = np.add.reduceat(means * weights, starts) / merged_weights
+        # the weighted average may round outside of the merged means, which must stay sorted and within the values
+        merged_means = np.clip(merged_means, means[starts], means[np.append(starts[1:], len(means)) - 1])
+        return merged_means, merged_weights
+
+
+class TopKSketch:
+    """Mergeable summary of the most frequent values, which keeps the counts of at most `capacity` distinct values.
+
+    When there are more distinct values than that, the counts are kept like in the space-saving algorithm: only the `capacity` largest
+    counts are kept, and a value which is not in the sketch is counted from the smallest count in it, since it may have been counted up to
+    that before it was dropped. Counts are overestimated by at most n / capacity for n values, any value which makes up more than
+    1 / capacity of the values is kept, and the most frequent value is exact for columns with at most `capacity` distinct values.
+    """
+
+    def __init__(self, capacity=1000):
+        """Mergeable summary of the most frequent values.
+
+        Arguments:
+            capacity (int): Maximum number of distinct values to keep counts for. Defaults to 1000.
+        """
+        self.capacity = capacity
+        self._counts = pd.Series(dtype=np.float64)
+
+    def update(self, values):
+        """Adds values to the sketch. Missing values are ignored.
+
+        Arguments:
+            values (pd.Series, np.ndarray, list): The values to add.
+
+        Returns:
+            self
+        """
+        values = pd.Series(values)
+        if is_categorical_dtype(values):
+            values = values.astype(object)
+        self._add_counts(values.value_counts(), 0.0)
+        return self
+
+    def merge(self, other):
+        """Adds the values summarized by another sketch, for example one updated on another shard of the data.
+
+        Arguments:
+            other (TopKSketch): The sketch to merge.
+
+        Returns:
+            self
+        """
+        self._add_counts(other._counts, other._missing_count())
+        return self
+
+    def most_frequent(self):
+        """Returns the most frequent value, breaking ties with the smallest value like sklearn's SimpleImputer.
+
+        Returns:
+            The most frequent value, or NaN if no values have been added.
+        """
+        if len(self._counts) == 0:
+            return np.nan
+        return self._counts[self._counts == self._counts.max()].index.min()
+
+    def _missing_count(self):
+        """Returns the largest count a value which is not in the sketch may have: the smallest count once the sketch is full, and 0 before."""
+        if len(self._counts) < self.capacity:
+            return 0.0
+        return self._counts.min()
+
+    def _add_counts(self, counts, missing_count):
+        """Adds counts of values, keeping the `capacity` largest once more than `capacity` values are counted.
+
+        Arguments:
+            counts (pd.Series): Counts indexed by value.
+            missing_count (float): Count of the values which are not in `counts`.
+        """
+        new_values = counts.index[~counts.index.isin(self._counts.index)]
+        index = self._counts.index.append(new_values)
+        counts = (self._counts.reindex(index, fill_value=self._missing_count()) +
+                  counts.astype(np.float64).reindex(index, fill_value=missing_count))
+        if len(counts) > self.capacity:
+            counts = counts.nlargest(self.capacity)
+        self._counts = counts
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+from scipy import sparse
+
+import woodwork as ww
+
+
+class SparseFeatures:
+    """Numeric features stored in a scipy sparse matrix, with column names and a row index.
+
+    Components which produce mostly zeros, such as `OneHotEncoder` with `sparse=True`, can output SparseFeatures instead of a ww.DataTable.
+    `ComponentGraph` passes them on to components which support sparse input, such as the LightGBM, XGBoost and linear estimators,
+    and converts them to a dense ww.DataTable for any other component.
+    """
+
+    def __init__(self, matrix, columns, index=None):
+        """Numeric features stored in a scipy sparse matrix.
+
+        Arguments:
+            matrix (scipy.sparse.spmatrix, np.ndarray): The values, of shape [n_samples, n_features]. Converted to CSR format.
+            columns (list): Names of the features.
+            index (pd.Index): Index of the rows. Defaults to None, which uses a RangeIndex.
+        """
+        self.matrix = sparse.csr_matrix(matrix)
+        self.columns = list(columns)
+        if len(self.columns) != self.matrix.shape[1]:
+            raise ValueError(f"Got {len(self.columns)} column names for {self.matrix.shape[1]} columns")
+        self.index = index if index is not None else pd.RangeIndex(self.matrix.shape[0])
+
+    @property
+    def shape(self):
+        """The number of rows and columns."""
+        return self.matrix.shape
+
+    def to_dataframe(self):
+        """Converts the features to a dense pd.DataFrame.
+
+        Returns:
+            pd.DataFrame: The features.
+        """
+        return pd.DataFrame(self.matrix.toarray(), columns=self.columns, index=self.index)
+
+    def to_datatable(self):
+        """Converts the features to a dense ww.DataTable.
+
+        Returns:
+            ww.DataTable: The features.
+        """
+        return ww.DataTable(self.to_dataframe())
+
+    @classmethod
+    def concat(cls, inputs):
+        """Concatenates SparseFeatures and numeric data column-wise, keeping the result sparse.
+
+        Arguments:
+            inputs (list(SparseFeatures, pd.DataFrame, ww.DataTable)): The data to concatenate, which must have the same number of rows.
+
+        Returns:
+            SparseFeatures or None: The concatenated features, or None if any of the dense inputs has non-numeric columns.
+        """
+        matrices = []
+        columns = []
+        index = None
+        for data in inputs:
+            if isinstance(data, ww.DataTable):
+                data = data.to_dataframe()
+            if isinstance(data, pd.Series):
+                data = data.to_frame()
+            if isinstance(data, SparseFeatures):
+                matrices.append(data.matrix)
+            else:
+                if not all(is_numeric_dtype(dtype) or is_bool_dtype(dtype) for dtype in data.dtypes):
+                    return None
+                matrices.append(sparse.csr_matrix(data.to_numpy(dtype=np.float64)))
+            columns.extend(data.columns)
+            if index is None:
+                index = data.index
+        return cls(sparse.hstack(matrices, format='csr'), columns, index)
+
+
+def _is_sparse(X):
+    """Returns whether X is SparseFeatures or a scipy sparse matrix."""
+    return isinstance(X, SparseFeatures) or sparse.issparse(X)
+
+
+def _unwrap_sparse(X):
+    """Returns the scipy sparse matrix of SparseFeatures, for passing to a library estimator, or X unchanged otherwise."""
+    if isinstance(X, SparseFeatures):
+        return X.matrix
+    return X
+
+
+def _densify(X):
+    """Converts SparseFeatures to a dense pd.DataFrame, leaving other data unchanged."""
+    if isinstance(X, SparseFeatures):
+        return X.to_dataframe()
+    return X